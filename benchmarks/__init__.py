@@ -0,0 +1 @@
+"""Performance benchmarks for the Dremio connector (see benchmarks/conftest.py)."""
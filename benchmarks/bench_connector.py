@@ -0,0 +1,78 @@
+"""
+Benchmarks des traitements par colonne/table du connecteur
+
+Les règles de classification et la génération des requêtes de profiling sont
+dans ``dremio_connector.core``: mesurables sans le framework OpenMetadata.
+"""
+import pytest
+
+from dremio_connector.core.classification import classify_column_name
+from dremio_connector.core.dbt_cache import DbtIndex
+from dremio_connector.core.profiler import build_column_profile_query
+
+_COLUMN_WORDS = [
+    "id", "customer_email", "phone_number", "first_name", "city", "amount", "created_at",
+    "status", "iban", "api_key", "order_total", "credit_card", "description", "zip_code",
+]
+
+_OM_TYPES = ["DataType.INT", "DataType.BIGINT", "DataType.VARCHAR", "DataType.DOUBLE", "DataType.TIMESTAMP"]
+
+
+@pytest.fixture(scope="module")
+def column_names(scaled):
+    return [f"{_COLUMN_WORDS[i % len(_COLUMN_WORDS)]}_{i % 97}" for i in range(scaled(1_000_000))]
+
+
+def test_column_classification(benchmark, column_names):
+    benchmark.extra_info["items"] = len(column_names)
+
+    def classify_all():
+        return [classify_column_name(name) for name in column_names]
+
+    tags = benchmark.pedantic(classify_all, rounds=3)
+
+    assert tags[1] == ["PII.Email"]
+
+
+@pytest.fixture(scope="module")
+def dbt_index(scaled):
+    nodes = {
+        f"model.bench.model_{i}": {
+            "resource_type": "model",
+            "name": f"model_{i}",
+            "description": f"Model {i}",
+            "tags": ["bench"],
+            "columns": {f"col_{c}": {"description": f"Column {c}"} for c in range(10)},
+        }
+        for i in range(scaled(10_000))
+    }
+    return DbtIndex.from_artifacts(manifest={"nodes": nodes})
+
+
+def test_dbt_lookups(benchmark, dbt_index, scaled):
+    models = len(dbt_index)
+    # Moitié de hits (casse différente), moitié de tables sans modèle dbt
+    names = [f"MODEL_{i % models}" if i % 2 else f"table_{i}" for i in range(scaled(1_000_000))]
+    benchmark.extra_info["items"] = len(names)
+
+    def lookup_all():
+        return [dbt_index.lookup(name) for name in names]
+
+    found = benchmark.pedantic(lookup_all, rounds=3)
+
+    assert found[1]["name"] == "model_1"
+
+
+def test_profile_query_generation(benchmark, scaled):
+    columns = [(f"column_{i}", _OM_TYPES[i % len(_OM_TYPES)]) for i in range(scaled(100_000))]
+    benchmark.extra_info["items"] = len(columns)
+
+    def build_all():
+        return [
+            build_column_profile_query('"source"."schema"."table"', name, column_type, 10000)
+            for name, column_type in columns
+        ]
+
+    queries = benchmark.pedantic(build_all, rounds=3)
+
+    assert "STDDEV" in queries[0]
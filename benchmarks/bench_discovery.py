@@ -0,0 +1,28 @@
+"""
+Benchmark du crawl complet de découverte contre le serveur Dremio simulé
+"""
+import logging
+
+import pytest
+
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer
+from dremio_connector.core.sync_engine import DremioAutoDiscovery
+
+
+@pytest.fixture(scope="module")
+def dremio_server(scaled):
+    catalog = SyntheticCatalog(datasets=scaled(5000), sources=5, depth=2, fan_out=5)
+    logging.getLogger("dremio_connector").setLevel(logging.WARNING)
+    with MockDremioServer(catalog) as server:
+        yield server
+
+
+def test_discovery_crawl(benchmark, dremio_server):
+    client = DremioAutoDiscovery(dremio_server.url, "admin", "admin")
+    assert client.authenticate()
+    benchmark.extra_info["items"] = dremio_server.catalog.datasets
+
+    resources = benchmark.pedantic(client.discover_all_resources, rounds=3)
+
+    assert len(resources) == dremio_server.catalog.datasets + dremio_server.catalog.containers()
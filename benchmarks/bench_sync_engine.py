@@ -0,0 +1,53 @@
+"""
+Benchmarks des étapes CPU du moteur de synchronisation
+"""
+import pytest
+
+from dremio_connector.core.sync_engine import DremioAutoDiscovery, DremioOpenMetadataSync
+
+_DREMIO_TYPES = ["INTEGER", "BIGINT", "VARCHAR", "DOUBLE", "TIMESTAMP", "BOOLEAN", "DECIMAL", "DATE", "STRUCT", "LIST"]
+
+
+@pytest.fixture(scope="module")
+def resources(scaled):
+    """Ressources de découverte: sources, dossiers imbriqués et datasets"""
+    count = scaled(1_000_000)
+    sources = [f"source_{s}" for s in range(10)]
+    folders = [f"folder_{f}" for f in range(100)]
+    resources = [{"type": "source", "path": [s]} for s in sources]
+    resources += [{"type": "folder", "path": [s, f]} for s in sources for f in folders]
+    for i in range(count):
+        source = sources[i % 10]
+        folder = folders[(i // 10) % 100]
+        if i % 7 == 0:
+            path = [source, folder, "sub", f"table_{i}"]
+        else:
+            path = [source, folder, f"table_{i}"]
+        resources.append({"type": "dataset", "path": path})
+    return resources
+
+
+def test_organize_hierarchy(benchmark, resources):
+    sync = DremioOpenMetadataSync("http://dremio", "u", "p", "http://om/api", "jwt", "bench")
+    benchmark.extra_info["items"] = len(resources)
+
+    hierarchy = benchmark.pedantic(sync._organize_hierarchy, args=(resources,), rounds=3)
+
+    assert len(hierarchy) == 10
+
+
+@pytest.fixture(scope="module")
+def dremio_types(scaled):
+    return [{"name": _DREMIO_TYPES[i % len(_DREMIO_TYPES)]} for i in range(scaled(1_000_000))]
+
+
+def test_map_dremio_type(benchmark, dremio_types):
+    client = DremioAutoDiscovery("http://dremio", "u", "p")
+    benchmark.extra_info["items"] = len(dremio_types)
+
+    def map_all():
+        return [client._map_dremio_type(t) for t in dremio_types]
+
+    mapped = benchmark.pedantic(map_all, rounds=3)
+
+    assert mapped[0] == "INT"
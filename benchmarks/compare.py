@@ -0,0 +1,106 @@
+"""
+Compare des résultats de benchmarks à une baseline JSON
+
+Une régression est un benchmark dont la médiane dépasse celle de la baseline
+de plus de ``--threshold`` (10% par défaut). Code de sortie 1 s'il y en a.
+
+Usage:
+    python -m benchmarks.compare .benchmarks/current.json
+    python -m benchmarks.compare current.json --baseline other.json --threshold 0.2
+    python -m benchmarks.compare current.json --update   # remplace la baseline
+"""
+
+import argparse
+import json
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "baseline.json"
+
+
+def load_results(path: str) -> Dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(current: Dict, baseline: Dict, threshold: float = 0.10, metric: str = "median") -> List[Dict]:
+    """
+    Compare benchmark par benchmark
+
+    Returns:
+        List[Dict]: {"name", "baseline", "current", "change", "status"} avec
+            status "regression", "improvement", "ok", "new" ou "missing"
+    """
+    rows = []
+    current_benchmarks = current.get("benchmarks", {})
+    baseline_benchmarks = baseline.get("benchmarks", {})
+
+    for name in sorted(set(current_benchmarks) | set(baseline_benchmarks)):
+        if name not in baseline_benchmarks:
+            rows.append({"name": name, "baseline": None, "current": current_benchmarks[name][metric],
+                         "change": None, "status": "new"})
+            continue
+        if name not in current_benchmarks:
+            rows.append({"name": name, "baseline": baseline_benchmarks[name][metric], "current": None,
+                         "change": None, "status": "missing"})
+            continue
+
+        before = baseline_benchmarks[name][metric]
+        after = current_benchmarks[name][metric]
+        change = (after - before) / before if before else 0.0
+        if change > threshold:
+            status = "regression"
+        elif change < -threshold:
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append({"name": name, "baseline": before, "current": after, "change": change, "status": status})
+    return rows
+
+
+def format_rows(rows: List[Dict]) -> str:
+    def ms(value: Optional[float]) -> str:
+        return f"{value * 1000:12.3f}" if value is not None else f"{'-':>12}"
+
+    lines = [f"{'benchmark':45} {'baseline ms':>12} {'current ms':>12} {'change':>9}  status"]
+    for row in rows:
+        change = f"{row['change']:+8.1%}" if row["change"] is not None else f"{'-':>8}"
+        lines.append(f"{row['name']:45} {ms(row['baseline'])} {ms(row['current'])} {change:>9}  {row['status']}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare des résultats de benchmarks à une baseline")
+    parser.add_argument("current", help="Résultats JSON (pytest benchmarks --bench-json=...)")
+    parser.add_argument("--baseline", default=str(DEFAULT_BASELINE))
+    parser.add_argument("--threshold", type=float, default=0.10, help="Régression tolérée (0.10 = +10%%)")
+    parser.add_argument("--metric", default="median", choices=["median", "mean", "min"])
+    parser.add_argument("--update", action="store_true", help="Remplacer la baseline par les résultats courants")
+    args = parser.parse_args(argv)
+
+    if args.update:
+        Path(args.baseline).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(args.current, args.baseline)
+        print(f"Baseline mise à jour: {args.baseline}")
+        return 0
+
+    current = load_results(args.current)
+    baseline = load_results(args.baseline)
+    if current.get("scale") != baseline.get("scale"):
+        print(f"⚠️  Échelles différentes: baseline {baseline.get('scale')}, courant {current.get('scale')}")
+
+    rows = compare(current, baseline, threshold=args.threshold, metric=args.metric)
+    print(format_rows(rows))
+
+    regressions = [row["name"] for row in rows if row["status"] == "regression"]
+    if regressions:
+        print(f"\n❌ {len(regressions)} régression(s) au-delà de {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    print(f"\n✅ Aucune régression au-delà de {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Benchmark suite du connecteur Dremio
+
+Fixture ``benchmark`` au style de pytest-benchmark (``benchmark(fn, *args)``,
+``benchmark.pedantic(...)``, ``benchmark.extra_info``) sans dépendance
+supplémentaire. Les résultats sont écrits en JSON puis comparés à une
+baseline par ``python -m benchmarks.compare``.
+
+Usage:
+    python -m pytest benchmarks --bench-json=.benchmarks/current.json
+    python -m benchmarks.compare .benchmarks/current.json
+
+Options:
+    --bench-json PATH   fichier JSON des résultats
+    --bench-scale F     facteur de taille des jeux de données (défaut 1.0,
+                        ou variable d'environnement DREMIO_BENCH_SCALE)
+"""
+
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+import pytest
+
+# Durée minimale visée pour une mesure (s) et bornes du nombre de rounds
+MIN_ROUND_TIME = 0.01
+MIN_TIME = 0.5
+MIN_ROUNDS = 5
+MAX_ROUNDS = 1000
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("dremio-benchmarks")
+    group.addoption("--bench-json", default=None, help="Écrire les résultats des benchmarks dans ce fichier JSON")
+    group.addoption(
+        "--bench-scale",
+        type=float,
+        default=float(os.environ.get("DREMIO_BENCH_SCALE", "1.0")),
+        help="Facteur de taille des jeux de données (1.0 = tailles nominales, ex. 1M ressources)",
+    )
+
+
+def pytest_configure(config):
+    config._bench_results = {}
+
+
+@pytest.fixture(scope="session")
+def bench_scale(request) -> float:
+    return request.config.getoption("--bench-scale")
+
+
+@pytest.fixture(scope="session")
+def scaled(bench_scale) -> Callable[[int], int]:
+    """Taille d'un jeu de données mise à l'échelle (au moins 1)"""
+    return lambda size: max(1, int(size * bench_scale))
+
+
+class BenchmarkFixture:
+    """Mesure d'une fonction: rounds × itérations, statistiques par itération"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.extra_info: Dict = {}
+        self.stats: Optional[Dict] = None
+
+    def __call__(self, func: Callable, *args, **kwargs):
+        # Calibrage: assez d'itérations pour qu'un round dure MIN_ROUND_TIME
+        started = time.perf_counter()
+        result = func(*args, **kwargs)
+        duration = max(time.perf_counter() - started, 1e-9)
+
+        iterations = max(1, int(MIN_ROUND_TIME / duration))
+        rounds = int(min(MAX_ROUNDS, max(MIN_ROUNDS, MIN_TIME / (duration * iterations))))
+        self._run(func, args, kwargs, rounds=rounds, iterations=iterations)
+        return result
+
+    def pedantic(
+        self,
+        func: Callable,
+        args: tuple = (),
+        kwargs: Optional[Dict] = None,
+        setup: Optional[Callable] = None,
+        rounds: int = 1,
+        iterations: int = 1,
+        warmup_rounds: int = 0,
+    ):
+        kwargs = kwargs or {}
+        for _ in range(warmup_rounds):
+            func(*args, **kwargs)
+        return self._run(func, args, kwargs, rounds=rounds, iterations=iterations, setup=setup)
+
+    def _run(self, func, args, kwargs, rounds: int, iterations: int, setup: Optional[Callable] = None):
+        timings: List[float] = []
+        result = None
+        for _ in range(rounds):
+            if setup is not None:
+                setup_result = setup()
+                if setup_result is not None:
+                    args, kwargs = setup_result
+            started = time.perf_counter()
+            for _ in range(iterations):
+                result = func(*args, **kwargs)
+            timings.append((time.perf_counter() - started) / iterations)
+
+        self.stats = {
+            "min": min(timings),
+            "max": max(timings),
+            "mean": statistics.fmean(timings),
+            "median": statistics.median(timings),
+            "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            "rounds": rounds,
+            "iterations": iterations,
+            "ops": 1.0 / statistics.median(timings) if statistics.median(timings) else None,
+        }
+        items = self.extra_info.get("items")
+        if items:
+            self.stats["items_per_second"] = items / self.stats["median"]
+        return result
+
+
+@pytest.fixture
+def benchmark(request):
+    fixture = BenchmarkFixture(request.node.nodeid.split("::", 1)[-1])
+    yield fixture
+    if fixture.stats is not None:
+        request.config._bench_results[fixture.name] = {**fixture.stats, "extra_info": fixture.extra_info}
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    results = getattr(config, "_bench_results", {})
+    if not results:
+        return
+    terminalreporter.section("benchmarks")
+    for name, stats in sorted(results.items()):
+        throughput = f"  {stats['items_per_second']:,.0f} items/s" if stats.get("items_per_second") else ""
+        terminalreporter.write_line(
+            f"{name:55} median {stats['median'] * 1000:10.3f} ms  "
+            f"(min {stats['min'] * 1000:.3f}, rounds {stats['rounds']}){throughput}"
+        )
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    path = config.getoption("--bench-json")
+    results = getattr(config, "_bench_results", {})
+    if not path or not results:
+        return
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "machine": {
+                    "python": sys.version.split()[0],
+                    "platform": platform.platform(),
+                    "cpu_count": os.cpu_count(),
+                },
+                "scale": config.getoption("--bench-scale"),
+                "benchmarks": results,
+            },
+            f,
+            indent=2,
+            sort_keys=True,
+        )
@@ -18,12 +18,33 @@ Modules:
 __version__ = "2.0.0"
 __author__ = "Dremio OpenMetadata Team"
 
-from dremio_connector.dremio_source import DremioConnector
-from dremio_connector.core.sync_engine import DremioAutoDiscovery, DremioOpenMetadataSync, sync_dremio_to_openmetadata
-
-__all__ = [
-    "DremioConnector",
-    "DremioAutoDiscovery",
-    "DremioOpenMetadataSync",
-    "sync_dremio_to_openmetadata",
-]
+import importlib
+from typing import TYPE_CHECKING
+
+# Exports chargés au premier accès (PEP 562): ``import dremio_connector`` ne
+# tire ni openmetadata-ingestion ni requests, seulement le module demandé.
+_EXPORTS = {
+    "DremioConnector": "dremio_connector.dremio_source",
+    "DremioAutoDiscovery": "dremio_connector.core.sync_engine",
+    "DremioOpenMetadataSync": "dremio_connector.core.sync_engine",
+    "sync_dremio_to_openmetadata": "dremio_connector.core.sync_engine",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from dremio_connector.dremio_source import DremioConnector
+    from dremio_connector.core.sync_engine import DremioAutoDiscovery, DremioOpenMetadataSync, sync_dremio_to_openmetadata
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
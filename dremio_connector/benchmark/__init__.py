@@ -0,0 +1,20 @@
+"""Benchmark harness: synthetic Dremio catalogs and local mock Dremio/OpenMetadata servers."""
+
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer, MockOpenMetadataServer
+from dremio_connector.benchmark.harness import (
+    percentiles,
+    run_connector_benchmark,
+    run_discovery_benchmark,
+    run_sync_benchmark,
+)
+
+__all__ = [
+    "SyntheticCatalog",
+    "MockDremioServer",
+    "MockOpenMetadataServer",
+    "percentiles",
+    "run_connector_benchmark",
+    "run_discovery_benchmark",
+    "run_sync_benchmark",
+]
@@ -0,0 +1,5 @@
+import sys
+
+from dremio_connector.benchmark.harness import main
+
+sys.exit(main())
@@ -0,0 +1,229 @@
+"""
+Générateur de catalogues Dremio synthétiques (1k → 1M datasets)
+
+Le catalogue n'est jamais matérialisé: chaque conteneur et chaque dataset est
+dérivé de son index (noms, ids, colonnes, SQL des vues), ce qui permet de
+servir un catalogue d'un million de datasets sans le garder en mémoire.
+
+Forme:
+    sources (space/source) → ``depth`` niveaux de dossiers (``fan_out`` par
+    niveau) → datasets répartis uniformément sur les dossiers feuilles
+
+Usage:
+    from dremio_connector.benchmark.catalog import SyntheticCatalog
+
+    catalog = SyntheticCatalog(datasets=100_000, depth=2, fan_out=10)
+    catalog.root()                         # /api/v3/catalog
+    catalog.by_path(["source_0", "folder_3"])  # /api/v3/catalog/by-path/...
+    catalog.by_id("ds-42")                 # /api/v3/catalog/{id}
+"""
+
+import random
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Noms de colonnes réalistes: certains déclenchent l'auto-classification
+_COLUMN_NAMES = [
+    "id", "customer_id", "email", "phone", "first_name", "city", "amount",
+    "created_at", "status", "country", "iban", "quantity", "price", "updated_at",
+    "description", "account_number", "zip_code", "order_date", "category", "score",
+]
+
+_COLUMN_TYPES = ["BIGINT", "VARCHAR", "DOUBLE", "TIMESTAMP", "INTEGER", "DATE", "BOOLEAN", "DECIMAL"]
+
+
+class SyntheticCatalog:
+    """
+    Catalogue Dremio déterministe dérivé d'une graine
+
+    Args:
+        datasets: nombre total de datasets
+        sources: nombre de conteneurs racine (sources/spaces)
+        depth: nombre de niveaux de dossiers sous chaque source (0 = datasets
+            directement dans la source)
+        fan_out: dossiers enfants par niveau
+        columns: (min, max) colonnes par dataset
+        view_ratio: part des datasets qui sont des vues (VIRTUAL_DATASET)
+        seed: graine des tirages
+    """
+
+    def __init__(
+        self,
+        datasets: int = 1000,
+        sources: int = 5,
+        depth: int = 1,
+        fan_out: int = 10,
+        columns: Tuple[int, int] = (5, 20),
+        view_ratio: float = 0.2,
+        seed: int = 42,
+    ):
+        self.datasets = datasets
+        self.sources = sources
+        self.depth = depth
+        self.fan_out = fan_out
+        self.columns = columns
+        self.view_ratio = view_ratio
+        self.seed = seed
+        self.leaves = sources * fan_out ** depth
+        self.per_leaf = max(1, -(-datasets // self.leaves))
+
+    # ------------------------------------------------------------------
+    # Index ↔ path
+    # ------------------------------------------------------------------
+
+    def _leaf_index(self, folders: List[int], source: int) -> int:
+        index = source
+        for folder in folders:
+            index = index * self.fan_out + folder
+        return index
+
+    def _leaf_path(self, leaf: int) -> List[str]:
+        folders = []
+        for _ in range(self.depth):
+            leaf, folder = divmod(leaf, self.fan_out)
+            folders.append(f"folder_{folder}")
+        return [f"source_{leaf}"] + folders[::-1]
+
+    def _leaf_range(self, leaf: int) -> range:
+        start = leaf * self.per_leaf
+        return range(min(start, self.datasets), min(start + self.per_leaf, self.datasets))
+
+    def is_view(self, index: int) -> bool:
+        # La première table d'un dossier n'est jamais une vue: chaque vue a un amont
+        if index % self.per_leaf == 0:
+            return False
+        return random.Random(self.seed * 1_000_003 + index).random() < self.view_ratio
+
+    def dataset_name(self, index: int) -> str:
+        return f"{'view' if self.is_view(index) else 'table'}_{index}"
+
+    def dataset_path(self, index: int) -> List[str]:
+        return self._leaf_path(index // self.per_leaf) + [self.dataset_name(index)]
+
+    def _parse_path(self, path: List[str]) -> Optional[Tuple[int, Optional[int]]]:
+        """Retourne (leaf ou préfixe, index du dataset) pour un path, None si inconnu"""
+        try:
+            numbers = [int(part.rsplit("_", 1)[1]) for part in path]
+        except (IndexError, ValueError):
+            return None
+
+        if not path or not path[0].startswith("source_") or numbers[0] >= self.sources:
+            return None
+        folders = numbers[1:self.depth + 1]
+        if any(n >= self.fan_out for n in folders) or any(
+            not part.startswith("folder_") for part in path[1:self.depth + 1]
+        ):
+            return None
+
+        if len(path) <= self.depth + 1:
+            return self._leaf_index(folders, numbers[0]), None
+
+        if len(path) != self.depth + 2:
+            return None
+        index = numbers[-1]
+        leaf = self._leaf_index(folders, numbers[0])
+        if index not in self._leaf_range(leaf) or path[-1] != self.dataset_name(index):
+            return None
+        return leaf, index
+
+    # ------------------------------------------------------------------
+    # Réponses de l'API catalogue
+    # ------------------------------------------------------------------
+
+    def _container_entry(self, path: List[str]) -> Dict:
+        if len(path) == 1:
+            return {
+                "id": f"c-{'-'.join(path)}",
+                "path": path,
+                "type": "CONTAINER",
+                "containerType": "SOURCE",
+            }
+        return {
+            "id": f"c-{'-'.join(path)}",
+            "path": path,
+            "type": "CONTAINER",
+            "containerType": "FOLDER",
+        }
+
+    def _dataset_entry(self, index: int) -> Dict:
+        return {
+            "id": f"ds-{index}",
+            "path": self.dataset_path(index),
+            "type": "DATASET",
+            "datasetType": "VIRTUAL" if self.is_view(index) else "PROMOTED",
+        }
+
+    def root(self) -> Dict:
+        """Réponse de /api/v3/catalog"""
+        return {"data": [self._container_entry([f"source_{s}"]) for s in range(self.sources)]}
+
+    def children(self, path: List[str]) -> List[Dict]:
+        """Enfants d'un conteneur (dossiers, ou datasets pour un dossier feuille)"""
+        parsed = self._parse_path(path)
+        if parsed is None or parsed[1] is not None:
+            return []
+        if len(path) <= self.depth:
+            return [self._container_entry(path + [f"folder_{f}"]) for f in range(self.fan_out)]
+        return [self._dataset_entry(index) for index in self._leaf_range(parsed[0])]
+
+    def by_path(self, path: List[str]) -> Optional[Dict]:
+        """Réponse de /api/v3/catalog/by-path/{path}"""
+        parsed = self._parse_path(path)
+        if parsed is None:
+            return None
+        leaf, index = parsed
+        if index is not None:
+            return self.dataset(index)
+
+        entry = self._container_entry(path)
+        entry["entityType"] = "source" if len(path) == 1 else "folder"
+        entry["children"] = self.children(path)
+        return entry
+
+    def by_id(self, item_id: str) -> Optional[Dict]:
+        """Réponse de /api/v3/catalog/{id}"""
+        if item_id.startswith("ds-"):
+            try:
+                index = int(item_id[3:])
+            except ValueError:
+                return None
+            return self.dataset(index) if 0 <= index < self.datasets else None
+        if item_id.startswith("c-"):
+            return self.by_path(item_id[2:].split("-"))
+        return None
+
+    def fields(self, index: int) -> List[Dict]:
+        rng = random.Random(self.seed * 7_919 + index)
+        count = rng.randint(*self.columns)
+        fields = []
+        for position in range(count):
+            name = _COLUMN_NAMES[position % len(_COLUMN_NAMES)]
+            if position >= len(_COLUMN_NAMES):
+                name = f"{name}_{position // len(_COLUMN_NAMES)}"
+            fields.append({"name": name, "type": {"name": rng.choice(_COLUMN_TYPES)}})
+        return fields
+
+    def dataset(self, index: int) -> Dict:
+        """Entité dataset complète (schéma, et SQL pour les vues)"""
+        path = self.dataset_path(index)
+        entity = {
+            "entityType": "dataset",
+            "id": f"ds-{index}",
+            "path": path,
+            "type": "VIRTUAL_DATASET" if self.is_view(index) else "PHYSICAL_DATASET",
+            "tag": f"{self.seed}-{index}",
+            "fields": self.fields(index),
+        }
+        if not self.is_view(index):
+            entity["format"] = {"type": "Parquet"}
+        if self.is_view(index):
+            upstream = self.dataset_path(index - 1)
+            entity["sql"] = "SELECT * FROM " + ".".join(f'"{part}"' for part in upstream)
+            entity["sqlContext"] = path[:-1]
+        return entity
+
+    def iter_datasets(self) -> Iterator[int]:
+        return iter(range(self.datasets))
+
+    def containers(self) -> int:
+        """Nombre total de conteneurs (sources + dossiers)"""
+        return sum(self.sources * self.fan_out ** level for level in range(self.depth + 1))
@@ -0,0 +1,88 @@
+"""
+Serveur Arrow Flight local simulant le port Flight de Dremio
+
+Stand-in de ``grpc+tcp://host:32010``: authentification basic puis bearer
+(en-tête ``authorization``, comme Dremio), une commande SQL par
+``FlightDescriptor``, résultats en record batches. Les requêtes sont
+exécutées par le MockDremioServer associé: mêmes résultats qu'en REST.
+
+Usage:
+    with MockDremioServer(catalog) as dremio, MockFlightServer(dremio) as flight:
+        client = DremioAutoDiscovery(dremio.url, "admin", "admin", flight_port=flight.port)
+"""
+
+import base64
+import threading
+import uuid
+from typing import Dict, List
+
+import pyarrow as pa
+import pyarrow.flight as flight
+
+from dremio_connector.benchmark.servers import MockDremioServer
+
+_TOKEN = "bench-flight-token"
+
+
+class _NoopAuthHandler(flight.ServerAuthHandler):
+    """Handshake sans effet: l'authentification passe par le middleware"""
+
+    def authenticate(self, outgoing, incoming):
+        pass
+
+    def is_valid(self, token):
+        return ""
+
+
+class _BearerMiddleware(flight.ServerMiddleware):
+    def sending_headers(self):
+        return {"authorization": f"Bearer {_TOKEN}"}
+
+
+class _BasicAuthFactory(flight.ServerMiddlewareFactory):
+    """Basic (n'importe quel utilisateur non vide) → bearer; bearer vérifié ensuite"""
+
+    def start_call(self, info, headers):
+        values = headers.get("authorization") or [""]
+        scheme, _, credentials = values[0].partition(" ")
+        if scheme == "Basic":
+            user = base64.b64decode(credentials).decode("utf-8").partition(":")[0]
+            if user:
+                return _BearerMiddleware()
+        elif scheme == "Bearer" and credentials == _TOKEN:
+            return None
+        raise flight.FlightUnauthenticatedError("invalid credentials")
+
+
+class MockFlightServer(flight.FlightServerBase):
+    """
+    Serveur Flight sur un port libre de 127.0.0.1, requêtes exécutées par ``dremio``
+
+    ``queries`` garde les requêtes reçues, dans l'ordre.
+    """
+
+    def __init__(self, dremio: MockDremioServer):
+        super().__init__(
+            "grpc+tcp://127.0.0.1:0",
+            auth_handler=_NoopAuthHandler(),
+            middleware={"auth": _BasicAuthFactory()},
+        )
+        self.dremio = dremio
+        self.queries: List[str] = []
+        self._results: Dict[bytes, pa.Table] = {}
+        self._lock = threading.Lock()
+
+    def get_flight_info(self, context, descriptor):
+        sql = descriptor.command.decode("utf-8")
+        table = pa.Table.from_pylist(self.dremio._execute(sql))
+        ticket = uuid.uuid4().hex.encode("ascii")
+        with self._lock:
+            self.queries.append(sql)
+            self._results[ticket] = table
+        endpoint = flight.FlightEndpoint(ticket, [])
+        return flight.FlightInfo(table.schema, descriptor, [endpoint], table.num_rows, -1)
+
+    def do_get(self, context, ticket):
+        with self._lock:
+            table = self._results.pop(ticket.ticket)
+        return flight.RecordBatchStream(table)
@@ -0,0 +1,341 @@
+"""
+Harnais de benchmark: synchronisation complète contre les serveurs simulés
+
+Deux scénarios, chacun sur un SyntheticCatalog servi par MockDremioServer:
+- ``sync``: ``DremioOpenMetadataSync.sync`` (découverte + écritures PUT vers
+  MockOpenMetadataServer)
+- ``connector``: méthodes de topologie de ``DremioConnector``
+  (get_database_names → get_database_schema_names → get_tables_name_and_type →
+  yield_table), comme les appelle le framework OpenMetadata. Nécessite
+  ``openmetadata-ingestion``.
+
+Le rapport donne le débit (datasets/s, requêtes/s) et les percentiles de
+latence par endpoint (côté serveur) et par étape (côté client).
+
+Usage:
+    python -m dremio_connector.benchmark --datasets 10000 --latency-ms 2
+    python -m dremio_connector.benchmark --scenario connector --error-rate 0.01
+"""
+
+import argparse
+import json
+import logging
+import time
+from types import SimpleNamespace
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import EndpointStats, MockDremioServer, MockOpenMetadataServer
+from dremio_connector.core.sync_engine import DremioAutoDiscovery, DremioOpenMetadataSync
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+def percentiles(samples: Sequence[float], points: Iterable[int] = PERCENTILES) -> Dict[str, float]:
+    """Percentiles (rang le plus proche) en millisecondes"""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    result = {}
+    for point in points:
+        rank = max(0, min(len(ordered) - 1, -(-point * len(ordered) // 100) - 1))
+        result[f"p{point}_ms"] = round(ordered[rank] * 1000, 3)
+    result["max_ms"] = round(ordered[-1] * 1000, 3)
+    return result
+
+
+def summarize_endpoints(stats: EndpointStats) -> Dict[str, Dict]:
+    """Nombre de requêtes, erreurs et percentiles de latence par endpoint"""
+    summary = {}
+    for endpoint, durations in sorted(stats.durations.items()):
+        summary[endpoint] = {
+            "requests": len(durations),
+            "errors": stats.errors.get(endpoint, 0),
+            **percentiles(durations),
+        }
+    return summary
+
+
+def _quiet(level: int):
+    """Les logs par item de la synchronisation dominent sinon la mesure"""
+    logging.getLogger("dremio_connector").setLevel(level)
+
+
+def run_sync_benchmark(
+    catalog: SyntheticCatalog,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+    lineage: bool = False,
+    log_level: int = logging.WARNING,
+    sync_options: Optional[Dict] = None,
+    sync_mode: Optional[Dict] = None,
+) -> Dict:
+    """
+    Mesure DremioOpenMetadataSync.sync sur le catalogue synthétique
+
+    ``sync_options`` (max_workers, rate_limit, include, state_dir...) est passé
+    au constructeur, ``sync_mode`` (incremental, dry_run) à ``sync``.
+    """
+    _quiet(log_level)
+    server_args = {"latency_ms": latency_ms, "jitter_ms": jitter_ms, "error_rate": error_rate}
+
+    with MockDremioServer(catalog, **server_args) as dremio, MockOpenMetadataServer(**server_args) as om:
+        sync = DremioOpenMetadataSync(
+            dremio_url=dremio.url,
+            dremio_user="admin",
+            dremio_password="admin",
+            openmetadata_url=f"{om.url}/api",
+            jwt_token="bench",
+            service_name="dremio_bench",
+            **(sync_options or {}),
+        )
+        started = time.perf_counter()
+        result = sync.sync(lineage=lineage, **(sync_mode or {}))
+        duration = time.perf_counter() - started
+
+        requests_count = dremio.stats.requests() + om.stats.requests()
+        return {
+            "scenario": "sync",
+            "catalog": _catalog_shape(catalog),
+            "server": server_args,
+            "duration_seconds": round(duration, 3),
+            "datasets_per_second": round(catalog.datasets / duration, 1) if duration else None,
+            "requests_per_second": round(requests_count / duration, 1) if duration else None,
+            "result": result,
+            "dremio_endpoints": summarize_endpoints(dremio.stats),
+            "openmetadata_endpoints": summarize_endpoints(om.stats),
+        }
+
+
+class _TopologyContext:
+    """Contexte minimal de topologie (équivalent de TopologyContextManager.get())"""
+
+    def __init__(self, service_name: str):
+        self.state = SimpleNamespace(database_service=service_name, database=None, database_schema=None)
+
+    def get(self) -> SimpleNamespace:
+        return self.state
+
+
+def _bench_connector(dremio_url: str, service_name: str):
+    """DremioConnector branché sur le serveur simulé, sans workflow OpenMetadata"""
+    from dremio_connector.dremio_source import DremioConnector
+
+    connector = DremioConnector.__new__(DremioConnector)
+    options = {"url": dremio_url, "username": "admin", "password": "admin"}
+    connector.config = SimpleNamespace(serviceConnection=SimpleNamespace(
+        root=SimpleNamespace(config=SimpleNamespace(connectionOptions=SimpleNamespace(root=options)))
+    ))
+    connector.metadata = None
+    connector.source_config = SimpleNamespace()
+    connector.database_source_state = set()
+    connector.dataset_columns = {}
+    connector.context = _TopologyContext(service_name)
+    connector.prepare()
+    return connector
+
+
+def run_connector_benchmark(
+    catalog: SyntheticCatalog,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+    log_level: int = logging.WARNING,
+) -> Dict:
+    """Mesure le parcours de topologie de DremioConnector sur le catalogue synthétique"""
+    _quiet(log_level)
+    server_args = {"latency_ms": latency_ms, "jitter_ms": jitter_ms, "error_rate": error_rate}
+    stages: Dict[str, List[float]] = {
+        "get_database_names": [],
+        "get_database_schema_names": [],
+        "get_tables_name_and_type": [],
+        "yield_table": [],
+    }
+
+    def timed(stage: str, iterable_factory) -> List:
+        started = time.perf_counter()
+        items = list(iterable_factory() or [])
+        stages[stage].append(time.perf_counter() - started)
+        return items
+
+    with MockDremioServer(catalog, **server_args) as dremio:
+        connector = _bench_connector(dremio.url, "dremio_bench")
+        state = connector.context.get()
+        tables = 0
+        started = time.perf_counter()
+
+        for database in timed("get_database_names", connector.get_database_names):
+            state.database = database
+            for schema in timed("get_database_schema_names", connector.get_database_schema_names):
+                state.database_schema = schema
+                for table in timed("get_tables_name_and_type", connector.get_tables_name_and_type):
+                    timed("yield_table", lambda: connector.yield_table(table))
+                    tables += 1
+
+        duration = time.perf_counter() - started
+        return {
+            "scenario": "connector",
+            "catalog": _catalog_shape(catalog),
+            "server": server_args,
+            "duration_seconds": round(duration, 3),
+            "tables": tables,
+            "tables_per_second": round(tables / duration, 1) if duration else None,
+            "requests_per_second": round(dremio.stats.requests() / duration, 1) if duration else None,
+            "stages": {
+                stage: {"calls": len(durations), **percentiles(durations)}
+                for stage, durations in stages.items()
+            },
+            "dremio_endpoints": summarize_endpoints(dremio.stats),
+        }
+
+
+def run_discovery_benchmark(
+    catalog: SyntheticCatalog,
+    latency_ms: float = 0.0,
+    jitter_ms: float = 0.0,
+    error_rate: float = 0.0,
+    log_level: int = logging.WARNING,
+    client_options: Optional[Dict] = None,
+) -> Dict:
+    """Mesure seulement DremioAutoDiscovery.discover_all_resources (sans écriture)"""
+    _quiet(log_level)
+    server_args = {"latency_ms": latency_ms, "jitter_ms": jitter_ms, "error_rate": error_rate}
+
+    with MockDremioServer(catalog, **server_args) as dremio:
+        client = DremioAutoDiscovery(dremio.url, "admin", "admin", **(client_options or {}))
+        client.authenticate()
+        started = time.perf_counter()
+        resources = client.discover_all_resources()
+        duration = time.perf_counter() - started
+        return {
+            "scenario": "discovery",
+            "catalog": _catalog_shape(catalog),
+            "server": server_args,
+            "duration_seconds": round(duration, 3),
+            "resources": len(resources),
+            "datasets_per_second": round(catalog.datasets / duration, 1) if duration else None,
+            "requests_per_second": round(dremio.stats.requests() / duration, 1) if duration else None,
+            "dremio_endpoints": summarize_endpoints(dremio.stats),
+        }
+
+
+def _catalog_shape(catalog: SyntheticCatalog) -> Dict:
+    return {
+        "datasets": catalog.datasets,
+        "sources": catalog.sources,
+        "depth": catalog.depth,
+        "fan_out": catalog.fan_out,
+        "columns": list(catalog.columns),
+        "view_ratio": catalog.view_ratio,
+    }
+
+
+def format_report(report: Dict) -> str:
+    """Rendu texte d'un rapport de benchmark"""
+    lines = [
+        f"Scénario: {report['scenario']}  —  {report['catalog']['datasets']} datasets "
+        f"(depth={report['catalog']['depth']}, fan_out={report['catalog']['fan_out']})",
+        f"Durée: {report['duration_seconds']}s",
+    ]
+    for key in ("datasets_per_second", "tables_per_second", "requests_per_second"):
+        if report.get(key) is not None:
+            lines.append(f"{key}: {report[key]}")
+
+    for section in ("stages", "dremio_endpoints", "openmetadata_endpoints"):
+        if not report.get(section):
+            continue
+        lines.append(f"{section}:")
+        for name, values in report[section].items():
+            count = values.get("requests", values.get("calls"))
+            errors = values.get("errors", 0)
+            lines.append(
+                f"  {name:45} n={count:<8} err={errors:<5} "
+                f"p50={values.get('p50_ms')}ms p95={values.get('p95_ms')}ms p99={values.get('p99_ms')}ms"
+            )
+    return "\n".join(lines)
+
+
+def build_parser(add_help: bool = True) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Benchmark du connecteur Dremio contre des serveurs simulés",
+        add_help=add_help,
+    )
+    parser.add_argument("--scenario", choices=["sync", "connector", "discovery"], default="sync")
+    parser.add_argument("--datasets", type=int, default=1000)
+    parser.add_argument("--sources", type=int, default=5)
+    parser.add_argument("--depth", type=int, default=1)
+    parser.add_argument("--fan-out", type=int, default=10)
+    parser.add_argument("--min-columns", type=int, default=5)
+    parser.add_argument("--max-columns", type=int, default=20)
+    parser.add_argument("--view-ratio", type=float, default=0.2)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--lineage", action="store_true", help="Inclure le lineage des vues (scénario sync)")
+    parser.add_argument("--bulk-import", action="store_true",
+                        help="Écrire schémas et tables par import CSV (scénario sync)")
+    parser.add_argument("--prefetch-index", action="store_true",
+                        help="Indexer d'abord les entités OpenMetadata existantes (scénario sync)")
+    parser.add_argument("--json", dest="json_output", help="Écrire le rapport JSON dans ce fichier")
+    return parser
+
+
+def run_from_args(args: argparse.Namespace) -> Dict:
+    """
+    Exécute le scénario décrit par les arguments de build_parser
+
+    Les réglages de la CLI ``dremio-connector bench`` (concurrency, rate_limit,
+    om_rate_limit, retries, include, exclude, state_dir, mode, bulk_import,
+    prefetch_index) sont lus s'ils sont présents.
+    """
+    catalog = SyntheticCatalog(
+        datasets=args.datasets,
+        sources=args.sources,
+        depth=args.depth,
+        fan_out=args.fan_out,
+        columns=(args.min_columns, args.max_columns),
+        view_ratio=args.view_ratio,
+        seed=args.seed,
+    )
+    server_args = {"latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "error_rate": args.error_rate}
+
+    client_options = {
+        "max_workers": getattr(args, "concurrency", 1),
+        "rate_limit": getattr(args, "rate_limit", None),
+        "max_retries": getattr(args, "retries", 0),
+    }
+    sync_options = {
+        **client_options,
+        "om_rate_limit": getattr(args, "om_rate_limit", None),
+        "include": getattr(args, "include", None),
+        "exclude": getattr(args, "exclude", None),
+        "state_dir": getattr(args, "state_dir", None),
+        "bulk_import": getattr(args, "bulk_import", False),
+        "prefetch_index": getattr(args, "prefetch_index", False),
+    }
+    mode = getattr(args, "mode", "full")
+    sync_mode = {"incremental": mode == "incremental", "dry_run": mode == "dry-run"}
+
+    if args.scenario == "connector":
+        return run_connector_benchmark(catalog, **server_args)
+    if args.scenario == "discovery":
+        return run_discovery_benchmark(catalog, client_options=client_options, **server_args)
+    return run_sync_benchmark(
+        catalog, lineage=args.lineage, sync_options=sync_options, sync_mode=sync_mode, **server_args
+    )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    args = build_parser().parse_args(argv)
+    report = run_from_args(args)
+
+    print(format_report(report))
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    return 0
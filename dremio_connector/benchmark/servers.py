@@ -0,0 +1,587 @@
+"""
+Serveurs HTTP locaux simulant Dremio et OpenMetadata pour les benchmarks
+
+Les tests existants mockent ``requests`` et masquent toute latence. Ces
+serveurs tournent dans le process (ThreadingHTTPServer, un thread par
+connexion) et répondent comme les vraies API, avec une latence et un taux
+d'erreur configurables:
+
+- MockDremioServer: ``/apiv2/login``, ``/api/v3/catalog``,
+  ``/api/v3/catalog/by-path/...``, ``/api/v3/catalog/{id}``, ``/api/v3/sql``,
+  ``/api/v3/job/{id}`` et ``/api/v3/job/{id}/results``
+- MockOpenMetadataServer: ``PUT /v1/databases``, ``/v1/databaseSchemas``,
+  ``/v1/tables``, l'import CSV ``/v1/{databases,databaseSchemas}/name/{fqn}/import``,
+  les listings ``GET`` des mêmes entités (par service, database ou schéma),
+  ``PATCH`` (JSON Patch des colonnes), ``DELETE`` et ``PUT .../tableProfile``
+  de ``/v1/tables/{id}`` (et, pour les étapes optionnelles, lineage et usage)
+
+Chaque serveur mesure le temps de traitement par endpoint (latence injectée
+comprise) dans ``stats``.
+
+Usage:
+    from dremio_connector.benchmark.catalog import SyntheticCatalog
+    from dremio_connector.benchmark.servers import MockDremioServer
+
+    with MockDremioServer(SyntheticCatalog(datasets=10_000), latency_ms=2) as dremio:
+        client = DremioAutoDiscovery(dremio.url, "admin", "admin")
+"""
+
+import csv
+import io
+import json
+import random
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.core.profiler import quote_path
+
+# Alias des agrégats des requêtes de profiling ("... as row_count")
+_ALIAS_RE = re.compile(r"\bas\s+([A-Za-z_][A-Za-z0-9_]*)", re.IGNORECASE)
+
+# Échantillon d'une table (moteur de profiling sample): SELECT "a", "b" FROM "s"."t" LIMIT n
+_SAMPLE_RE = re.compile(r'^SELECT\s+(.+?)\s+FROM\s+("[^"]+"(?:\."[^"]+")*)\s+LIMIT\s+(\d+)$', re.IGNORECASE | re.DOTALL)
+_SAMPLE_NUMERIC_TYPES = ("BIGINT", "INTEGER", "DOUBLE", "DECIMAL")
+
+
+class EndpointStats:
+    """Compteurs et durées de traitement par endpoint (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.durations: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record(self, endpoint: str, duration: float, error: bool):
+        with self._lock:
+            self.durations.setdefault(endpoint, []).append(duration)
+            if error:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def requests(self) -> int:
+        with self._lock:
+            return sum(len(d) for d in self.durations.values())
+
+    def reset(self):
+        with self._lock:
+            self.durations.clear()
+            self.errors.clear()
+
+
+class _MockServer:
+    """
+    Base des serveurs: thread d'écoute, latence et erreurs injectées
+
+    Args:
+        latency_ms: latence ajoutée à chaque réponse
+        jitter_ms: variation aléatoire uniforme ajoutée à la latence
+        error_rate: probabilité de répondre 503 (hors login)
+        seed: graine des tirages (latence, erreurs)
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.stats = EndpointStats()
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "_MockServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _draw(self) -> Tuple[float, bool]:
+        with self._rng_lock:
+            delay = self.latency_ms + (self._rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+            failed = self.error_rate > 0 and self._rng.random() < self.error_rate
+        return delay / 1000.0, failed
+
+    def route(self, method: str, path: str, query: Dict[str, List[str]], body: Optional[Dict]) -> Tuple[str, int, object]:
+        """Retourne (endpoint normalisé, status HTTP, payload JSON)"""
+        raise NotImplementedError
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _handle(self, method: str):
+                started = time.perf_counter()
+                parts = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                body = None
+                if length:
+                    raw = self.rfile.read(length)
+                    try:
+                        body = json.loads(raw)
+                    except ValueError:
+                        # Corps texte (import CSV)
+                        body = raw.decode("utf-8", "replace")
+
+                endpoint, status, payload = server.route(method, parts.path, parse_qs(parts.query), body)
+                delay, failed = server._draw()
+                if failed and endpoint != "/apiv2/login":
+                    status, payload = 503, {"message": "injected error"}
+                if delay:
+                    time.sleep(delay)
+
+                data = json.dumps(payload).encode("utf-8")
+                # Enregistré avant la réponse: le client qui la reçoit voit déjà sa requête dans stats
+                server.stats.record(f"{method} {endpoint}", time.perf_counter() - started, status >= 400)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._handle("GET")
+
+            def do_POST(self):
+                self._handle("POST")
+
+            def do_PUT(self):
+                self._handle("PUT")
+
+            def do_PATCH(self):
+                self._handle("PATCH")
+
+            def do_DELETE(self):
+                self._handle("DELETE")
+
+        return Handler
+
+
+class MockDremioServer(_MockServer):
+    """
+    Stand-in de l'API REST Dremio servant un SyntheticCatalog
+
+    Les jobs SQL sont terminés immédiatement. Résultats:
+    - ``INFORMATION_SCHEMA."TABLES"`` / ``"VIEWS"``: générés depuis le catalogue
+    - ``sys.reflections``: une réflexion RAW par id de ``reflections``, plus
+      les lignes de ``reflection_rows`` (réflexions avec colonnes)
+    - jobs accélérés: une requête sans ``SELECT *`` sur un dataset de
+      ``reflection_rows`` a une réflexion ``CHOSEN`` dans son statut
+    - ``TABLE(table_snapshot(...))``: un snapshot dont le résumé donne
+      ``rows_per_table`` lignes
+    - requêtes d'agrégats (profiling): une ligne, une valeur par alias
+    - échantillons (``SELECT "a", ... FROM table LIMIT n``): ``rows_per_table``
+      lignes au plus; numériques ``i % 7``, autres ``"{colonne}-{i % 7}"``,
+      une valeur sur dix nulle
+    - autres requêtes: aucune ligne
+    """
+
+    def __init__(self, catalog: SyntheticCatalog, rows_per_table: int = 10_000, **kwargs):
+        super().__init__(**kwargs)
+        self.catalog = catalog
+        self.rows_per_table = rows_per_table
+        # dataset_id → record_count des réflexions RAW (sys.reflections)
+        self.reflections: Dict[str, int] = {}
+        # lignes de sys.reflections (dataset_id, type, display_columns, dimensions, measures...)
+        self.reflection_rows: List[Dict] = []
+        self._jobs: Dict[str, Callable[[], List[Dict]]] = {}
+        self._accelerations: Dict[str, Dict] = {}
+        self._jobs_lock = threading.Lock()
+
+    def route(self, method, path, query, body):
+        if path == "/apiv2/login" and method == "POST":
+            return "/apiv2/login", 200, {"token": "bench-token"}
+
+        if path == "/api/v3/catalog" and method == "GET":
+            return "/api/v3/catalog", 200, self.catalog.root()
+
+        if path.startswith("/api/v3/catalog/by-path/"):
+            item_path = [unquote(p) for p in path[len("/api/v3/catalog/by-path/"):].split("/") if p]
+            item = self.catalog.by_path(item_path)
+            return "/api/v3/catalog/by-path", (200 if item else 404), item or {"errorMessage": "not found"}
+
+        if path.startswith("/api/v3/catalog/"):
+            item = self.catalog.by_id(unquote(path[len("/api/v3/catalog/"):]))
+            return "/api/v3/catalog/{id}", (200 if item else 404), item or {"errorMessage": "not found"}
+
+        if path == "/api/v3/sql" and method == "POST":
+            job_id = str(uuid.uuid4())
+            sql = (body or {}).get("sql", "")
+            with self._jobs_lock:
+                self._jobs[job_id] = self._job_rows(sql)
+                reflection = self._chosen_reflection(sql)
+                if reflection is not None:
+                    self._accelerations[job_id] = reflection
+            return "/api/v3/sql", 200, {"id": job_id}
+
+        if path.startswith("/api/v3/job/"):
+            parts = path[len("/api/v3/job/"):].split("/")
+            with self._jobs_lock:
+                rows = self._jobs.get(parts[0])
+            if rows is None:
+                return "/api/v3/job/{id}", 404, {"errorMessage": "unknown job"}
+            if len(parts) > 1 and parts[1] == "results":
+                offset = int(query.get("offset", ["0"])[0])
+                limit = int(query.get("limit", ["100"])[0])
+                all_rows = rows()
+                return "/api/v3/job/{id}/results", 200, {
+                    "rowCount": len(all_rows),
+                    "rows": all_rows[offset:offset + limit],
+                }
+            status = {"jobState": "COMPLETED", "rowCount": len(rows())}
+            with self._jobs_lock:
+                reflection = self._accelerations.get(parts[0])
+            if reflection is not None:
+                status["acceleration"] = {"reflectionRelationships": [{
+                    "datasetId": reflection["dataset_id"],
+                    "reflectionId": reflection.get("reflection_id", reflection["dataset_id"]),
+                    "relationship": "CHOSEN",
+                }]}
+            return "/api/v3/job/{id}", 200, status
+
+        return path, 404, {"errorMessage": "not implemented"}
+
+    def _chosen_reflection(self, sql: str) -> Optional[Dict]:
+        """Réflexion de ``reflection_rows`` substituée au job (requête sans SELECT *)"""
+        if "SELECT *" in " ".join(sql.split()).upper():
+            return None
+        for row in self.reflection_rows:
+            entity = self.catalog.by_id(row["dataset_id"])
+            if entity and quote_path(entity["path"]) in sql:
+                return row
+        return None
+
+    def _job_rows(self, sql: str) -> Callable[[], List[Dict]]:
+        """Résultat (calculé une fois, à la première lecture) d'un job SQL"""
+        cache: List[List[Dict]] = []
+
+        def rows() -> List[Dict]:
+            if not cache:
+                cache.append(self._execute(sql))
+            return cache[0]
+
+        return rows
+
+    def _execute(self, sql: str) -> List[Dict]:
+        normalized = " ".join(sql.split()).upper()
+        if 'INFORMATION_SCHEMA."TABLES"' in normalized:
+            return [
+                {"TABLE_SCHEMA": ".".join(path[:-1]), "TABLE_NAME": path[-1]}
+                for path in map(self.catalog.dataset_path, self.catalog.iter_datasets())
+            ]
+        if 'INFORMATION_SCHEMA."VIEWS"' in normalized:
+            rows = []
+            for index in self.catalog.iter_datasets():
+                if self.catalog.is_view(index):
+                    entity = self.catalog.dataset(index)
+                    rows.append({
+                        "TABLE_SCHEMA": ".".join(entity["path"][:-1]),
+                        "TABLE_NAME": entity["path"][-1],
+                        "VIEW_DEFINITION": entity["sql"],
+                    })
+            return rows
+
+        if "SYS.REFLECTIONS" in normalized:
+            return [
+                {"dataset_id": dataset_id, "record_count": count, "type": "RAW", "status": "CAN_ACCELERATE"}
+                for dataset_id, count in self.reflections.items()
+            ] + [{"status": "CAN_ACCELERATE", **row} for row in self.reflection_rows]
+        if "TABLE_SNAPSHOT(" in normalized:
+            summary = [{"key": "total-records", "value": str(self.rows_per_table)}]
+            return [{"committed_at": "2024-01-01 00:00:00", "operation": "append", "summary": summary}]
+
+        aliases = _ALIAS_RE.findall(sql)
+        if not aliases:
+            return self._sample(sql)
+        if "FROM" not in normalized:
+            return []
+        row = {}
+        for alias in aliases:
+            name = alias.lower()
+            if name in ("row_count", "total_count", "non_null_count"):
+                row[alias] = self.rows_per_table
+            elif name == "distinct_count":
+                row[alias] = self.rows_per_table // 2
+            else:
+                row[alias] = 42
+        return [row]
+
+
+    def _sample(self, sql: str) -> List[Dict]:
+        match = _SAMPLE_RE.match(sql.strip())
+        if not match:
+            return []
+        path = [part.replace('""', '"') for part in re.findall(r'"((?:[^"]|"")+)"', match.group(2))]
+        entity = self.catalog.by_path(path)
+        if not entity or "fields" not in entity:
+            return []
+        types = {field["name"]: field["type"]["name"] for field in entity["fields"]}
+        names = re.findall(r'"((?:[^"]|"")+)"', match.group(1))
+        rows = []
+        for i in range(min(int(match.group(3)), self.rows_per_table)):
+            row = {}
+            for name in names:
+                if i % 10 == 9:
+                    row[name] = None
+                elif types.get(name) in _SAMPLE_NUMERIC_TYPES:
+                    row[name] = i % 7
+                else:
+                    row[name] = f"{name}-{i % 7}"
+            rows.append(row)
+        return rows
+
+
+class MockOpenMetadataServer(_MockServer):
+    """
+    Stand-in des endpoints d'écriture OpenMetadata utilisés par la synchronisation
+
+    Les entités sont acceptées sans validation et reçoivent un id stable par FQN;
+    la version augmente de 0.1 quand les colonnes d'une table changent.
+    L'import CSV vérifie les en-têtes (IMPORT_HEADERS) et refuse les lignes
+    dont le nom est dans ``reject_names``.
+    """
+
+    _ENTITY_PARENTS = {
+        "/v1/databases": "service",
+        "/v1/databaseSchemas": "database",
+        "/v1/tables": "databaseSchema",
+    }
+
+    _ENTITY_KINDS = {
+        "/v1/databases": "database",
+        "/v1/databaseSchemas": "databaseSchema",
+        "/v1/tables": "table",
+    }
+
+    _IMPORT_RE = re.compile(r"^/v1/(databases|databaseSchemas)/name/([^/]+)/import$")
+
+    def __init__(self, reject_names: Optional[Set[str]] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.entities: Dict[str, str] = {}
+        # FQN → {"kind", "parent", "columns", "version"} (listings GET /v1/...)
+        self.records: Dict[str, Dict] = {}
+        self.reject_names: Set[str] = set(reject_names or ())
+        # Dernier profil reçu par id de table
+        self.profiles: Dict[str, Dict] = {}
+        # FQN des tables soft-deleted (absentes des listings)
+        self.deleted: Set[str] = set()
+        self._entities_lock = threading.Lock()
+
+    def _store(self, kind: str, parent: str, fqn: str, columns: Optional[List[Dict]] = None) -> str:
+        with self._entities_lock:
+            entity_id = self.entities.setdefault(fqn, str(uuid.uuid4()))
+            record = self.records.get(fqn)
+            if record is None:
+                self.records[fqn] = {"kind": kind, "parent": parent, "columns": columns or [], "version": 0.1}
+            elif columns is not None and columns != record["columns"]:
+                record["columns"] = columns
+                record["version"] = round(record["version"] + 0.1, 1)
+            self.deleted.discard(fqn)
+        return entity_id
+
+    def route(self, method, path, query, body):
+        if path.startswith("/api/"):
+            path = path[len("/api"):]
+
+        if method == "PUT" and path in self._ENTITY_PARENTS:
+            body = body or {}
+            name = body.get("name", "")
+            if "." in name:
+                name = f'"{name}"'
+            parent = body.get(self._ENTITY_PARENTS[path], '')
+            fqn = f"{parent}.{name}"
+            columns = body.get("columns") if path == "/v1/tables" else None
+            entity_id = self._store(self._ENTITY_KINDS[path], parent, fqn, columns)
+            return path, 200, {"id": entity_id, "name": body.get("name"), "fullyQualifiedName": fqn}
+
+        match = self._IMPORT_RE.match(path)
+        if method == "PUT" and match:
+            dry_run = query.get("dryRun", ["true"])[0] == "true"
+            result = self._import_csv(match.group(1), unquote(match.group(2)), body or "", dry_run)
+            return f"/v1/{match.group(1)}/name/{{fqn}}/import", 200, result
+
+        if method == "GET" and path in self._ENTITY_KINDS:
+            return path, 200, self._list(self._ENTITY_KINDS[path], query)
+
+        if method == "PATCH" and path.startswith("/v1/tables/"):
+            status, payload = self._patch_table(path.rsplit("/", 1)[1], body or [])
+            return "/v1/tables/{id}", status, payload
+
+        if method == "DELETE" and path.startswith("/v1/tables/"):
+            table_id = path.rsplit("/", 1)[1]
+            with self._entities_lock:
+                fqn = next(
+                    (f for f, i in self.entities.items() if i == table_id and self.records[f]["kind"] == "table"),
+                    None,
+                )
+                if fqn:
+                    self.deleted.add(fqn)
+            return "/v1/tables/{id}", 200 if fqn else 404, {"id": table_id}
+
+        if method == "PUT" and path == "/v1/lineage":
+            return path, 200, {}
+
+        if method == "PUT" and path.startswith("/v1/tables/") and path.endswith("/tableProfile"):
+            with self._entities_lock:
+                self.profiles[path.split("/")[3]] = body
+            return "/v1/tables/{id}/tableProfile", 200, body
+
+        if path.startswith("/v1/usage/") or (path.startswith("/v1/tables/") and path.endswith("/joins")):
+            return re.sub(r"/[0-9a-f-]{36}", "/{id}", path), 200, {}
+
+        return path, 404, {"message": "not implemented"}
+
+    def _patch_table(self, table_id: str, operations: List[Dict]) -> Tuple[int, Dict]:
+        """
+        JSON Patch des colonnes d'une table (``test``, ``add``, ``replace``,
+        ``remove`` sous ``/columns``); un ``test`` en échec donne 409
+        """
+        with self._entities_lock:
+            fqn = next(
+                (f for f, i in self.entities.items() if i == table_id and self.records[f]["kind"] == "table"),
+                None,
+            )
+            if fqn is None:
+                return 404, {"message": f"table {table_id} not found"}
+            record = self.records[fqn]
+            columns = [dict(c) for c in record["columns"]]
+            for operation in operations:
+                parts = operation["path"].strip("/").split("/")
+                if parts[0] != "columns" or len(parts) not in (2, 3):
+                    return 400, {"message": f"unsupported path {operation['path']}"}
+                if parts[1] == "-":
+                    if operation["op"] != "add":
+                        return 400, {"message": f"invalid path {operation['path']}"}
+                    columns.append(operation["value"])
+                    continue
+                position = int(parts[1])
+                if position >= len(columns):
+                    return 409, {"message": f"no column at {operation['path']}"}
+                if operation["op"] == "test":
+                    current = columns[position] if len(parts) == 2 else columns[position].get(parts[2])
+                    if current != operation["value"]:
+                        return 409, {"message": f"test failed at {operation['path']}"}
+                elif operation["op"] == "remove" and len(parts) == 2:
+                    del columns[position]
+                elif operation["op"] in ("add", "replace") and len(parts) == 3:
+                    columns[position][parts[2]] = operation["value"]
+                else:
+                    return 400, {"message": f"unsupported operation {operation['op']} {operation['path']}"}
+            if columns != record["columns"]:
+                record["columns"] = columns
+                record["version"] = round(record["version"] + 0.1, 1)
+            return 200, {"id": table_id, "fullyQualifiedName": fqn, "version": record["version"]}
+
+    def _import_csv(self, collection: str, parent_fqn: str, text: str, dry_run: bool) -> Dict:
+        """CsvImportResult d'un import récursif (tables du schéma ou schémas de la database)"""
+        from dremio_connector.core.bulk_import import IMPORT_HEADERS
+
+        reader = csv.DictReader(io.StringIO(text))
+        if reader.fieldnames != IMPORT_HEADERS:
+            return {"dryRun": dry_run, "status": "aborted", "abortReason": "Header mismatch"}
+
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=["status", "details", *IMPORT_HEADERS], lineterminator="\n")
+        writer.writeheader()
+        passed = failed = 0
+        imported: Dict[str, Tuple[str, List[Dict]]] = {}
+        table_fqn = None
+        for row in reader:
+            rejected = row["name*"] in self.reject_names
+            failed += rejected
+            passed += not rejected
+            writer.writerow({"status": "failure" if rejected else "success",
+                             "details": "rejected" if rejected else "Entity created", **row})
+            entity_type = row["entityType*"]
+            if dry_run or rejected:
+                table_fqn = None if entity_type == "table" else table_fqn
+                continue
+            if entity_type in ("table", "databaseSchema"):
+                imported[row["fullyQualifiedName"]] = (entity_type, [])
+                table_fqn = row["fullyQualifiedName"]
+            elif entity_type == "column":
+                # Les colonnes suivent leur table dans le CSV
+                if table_fqn in imported:
+                    imported[table_fqn][1].append({
+                        "name": row["name*"],
+                        "dataType": row["column.dataType"],
+                        "description": row["description"],
+                    })
+
+        for fqn, (entity_type, columns) in imported.items():
+            self._store(entity_type, parent_fqn, fqn, columns if entity_type == "table" else None)
+
+        return {
+            "dryRun": dry_run,
+            "status": "success" if not failed else ("partialSuccess" if passed else "failure"),
+            "numberOfRowsProcessed": passed + failed,
+            "numberOfRowsPassed": passed,
+            "numberOfRowsFailed": failed,
+            "importResultsCsv": output.getvalue(),
+        }
+
+    def _list(self, kind: str, query: Dict[str, List[str]]) -> Dict:
+        """
+        Entités d'un type, par pages (curseur ``after`` = position)
+
+        Filtres ``service``, ``database`` (préfixe du FQN) et ``databaseSchema``
+        (parent); ``fields=columns`` ajoute les colonnes des tables.
+        """
+        service = query.get("service", [None])[0]
+        database = query.get("database", [None])[0]
+        schema_fqn = query.get("databaseSchema", [None])[0]
+        fields = query.get("fields", [""])[0].split(",")
+        limit = int(query.get("limit", ["10"])[0])
+        offset = int(query.get("after", ["0"])[0])
+        with self._entities_lock:
+            matching = sorted(
+                fqn for fqn, record in self.records.items()
+                if record["kind"] == kind and fqn not in self.deleted
+                and (service is None or fqn.startswith(f"{service}."))
+                and (database is None or fqn.startswith(f"{database}."))
+                and (schema_fqn is None or record["parent"] == schema_fqn)
+            )
+            page = []
+            for fqn in matching[offset:offset + limit]:
+                entity = {"id": self.entities[fqn], "fullyQualifiedName": fqn, "version": self.records[fqn]["version"]}
+                if "columns" in fields:
+                    entity["columns"] = list(self.records[fqn]["columns"])
+                page.append(entity)
+        paging = {"total": len(matching)}
+        if offset + limit < len(matching):
+            paging["after"] = str(offset + limit)
+        return {"data": page, "paging": paging}
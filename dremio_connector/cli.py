@@ -0,0 +1,416 @@
+"""
+CLI dremio-connector: synchronisation, découverte et profiling hors Airflow
+
+Sous-commandes:
+    discover   découvre le catalogue Dremio et écrit une ressource par ligne (JSONL)
+    sync       synchronise vers OpenMetadata (modes full, incremental, dry-run)
+    profile    profile les datasets découverts (une ligne JSONL par dataset,
+               poussée vers OpenMetadata avec --push)
+    bench      benchmark contre les serveurs Dremio/OpenMetadata simulés
+
+Chaque sous-commande accepte les mêmes réglages de performance (concurrence,
+limites de débit, retries, filtres include/exclude, répertoire d'état), ce qui
+rend un run reproductible d'une machine à l'autre. Avec ``--snapshot``, le
+premier parcours du catalogue est écrit dans un snapshot (core.snapshot) que
+les sous-commandes suivantes et le connecteur réutilisent tant qu'il est frais.
+
+Usage:
+    dremio-connector discover --dremio-url http://dremio:9047 -o catalog.jsonl
+    dremio-connector sync --mode incremental --concurrency 8 --exclude "scratch*"
+    dremio-connector profile --include "lake.sales.*" --sample-rows 10000
+    dremio-connector profile --push --concurrency 8 -o /dev/null
+    dremio-connector profile --engine sample --sample-rows 50000 --flight-port 32010
+    dremio-connector sync --snapshot && dremio-connector profile --snapshot
+    dremio-connector bench --datasets 10000 --latency-ms 2 --concurrency 8
+
+Les identifiants peuvent venir de l'environnement: DREMIO_URL, DREMIO_USER,
+DREMIO_PASSWORD, OPENMETADATA_URL, OPENMETADATA_JWT_TOKEN.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Sequence, TextIO
+
+from dremio_connector.core import metrics, tracing
+from dremio_connector.core.filters import PathFilter, split_patterns
+from dremio_connector.core.profile_sink import DEFAULT_BATCH_SIZE, DEFAULT_MAX_QUEUE
+from dremio_connector.core.profile_state import DEFAULT_PROFILE_MAX_AGE
+from dremio_connector.core.progress import DEFAULT_INTERVAL, ProgressLogger
+from dremio_connector.core.reconcile import DEFAULT_MAX_DELETE_RATIO
+from dremio_connector.core.row_count import SAMPLE_SOURCES as SAMPLE_ROW_COUNT_SOURCES, SOURCES as ROW_COUNT_SOURCES
+from dremio_connector.core.sample_profiler import ENGINES as PROFILE_ENGINES
+from dremio_connector.core.snapshot import DEFAULT_MAX_AGE, default_snapshot_path
+
+logger = logging.getLogger("dremio_connector.cli")
+
+SYNC_MODES = ("full", "incremental", "dry-run")
+
+# --snapshot sans chemin: snapshot de l'instance dans --state-dir
+AUTO_SNAPSHOT = "auto"
+
+
+def _add_tuning_arguments(parser: argparse.ArgumentParser):
+    """Réglages communes à toutes les sous-commandes"""
+    group = parser.add_argument_group("performance et périmètre")
+    group.add_argument("--concurrency", type=int, default=1,
+                       help="Requêtes Dremio en parallèle (schémas des datasets, profiling)")
+    group.add_argument("--rate-limit", type=float, default=None,
+                       help="Requêtes par seconde vers Dremio (défaut: illimité)")
+    group.add_argument("--om-rate-limit", type=float, default=None,
+                       help="Requêtes par seconde vers OpenMetadata (défaut: illimité)")
+    group.add_argument("--retries", type=int, default=0,
+                       help="Retries des GET Dremio sur timeout/429/5xx")
+    group.add_argument("--include", action="append", default=None, metavar="PATTERN",
+                       help="Motif glob (ou 're:' + regex) sur le path joint par '.' (répétable)")
+    group.add_argument("--exclude", action="append", default=None, metavar="PATTERN",
+                       help="Motif à exclure; un conteneur exclu n'est jamais exploré (répétable)")
+    group.add_argument("--state-dir", default=None,
+                       help="Répertoire des états (incrémental, usage); défaut: tmp système")
+    group.add_argument("--snapshot", nargs="?", const=AUTO_SNAPSHOT, default=None, metavar="PATH",
+                       help="Snapshot de découverte partagé entre les sous-commandes et le connecteur "
+                            "(sans PATH: dans --state-dir)")
+    group.add_argument("--snapshot-max-age", type=float, default=DEFAULT_MAX_AGE, metavar="SECONDS",
+                       help="Âge maximal d'un snapshot réutilisé; au-delà le catalogue est reparcouru")
+
+
+def _add_observability_arguments(parser: argparse.ArgumentParser):
+    group = parser.add_argument_group("observabilité")
+    group.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+    group.add_argument("--progress-interval", type=float, default=DEFAULT_INTERVAL,
+                       help="Secondes entre deux lignes de progression (0 = désactivé)")
+    group.add_argument("--metrics-file", default=None, help="Fichier Prometheus écrit en fin de run")
+    group.add_argument("--metrics-port", type=int, default=None, help="Port de l'endpoint /metrics")
+    group.add_argument("--trace-file", default=None, help="Fichier JSONL des spans")
+
+
+def _add_dremio_arguments(parser: argparse.ArgumentParser):
+    group = parser.add_argument_group("Dremio")
+    group.add_argument("--dremio-url", default=os.environ.get("DREMIO_URL", "http://localhost:9047"))
+    group.add_argument("--dremio-user", default=os.environ.get("DREMIO_USER"))
+    group.add_argument("--dremio-password", default=os.environ.get("DREMIO_PASSWORD"))
+    group.add_argument("--flight-port", type=int, default=os.environ.get("DREMIO_FLIGHT_PORT"),
+                       help="Requêtes SQL en Arrow Flight sur ce port (32010), repli REST si injoignable")
+    group.add_argument("--flight-tls", action="store_true", help="Arrow Flight en TLS (grpc+tls)")
+
+
+def _add_openmetadata_arguments(parser: argparse.ArgumentParser):
+    group = parser.add_argument_group("OpenMetadata")
+    group.add_argument("--openmetadata-url", default=os.environ.get("OPENMETADATA_URL", "http://localhost:8585/api"))
+    group.add_argument("--jwt-token", default=os.environ.get("OPENMETADATA_JWT_TOKEN"))
+    group.add_argument("--service-name", default="dremio")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from dremio_connector.benchmark.harness import build_parser as build_bench_parser
+
+    parser = argparse.ArgumentParser(prog="dremio-connector", description="Connecteur Dremio → OpenMetadata")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    discover = subparsers.add_parser("discover", help="Découvre le catalogue Dremio (JSONL)")
+    _add_dremio_arguments(discover)
+    discover.add_argument("-o", "--output", default="-", help="Fichier JSONL (défaut: stdout)")
+    discover.add_argument("--with-schema", action="store_true", help="Inclure l'entité Dremio brute des datasets")
+    discover.set_defaults(func=cmd_discover)
+
+    sync = subparsers.add_parser("sync", help="Synchronise Dremio vers OpenMetadata")
+    _add_dremio_arguments(sync)
+    _add_openmetadata_arguments(sync)
+    sync.add_argument("--mode", choices=SYNC_MODES, default="full",
+                      help="full: tout réécrire; incremental: tables modifiées seulement; dry-run: aucune écriture")
+    sync.add_argument("--lineage", action="store_true", help="Pousser le lineage des vues")
+    sync.add_argument("--usage", action="store_true", help="Pousser l'usage depuis sys.jobs_recent")
+    sync.add_argument("--reconcile", action="store_true",
+                      help="Soft-delete des tables OpenMetadata dont le dataset Dremio a disparu")
+    sync.add_argument("--max-delete-ratio", type=float, default=DEFAULT_MAX_DELETE_RATIO,
+                      help="Garde-fou: part maximale des tables du service supprimées en un run")
+    sync.add_argument("--delete-rate-limit", type=float, default=None,
+                      help="Suppressions par seconde (défaut: --om-rate-limit)")
+    sync.add_argument("--bulk-import", action="store_true",
+                      help="Écrire schémas et tables par import CSV (dry-run, puis PUT pour les lignes refusées)")
+    sync.add_argument("--prefetch-index", action="store_true",
+                      help="Lister d'abord les entités du service et ne réécrire que les nouvelles ou modifiées")
+    sync.set_defaults(func=cmd_sync)
+
+    profile = subparsers.add_parser("profile", help="Profile les datasets découverts (JSONL)")
+    _add_dremio_arguments(profile)
+    profile.add_argument("-o", "--output", default="-", help="Fichier JSONL (défaut: stdout)")
+    profile.add_argument("--sample-rows", type=int, default=None,
+                         help="Lignes échantillonnées par colonne (moteur sample: par table, défaut 10000)")
+    profile.add_argument("--engine", choices=PROFILE_ENGINES, default="sql",
+                         help="sql: une requête d'agrégats par colonne dans Dremio; "
+                              "sample: un échantillon par table, métriques calculées localement (NumPy)")
+    profile.add_argument("--row-count-sources", default=None,
+                         help="Sources du nombre de lignes, dans l'ordre (COUNT(*) = count; défaut: "
+                              f"{','.join(ROW_COUNT_SOURCES)}, moteur sample: {','.join(SAMPLE_ROW_COUNT_SOURCES)})")
+    profile.add_argument("--no-reflection-routing", dest="reflection_routing", action="store_false",
+                         help="Ne pas mettre en forme les requêtes des colonnes couvertes par une réflexion")
+    profile.add_argument("--incremental", action="store_true",
+                         help="Réutiliser les agrégats des datasets inchangés (tag Dremio et nombre de lignes)")
+    profile.add_argument("--profile-max-age", type=float, default=DEFAULT_PROFILE_MAX_AGE, metavar="SECONDS",
+                         help="Âge maximal d'un profil réutilisé en incrémental")
+    _add_openmetadata_arguments(profile)
+    profile.add_argument("--push", action="store_true",
+                         help="Pousser les profils vers OpenMetadata (lots concurrents, spool si indisponible)")
+    profile.add_argument("--push-batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                         help="Profils écrits par lot")
+    profile.add_argument("--push-queue-size", type=int, default=DEFAULT_MAX_QUEUE,
+                         help="Profils en attente d'écriture au maximum (le profiling attend au-delà)")
+    profile.set_defaults(func=cmd_profile)
+
+    bench = subparsers.add_parser(
+        "bench", parents=[build_bench_parser(add_help=False)],
+        help="Benchmark contre les serveurs simulés",
+    )
+    bench.add_argument("--mode", choices=SYNC_MODES, default="full", help="Mode du scénario sync")
+    bench.set_defaults(func=cmd_bench)
+
+    for subparser in (discover, sync, profile, bench):
+        _add_tuning_arguments(subparser)
+        _add_observability_arguments(subparser)
+    return parser
+
+
+@contextmanager
+def _open_output(path: str) -> Iterator[TextIO]:
+    if path == "-":
+        yield sys.stdout
+        sys.stdout.flush()
+    else:
+        with open(path, "w", encoding="utf-8") as f:
+            yield f
+
+
+@contextmanager
+def _observability(args: argparse.Namespace) -> Iterator[None]:
+    """Endpoint/fichier de métriques et traces demandés sur la ligne de commande"""
+    server = metrics.start_metrics_server(args.metrics_port) if args.metrics_port else None
+    exporter = tracing.FileSpanExporter(args.trace_file) if args.trace_file else None
+    previous = tracing.get_tracer()
+    if exporter:
+        tracing.configure_tracing(exporter)
+    try:
+        yield
+    finally:
+        if exporter:
+            tracing.set_tracer(previous)
+            exporter.shutdown()
+        if args.metrics_file:
+            metrics.write_textfile(args.metrics_file)
+        if server:
+            server.shutdown()
+
+
+def _discovery_client(args: argparse.Namespace):
+    from dremio_connector.core.sync_engine import DremioAutoDiscovery
+
+    return DremioAutoDiscovery(
+        args.dremio_url,
+        args.dremio_user,
+        args.dremio_password,
+        max_retries=args.retries,
+        progress_interval=args.progress_interval,
+        max_workers=args.concurrency,
+        rate_limit=args.rate_limit,
+        path_filter=PathFilter(args.include, args.exclude),
+        flight_port=args.flight_port,
+        flight_tls=args.flight_tls,
+    )
+
+
+def _snapshot_path(args: argparse.Namespace) -> Optional[str]:
+    if args.snapshot == AUTO_SNAPSHOT:
+        return str(default_snapshot_path(args.dremio_url, args.state_dir))
+    return args.snapshot
+
+
+def _discover(args: argparse.Namespace):
+    """Client authentifié et ressources filtrées, None si l'authentification échoue"""
+    client = _discovery_client(args)
+    if not client.authenticate():
+        return None, []
+    snapshot_path = _snapshot_path(args)
+    if not snapshot_path:
+        return client, client.discover_all_resources()
+    snapshot = client.discover_snapshot(snapshot_path, max_age=args.snapshot_max_age)
+    return client, snapshot.resources(client.path_filter) if snapshot is not None else []
+
+
+def cmd_discover(args: argparse.Namespace) -> int:
+    client, resources = _discover(args)
+    if client is None:
+        return 1
+    with _open_output(args.output) as out:
+        for resource in resources:
+            if not args.with_schema:
+                resource = {k: v for k, v in resource.items() if k != "schema"}
+            out.write(json.dumps(resource, default=str) + "\n")
+    logger.info(f"✅ {len(resources)} ressources écrites")
+    return 0
+
+
+def cmd_sync(args: argparse.Namespace) -> int:
+    from dremio_connector.core.sync_engine import DremioOpenMetadataSync
+
+    sync = DremioOpenMetadataSync(
+        dremio_url=args.dremio_url,
+        dremio_user=args.dremio_user,
+        dremio_password=args.dremio_password,
+        openmetadata_url=args.openmetadata_url,
+        jwt_token=args.jwt_token,
+        service_name=args.service_name,
+        state_dir=args.state_dir,
+        max_retries=args.retries,
+        progress_interval=args.progress_interval,
+        max_workers=args.concurrency,
+        rate_limit=args.rate_limit,
+        om_rate_limit=args.om_rate_limit,
+        include=args.include,
+        exclude=args.exclude,
+        snapshot_path=_snapshot_path(args),
+        snapshot_max_age=args.snapshot_max_age,
+        bulk_import=args.bulk_import,
+        max_delete_ratio=args.max_delete_ratio,
+        delete_rate_limit=args.delete_rate_limit,
+        prefetch_index=args.prefetch_index,
+        flight_port=args.flight_port,
+        flight_tls=args.flight_tls,
+    )
+    result = sync.sync(
+        lineage=args.lineage,
+        usage=args.usage,
+        incremental=args.mode == "incremental",
+        dry_run=args.mode == "dry-run",
+        reconcile=args.reconcile,
+    )
+    print(json.dumps(result, indent=2, default=str))
+    failed = "error" in result or result.get("errors") or result.get("reconcile_aborted")
+    return 1 if failed else 0
+
+
+def _profile_sink(args: argparse.Namespace):
+    """
+    ProfileSink démarré vers OpenMetadata (spool dans --state-dir) et
+    FQN → id des tables du service; (None, {}) si le listing échoue
+    """
+    from dremio_connector.core.profile_sink import ProfileSink, default_spool_path
+    from dremio_connector.core.sync_engine import OpenMetadataSyncEngine
+
+    engine = OpenMetadataSyncEngine(args.openmetadata_url, args.jwt_token, args.service_name, rate_limit=args.om_rate_limit)
+    table_ids = engine.list_service_tables()
+    if table_ids is None:
+        logger.error(f"❌ Tables du service {args.service_name} illisibles dans OpenMetadata")
+        return None, {}
+    sink = ProfileSink(
+        engine.put_table_profile,
+        default_spool_path(args.openmetadata_url, args.service_name, args.state_dir),
+        batch_size=args.push_batch_size,
+        max_queue=args.push_queue_size,
+        max_workers=args.concurrency,
+    )
+    return sink.start(), table_ids
+
+
+def cmd_profile(args: argparse.Namespace) -> int:
+    from dremio_connector.core.profile_state import ProfileState, dataset_tag
+    from dremio_connector.core.profiler import profile_dataset, table_profile_payload
+    from dremio_connector.core.reflections import ReflectionIndex
+    from dremio_connector.core.row_count import RowCountResolver
+    from dremio_connector.core.sample_profiler import DEFAULT_SAMPLE_ROWS, profile_dataset_sample
+    from dremio_connector.core.sync_engine import build_fqn, split_dataset_path
+
+    client, resources = _discover(args)
+    if client is None:
+        return 1
+    sink, table_ids = _profile_sink(args) if args.push else (None, {})
+    if args.push and sink is None:
+        return 1
+    datasets = [r for r in resources if r.get("type") == "dataset" and r.get("columns")]
+    progress = ProgressLogger(logger, "Profiling", total=len(datasets), interval=args.progress_interval)
+    state = ProfileState(args.dremio_url, args.state_dir).load() if args.incremental else None
+    reflections = ReflectionIndex(client, routing=args.reflection_routing)
+    if args.row_count_sources:
+        row_count_sources = split_patterns(args.row_count_sources)
+    else:
+        # Le moteur sample ne lance pas de COUNT(*) sauf demande explicite
+        row_count_sources = SAMPLE_ROW_COUNT_SOURCES if args.engine == "sample" else ROW_COUNT_SOURCES
+    row_counts = RowCountResolver(client, row_count_sources, reflections=reflections)
+    reused = 0
+    # Le moteur sample tire toujours un échantillon borné
+    sample_rows = args.sample_rows or (DEFAULT_SAMPLE_ROWS if args.engine == "sample" else None)
+
+    def profile(resource: Dict) -> Dict:
+        previous = None
+        if state is not None:
+            tag = dataset_tag(resource.get("schema"))
+            previous = state.previous(resource["path"], tag, sample_rows, args.profile_max_age)
+        if args.engine == "sample":
+            return profile_dataset_sample(
+                client, resource["path"], resource["columns"], sample_rows, previous,
+                row_counts=row_counts, entity=resource.get("schema"),
+            )
+        return profile_dataset(
+            client, resource["path"], resource["columns"], sample_rows, previous,
+            row_counts=row_counts, entity=resource.get("schema"), reflections=reflections,
+        )
+
+    try:
+        with _open_output(args.output) as out, ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+            for resource, result in zip(datasets, executor.map(profile, datasets)):
+                out.write(json.dumps(result, default=str) + "\n")
+                if state is not None and result["reused"]:
+                    reused += 1
+                elif state is not None:
+                    tag = dataset_tag(resource.get("schema"))
+                    state.record(result["path"], tag, sample_rows, result["row_count"], result["columns"])
+                table_id = table_ids.get(build_fqn(args.service_name, *split_dataset_path(result["path"])))
+                if sink is not None and table_id:
+                    timestamp = int(time.time() * 1000)
+                    sink.put(table_id, table_profile_payload(result, timestamp, len(resource["columns"])))
+                progress.advance(item=".".join(result["path"]))
+    finally:
+        if sink is not None:
+            stats = sink.close()
+            logger.info(
+                f"📤 Profils OpenMetadata: {stats['written']} écrits, {stats['spooled']} dans le spool, "
+                f"{stats['rejected']} refusés, {stats['replayed']} rejoués"
+            )
+    progress.finish()
+    logger.info(f"🔢 Nombres de lignes par source: {row_counts.stats}")
+    if reflections.hit_rate() is not None:
+        logger.info(f"⚡ {reflections.summary()}")
+    if state is not None:
+        logger.info(f"♻️  {reused}/{len(datasets)} profils réutilisés (datasets inchangés)")
+        state.save()
+    return 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    from dremio_connector.benchmark.harness import format_report, run_from_args
+
+    report = run_from_args(args)
+    print(format_report(report))
+    if args.json_output:
+        with open(args.json_output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=str)
+    return 0
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        stream=sys.stderr,
+    )
+    with _observability(args):
+        return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,54 @@
 """Core module for Dremio connector functionality."""
 
-from dremio_connector.core.sync_engine import (
-    DremioOpenMetadataSync,
-    DremioAutoDiscovery,
-    OpenMetadataSyncEngine,
-    sync_dremio_to_openmetadata
-)
-
-__all__ = [
-    "DremioOpenMetadataSync",
-    "DremioAutoDiscovery",
-    "OpenMetadataSyncEngine",
-    "sync_dremio_to_openmetadata"
-]
+import importlib
+from typing import TYPE_CHECKING
+
+# Exports chargés au premier accès (PEP 562), comme dans dremio_connector:
+# importer un sous-module (progress, metrics...) ne charge pas les autres.
+_EXPORTS = {
+    "DremioOpenMetadataSync": "dremio_connector.core.sync_engine",
+    "DremioAutoDiscovery": "dremio_connector.core.sync_engine",
+    "OpenMetadataSyncEngine": "dremio_connector.core.sync_engine",
+    "sync_dremio_to_openmetadata": "dremio_connector.core.sync_engine",
+    "DbtArtifactCache": "dremio_connector.core.dbt_cache",
+    "DbtIndex": "dremio_connector.core.dbt_cache",
+    "load_dbt_index": "dremio_connector.core.dbt_cache",
+    "ViewLineageExtractor": "dremio_connector.core.lineage",
+    "ColumnLineageResolver": "dremio_connector.core.lineage",
+    "SqlParseCache": "dremio_connector.core.lineage",
+    "collect_view_definitions": "dremio_connector.core.lineage",
+    "UsageAggregator": "dremio_connector.core.usage",
+    "UsageIngestion": "dremio_connector.core.usage",
+    "UsageState": "dremio_connector.core.usage",
+}
+
+__all__ = list(_EXPORTS)
+
+if TYPE_CHECKING:
+    from dremio_connector.core.sync_engine import (
+        DremioOpenMetadataSync,
+        DremioAutoDiscovery,
+        OpenMetadataSyncEngine,
+        sync_dremio_to_openmetadata
+    )
+    from dremio_connector.core.dbt_cache import DbtArtifactCache, DbtIndex, load_dbt_index
+    from dremio_connector.core.lineage import (
+        ColumnLineageResolver,
+        SqlParseCache,
+        ViewLineageExtractor,
+        collect_view_definitions,
+    )
+    from dremio_connector.core.usage import UsageAggregator, UsageIngestion, UsageState
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
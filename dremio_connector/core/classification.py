@@ -0,0 +1,28 @@
+"""
+Auto-classification des colonnes par motifs de nom
+
+Règles utilisées par ``DremioConnector.get_column_tag_labels``: une colonne
+reçoit le tag d'une catégorie dès que son nom (en minuscules) contient l'un
+des motifs de la catégorie. Module sans dépendance OpenMetadata, pour pouvoir
+être réutilisé et mesuré hors du framework d'ingestion.
+"""
+
+from typing import List, Tuple
+
+# (tag FQN, motifs recherchés dans le nom de colonne en minuscules)
+CLASSIFICATION_RULES: List[Tuple[str, Tuple[str, ...]]] = [
+    ("PII.Email", ("email", "mail", "e_mail", "courriel")),
+    ("PII.Phone", ("phone", "tel", "telephone", "mobile", "cell")),
+    ("PII.Name", ("name", "nom", "prenom", "firstname", "lastname", "fullname")),
+    ("PII.Address", ("address", "adresse", "street", "city", "ville", "zip", "postal", "country", "pays")),
+    ("PII.ID", ("ssn", "social_security", "passport", "license", "licence")),
+    ("Sensitive.Credential", ("password", "passwd", "pwd", "token", "secret", "key", "credential")),
+    ("Financial.CreditCard", ("credit_card", "creditcard", "cc_number", "card_number", "carte_credit")),
+    ("Financial.BankAccount", ("account", "iban", "swift", "routing", "bank_account", "compte_bancaire")),
+]
+
+
+def classify_column_name(column_name: str) -> List[str]:
+    """Retourne les tag FQN détectés pour un nom de colonne (dans l'ordre des règles)"""
+    name = column_name.lower()
+    return [tag_fqn for tag_fqn, patterns in CLASSIFICATION_RULES if any(p in name for p in patterns)]
@@ -0,0 +1,70 @@
+"""
+Mise à jour des colonnes d'une table par JSON Patch (RFC 6902)
+
+Quand seules quelques colonnes d'une table changent (type, longueur,
+description), le PUT renvoie toute la table avec toutes ses colonnes et crée
+une version complète. À partir du dernier état connu (colonnes listées par
+l'index, voir core.entity_index), seul le delta est envoyé:
+
+    PATCH /v1/tables/{id}    (Content-Type: application/json-patch+json)
+
+Chaque colonne modifiée est précédée d'une opération ``test`` sur son nom:
+si la table a changé entre-temps côté OpenMetadata, le serveur refuse le
+patch et la table est réécrite par PUT.
+
+Les champs absents du nouvel état ne sont jamais retirés (une description
+saisie dans OpenMetadata est conservée, comme avec le PUT).
+"""
+
+from typing import Dict, List, Optional
+
+# Champs de colonne comparés et patchés (ceux envoyés par la découverte)
+PATCH_FIELDS = ("dataType", "dataLength", "description")
+
+PATCH_CONTENT_TYPE = "application/json-patch+json"
+
+
+def compact_columns(columns: List[Dict]) -> List[Dict]:
+    """Nom et champs patchables des colonnes (état connu gardé par l'index)"""
+    return [
+        {key: column[key] for key in ("name", *PATCH_FIELDS) if column.get(key) not in (None, "")}
+        for column in columns
+    ]
+
+
+def column_patch(old: List[Dict], new: List[Dict]) -> Optional[List[Dict]]:
+    """
+    Opérations JSON Patch qui amènent les colonnes ``old`` à ``new``
+
+    Les colonnes sont appariées par position. Ajouts et suppressions en fin
+    de liste sont patchés; une colonne renommée ou déplacée rend le patch
+    par position ambigu.
+
+    Returns:
+        Optional[List[Dict]]: opérations (vide si rien à changer), ou None
+        si la table doit être réécrite par PUT
+    """
+    common = min(len(old), len(new))
+    if any(old[i].get("name") != new[i].get("name") for i in range(common)):
+        return None
+
+    operations = []
+    for i in range(common):
+        changes = []
+        for field in PATCH_FIELDS:
+            after = new[i].get(field)
+            if after in (None, "") or old[i].get(field) == after:
+                continue
+            op = "replace" if old[i].get(field) not in (None, "") else "add"
+            changes.append({"op": op, "path": f"/columns/{i}/{field}", "value": after})
+        if changes:
+            operations.append({"op": "test", "path": f"/columns/{i}/name", "value": old[i]["name"]})
+            operations.extend(changes)
+
+    for column in new[common:]:
+        operations.append({"op": "add", "path": "/columns/-", "value": column})
+    # Suppressions depuis la fin: les positions précédentes restent valides
+    for i in reversed(range(common, len(old))):
+        operations.append({"op": "test", "path": f"/columns/{i}/name", "value": old[i]["name"]})
+        operations.append({"op": "remove", "path": f"/columns/{i}"})
+    return operations
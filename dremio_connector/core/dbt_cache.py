@@ -0,0 +1,350 @@
+"""
+Cache disque des artefacts dbt (catalog.json, manifest.json, run_results.json)
+
+Chaque ingestion relisait et re-parsait les trois fichiers JSON dbt, même quand
+dbt n'avait pas été relancé. Ce module construit une vue indexée des artefacts
+(modèles par nom, descriptions, tags, documentation des colonnes) et la sérialise
+dans un fichier JSON.
+
+Le cache est indexé par artefact sur:
+- le chemin absolu du fichier
+- mtime (ns) et taille
+- le hash SHA-256 du contenu
+
+Un run "à chaud" ne fait qu'un ``stat()`` par artefact puis charge l'index
+pré-calculé. Le hash n'est recalculé que si mtime/taille ont changé: un fichier
+simplement "touché" (contenu identique) ne déclenche donc pas de re-parsing.
+
+Format du fichier: une ligne JSON d'en-tête (version + empreintes) suivie d'une
+ligne JSON de payload (l'index). La validation ne lit que l'en-tête. Le cache
+est relu depuis un répertoire partagé (tmp système par défaut): il reste en
+JSON, jamais en pickle, pour qu'un fichier déposé par un tiers ne puisse pas
+exécuter de code au chargement.
+
+Usage:
+    from dremio_connector.core.dbt_cache import DbtArtifactCache
+
+    cache = DbtArtifactCache(
+        cache_path="/var/cache/dremio_connector/dbt_index.json",
+        catalog_path="target/catalog.json",
+        manifest_path="target/manifest.json",
+        run_results_path="target/run_results.json",
+    )
+    index = cache.load()
+    model = index.lookup("customers")
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+CACHE_FORMAT_VERSION = 2
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class DbtIndex:
+    """
+    Vue indexée des artefacts dbt
+
+    Chaque modèle est stocké sous la forme d'un dict:
+        {
+            "unique_id": str,
+            "name": str,
+            "database": str,
+            "schema": str,
+            "description": str,
+            "tags": List[str],
+            "columns": Dict[str, str] (nom de colonne en minuscules → description),
+            "materialized": str,
+            "run_status": str (optionnel, issu de run_results.json)
+        }
+
+    Les modèles sont indexés par nom en minuscules. En cas de doublon, le premier
+    modèle rencontré dans le manifest est conservé.
+    """
+
+    def __init__(self, models: Optional[Dict[str, Dict]] = None):
+        self.models: Dict[str, Dict] = models or {}
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def lookup(self, table_name: str) -> Optional[Dict]:
+        """Retourne le modèle dbt correspondant à un nom de table Dremio"""
+        if not table_name:
+            return None
+        return self.models.get(table_name.lower())
+
+    def tags(self) -> List[str]:
+        """Tags dbt distincts de tous les modèles, triés"""
+        return sorted({tag for model in self.models.values() for tag in model.get("tags", [])})
+
+    @classmethod
+    def from_artifacts(
+        cls,
+        catalog: Optional[Dict] = None,
+        manifest: Optional[Dict] = None,
+        run_results: Optional[Dict] = None,
+    ) -> "DbtIndex":
+        """Construit l'index à partir des artefacts dbt déjà parsés"""
+        run_status: Dict[str, str] = {}
+        for result in (run_results or {}).get("results", []):
+            unique_id = result.get("unique_id")
+            if unique_id:
+                run_status[unique_id] = result.get("status", "")
+
+        catalog_nodes = (catalog or {}).get("nodes", {})
+
+        models: Dict[str, Dict] = {}
+        for node_id, node_data in (manifest or {}).get("nodes", {}).items():
+            if node_data.get("resource_type") != "model":
+                continue
+
+            name = node_data.get("name", "")
+            key = name.lower()
+            if not key or key in models:
+                continue
+
+            # Documentation du manifest, complétée par les commentaires du catalog
+            columns: Dict[str, str] = {}
+            for col_name, col_data in node_data.get("columns", {}).items():
+                description = (col_data or {}).get("description") or ""
+                if description:
+                    columns[col_name.lower()] = description
+
+            catalog_columns = catalog_nodes.get(node_id, {}).get("columns", {})
+            for col_name, col_data in catalog_columns.items():
+                comment = (col_data or {}).get("comment") or ""
+                if comment and col_name.lower() not in columns:
+                    columns[col_name.lower()] = comment
+
+            config = node_data.get("config", {}) or {}
+            model = {
+                "unique_id": node_id,
+                "name": name,
+                "database": node_data.get("database", ""),
+                "schema": node_data.get("schema", ""),
+                "description": node_data.get("description", "") or "",
+                "tags": list(node_data.get("tags", []) or []),
+                "columns": columns,
+                "materialized": config.get("materialized", ""),
+            }
+            if node_id in run_status:
+                model["run_status"] = run_status[node_id]
+
+            models[key] = model
+
+        return cls(models)
+
+
+class DbtArtifactCache:
+    """
+    Cache disque de l'index dbt, invalidé sur changement des artefacts
+
+    Clé par artefact: (chemin, mtime_ns, taille, sha256). Les artefacts absents
+    ou non configurés ont une empreinte ``None``.
+    """
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        catalog_path: Optional[str] = None,
+        manifest_path: Optional[str] = None,
+        run_results_path: Optional[str] = None,
+    ):
+        self.artifact_paths = {
+            "catalog": catalog_path,
+            "manifest": manifest_path,
+            "run_results": run_results_path,
+        }
+        self.cache_path = Path(cache_path) if cache_path else self.default_cache_path()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def default_cache_path(self) -> Path:
+        """Chemin par défaut: un fichier par combinaison d'artefacts dans le tmp système"""
+        key = "|".join(
+            str(Path(p).resolve()) if p else "" for p in self.artifact_paths.values()
+        )
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        return Path(tempfile.gettempdir()) / "dremio_connector" / f"dbt_index_{digest}.json"
+
+    def load(self) -> DbtIndex:
+        """Retourne l'index dbt, depuis le cache si les artefacts n'ont pas changé"""
+        stats = {name: self._stat(path) for name, path in self.artifact_paths.items()}
+
+        header = self._read_header()
+        if header is not None:
+            fingerprints = self._validate(header.get("fingerprints", {}), stats)
+            if fingerprints is not None:
+                index = self._read_payload()
+                if index is not None:
+                    self.stats["hits"] += 1
+                    logger.info(f"⚡ Index dbt chargé depuis le cache: {self.cache_path} ({len(index)} modèles)")
+                    if fingerprints != header.get("fingerprints"):
+                        # Artefacts "touchés" sans changement de contenu: rafraîchir la clé
+                        self._write(fingerprints, index)
+                    return index
+
+        self.stats["misses"] += 1
+        fingerprints = {
+            name: self._fingerprint(self.artifact_paths[name], stat)
+            for name, stat in stats.items()
+        }
+        index = DbtIndex.from_artifacts(
+            catalog=self._load_json_artifact("catalog"),
+            manifest=self._load_json_artifact("manifest"),
+            run_results=self._load_json_artifact("run_results"),
+        )
+        self._write(fingerprints, index)
+        return index
+
+    def _stat(self, path: Optional[str]) -> Optional[os.stat_result]:
+        if not path:
+            return None
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
+    def _fingerprint(self, path: Optional[str], stat: Optional[os.stat_result]) -> Optional[Dict]:
+        if not path or stat is None:
+            return None
+        return {
+            "path": str(Path(path).resolve()),
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": self._hash_file(path),
+        }
+
+    def _hash_file(self, path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _validate(self, cached: Dict, stats: Dict) -> Optional[Dict]:
+        """
+        Compare les empreintes en cache à l'état courant des artefacts
+
+        Returns:
+            Les empreintes à jour si le cache est valide, None sinon
+        """
+        current = {}
+        for name, stat in stats.items():
+            path = self.artifact_paths[name]
+            entry = cached.get(name)
+
+            if stat is None or not path:
+                if entry is not None:
+                    return None
+                current[name] = None
+                continue
+
+            if entry is None or entry.get("path") != str(Path(path).resolve()):
+                return None
+
+            if entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+                current[name] = entry
+                continue
+
+            if entry.get("size") != stat.st_size:
+                return None
+
+            # mtime changé, même taille: seul le hash du contenu tranche
+            sha256 = self._hash_file(path)
+            if sha256 != entry.get("sha256"):
+                return None
+            current[name] = {**entry, "mtime_ns": stat.st_mtime_ns}
+
+        return current
+
+    def _read_header(self) -> Optional[Dict]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                header = json.loads(f.readline())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Cache dbt illisible {self.cache_path}: {e}")
+            return None
+
+        if not isinstance(header, dict) or header.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        return header
+
+    def _read_payload(self) -> Optional[DbtIndex]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                f.readline()  # en-tête
+                models = json.loads(f.readline())
+            if not isinstance(models, dict):
+                return None
+            return DbtIndex(models)
+        except Exception as e:
+            logger.debug(f"Payload du cache dbt illisible {self.cache_path}: {e}")
+            return None
+
+    def _write(self, fingerprints: Dict, index: DbtIndex):
+        """Écriture atomique (fichier temporaire + rename)"""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=str(self.cache_path.parent), prefix=".dbt_index_", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"version": CACHE_FORMAT_VERSION, "fingerprints": fingerprints}) + "\n")
+                f.write(json.dumps(index.models) + "\n")
+            os.replace(tmp_path, self.cache_path)
+            logger.debug(f"Cache dbt écrit: {self.cache_path}")
+        except Exception as e:
+            logger.warning(f"⚠️  Impossible d'écrire le cache dbt {self.cache_path}: {e}")
+
+    def _load_json_artifact(self, name: str) -> Optional[Dict]:
+        """Charge un artefact dbt JSON (catalog, manifest ou run_results)"""
+        path = self.artifact_paths.get(name)
+        if not path:
+            return None
+
+        label = {"catalog": "catalog", "manifest": "manifest", "run_results": "run results"}[name]
+        try:
+            artifact_file = Path(path)
+            if not artifact_file.exists():
+                logger.warning(f"⚠️  DBT {label} not found: {path}")
+                return None
+
+            logger.info(f"📖 Loading DBT {label} from: {path}")
+            with open(artifact_file, "r", encoding="utf-8") as f:
+                artifact = json.load(f)
+
+            if name == "run_results":
+                logger.info(f"✅ DBT run results loaded: {len(artifact.get('results', []))} results")
+            else:
+                logger.info(f"✅ DBT {label} loaded: {len(artifact.get('nodes', {}))} nodes")
+            return artifact
+        except Exception as e:
+            logger.error(f"❌ Error loading DBT {label}: {e}")
+            return None
+
+
+def load_dbt_index(
+    catalog_path: Optional[str] = None,
+    manifest_path: Optional[str] = None,
+    run_results_path: Optional[str] = None,
+    cache_path: Optional[str] = None,
+) -> DbtIndex:
+    """Fonction helper: charge l'index dbt en passant par le cache disque"""
+    cache = DbtArtifactCache(
+        cache_path=cache_path,
+        catalog_path=catalog_path,
+        manifest_path=manifest_path,
+        run_results_path=run_results_path,
+    )
+    return cache.load()
@@ -0,0 +1,134 @@
+"""
+Index local des entités OpenMetadata existantes d'un service
+
+Avant les écritures, les databases, schémas et tables du service sont listés
+par pages (curseur ``after``) avec un jeu de champs minimal: id, FQN et
+version, plus les colonnes des tables pour en calculer l'empreinte. Les
+listings de chaque database partent en parallèle.
+
+OpenMetadataSyncEngine consulte ensuite l'index pour décider, sans aucun GET
+par entité:
+- ``create``: l'entité n'existe pas
+- ``update``: la table existe mais ses colonnes ont changé
+- ``skip``: l'entité existe à l'identique, aucune écriture
+
+Pour les tables, les colonnes listées sont gardées sous forme compacte (nom
+et champs patchables): c'est le dernier état connu à partir duquel une mise
+à jour ne PATCHe que le delta (voir core.column_patch).
+
+Un listing en échec laisse simplement l'index incomplet: les entités
+manquantes sont écrites (PUT idempotent), jamais sautées à tort.
+"""
+
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+from dremio_connector.core.column_patch import compact_columns
+
+logger = logging.getLogger(__name__)
+
+CREATE = "create"
+UPDATE = "update"
+SKIP = "skip"
+
+
+def column_checksum(columns: List[Dict]) -> str:
+    """
+    Empreinte des colonnes (nom, type, description), comparable entre le
+    payload envoyé et les colonnes renvoyées par OpenMetadata
+    """
+    payload = json.dumps(
+        [[c.get("name"), str(c.get("dataType", "")).upper(), c.get("description") or ""] for c in columns],
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class EntityIndex:
+    """
+    FQN → (id, version) des databases et schémas, FQN → (id, version,
+    empreinte des colonnes) des tables, et FQN → colonnes compactes des tables
+    """
+
+    def __init__(self):
+        self.databases: Dict[str, Tuple[str, float]] = {}
+        self.schemas: Dict[str, Tuple[str, float]] = {}
+        self.tables: Dict[str, Tuple[str, float, str]] = {}
+        self.columns: Dict[str, List[Dict]] = {}
+        self.complete = True
+
+    @classmethod
+    def build(cls, engine, max_workers: int = 4) -> "EntityIndex":
+        """
+        Liste les entités du service de ``engine`` (OpenMetadataSyncEngine)
+
+        Les databases d'abord (une liste paginée), puis schémas et tables de
+        chaque database en parallèle sur ``max_workers`` threads.
+        """
+        index = cls()
+        databases = engine.list_entities("databases", {"service": engine.service_name})
+        if databases is None:
+            index.complete = False
+            return index
+        index.add_entities(index.databases, databases)
+
+        fqns = list(index.databases)
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            schema_pages = [
+                executor.submit(engine.list_entities, "databaseSchemas", {"database": fqn}) for fqn in fqns
+            ]
+            table_pages = [
+                executor.submit(engine.list_entities, "tables", {"database": fqn, "fields": "columns"})
+                for fqn in fqns
+            ]
+            for future in schema_pages:
+                index.add_entities(index.schemas, future.result())
+            for future in table_pages:
+                index.add_tables(future.result())
+
+        logger.info(
+            f"🗂️  Index OpenMetadata: {len(index.databases)} databases, {len(index.schemas)} schemas, "
+            f"{len(index.tables)} tables"
+            + ("" if index.complete else " (incomplet)")
+        )
+        return index
+
+    def add_entities(self, target: Dict[str, Tuple[str, float]], entities: Optional[List[Dict]]):
+        if entities is None:
+            self.complete = False
+            return
+        for entity in entities:
+            if entity.get("fullyQualifiedName") and entity.get("id"):
+                target[entity["fullyQualifiedName"]] = (entity["id"], entity.get("version", 0.0))
+
+    def add_tables(self, tables: Optional[List[Dict]]):
+        if tables is None:
+            self.complete = False
+            return
+        for table in tables:
+            if table.get("fullyQualifiedName") and table.get("id"):
+                columns = table.get("columns") or []
+                self.tables[table["fullyQualifiedName"]] = (
+                    table["id"],
+                    table.get("version", 0.0),
+                    column_checksum(columns),
+                )
+                self.columns[table["fullyQualifiedName"]] = compact_columns(columns)
+
+    def decide(self, table_fqn: str, columns: List[Dict]) -> str:
+        """create, update ou skip pour une table et ses colonnes"""
+        entry = self.tables.get(table_fqn)
+        if entry is None:
+            return CREATE
+        return SKIP if entry[2] == column_checksum(columns) else UPDATE
+
+    def table_id(self, table_fqn: str) -> Optional[str]:
+        entry = self.tables.get(table_fqn)
+        return entry[0] if entry else None
+
+    def __len__(self) -> int:
+        return len(self.databases) + len(self.schemas) + len(self.tables)
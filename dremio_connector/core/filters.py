@@ -0,0 +1,138 @@
+"""
+Filtres include/exclude sur les paths Dremio, évalués pendant la découverte
+
+Un motif s'applique au path joint par "." (``source.folder.table``), sans
+tenir compte de la casse:
+- glob par défaut: ``lake.sales.*``, ``scratch*``, ``*.tmp_*``
+- regex avec le préfixe ``re:``: ``re:^(dev|test)_.*``
+
+Les motifs sont évalués sur les préfixes du path: un motif qui correspond à
+un conteneur couvre tout son sous-arbre. Ainsi ``--exclude scratch`` écarte
+la source ``scratch`` et tous ses datasets, et ``--include lake.sales``
+garde tout ce qui est sous ``lake.sales``.
+
+Pendant la découverte, ``PathFilter.explore`` décide si un conteneur doit
+être ouvert: un conteneur exclu, ou qui ne peut mener à aucun motif include,
+n'est jamais listé et les schémas de ses datasets ne sont jamais demandés.
+
+Usage:
+    path_filter = PathFilter(include=["lake.*"], exclude=["scratch*", "re:.*\\.tmp_.*"])
+    path_filter.explore(["scratch_alice"])        # False: sous-arbre élagué
+    path_filter.accept(["lake", "sales", "orders"])  # True
+"""
+
+import fnmatch
+import re
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# Préfixe des motifs regex (les autres sont des globs)
+REGEX_PREFIX = "re:"
+
+_WILDCARDS = re.compile(r"[*?\[]")
+
+
+class PathRule:
+    """Motif compilé (glob ou regex) sur un path joint par "." """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        if pattern.startswith(REGEX_PREFIX):
+            self.regex = re.compile(pattern[len(REGEX_PREFIX):], re.IGNORECASE)
+            self.segments = None
+        else:
+            self.regex = re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+            self.segments = [s.lower() for s in pattern.split(".")]
+
+    def matches(self, dotted: str) -> bool:
+        return self.regex.fullmatch(dotted) is not None
+
+    def may_match_below(self, path: Sequence[str]) -> bool:
+        """
+        Un descendant de ``path`` peut-il correspondre au motif?
+
+        Comparaison segment par segment jusqu'au premier ``*`` (qui peut
+        couvrir plusieurs segments); une regex n'est jamais élaguée.
+        """
+        if self.segments is None:
+            return True
+        for part, segment in zip(path, self.segments):
+            if "*" in segment:
+                return True
+            if _WILDCARDS.search(segment):
+                if not fnmatch.fnmatchcase(part.lower(), segment):
+                    return False
+            elif part.lower() != segment:
+                return False
+        return len(path) < len(self.segments)
+
+    def __repr__(self) -> str:
+        return f"PathRule({self.pattern!r})"
+
+
+class PathFilter:
+    """
+    Règles include/exclude évaluées sur les préfixes des paths
+
+    Args:
+        include: motifs à garder (vide = tout)
+        exclude: motifs à écarter, prioritaires sur include
+    """
+
+    def __init__(self, include: Optional[Iterable[str]] = None, exclude: Optional[Iterable[str]] = None):
+        self.include: List[PathRule] = [PathRule(p) for p in include or [] if p]
+        self.exclude: List[PathRule] = [PathRule(p) for p in exclude or [] if p]
+
+    def __bool__(self) -> bool:
+        return bool(self.include or self.exclude)
+
+    @staticmethod
+    def _prefixes(path: Sequence[str]) -> List[str]:
+        prefixes = []
+        dotted = ""
+        for part in path:
+            dotted = f"{dotted}.{part}" if dotted else part
+            prefixes.append(dotted)
+        return prefixes
+
+    def _excluded(self, prefixes: List[str]) -> bool:
+        return any(rule.matches(p) for rule in self.exclude for p in prefixes)
+
+    def _included(self, prefixes: List[str]) -> bool:
+        return not self.include or any(rule.matches(p) for rule in self.include for p in prefixes)
+
+    def accept(self, path: Sequence[str]) -> bool:
+        """La ressource ``path`` est-elle gardée?"""
+        if not self:
+            return True
+        prefixes = self._prefixes(path)
+        return self._included(prefixes) and not self._excluded(prefixes)
+
+    def explore(self, path: Sequence[str]) -> bool:
+        """Le conteneur ``path`` doit-il être ouvert (listé, datasets lus)?"""
+        if not self:
+            return True
+        prefixes = self._prefixes(path)
+        if self._excluded(prefixes):
+            return False
+        return self._included(prefixes) or any(rule.may_match_below(path) for rule in self.include)
+
+    def filter(self, resources: Iterable[Dict]) -> List[Dict]:
+        """Ressources découvertes (clé ``path``) gardées par le filtre"""
+        resources = list(resources)
+        if not self:
+            return resources
+        return [r for r in resources if self.accept(r.get("path") or r.get("full_path", "").split("."))]
+
+    def __repr__(self) -> str:
+        include = [r.pattern for r in self.include]
+        exclude = [r.pattern for r in self.exclude]
+        return f"PathFilter(include={include!r}, exclude={exclude!r})"
+
+
+def split_patterns(value) -> List[str]:
+    """Motifs depuis une option de connexion: liste ou chaîne séparée par des virgules"""
+    if not value:
+        return []
+    if isinstance(value, str):
+        value = value.split(",")
+    return [p.strip() for p in value if p and p.strip()]
@@ -0,0 +1,142 @@
+"""
+Transport Arrow Flight des requêtes SQL Dremio
+
+Le cycle REST (``POST /api/v3/sql``, polling du job, pages de 500 lignes
+JSON) coûte au moins trois allers-retours par requête et parse chaque
+valeur en objet Python. Dremio expose aussi ses requêtes en Arrow Flight
+(port 32010 par défaut): une requête est un ``FlightDescriptor`` de
+commande SQL, ses résultats arrivent en record batches Arrow, sans
+sérialisation JSON ni pagination.
+
+``DremioAutoDiscovery(flight_port=...)`` passe par ce transport pour
+``execute_sql_query``, ``iter_sql_rows`` et ``execute_sql_arrow``; le
+catalogue reste en REST. Si le port Flight ne répond pas (à la connexion ou
+en cours de run), le client revient au cycle REST.
+
+pyarrow est importé à la connexion seulement (import du connecteur en
+quelques millisecondes).
+"""
+
+import logging
+from typing import Iterator, List, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLIGHT_PORT = 32010
+
+
+def flight_location(url: str, port: int = DEFAULT_FLIGHT_PORT, tls: bool = False) -> str:
+    """Location gRPC du serveur Flight sur l'hôte de l'URL REST Dremio"""
+    host = urlsplit(url).hostname or "localhost"
+    return f"grpc+{'tls' if tls else 'tcp'}://{host}:{port}"
+
+
+def is_unavailable(error: Exception) -> bool:
+    """Vrai si l'erreur Flight signale un serveur injoignable (repli REST)"""
+    import pyarrow.flight as flight
+
+    return isinstance(error, (flight.FlightUnavailableError, flight.FlightTimedOutError, OSError))
+
+
+class FlightTransport:
+    """
+    Client Arrow Flight authentifié d'une instance Dremio
+
+    Args:
+        location: location gRPC (flight_location)
+        username, password: identifiants Dremio (authentification basic → bearer)
+        timeout: secondes par appel Flight
+    """
+
+    def __init__(self, location: str, username: str, password: str, timeout: float = 30.0):
+        self.location = location
+        self.username = username
+        self.password = password
+        self.timeout = timeout
+        self._client = None
+        self._options = None
+
+    def connect(self) -> bool:
+        """Ouvre le client et s'authentifie; False si pyarrow.flight ou le serveur manque"""
+        try:
+            import pyarrow.flight as flight
+        except ImportError:
+            logger.warning("⚠️  pyarrow.flight non disponible, requêtes SQL en REST")
+            return False
+
+        try:
+            client = flight.FlightClient(self.location)
+            header = client.authenticate_basic_token(
+                self.username, self.password, flight.FlightCallOptions(timeout=self.timeout)
+            )
+        except Exception as e:
+            logger.warning(f"⚠️  Arrow Flight injoignable ({self.location}): {e}")
+            return False
+
+        self._client = client
+        self._options = flight.FlightCallOptions(headers=[header], timeout=self.timeout)
+        return True
+
+    def iter_batches(self, query: str) -> Iterator:
+        """
+        Record batches Arrow des résultats d'une requête
+
+        La requête est soumise et son flux ouvert avant le premier batch:
+        un serveur injoignable à l'ouverture lève son erreur à l'appel. Une
+        coupure en cours de flux est levée par l'itération.
+        """
+        _, readers = self._readers(query)
+        return (chunk.data for reader in readers for chunk in reader)
+
+    def read_table(self, query: str):
+        """Table Arrow de tous les résultats d'une requête"""
+        import pyarrow as pa
+
+        info, readers = self._readers(query)
+        tables = [reader.read_all() for reader in readers]
+        if len(tables) == 1:
+            return tables[0]
+        return pa.concat_tables(tables) if tables else info.schema.empty_table()
+
+    def read_page(self, query: str, limit: int) -> Tuple[object, int]:
+        """
+        (table des ``limit`` premières lignes, nombre total de lignes)
+
+        Les batches sont lus un par un: seules les lignes de la page restent
+        en mémoire. Le total vient de ``FlightInfo.total_records`` quand le
+        serveur le fournit (les flux sont alors annulés dès la page pleine);
+        sinon les batches suivants sont comptés sans être gardés.
+        """
+        import pyarrow as pa
+
+        info, readers = self._readers(query)
+        total = info.total_records if info.total_records >= 0 else None
+        batches, kept, counted = [], 0, 0
+        for reader in readers:
+            for chunk in reader:
+                counted += chunk.data.num_rows
+                if kept < limit:
+                    batch = chunk.data.slice(0, limit - kept)
+                    batches.append(batch)
+                    kept += batch.num_rows
+                if kept >= limit and total is not None:
+                    break
+            if kept >= limit and total is not None:
+                for unread in readers:
+                    unread.cancel()
+                break
+        table = pa.Table.from_batches(batches) if batches else info.schema.empty_table()
+        return table, total if total is not None else counted
+
+    def _readers(self, query: str) -> Tuple[object, List]:
+        """(FlightInfo, un flux par endpoint) d'une requête"""
+        import pyarrow.flight as flight
+
+        info = self._client.get_flight_info(flight.FlightDescriptor.for_command(query), self._options)
+        return info, [self._client.do_get(endpoint.ticket, self._options) for endpoint in info.endpoints]
+
+    def close(self):
+        if self._client is not None:
+            self._client.close()
+            self._client = None
@@ -0,0 +1,40 @@
+"""
+Imports différés pour garder l'import du connecteur en quelques millisecondes
+
+``requests`` (urllib3, ssl, charset_normalizer...) et les modules
+``metadata.generated.schema`` d'openmetadata-ingestion coûtent de la centaine
+de millisecondes à plusieurs secondes à importer. Chaque tâche Airflow et
+chaque ``python -c`` de healthcheck paieraient ce coût même sans faire une
+seule requête.
+
+``lazy_import`` renvoie un module dont le chargement réel est repoussé au
+premier accès à un attribut (``importlib.util.LazyLoader``). Le module est
+enregistré dans ``sys.modules``: un import ultérieur, ailleurs, récupère le
+même objet et déclenche le chargement normalement.
+
+Usage:
+    requests = lazy_import("requests")
+    ...
+    requests.get(url)  # requests est réellement importé ici
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Module ``name`` chargé au premier accès à un attribut"""
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -0,0 +1,924 @@
+"""
+Lineage des vues Dremio (VIRTUAL_DATASET) extrait de leur SQL
+
+Pipeline:
+1. Collecte des définitions de vues (``sql`` + ``sqlContext``):
+   - depuis les réponses catalogue déjà récupérées par la découverte
+   - ou en masse via ``INFORMATION_SCHEMA."VIEWS"`` (un seul job SQL paginé)
+2. Parsing des références de tables du SQL, avec un cache indexé par hash du SQL
+   (persisté dans ``state_dir``: default_parse_cache_path) et un pool de
+   processus pour les gros volumes
+3. Résolution des références relativement au ``sqlContext`` de la vue
+4. Émission des arêtes de lineage par lots
+
+Aucun appel API n'est fait par vue: les 15k vues d'un catalogue sont traitées
+à partir de deux requêtes SQL en masse (ou directement du crawl).
+
+Usage:
+    from dremio_connector.core.lineage import (
+        ViewLineageExtractor, collect_view_definitions
+    )
+
+    views = collect_view_definitions(resources)
+    extractor = ViewLineageExtractor(known_datasets=[r["path"] for r in resources])
+    for batch in extractor.extract(views):
+        for edge in batch:
+            print(edge["from"], "→", edge["to"])
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<ws>\s+)
+  | (?P<comment>--[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^']|'')*')
+  | (?P<quoted>"(?:[^"]|"")*")
+  | (?P<backtick>`[^`]*`)
+  | (?P<ident>[A-Za-z_][A-Za-z0-9_$]*)
+  | (?P<number>\d+(?:\.\d*)?)
+  | (?P<punct>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+# Mots-clés qui ne peuvent pas être un alias de table
+_RESERVED = {
+    "ALL", "AND", "AS", "AT", "BETWEEN", "BRANCH", "BY", "CASE", "COMMIT", "CROSS",
+    "DISTINCT", "ELSE", "END", "EXCEPT", "FETCH", "FOR", "FROM", "FULL", "GROUP",
+    "HAVING", "IN", "INNER", "INTERSECT", "IS", "JOIN", "LATERAL", "LEFT", "LIMIT",
+    "MINUS", "NATURAL", "NOT", "OFFSET", "ON", "OR", "ORDER", "OUTER", "QUALIFY",
+    "REF", "REFERENCE", "RIGHT", "SELECT", "SNAPSHOT", "TABLE", "TAG", "THEN",
+    "UNION", "UNNEST", "USING", "VALUES", "WHEN", "WHERE", "WINDOW", "WITH",
+}
+
+_SUBQUERY_STARTS = {"SELECT", "WITH", "VALUES"}
+
+# (type, valeur): "ident" (mot non quoté), "quoted" (identifiant quoté), "string", "number", "punct"
+Token = Tuple[str, str]
+
+PARALLEL_THRESHOLD = 256
+
+
+def tokenize(sql: str) -> List[Token]:
+    """Découpe un SQL Dremio en tokens (commentaires et espaces ignorés)"""
+    tokens: List[Token] = []
+    for match in _TOKEN_RE.finditer(sql):
+        kind = match.lastgroup
+        value = match.group()
+        if kind in ("ws", "comment"):
+            continue
+        if kind == "quoted":
+            tokens.append(("quoted", value[1:-1].replace('""', '"')))
+        elif kind == "backtick":
+            tokens.append(("quoted", value[1:-1]))
+        else:
+            tokens.append((kind, value))
+    return tokens
+
+
+def _is_name(token: Token) -> bool:
+    return token[0] in ("ident", "quoted")
+
+
+def _keyword(token: Token) -> str:
+    return token[1].upper() if token[0] == "ident" else ""
+
+
+def _match_paren(tokens: List[Token], start: int) -> int:
+    """Index de la parenthèse fermante correspondant à tokens[start] == '('"""
+    depth = 0
+    for j in range(start, len(tokens)):
+        if tokens[j] == ("punct", "("):
+            depth += 1
+        elif tokens[j] == ("punct", ")"):
+            depth -= 1
+            if depth == 0:
+                return j
+    return len(tokens) - 1
+
+
+def _read_alias(tokens: List[Token], j: int) -> Tuple[Optional[str], int]:
+    """Lit un alias optionnel ([AS] nom) à partir de j, retourne (alias, index suivant)"""
+    token = tokens[j] if j < len(tokens) else ("eof", "")
+    following = tokens[j + 1] if j + 1 < len(tokens) else ("eof", "")
+    if _keyword(token) == "AS" and _is_name(following):
+        return following[1], j + 2
+    if token[0] == "quoted" or (token[0] == "ident" and token[1].upper() not in _RESERVED):
+        return token[1], j + 1
+    return None, j
+
+
+class _ReferenceParser:
+    """Extrait les tables référencées (FROM / JOIN) et leurs alias"""
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.tables: List[Tuple[str, ...]] = []
+        self.aliases: Dict[str, Tuple[str, ...]] = {}
+        self.ctes: set = set()
+
+    def _at(self, j: int) -> Token:
+        return self.tokens[j] if 0 <= j < len(self.tokens) else ("eof", "")
+
+    def parse(self) -> Dict:
+        tokens = self.tokens
+        # Pile des parenthèses: "query" (sous-requête / groupe de tables) ou "expr"
+        stack: List[str] = []
+
+        for i, token in enumerate(tokens):
+            if token == ("punct", "("):
+                following = _keyword(self._at(i + 1))
+                previous = _keyword(self._at(i - 1))
+                if following in _SUBQUERY_STARTS or previous in ("FROM", "JOIN"):
+                    stack.append("query")
+                else:
+                    stack.append("expr")
+            elif token == ("punct", ")"):
+                if stack:
+                    stack.pop()
+            elif stack and stack[-1] == "expr":
+                # FROM dans EXTRACT(... FROM x), TRIM(... FROM x), etc.
+                continue
+            elif _keyword(token) == "WITH":
+                self._collect_ctes(i + 1)
+            elif _keyword(token) == "FROM":
+                self._parse_table_list(i + 1)
+            elif _keyword(token) == "JOIN":
+                self._parse_table_ref(i + 1)
+
+        tables = [t for t in dict.fromkeys(self.tables) if not (len(t) == 1 and t[0].lower() in self.ctes)]
+        aliases = {a: t for a, t in self.aliases.items() if t in tables}
+        return {"tables": [list(t) for t in tables], "aliases": {a: list(t) for a, t in aliases.items()}}
+
+    def _collect_ctes(self, j: int):
+        if _keyword(self._at(j)) == "RECURSIVE":
+            j += 1
+        while _is_name(self._at(j)):
+            name = self._at(j)[1]
+            j += 1
+            if self._at(j) == ("punct", "("):
+                j = _match_paren(self.tokens, j) + 1
+            if _keyword(self._at(j)) != "AS" or self._at(j + 1) != ("punct", "("):
+                return
+            self.ctes.add(name.lower())
+            j = _match_paren(self.tokens, j + 1) + 1
+            if self._at(j) != ("punct", ","):
+                return
+            j += 1
+
+    def _parse_table_list(self, j: int):
+        while True:
+            j = self._parse_table_ref(j)
+            if self._at(j) != ("punct", ","):
+                return
+            j += 1
+
+    def _parse_table_ref(self, j: int) -> int:
+        """Parse une référence de table à partir de j, retourne l'index suivant"""
+        token = self._at(j)
+
+        if token == ("punct", "("):
+            if _keyword(self._at(j + 1)) not in _SUBQUERY_STARTS:
+                # Groupe de jointures: FROM (a JOIN b ON ...)
+                self._parse_table_ref(j + 1)
+            return self._skip_alias(_match_paren(self.tokens, j) + 1)
+
+        if _keyword(token) in ("LATERAL", "UNNEST", "TABLE"):
+            return j + 1
+
+        if not _is_name(token):
+            return j
+
+        parts = [token[1]]
+        j += 1
+        while self._at(j) == ("punct", ".") and _is_name(self._at(j + 1)):
+            parts.append(self._at(j + 1)[1])
+            j += 2
+
+        if self._at(j) == ("punct", "("):
+            # Appel de fonction table, pas une table
+            return _match_paren(self.tokens, j) + 1
+
+        ref = tuple(parts)
+        self.tables.append(ref)
+
+        alias, j = _read_alias(self.tokens, j)
+        self.aliases[(alias or parts[-1]).lower()] = ref
+        return j
+
+    def _skip_alias(self, j: int) -> int:
+        return _read_alias(self.tokens, j)[1]
+
+
+# Mots non quotés qui ne sont jamais des colonnes dans une expression de projection
+_EXPRESSION_KEYWORDS = _RESERVED | {
+    "ASC", "BOTH", "CAST", "CURRENT", "CURRENT_DATE", "CURRENT_TIMESTAMP", "DATE",
+    "DAY", "DESC", "FALSE", "FILTER", "FOLLOWING", "HOUR", "ILIKE", "INTERVAL",
+    "LEADING", "LIKE", "MINUTE", "MONTH", "NULL", "NULLS", "OVER", "PARTITION",
+    "PRECEDING", "QUARTER", "RANGE", "ROW", "ROWS", "SECOND", "TIMESTAMP",
+    "TRAILING", "TRUE", "UNBOUNDED", "WEEK", "YEAR", "FIRST", "LAST", "SIMILAR",
+}
+
+_SET_OPERATORS = {"UNION", "EXCEPT", "INTERSECT", "MINUS"}
+
+_CLAUSE_END = {"WHERE", "GROUP", "HAVING", "ORDER", "LIMIT", "QUALIFY", "WINDOW", "OFFSET", "FETCH"}
+
+_JOIN_WORDS = {"JOIN", "INNER", "LEFT", "RIGHT", "FULL", "CROSS", "OUTER", "NATURAL", "LATERAL"}
+
+
+class _ProjectionParser:
+    """
+    Construit l'arbre des SELECT d'une vue pour le lineage colonne
+
+    Représentation (dicts/listes uniquement: sérialisable et transmissible au pool):
+        select = {
+            "columns": [{"name": str, "sources": [[qualifier|None, column]],
+                         "star": bool, "qualifier": str|None}],
+            "from": [{"alias": str, "table": List[str]|None, "select": select|None}],
+            "branches": [select, ...] (autres branches UNION/EXCEPT/INTERSECT)
+        }
+    """
+
+    def __init__(self, tokens: List[Token]):
+        self.tokens = tokens
+        self.ctes: Dict[str, Dict] = {}
+
+    def _at(self, j: int) -> Token:
+        return self.tokens[j] if 0 <= j < len(self.tokens) else ("eof", "")
+
+    def _depth0(self, start: int, end: int) -> Iterator[int]:
+        """Indices des tokens de profondeur 0 dans [start, end)"""
+        j = start
+        while j < end:
+            yield j
+            if self.tokens[j] == ("punct", "("):
+                j = _match_paren(self.tokens, j)
+            j += 1
+
+    def parse(self) -> Optional[Dict]:
+        end = len(self.tokens)
+        if end and self.tokens[-1] == ("punct", ";"):
+            end -= 1
+        return self.parse_query(0, end)
+
+    def parse_query(self, start: int, end: int) -> Optional[Dict]:
+        if _keyword(self._at(start)) == "WITH":
+            start = self._parse_ctes(start + 1, end)
+
+        if self._at(start) == ("punct", "(") and _match_paren(self.tokens, start) == end - 1:
+            return self.parse_query(start + 1, end - 1)
+
+        bounds = [start]
+        for j in self._depth0(start, end):
+            if _keyword(self.tokens[j]) in _SET_OPERATORS:
+                bounds.append(j)
+        bounds.append(end)
+
+        branches = []
+        for k in range(len(bounds) - 1):
+            branch_start = bounds[k]
+            if k > 0:
+                branch_start += 1
+                if _keyword(self._at(branch_start)) in ("ALL", "DISTINCT"):
+                    branch_start += 1
+            if self._at(branch_start) == ("punct", "("):
+                branch = self.parse_query(branch_start + 1, _match_paren(self.tokens, branch_start))
+            else:
+                branch = self._parse_simple_select(branch_start, bounds[k + 1])
+            if branch:
+                branches.append(branch)
+
+        if not branches:
+            return None
+        main = branches[0]
+        main["branches"] = branches[1:]
+        return main
+
+    def _parse_ctes(self, j: int, end: int) -> int:
+        if _keyword(self._at(j)) == "RECURSIVE":
+            j += 1
+        while j < end and _is_name(self._at(j)):
+            name = self._at(j)[1].lower()
+            j += 1
+            if self._at(j) == ("punct", "("):
+                j = _match_paren(self.tokens, j) + 1
+            if _keyword(self._at(j)) != "AS" or self._at(j + 1) != ("punct", "("):
+                return j
+            close = _match_paren(self.tokens, j + 1)
+            self.ctes[name] = self.parse_query(j + 2, close)
+            j = close + 1
+            if self._at(j) != ("punct", ","):
+                return j
+            j += 1
+        return j
+
+    def _parse_simple_select(self, start: int, end: int) -> Optional[Dict]:
+        if _keyword(self._at(start)) != "SELECT":
+            return None
+        j = start + 1
+        if _keyword(self._at(j)) in ("DISTINCT", "ALL"):
+            j += 1
+
+        from_index = end
+        clause_end = end
+        for k in self._depth0(j, end):
+            keyword = _keyword(self.tokens[k])
+            if keyword == "FROM" and from_index == end:
+                from_index = k
+            elif keyword in _CLAUSE_END and from_index != end:
+                clause_end = k
+                break
+
+        items = []
+        item_start = j
+        for k in list(self._depth0(j, from_index)) + [from_index]:
+            if k == from_index or self.tokens[k] == ("punct", ","):
+                if k > item_start:
+                    items.append(self._parse_item(item_start, k, len(items)))
+                item_start = k + 1
+
+        from_items = self._parse_from(from_index + 1, clause_end) if from_index < end else []
+        return {"columns": items, "from": from_items, "branches": []}
+
+    def _parse_item(self, start: int, end: int, position: int) -> Dict:
+        tokens = self.tokens
+        if end - start == 1 and tokens[start] == ("punct", "*"):
+            return {"name": None, "sources": [], "star": True, "qualifier": None}
+        if tokens[end - 1] == ("punct", "*") and end - start >= 3 and tokens[end - 2] == ("punct", "."):
+            return {"name": None, "sources": [], "star": True, "qualifier": tokens[end - 3][1].lower()}
+
+        alias = None
+        expr_end = end
+        if end - start >= 3 and _keyword(tokens[end - 2]) == "AS" and _is_name(tokens[end - 1]):
+            alias = tokens[end - 1][1]
+            expr_end = end - 2
+        elif end - start >= 2 and _is_name(tokens[end - 1]) and _keyword(tokens[end - 1]) not in _EXPRESSION_KEYWORDS:
+            previous = tokens[end - 2]
+            if previous != ("punct", ".") and (_is_name(previous) or previous == ("punct", ")") or previous[0] in ("string", "number")):
+                alias = tokens[end - 1][1]
+                expr_end = end - 1
+
+        sources = []
+        j = start
+        after_as = False
+        while j < expr_end:
+            token = tokens[j]
+            if _keyword(token) == "AS":
+                after_as = True  # CAST(x AS type): le type n'est pas une colonne
+            elif token == ("punct", "(") or token == ("punct", ")") or token == ("punct", ","):
+                after_as = False
+            elif _is_name(token) and not after_as:
+                parts = [token[1]]
+                while tokens[j + 1:j + 2] == [("punct", ".")] and j + 2 < expr_end and _is_name(tokens[j + 2]):
+                    parts.append(tokens[j + 2][1])
+                    j += 2
+                is_function = j + 1 < expr_end and tokens[j + 1] == ("punct", "(")
+                is_keyword = token[0] == "ident" and len(parts) == 1 and token[1].upper() in _EXPRESSION_KEYWORDS
+                if not is_function and not is_keyword:
+                    qualifier = parts[-2].lower() if len(parts) > 1 else None
+                    sources.append([qualifier, parts[-1]])
+            j += 1
+
+        name = alias
+        if name is None and expr_end - start >= 1 and len(sources) == 1 and _is_name(tokens[expr_end - 1]):
+            name = sources[0][1]
+        if name is None:
+            name = f"EXPR${position}"
+        return {"name": name, "sources": sources, "star": False, "qualifier": None}
+
+    def _parse_from(self, start: int, end: int) -> List[Dict]:
+        items: List[Dict] = []
+        expect_ref = True
+        j = start
+        while j < end:
+            token = self.tokens[j]
+            keyword = _keyword(token)
+            if token == ("punct", ",") or keyword == "JOIN":
+                expect_ref = True
+                j += 1
+            elif keyword in ("ON", "USING"):
+                expect_ref = False
+                j += 1
+            elif expect_ref and keyword not in _JOIN_WORDS:
+                j = self._parse_from_ref(j, end, items)
+                expect_ref = False
+            elif token == ("punct", "("):
+                j = _match_paren(self.tokens, j) + 1
+            else:
+                j += 1
+        return items
+
+    def _parse_from_ref(self, j: int, end: int, items: List[Dict]) -> int:
+        token = self._at(j)
+        if token == ("punct", "("):
+            close = _match_paren(self.tokens, j)
+            if _keyword(self._at(j + 1)) in _SUBQUERY_STARTS:
+                sub = self.parse_query(j + 1, close)
+                alias, k = _read_alias(self.tokens, close + 1)
+                items.append({"alias": (alias or "").lower(), "table": None, "select": sub})
+                return k
+            items.extend(self._parse_from(j + 1, close))
+            return close + 1
+
+        if _keyword(token) in ("UNNEST", "TABLE") or not _is_name(token):
+            return j + 1
+
+        parts = [token[1]]
+        j += 1
+        while self._at(j) == ("punct", ".") and _is_name(self._at(j + 1)):
+            parts.append(self._at(j + 1)[1])
+            j += 2
+        if self._at(j) == ("punct", "("):
+            return _match_paren(self.tokens, j) + 1
+
+        alias, j = _read_alias(self.tokens, j)
+        items.append({"alias": (alias or parts[-1]).lower(), "table": parts, "select": None})
+        return j
+
+
+def parse_view_sql(sql: str) -> Dict:
+    """
+    Parse le SQL d'une vue (fonction top-level: exécutable dans un pool de processus)
+
+    Returns:
+        Dict: {"tables": List[List[str]] (références brutes, non résolues),
+               "aliases": Dict[str, List[str]] (alias en minuscules → référence),
+               "select": Dict (arbre des SELECT, voir _ProjectionParser) ou None,
+               "ctes": Dict[str, Dict] (CTE en minuscules → arbre SELECT)}
+    """
+    try:
+        tokens = tokenize(sql)
+        parsed = _ReferenceParser(tokens).parse()
+    except Exception as e:  # SQL exotique: pas de lineage plutôt qu'un échec global
+        logger.debug(f"Parsing SQL impossible: {e}")
+        return {"tables": [], "aliases": {}, "select": None, "ctes": {}}
+
+    try:
+        projection = _ProjectionParser(tokens)
+        parsed["select"] = projection.parse()
+        parsed["ctes"] = projection.ctes
+    except Exception as e:  # lineage table conservé même sans lineage colonne
+        logger.debug(f"Parsing de la projection impossible: {e}")
+        parsed["select"] = None
+        parsed["ctes"] = {}
+    return parsed
+
+
+def sql_hash(sql: str) -> str:
+    """Clé du cache de parsing"""
+    return hashlib.sha1(sql.encode("utf-8")).hexdigest()
+
+
+def default_parse_cache_path(dremio_url: str, state_dir: Optional[str] = None) -> str:
+    """Cache de parsing des vues d'une instance Dremio dans ``state_dir`` (défaut: tmp système)"""
+    digest = hashlib.sha1(dremio_url.encode("utf-8")).hexdigest()[:12]
+    directory = state_dir or os.path.join(tempfile.gettempdir(), "dremio_connector")
+    return os.path.join(directory, f"view_parse_cache_{digest}.json")
+
+
+class SqlParseCache:
+    """
+    Cache des résultats de parsing, indexé par hash du SQL
+
+    Optionnellement persisté sur disque (JSON) pour que les runs suivants ne
+    re-parsent que les vues dont le SQL a changé. Pas de pickle: un fichier de
+    cache déposé par un tiers ne doit pas pouvoir exécuter de code au chargement.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._entries: Dict[str, Dict] = {}
+        self._dirty = False
+        if path:
+            self._load()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Dict]:
+        return self._entries.get(key)
+
+    def put(self, key: str, parsed: Dict):
+        self._entries[key] = parsed
+        self._dirty = True
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                self._entries = entries
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.debug(f"Cache de parsing illisible {self.path}: {e}")
+
+    def save(self):
+        if not self.path or not self._dirty:
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except Exception as e:
+            logger.warning(f"⚠️  Impossible d'écrire le cache de parsing {self.path}: {e}")
+
+
+def collect_view_definitions(resources: Iterable[Dict]) -> List[Dict]:
+    """
+    Extrait les définitions de vues des ressources de DremioAutoDiscovery
+
+    Le schéma récupéré par id (/api/v3/catalog/{id}) d'un VIRTUAL_DATASET
+    contient déjà ``sql`` et ``sqlContext``: aucun appel supplémentaire.
+
+    Returns:
+        List[Dict]: {"path": List[str], "sql": str, "context": List[str]}
+    """
+    views = []
+    for resource in resources:
+        schema = resource.get("schema") or {}
+        if resource.get("type") != "dataset" or schema.get("type") != "VIRTUAL_DATASET":
+            continue
+        sql = schema.get("sql")
+        if not sql:
+            continue
+        views.append({
+            "path": list(resource.get("path", [])),
+            "sql": sql,
+            "context": list(schema.get("sqlContext") or []),
+        })
+    return views
+
+
+def fetch_view_definitions(client) -> List[Dict]:
+    """
+    Récupère toutes les définitions de vues en un seul job SQL paginé
+
+    ``INFORMATION_SCHEMA."VIEWS"`` ne fournit pas le sqlContext: le dossier
+    parent de la vue est utilisé comme contexte.
+    """
+    views = []
+    query = 'SELECT TABLE_SCHEMA, TABLE_NAME, VIEW_DEFINITION FROM INFORMATION_SCHEMA."VIEWS"'
+    for row in client.iter_sql_rows(query):
+        sql = row.get("VIEW_DEFINITION")
+        if not sql:
+            continue
+        context = _split_schema(row.get("TABLE_SCHEMA", ""))
+        views.append({
+            "path": context + [row.get("TABLE_NAME", "")],
+            "sql": sql,
+            "context": context,
+        })
+    logger.info(f"🔗 {len(views)} définitions de vues récupérées")
+    return views
+
+
+def fetch_known_datasets(client) -> List[List[str]]:
+    """Liste tous les datasets (tables et vues) en un seul job SQL paginé"""
+    query = (
+        'SELECT TABLE_SCHEMA, TABLE_NAME FROM INFORMATION_SCHEMA."TABLES" '
+        "WHERE TABLE_TYPE <> 'SYSTEM_TABLE'"
+    )
+    return [
+        _split_schema(row.get("TABLE_SCHEMA", "")) + [row.get("TABLE_NAME", "")]
+        for row in client.iter_sql_rows(query)
+    ]
+
+
+def _split_schema(table_schema: str) -> List[str]:
+    return [part for part in table_schema.split(".") if part] if table_schema else []
+
+
+class ViewLineageExtractor:
+    """
+    Calcule les arêtes de lineage table → vue pour un ensemble de vues
+
+    Args:
+        known_datasets: paths des datasets connus, pour résoudre les références
+            relatives au sqlContext (comparaison insensible à la casse, comme Dremio)
+        max_workers: taille du pool de processus (None = nombre de CPU, 1 = sans pool)
+        batch_size: nombre de vues par lot d'arêtes émis
+        parse_cache: cache de parsing partagé (en mémoire par défaut)
+        parallel_threshold: en dessous de ce nombre de SQL à parser, pas de pool
+        known_columns: colonnes connues par path de dataset (``_extract_columns``
+            au crawl, ou colonnes émises par ``yield_table``)
+        column_level: calculer aussi le lineage colonne (clé "columns" des arêtes)
+    """
+
+    def __init__(
+        self,
+        known_datasets: Optional[Iterable[List[str]]] = None,
+        max_workers: Optional[int] = None,
+        batch_size: int = 500,
+        parse_cache: Optional[SqlParseCache] = None,
+        parallel_threshold: int = PARALLEL_THRESHOLD,
+        known_columns: Optional[Dict[Tuple[str, ...], List[str]]] = None,
+        column_level: bool = False,
+    ):
+        self.known: Optional[Dict[Tuple[str, ...], List[str]]] = None
+        if known_datasets is not None:
+            self.known = {_path_key(path): list(path) for path in known_datasets}
+        self.max_workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+        self.batch_size = batch_size
+        self.parse_cache = parse_cache if parse_cache is not None else SqlParseCache()
+        self.parallel_threshold = parallel_threshold
+        self.known_columns = known_columns or {}
+        self.column_level = column_level
+        self.resolver: Optional["ColumnLineageResolver"] = None
+        self.stats = {"views": 0, "parsed": 0, "cache_hits": 0, "edges": 0, "column_edges": 0, "unresolved": 0}
+
+    def extract(self, views: Iterable[Dict]) -> Iterator[List[Dict]]:
+        """
+        Yields:
+            List[Dict]: lots d'arêtes {"from": List[str], "to": List[str], "sql": str}
+        """
+        views = list(views)
+        self.stats["views"] += len(views)
+        self.parse_all(view["sql"] for view in views)
+        if self.column_level:
+            self.resolver = ColumnLineageResolver(self, views, self.known_columns)
+
+        for start in range(0, len(views), self.batch_size):
+            batch = []
+            for view in views[start:start + self.batch_size]:
+                batch.extend(self.edges_for_view(view))
+            if batch:
+                self.stats["edges"] += len(batch)
+                yield batch
+
+        self.parse_cache.save()
+
+    def parse_all(self, sqls: Iterable[str]):
+        """Parse tous les SQL absents du cache, en parallèle au-delà du seuil"""
+        pending: Dict[str, str] = {}
+        for sql in sqls:
+            key = sql_hash(sql)
+            if key in self.parse_cache or key in pending:
+                self.stats["cache_hits"] += 1
+                continue
+            pending[key] = sql
+
+        if not pending:
+            return
+
+        keys = list(pending)
+        results = self._parse_many([pending[k] for k in keys])
+        for key, parsed in zip(keys, results):
+            self.parse_cache.put(key, parsed)
+        self.stats["parsed"] += len(keys)
+
+    def parsed(self, sql: str) -> Dict:
+        """Résultat de parsing d'un SQL (depuis le cache)"""
+        key = sql_hash(sql)
+        parsed = self.parse_cache.get(key)
+        if parsed is None:
+            parsed = parse_view_sql(sql)
+            self.parse_cache.put(key, parsed)
+            self.stats["parsed"] += 1
+        return parsed
+
+    def _parse_many(self, sqls: List[str]) -> List[Dict]:
+        if self.max_workers <= 1 or len(sqls) < self.parallel_threshold:
+            return [parse_view_sql(sql) for sql in sqls]
+
+        # multiprocessing n'est importé que si le parsing part réellement en parallèle
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(sqls) // (self.max_workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                return list(pool.map(parse_view_sql, sqls, chunksize=chunksize))
+        except Exception as e:
+            logger.warning(f"⚠️  Pool de processus indisponible ({e}), parsing séquentiel")
+            return [parse_view_sql(sql) for sql in sqls]
+
+    def resolve(self, reference: List[str], context: List[str]) -> Optional[List[str]]:
+        """
+        Résout une référence de table relativement au sqlContext de la vue
+
+        Comme Dremio: le contexte est essayé en premier, puis la référence absolue.
+        """
+        candidates = []
+        if context:
+            candidates.append(list(context) + list(reference))
+        candidates.append(list(reference))
+
+        if self.known is None:
+            return candidates[0] if len(reference) == 1 else candidates[-1]
+
+        for candidate in candidates:
+            canonical = self.known.get(_path_key(candidate))
+            if canonical is not None:
+                return canonical
+        return None
+
+    def edges_for_view(self, view: Dict) -> List[Dict]:
+        """Arêtes de lineage d'une vue (références résolues, dédupliquées)"""
+        parsed = self.parsed(view["sql"])
+        target = list(view["path"])
+        edges = []
+        seen = set()
+
+        for reference in parsed["tables"]:
+            upstream = self.resolve(reference, view.get("context", []))
+            if upstream is None:
+                self.stats["unresolved"] += 1
+                continue
+            key = tuple(upstream)
+            if key in seen or upstream == target:
+                continue
+            seen.add(key)
+            edges.append({"from": upstream, "to": target, "sql": view["sql"]})
+
+        if self.resolver is not None:
+            self._attach_column_lineage(target, edges)
+        return edges
+
+    def _attach_column_lineage(self, target: List[str], edges: List[Dict]):
+        """Ajoute à chaque arête les paires colonnes amont → colonne de la vue"""
+        lineage = self.resolver.column_lineage(target) or []
+
+        by_upstream: Dict[Tuple[str, ...], Dict[str, List[str]]] = {}
+        for column in lineage:
+            for upstream, upstream_column in column["sources"]:
+                mapping = by_upstream.setdefault(_path_key(upstream), {})
+                mapping.setdefault(column["name"], []).append(upstream_column)
+
+        for edge in edges:
+            mapping = by_upstream.get(_path_key(edge["from"]), {})
+            edge["columns"] = [
+                {"from": sorted(set(sources)), "to": name} for name, sources in mapping.items()
+            ]
+            self.stats["column_edges"] += len(edge["columns"])
+
+
+def _path_key(path: Iterable[str]) -> Tuple[str, ...]:
+    """Clé insensible à la casse d'un path de dataset (Dremio ignore la casse)"""
+    return tuple(part.lower() for part in path)
+
+
+class ColumnLineageResolver:
+    """
+    Lineage colonne des vues, avec résolution mémoïsée des schémas amont
+
+    Chaque projection d'une vue est rattachée aux colonnes des datasets amont
+    directs. Les colonnes d'un dataset amont viennent des colonnes connues
+    (crawl / yield_table) ou, pour une vue sans colonnes connues, de la
+    résolution de son propre SQL. Cette résolution est mémoïsée par dataset:
+    une chaîne de 10 vues (vue sur vue sur vue, ``SELECT *`` compris) est
+    résolue une seule fois par dataset, et non une fois par référence.
+    """
+
+    def __init__(
+        self,
+        extractor: ViewLineageExtractor,
+        views: Iterable[Dict],
+        known_columns: Optional[Dict[Tuple[str, ...], List[str]]] = None,
+    ):
+        self.extractor = extractor
+        self.views = {_path_key(view["path"]): view for view in views}
+        self.known_columns = {_path_key(path): list(columns) for path, columns in (known_columns or {}).items()}
+        self._columns_memo: Dict[Tuple[str, ...], Optional[List[str]]] = {}
+        self._lineage_memo: Dict[Tuple[str, ...], Optional[List[Dict]]] = {}
+        self._in_progress: set = set()
+        self.stats = {"views_resolved": 0}
+
+    def columns_of(self, path: List[str]) -> Optional[List[str]]:
+        """Colonnes d'un dataset (None si inconnues)"""
+        key = _path_key(path)
+        if key in self._columns_memo:
+            return self._columns_memo[key]
+
+        columns = self.known_columns.get(key)
+        if columns is None and key in self.views:
+            lineage = self.column_lineage(path)
+            columns = [column["name"] for column in lineage] if lineage is not None else None
+
+        self._columns_memo[key] = columns
+        return columns
+
+    def column_lineage(self, path: List[str]) -> Optional[List[Dict]]:
+        """
+        Returns:
+            List[Dict]: {"name": str, "sources": List[(path amont, colonne)]} par
+            colonne de la vue, ou None si la vue est inconnue / non parsable
+        """
+        key = _path_key(path)
+        if key in self._lineage_memo:
+            return self._lineage_memo[key]
+        if key in self._in_progress:
+            return None  # cycle de vues
+
+        view = self.views.get(key)
+        if view is None:
+            return None
+
+        self._in_progress.add(key)
+        try:
+            parsed = self.extractor.parsed(view["sql"])
+            result = None
+            if parsed.get("select"):
+                scope = _SelectScope(self, view.get("context", []), parsed.get("ctes", {}))
+                result = [
+                    {"name": name, "sources": sorted(sources)}
+                    for name, sources in scope.resolve_select(parsed["select"])
+                ]
+        finally:
+            self._in_progress.discard(key)
+
+        self._lineage_memo[key] = result
+        self.stats["views_resolved"] += 1
+        return result
+
+
+class _SelectScope:
+    """Résolution des colonnes dans le SQL d'une vue (CTE, sous-requêtes, alias)"""
+
+    def __init__(self, resolver: ColumnLineageResolver, context: List[str], ctes: Dict[str, Dict]):
+        self.resolver = resolver
+        self.context = context
+        self.ctes = ctes
+        self._items: Dict[int, Optional[List[Tuple[str, set]]]] = {}
+        self._cte_stack: set = set()
+
+    def resolve_select(self, select: Dict) -> List[Tuple[str, set]]:
+        output: List[Tuple[str, set]] = []
+        for column in select["columns"]:
+            if column["star"]:
+                for item in select["from"]:
+                    if column["qualifier"] and item["alias"] != column["qualifier"]:
+                        continue
+                    output.extend((name, set(sources)) for name, sources in self.item_columns(item) or [])
+            else:
+                sources: set = set()
+                for qualifier, name in column["sources"]:
+                    sources |= self.resolve_reference(select["from"], qualifier, name)
+                output.append((column["name"], sources))
+
+        # UNION/EXCEPT/INTERSECT: colonnes appariées par position
+        for branch in select.get("branches", []):
+            for position, (_, sources) in enumerate(self.resolve_select(branch)):
+                if position < len(output):
+                    output[position][1].update(sources)
+        return output
+
+    def item_columns(self, item: Dict) -> Optional[List[Tuple[str, set]]]:
+        """Colonnes exposées par un élément du FROM, avec leurs sources"""
+        item_id = id(item)
+        if item_id in self._items:
+            return self._items[item_id]
+
+        columns = None
+        if item["select"] is not None:
+            columns = self.resolve_select(item["select"])
+        else:
+            table = item["table"]
+            cte_name = table[0].lower() if len(table) == 1 else None
+            if cte_name in self.ctes and cte_name not in self._cte_stack and self.ctes[cte_name]:
+                self._cte_stack.add(cte_name)
+                try:
+                    columns = self.resolve_select(self.ctes[cte_name])
+                finally:
+                    self._cte_stack.discard(cte_name)
+            else:
+                path = self.resolver.extractor.resolve(table, self.context)
+                names = self.resolver.columns_of(path) if path else None
+                if names is not None:
+                    columns = [(name, {(tuple(path), name)}) for name in names]
+
+        self._items[item_id] = columns
+        return columns
+
+    def resolve_reference(self, from_items: List[Dict], qualifier: Optional[str], column: str) -> set:
+        candidates = [item for item in from_items if qualifier is None or item["alias"] == qualifier]
+        column_lower = column.lower()
+
+        for item in candidates:
+            for name, sources in self.item_columns(item) or []:
+                if name.lower() == column_lower:
+                    return set(sources)
+
+        # Colonnes amont inconnues: une seule table possible → on lui attribue la colonne
+        unknown = [item for item in candidates if item["select"] is None and self.item_columns(item) is None]
+        if len(unknown) == 1 and len(candidates) == 1:
+            path = self.resolver.extractor.resolve(unknown[0]["table"], self.context)
+            if path:
+                return {(tuple(path), column)}
+        return set()
@@ -0,0 +1,390 @@
+"""
+Métriques du connecteur au format d'exposition Prometheus
+
+Registre minimal (compteurs, jauges, histogrammes à labels) sans dépendance:
+les métriques sont exposées soit par un endpoint HTTP texte
+(``start_metrics_server``), soit par un fichier texte compatible pushgateway /
+node_exporter textfile collector (``write_textfile``).
+
+Métriques:
+    dremio_connector_http_request_duration_seconds{service,method,endpoint,status}
+    dremio_connector_http_requests_in_flight{service,endpoint}
+    dremio_connector_http_retries_total{service,endpoint}
+    dremio_connector_http_timeouts_total{service,endpoint}
+    dremio_connector_http_request_bytes_total{service,endpoint}
+    dremio_connector_http_response_bytes_total{service,endpoint}
+    dremio_connector_sql_job_queue_seconds
+    dremio_connector_sql_job_execution_seconds
+    dremio_connector_sql_job_wall_seconds{state}
+    dremio_connector_stage_duration_seconds{stage}
+
+Usage:
+    from dremio_connector.core import metrics
+
+    with metrics.stage("discovery"):
+        resources = client.discover_all_resources()
+
+    metrics.write_textfile("/var/lib/node_exporter/dremio_connector.prom")
+"""
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base: une famille de séries indexées par les valeurs de labels"""
+
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._series: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labelvalues: Sequence[str]) -> Tuple[str, ...]:
+        if len(labelvalues) != len(self.labelnames):
+            raise ValueError(f"{self.name}: attendu {len(self.labelnames)} labels, reçu {len(labelvalues)}")
+        return tuple(str(v) for v in labelvalues)
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        with self._lock:
+            series = sorted(self._series.items())
+        for labelvalues, value in series:
+            lines.extend(self._render_series(labelvalues, value))
+        return lines
+
+    def _render_series(self, labelvalues, value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labelvalues: str, amount: float = 1.0):
+        key = self._key(labelvalues)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0.0) + amount
+
+    def value(self, *labelvalues: str) -> float:
+        with self._lock:
+            return self._series.get(self._key(labelvalues), 0.0)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def inc(self, *labelvalues: str, amount: float = 1.0):
+        key = self._key(labelvalues)
+        with self._lock:
+            self._series[key] = self._series.get(key, 0.0) + amount
+
+    def dec(self, *labelvalues: str, amount: float = 1.0):
+        self.inc(*labelvalues, amount=-amount)
+
+    def set(self, *labelvalues: str, value: float):
+        key = self._key(labelvalues)
+        with self._lock:
+            self._series[key] = value
+
+    def value(self, *labelvalues: str) -> float:
+        with self._lock:
+            return self._series.get(self._key(labelvalues), 0.0)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+
+    def observe(self, *labelvalues: str, value: float):
+        key = self._key(labelvalues)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = {"counts": [0] * len(self.buckets), "sum": 0.0, "count": 0}
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series["counts"][i] += 1
+                    break
+            series["sum"] += value
+            series["count"] += 1
+
+    def count(self, *labelvalues: str) -> int:
+        with self._lock:
+            series = self._series.get(self._key(labelvalues))
+            return series["count"] if series else 0
+
+    def _render_series(self, labelvalues, value) -> List[str]:
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets, value["counts"]):
+            cumulative += count
+            labels = _format_labels(self.labelnames, labelvalues, f'le="{_format_value(bound)}"')
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, labelvalues)
+        lines.append(f"{self.name}_sum{labels} {_format_value(value['sum'])}")
+        lines.append(f"{self.name}_count{labels} {value['count']}")
+        return lines
+
+
+class MetricsRegistry:
+    """Ensemble de métriques rendu en un seul document texte"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = REGISTRY.histogram(
+    "dremio_connector_http_request_duration_seconds",
+    "HTTP request latency by service, endpoint and status",
+    ("service", "method", "endpoint", "status"),
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "dremio_connector_http_requests_in_flight",
+    "HTTP requests currently in flight",
+    ("service", "endpoint"),
+)
+HTTP_RETRIES = REGISTRY.counter(
+    "dremio_connector_http_retries_total",
+    "HTTP requests retried after a timeout, connection error or 429/5xx response",
+    ("service", "endpoint"),
+)
+HTTP_TIMEOUTS = REGISTRY.counter(
+    "dremio_connector_http_timeouts_total",
+    "HTTP requests that timed out",
+    ("service", "endpoint"),
+)
+HTTP_REQUEST_BYTES = REGISTRY.counter(
+    "dremio_connector_http_request_bytes_total",
+    "HTTP request body bytes sent",
+    ("service", "endpoint"),
+)
+HTTP_RESPONSE_BYTES = REGISTRY.counter(
+    "dremio_connector_http_response_bytes_total",
+    "HTTP response body bytes received",
+    ("service", "endpoint"),
+)
+SQL_JOB_QUEUE = REGISTRY.histogram(
+    "dremio_connector_sql_job_queue_seconds",
+    "Dremio SQL job time spent waiting for resources (reported by Dremio)",
+)
+SQL_JOB_EXECUTION = REGISTRY.histogram(
+    "dremio_connector_sql_job_execution_seconds",
+    "Dremio SQL job execution time (reported by Dremio)",
+)
+SQL_JOB_WALL = REGISTRY.histogram(
+    "dremio_connector_sql_job_wall_seconds",
+    "Client-side time from SQL job submission to final state",
+    ("state",),
+)
+ROW_COUNTS = REGISTRY.counter(
+    "dremio_connector_row_counts_total",
+    "Table row counts resolved, by source (catalog, iceberg, reflection, count)",
+    ("source",),
+)
+PROFILE_QUERIES = REGISTRY.counter(
+    "dremio_connector_profile_queries_total",
+    "Column profiling queries, by reflection route (raw, aggregation, none) and acceleration",
+    ("route", "accelerated"),
+)
+STAGE_DURATION = REGISTRY.histogram(
+    "dremio_connector_stage_duration_seconds",
+    "Duration of ingestion stages",
+    ("stage",),
+)
+
+
+def observe_http(
+    service: str,
+    method: str,
+    endpoint: str,
+    status: str,
+    duration: float,
+    request_bytes: int = 0,
+    response_bytes: int = 0,
+):
+    """Enregistre une requête HTTP terminée"""
+    HTTP_REQUEST_DURATION.observe(service, method, endpoint, status, value=duration)
+    if request_bytes:
+        HTTP_REQUEST_BYTES.inc(service, endpoint, amount=request_bytes)
+    if response_bytes:
+        HTTP_RESPONSE_BYTES.inc(service, endpoint, amount=response_bytes)
+
+
+def _parse_epoch(value) -> Optional[float]:
+    """Horodatage d'un statut de job Dremio (ISO 8601 ou epoch ms) en secondes"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value / 1000.0
+    try:
+        from datetime import datetime
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def job_duration(job_status: Dict, start_key: str, end_key: str) -> Optional[float]:
+    """Durée en secondes entre deux horodatages d'un statut de job, None si absents"""
+    start = _parse_epoch(job_status.get(start_key))
+    end = _parse_epoch(job_status.get(end_key))
+    if start is None or end is None or end < start:
+        return None
+    return end - start
+
+
+def job_accelerated(job_status: Optional[Dict]) -> bool:
+    """Vrai si Dremio a substitué une réflexion au job (relation CHOSEN)"""
+    acceleration = (job_status or {}).get("acceleration") or {}
+    return any(
+        relationship.get("relationship") == "CHOSEN"
+        for relationship in acceleration.get("reflectionRelationships") or []
+    )
+
+
+def observe_sql_job(job_status: Optional[Dict], wall_seconds: float):
+    """Enregistre les temps d'un job SQL depuis son statut final (/api/v3/job/{id})"""
+    status = job_status or {}
+    SQL_JOB_WALL.observe(status.get("jobState", "UNKNOWN"), value=wall_seconds)
+
+    queue = job_duration(status, "resourceSchedulingStartedAt", "resourceSchedulingEndedAt")
+    if queue is not None:
+        SQL_JOB_QUEUE.observe(value=queue)
+
+    execution = job_duration(status, "startedAt", "endedAt")
+    if execution is not None:
+        SQL_JOB_EXECUTION.observe(value=execution)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Mesure la durée d'une étape d'ingestion"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_DURATION.observe(name, value=time.perf_counter() - started)
+
+
+def render() -> str:
+    """Document texte Prometheus de toutes les métriques"""
+    return REGISTRY.render()
+
+
+def write_textfile(path: str):
+    """
+    Écrit les métriques dans un fichier (écriture atomique)
+
+    Format compatible avec le textfile collector de node_exporter, et
+    envoyable tel quel à un pushgateway:
+        curl --data-binary @dremio_connector.prom http://pushgateway:9091/metrics/job/dremio_connector
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(render())
+    os.replace(tmp_path, path)
+    logger.info(f"📊 Métriques écrites: {path}")
+
+
+def start_metrics_server(port: int, addr: str = "0.0.0.0") -> "ThreadingHTTPServer":
+    """Démarre un endpoint HTTP /metrics dans un thread daemon"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_error(404)
+                return
+            data = render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+    server = ThreadingHTTPServer((addr, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    logger.info(f"📊 Endpoint de métriques Prometheus: http://{addr}:{server.server_address[1]}/metrics")
+    return server
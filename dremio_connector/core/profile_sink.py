@@ -0,0 +1,244 @@
+"""
+Écriture tamponnée et par lots des profils de tables vers OpenMetadata
+
+Les profils (``PUT /v1/tables/{id}/tableProfile``, un par table avec ses
+colonnes) passent par une file bornée: le profiling continue pendant que
+les écritures partent, par lots, sur plusieurs threads. La latence
+d'OpenMetadata ne sérialise plus le profiling; la file bornée bloque les
+producteurs si les écritures prennent du retard (mémoire constante).
+
+Quand OpenMetadata est indisponible (un lot entier en échec), les profils
+suivants vont directement dans un spool local: un fichier JSON lines en
+ajout seul, rejoué au début du run suivant. Les profils rejoués en échec
+repartent dans le spool; rien n'est perdu entre deux runs.
+
+Le writer distingue deux échecs: ``FAILED`` (5xx, 429, erreur de connexion:
+à retenter, le profil part dans le spool) et ``REJECTED`` (4xx: table
+supprimée, payload refusé; le profil est abandonné avec un warning, le
+rejouer échouerait à nouveau). Les profils rejoués sont écrits à part
+des profils du run et ne déclarent jamais OpenMetadata indisponible:
+quelques profils obsolètes du spool ne bloquent pas les nouveaux.
+
+Usage:
+    with ProfileSink(engine.put_table_profile, default_spool_path(url, service)) as sink:
+        sink.put(table_id, table_profile_payload(profile, timestamp))
+"""
+
+import hashlib
+import json
+import logging
+import os
+import queue
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50
+DEFAULT_MAX_QUEUE = 1000
+
+# Résultats d'une écriture de profil
+WRITTEN = "written"
+REJECTED = "rejected"
+FAILED = "failed"
+
+# Fin de la file (close)
+_CLOSE = object()
+
+
+def default_spool_path(openmetadata_url: str, service_name: str, state_dir: Optional[str] = None) -> Path:
+    """Spool des profils d'un service OpenMetadata dans ``state_dir`` (défaut: tmp système)"""
+    digest = hashlib.sha1(f"{openmetadata_url}|{service_name}".encode("utf-8")).hexdigest()[:12]
+    directory = Path(state_dir) if state_dir else Path(tempfile.gettempdir()) / "dremio_connector"
+    return directory / f"profile_spool_{digest}.jsonl"
+
+
+class ProfileSink:
+    """
+    File bornée de profils vidée par lots concurrents, avec spool local
+
+    Args:
+        writer: (table_id, payload) → WRITTEN, REJECTED ou FAILED, une
+            écriture de profil (OpenMetadataSyncEngine.put_table_profile);
+            un booléen est lu comme WRITTEN / FAILED
+        spool_path: fichier des profils non écrits (None = profils perdus)
+        batch_size: profils par lot
+        max_queue: profils en attente au maximum (``put`` bloque au-delà)
+        max_workers: écritures concurrentes d'un lot
+        flush_interval: secondes d'attente maximale d'un lot incomplet
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[str, Dict], object],
+        spool_path: Optional[Path] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        max_workers: int = 4,
+        flush_interval: float = 1.0,
+    ):
+        self.writer = writer
+        self.spool_path = Path(spool_path) if spool_path else None
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
+        self.flush_interval = flush_interval
+        self.queue: "queue.Queue" = queue.Queue(maxsize=max(1, max_queue))
+        self.stats = {"written": 0, "failed": 0, "rejected": 0, "spooled": 0, "replayed": 0}
+        # Un lot entier du run en échec: OpenMetadata est considéré indisponible jusqu'à la fin du run
+        self.unavailable = False
+        self._spool_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._replay_path: Optional[Path] = None
+
+    def __enter__(self) -> "ProfileSink":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def start(self) -> "ProfileSink":
+        """Démarre le vidage en arrière-plan, puis rejoue le spool du run précédent"""
+        self._thread = threading.Thread(target=self._run, name="profile-sink", daemon=True)
+        self._thread.start()
+        for table_id, payload in self._take_spool():
+            self.stats["replayed"] += 1
+            self.queue.put((table_id, payload, True))
+        return self
+
+    def put(self, table_id: str, payload: Dict):
+        """Ajoute un profil (bloque si la file est pleine)"""
+        self.queue.put((table_id, payload, False))
+
+    def close(self) -> Dict:
+        """Vide la file, attend les dernières écritures et retourne les statistiques"""
+        if self._thread is not None:
+            self.queue.put(_CLOSE)
+            self._thread.join()
+            self._thread = None
+        if self._replay_path is not None:
+            # Profils rejoués écrits ou remis dans le spool
+            try:
+                self._replay_path.unlink()
+            except OSError:
+                pass
+            self._replay_path = None
+        if self.stats["spooled"]:
+            logger.warning(f"⚠️ {self.stats['spooled']} profils dans le spool {self.spool_path} (rejoués au prochain run)")
+        return self.stats
+
+    def _run(self):
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            closing = False
+            while not closing:
+                batch = []
+                item = self.queue.get()
+                deadline = time.monotonic() + self.flush_interval
+                while True:
+                    if item is _CLOSE:
+                        closing = True
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    try:
+                        item = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                    except queue.Empty:
+                        break
+                if batch:
+                    self._flush(batch, executor)
+
+    def _flush(self, batch: List[Tuple[str, Dict, bool]], executor: ThreadPoolExecutor):
+        """Écrit les profils rejoués puis ceux du run, en deux lots distincts"""
+        replayed = [(table_id, payload) for table_id, payload, from_spool in batch if from_spool]
+        fresh = [(table_id, payload) for table_id, payload, from_spool in batch if not from_spool]
+        if replayed:
+            self._write_batch(replayed, executor, replayed=True)
+        if fresh:
+            self._write_batch(fresh, executor)
+
+    def _write_batch(self, batch: List[Tuple[str, Dict]], executor: ThreadPoolExecutor, replayed: bool = False):
+        if self.unavailable:
+            self._spool(batch)
+            return
+        results = list(executor.map(self._write, batch))
+        failed = [item for item, result in zip(batch, results) if result == FAILED]
+        rejected = [item for item, result in zip(batch, results) if result == REJECTED]
+        self.stats["written"] += len(batch) - len(failed) - len(rejected)
+        self.stats["failed"] += len(failed)
+        self.stats["rejected"] += len(rejected)
+        logger.debug(
+            "📤 Lot de profils: %d écrits, %d en échec, %d refusés",
+            len(batch) - len(failed) - len(rejected), len(failed), len(rejected),
+        )
+        for table_id, _ in rejected:
+            logger.warning(f"⚠️ Profil de {table_id} refusé par OpenMetadata, abandonné")
+        if failed:
+            self._spool(failed)
+            # Les profils rejoués peuvent viser des tables disparues: seul le run décide
+            if not replayed and len(failed) == len(batch):
+                self.unavailable = True
+                logger.warning("⚠️ OpenMetadata indisponible: profils suivants écrits dans le spool")
+
+    def _write(self, item: Tuple[str, Dict]) -> str:
+        try:
+            result = self.writer(*item)
+        except Exception as e:
+            logger.debug("Échec écriture profil %s: %s", item[0], e)
+            return FAILED
+        if isinstance(result, bool):
+            return WRITTEN if result else FAILED
+        return result
+
+    def _spool(self, items: List[Tuple[str, Dict]]):
+        if self.spool_path is None:
+            return
+        with self._spool_lock:
+            try:
+                self.spool_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.spool_path, "a", encoding="utf-8") as f:
+                    for table_id, payload in items:
+                        f.write(json.dumps({"table_id": table_id, "profile": payload}, default=str) + "\n")
+                self.stats["spooled"] += len(items)
+            except OSError as e:
+                logger.warning(f"⚠️ Impossible d'écrire le spool de profils {self.spool_path}: {e}")
+
+    def _take_spool(self) -> List[Tuple[str, Dict]]:
+        """
+        Profils du spool à rejouer
+
+        Le spool est renommé avant d'être relu: les échecs du replay
+        repartent dans un nouveau spool. Le fichier renommé n'est supprimé
+        qu'à la fermeture (un run interrompu le rejoue au run suivant).
+        """
+        if self.spool_path is None:
+            return []
+        self._replay_path = self.spool_path.with_suffix(".replay")
+        with self._spool_lock:
+            if self.spool_path.exists():
+                if self._replay_path.exists():
+                    # Replay interrompu: le spool courant s'y ajoute
+                    with open(self.spool_path, "r", encoding="utf-8") as src, \
+                            open(self._replay_path, "a", encoding="utf-8") as dst:
+                        dst.write(src.read())
+                    self.spool_path.unlink()
+                else:
+                    os.replace(self.spool_path, self._replay_path)
+        if not self._replay_path.exists():
+            return []
+
+        items = []
+        with open(self._replay_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    items.append((entry["table_id"], entry["profile"]))
+                except (ValueError, KeyError, TypeError):
+                    # Dernière ligne tronquée par un arrêt brutal
+                    continue
+        if items:
+            logger.info(f"🔁 Replay de {len(items)} profils du spool {self.spool_path}")
+        return items
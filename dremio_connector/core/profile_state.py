@@ -0,0 +1,112 @@
+"""
+État du profiling incrémental (dernier profil de chaque dataset)
+
+Pour chaque dataset profilé, l'état garde le tag Dremio du dataset (il
+change à chaque modification de sa définition), le nombre de lignes, la
+date du profil et les agrégats par colonne (lignes de
+build_column_profile_query).
+
+Au run suivant, un dataset dont le tag n'a pas changé est d'abord sondé par
+son seul nombre de lignes: s'il est identique et que le profil a moins de
+``max_age`` secondes, les agrégats des colonnes sont réutilisés sans aucune
+requête par colonne. Les tables d'historique écrites une fois ne coûtent
+plus qu'un COUNT(*) par run.
+
+Un fichier JSON par instance Dremio.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PROFILE_STATE_VERSION = 1
+
+# Au-delà, un profil est recalculé même si le dataset semble inchangé
+DEFAULT_PROFILE_MAX_AGE = 7 * 24 * 3600.0
+
+
+def dataset_tag(entity: Optional[Dict]) -> Optional[str]:
+    """Tag de version d'une entité dataset du catalogue Dremio (None si absent)"""
+    return (entity or {}).get("tag") or None
+
+
+class ProfileState:
+    """
+    Derniers profils des datasets d'une instance Dremio, persistés en JSON
+
+    Args:
+        dremio_url: instance Dremio (clé du fichier)
+        state_dir: répertoire de l'état (défaut: tmp système)
+    """
+
+    def __init__(self, dremio_url: str, state_dir: Optional[str] = None):
+        digest = hashlib.sha1(dremio_url.encode("utf-8")).hexdigest()[:12]
+        directory = Path(state_dir) if state_dir else Path(tempfile.gettempdir()) / "dremio_connector"
+        self.path = directory / f"profile_state_{digest}.json"
+        self.datasets: Dict[str, Dict] = {}
+
+    def load(self) -> "ProfileState":
+        """Charge l'état du dernier run (vide au premier run ou si illisible)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return self
+        except Exception as e:
+            logger.warning(f"⚠️  État de profiling illisible {self.path}: {e}")
+            return self
+
+        if state.get("version") == PROFILE_STATE_VERSION:
+            self.datasets = state.get("datasets", {})
+        return self
+
+    def previous(
+        self,
+        path: List[str],
+        tag: Optional[str],
+        sample_rows: Optional[int] = None,
+        max_age: Optional[float] = DEFAULT_PROFILE_MAX_AGE,
+    ) -> Optional[Dict]:
+        """
+        Dernier profil réutilisable du dataset, à confirmer par son nombre de lignes
+
+        None si le dataset n'a pas de tag, si le tag ou l'échantillonnage ont
+        changé, ou si le profil a plus de ``max_age`` secondes (None = sans limite).
+        """
+        entry = self.datasets.get(".".join(path))
+        if entry is None or tag is None or entry.get("tag") != tag or entry.get("sample_rows") != sample_rows:
+            return None
+        if max_age is not None and time.time() - entry.get("profiled_at", 0) > max_age:
+            return None
+        return entry
+
+    def record(self, path: List[str], tag: Optional[str], sample_rows: Optional[int], row_count: Optional[int],
+               columns: Dict[str, Dict]):
+        """Enregistre un profil complet (un profil réutilisé garde sa date d'origine)"""
+        if tag is None:
+            return
+        self.datasets[".".join(path)] = {
+            "tag": tag,
+            "sample_rows": sample_rows,
+            "row_count": row_count,
+            "profiled_at": time.time(),
+            "columns": columns,
+        }
+
+    def save(self):
+        """Écriture atomique (fichier temporaire + rename)"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": PROFILE_STATE_VERSION, "datasets": self.datasets}, f, default=str)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"⚠️  Impossible d'écrire l'état de profiling {self.path}: {e}")
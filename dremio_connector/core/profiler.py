@@ -0,0 +1,228 @@
+"""
+Génération des requêtes SQL de profiling Dremio
+
+Utilisé par ``DremioConnector.get_profile_metrics``: une requête de comptage
+par table, puis une requête d'agrégats par colonne dont les métriques
+dépendent du type (numérique: min/max/moyenne/écart-type, texte: longueurs).
+``profile_dataset`` exécute les mêmes requêtes hors workflow OpenMetadata
+(commande ``dremio-connector profile``); ``table_profile_payload`` met son
+résultat au format de ``PUT /v1/tables/{id}/tableProfile``. Les requêtes
+des colonnes couvertes par une réflexion sont mises en forme pour être
+accélérées (routes de core.reflections).
+"""
+
+from typing import Dict, List, Optional
+
+from dremio_connector.core import tracing
+
+
+def is_numeric_type(column_type: str) -> bool:
+    """Types profilés avec min/max/mean/stddev"""
+    column_type = column_type.upper()
+    return 'INT' in column_type or column_type in ('BIGINT', 'DOUBLE', 'FLOAT', 'DECIMAL')
+
+
+def is_string_type(column_type: str) -> bool:
+    """Types profilés avec les longueurs min/max/moyenne"""
+    column_type = column_type.upper()
+    return 'VARCHAR' in column_type or 'CHAR' in column_type
+
+
+def build_row_count_query(dremio_path: str) -> str:
+    """Requête de comptage des lignes d'une table (alias row_count)"""
+    return f"SELECT COUNT(*) as row_count FROM {dremio_path}"
+
+
+def build_column_profile_query(
+    dremio_path: str,
+    column_name: str,
+    column_type: str,
+    sample_rows: Optional[int] = None,
+    route: Optional[Dict] = None
+) -> str:
+    """
+    Requête d'agrégats d'une colonne
+
+    Alias toujours présents: total_count, non_null_count, distinct_count.
+    Numériques: min_value, max_value, mean_value, stddev_value.
+    Texte: min_length, max_length, avg_length.
+
+    Args:
+        dremio_path: chemin Dremio quoté de la table ("source"."schema"."table")
+        column_name: nom de la colonne (non quoté)
+        column_type: type OpenMetadata de la colonne
+        sample_rows: limite de lignes échantillonnées (None = toutes)
+        route: route de ReflectionIndex.route; ``raw`` ne projette que la
+            colonne, ``aggregation`` se limite aux agrégats de la réflexion
+            (distinct_count seulement pour une dimension, mean_value
+            seulement avec SUM, sans stddev_value)
+    """
+    col_escaped = f'"{column_name}"'
+    sample_clause = f" LIMIT {sample_rows}" if sample_rows else ""
+
+    if route and route.get("type") == "aggregation":
+        metrics = [
+            "COUNT(*) as total_count",
+            f"COUNT({col_escaped}) as non_null_count",
+            f"MIN({col_escaped}) as min_value",
+            f"MAX({col_escaped}) as max_value",
+        ]
+        if route.get("dimension"):
+            metrics.append(f"COUNT(DISTINCT {col_escaped}) as distinct_count")
+        if "SUM" in route.get("measures", ()):
+            metrics.append(f"AVG(CAST({col_escaped} AS DOUBLE)) as mean_value")
+        return f"SELECT {', '.join(metrics)} FROM {dremio_path}"
+
+    metrics = [
+        "COUNT(*) as total_count",
+        f"COUNT({col_escaped}) as non_null_count",
+        f"COUNT(DISTINCT {col_escaped}) as distinct_count",
+    ]
+    if is_numeric_type(column_type):
+        metrics += [
+            f"MIN({col_escaped}) as min_value",
+            f"MAX({col_escaped}) as max_value",
+            f"AVG(CAST({col_escaped} AS DOUBLE)) as mean_value",
+            f"STDDEV(CAST({col_escaped} AS DOUBLE)) as stddev_value",
+        ]
+    elif is_string_type(column_type):
+        metrics += [
+            f"MIN(LENGTH({col_escaped})) as min_length",
+            f"MAX(LENGTH({col_escaped})) as max_length",
+            f"AVG(LENGTH({col_escaped})) as avg_length",
+        ]
+
+    projection = col_escaped if route and route.get("type") == "raw" else "*"
+    return f"SELECT {', '.join(metrics)} FROM (SELECT {projection} FROM {dremio_path}{sample_clause})"
+
+
+def quote_path(path: List[str]) -> str:
+    """Chemin Dremio quoté ("source"."folder"."table") depuis un path découvert"""
+    return ".".join('"{}"'.format(part.replace('"', '""')) for part in path)
+
+
+def profile_dataset(
+    client,
+    path: List[str],
+    columns: List[Dict],
+    sample_rows: Optional[int] = None,
+    previous: Optional[Dict] = None,
+    row_counts=None,
+    entity: Optional[Dict] = None,
+    reflections=None
+) -> Dict:
+    """
+    Profile un dataset découvert (DremioAutoDiscovery authentifié)
+
+    Args:
+        previous: dernier profil du dataset (ProfileState.previous); si le
+            nombre de lignes n'a pas changé, ses agrégats sont réutilisés
+            sans requête par colonne
+        row_counts: RowCountResolver (core.row_count) pour compter sans
+            scan quand c'est possible; sans résolveur, SELECT COUNT(*)
+        entity: entité dataset du catalogue, passée au résolveur
+        reflections: ReflectionIndex (core.reflections) qui route les
+            requêtes des colonnes et compte leur accélération
+
+    Returns:
+        Dict: {"path": List[str], "row_count": int | None,
+               "row_count_source": str | None,
+               "columns": {nom: ligne d'agrégats de build_column_profile_query},
+               "reused": bool}
+    """
+    dremio_path = quote_path(path)
+    profile = {"path": path, "row_count": None, "row_count_source": None, "columns": {}, "reused": False}
+
+    with tracing.span("profile_table", table=".".join(path)) as span:
+        if row_counts is not None:
+            profile["row_count"], profile["row_count_source"] = row_counts.resolve(path, entity)
+        else:
+            result = client.execute_sql_query(build_row_count_query(dremio_path))
+            if result and result.get("rows"):
+                profile["row_count"] = int(result["rows"][0].get("row_count", 0))
+                profile["row_count_source"] = "count"
+        span.set_attribute("row_count_source", profile["row_count_source"])
+
+        if previous is not None and profile["row_count"] is not None and previous.get("row_count") == profile["row_count"]:
+            names = {column["name"] for column in columns}
+            profile["columns"] = {name: stats for name, stats in previous.get("columns", {}).items() if name in names}
+            profile["reused"] = True
+            span.set_attribute("reused", True)
+            return profile
+
+        dataset_id = (entity or {}).get("id")
+        for column in columns:
+            with tracing.span("profile_column", column=column["name"]) as column_span:
+                route = None
+                if reflections is not None:
+                    route = reflections.route(dataset_id, column["name"], column.get("dataType", ""), sample_rows)
+                query = build_column_profile_query(
+                    dremio_path, column["name"], column.get("dataType", ""), sample_rows, route
+                )
+                result = client.execute_sql_query(query)
+                if reflections is not None:
+                    reflections.observe(route, result)
+                column_span.set_attribute("reflection_route", route["type"] if route else "none")
+                column_span.set_attribute("accelerated", bool((result or {}).get("accelerated")))
+            if result and result.get("rows"):
+                profile["columns"][column["name"]] = result["rows"][0]
+
+    return profile
+
+
+# Alias de build_column_profile_query → champ ColumnProfile
+_NUMERIC_METRICS = {"min_value": "min", "max_value": "max", "mean_value": "mean", "stddev_value": "stddev"}
+# Calculées par le moteur sample (core.sample_profiler) seulement
+_QUARTILE_METRICS = {"first_quartile": "firstQuartile", "median": "median", "third_quartile": "thirdQuartile"}
+_LENGTH_METRICS = {"min_length": "minLength", "max_length": "maxLength", "avg_length": "meanLength"}
+
+
+def table_profile_payload(
+    profile: Dict,
+    timestamp: int,
+    column_count: Optional[int] = None,
+    profile_sample: float = 100.0
+) -> Dict:
+    """
+    CreateTableProfile OpenMetadata depuis un résultat de profile_dataset
+
+    Mêmes métriques que ``DremioConnector._column_profile`` (proportions de
+    nulls et de valeurs distinctes calculées sur total_count).
+
+    Args:
+        timestamp: horodatage des profils (ms epoch)
+        column_count: colonnes de la table (défaut: colonnes profilées)
+    """
+    column_profiles = []
+    for name, stats in profile.get("columns", {}).items():
+        total_count = int(stats.get("total_count") or 0)
+        non_null_count = int(stats.get("non_null_count") or 0)
+        column_profile = {
+            "name": name,
+            "timestamp": timestamp,
+            "valuesCount": total_count,
+            "nullCount": total_count - non_null_count,
+            "nullProportion": (total_count - non_null_count) / total_count if total_count > 0 else 0.0,
+        }
+        if "distinct_count" in stats:
+            # Absent des requêtes routées vers une réflexion d'agrégation (hors dimensions)
+            distinct_count = int(stats.get("distinct_count") or 0)
+            column_profile["distinctCount"] = distinct_count
+            column_profile["uniqueCount"] = distinct_count
+            column_profile["uniqueProportion"] = distinct_count / total_count if total_count > 0 else 0.0
+        for alias, field in {**_NUMERIC_METRICS, **_QUARTILE_METRICS, **_LENGTH_METRICS}.items():
+            if stats.get(alias) is not None:
+                column_profile[field] = float(stats[alias])
+        if stats.get("histogram"):
+            column_profile["histogram"] = stats["histogram"]
+        column_profiles.append(column_profile)
+
+    table_profile = {
+        "timestamp": timestamp,
+        "columnCount": column_count if column_count is not None else len(column_profiles),
+        "profileSample": profile_sample,
+    }
+    if profile.get("row_count") is not None:
+        # Inconnu (moteur sample sans source de comptage): absent plutôt que 0
+        table_profile["rowCount"] = profile["row_count"]
+    return {"tableProfile": table_profile, "columnProfile": column_profiles}
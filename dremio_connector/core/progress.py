@@ -0,0 +1,118 @@
+"""
+Logs de progression agrégés pour les boucles par item
+
+Sur un gros catalogue, un ``logger.info`` par dataset, colonne ou écriture
+coûte en formatage et en I/O. Les logs par item passent en DEBUG (format
+``%`` paresseux) et un ``ProgressLogger`` émet à la place une ligne agrégée
+au plus toutes les ``interval`` secondes:
+
+    📊 Découverte: 48210 items (9642.0/s) — ex: src.raw.orders
+    📊 Tables: 1200/5000 (240.0/s, ETA 15s) — ex: src.raw.orders
+
+L'item cité est échantillonné: c'est le dernier vu au moment de la ligne.
+
+Usage:
+    progress = ProgressLogger(logger, "Tables", total=len(tables))
+    for table in tables:
+        ...
+        progress.advance(item=table["full_path"])
+    progress.finish()
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+# Intervalle par défaut entre deux lignes de progression (secondes)
+DEFAULT_INTERVAL = 10.0
+
+
+def format_eta(seconds: float) -> str:
+    """Durée restante lisible (45s, 3m12s, 2h05m)"""
+    seconds = int(seconds)
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+
+
+class ProgressLogger:
+    """
+    Ligne de progression périodique (items/s, ETA)
+
+    Args:
+        logger: logger de destination
+        label: nom de l'étape ("Découverte", "Tables"...)
+        total: nombre d'items attendus (ETA affichée si connu)
+        interval: secondes minimales entre deux lignes (0 ou None = désactivé)
+        level: niveau des lignes de progression
+        clock: horloge monotone (injectable pour les tests)
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        label: str,
+        total: Optional[int] = None,
+        interval: Optional[float] = DEFAULT_INTERVAL,
+        level: int = logging.INFO,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.logger = logger
+        self.label = label
+        self.total = total
+        self.interval = interval or 0
+        self.level = level
+        self.clock = clock
+        self.count = 0
+        self.emitted = 0
+        self._started = clock()
+        self._next_emit = self._started + self.interval
+        self._last_item = None
+        self._lock = threading.Lock()
+
+    def advance(self, n: int = 1, item: Optional[str] = None):
+        """Compte ``n`` items; émet une ligne si l'intervalle est écoulé"""
+        self.count += n
+        if item is not None:
+            self._last_item = item
+        if not self.interval:
+            return
+        now = self.clock()
+        if now < self._next_emit:
+            return
+        with self._lock:
+            if now < self._next_emit:
+                return
+            self._next_emit = now + self.interval
+        self._emit(now)
+
+    def finish(self):
+        """Ligne finale (total et débit moyen), si au moins un item a été compté"""
+        if self.interval and self.count:
+            self._emit(self.clock(), final=True)
+
+    def _emit(self, now: float, final: bool = False):
+        if not self.logger.isEnabledFor(self.level):
+            return
+        elapsed = max(now - self._started, 1e-9)
+        rate = self.count / elapsed
+        self.emitted += 1
+
+        if self.total:
+            if final:
+                progress = "%d/%d (%.1f/s, en %s)" % (self.count, self.total, rate, format_eta(elapsed))
+            else:
+                remaining = max(self.total - self.count, 0) / rate if rate else 0
+                progress = "%d/%d (%.1f/s, ETA %s)" % (self.count, self.total, rate, format_eta(remaining))
+        elif final:
+            progress = "%d items (%.1f/s, en %s)" % (self.count, rate, format_eta(elapsed))
+        else:
+            progress = "%d items (%.1f/s)" % (self.count, rate)
+
+        if self._last_item is not None and not final:
+            self.logger.log(self.level, "📊 %s: %s — ex: %s", self.label, progress, self._last_item)
+        else:
+            self.logger.log(self.level, "📊 %s: %s", self.label, progress)
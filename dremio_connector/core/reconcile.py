@@ -0,0 +1,116 @@
+"""
+Réconciliation mark-and-sweep des tables supprimées côté Dremio
+
+Mark: les FQN de toutes les tables découvertes (écrites ou inchangées) sont
+mis dans un set. Sweep: les tables du service sont listées page par page
+dans OpenMetadata (champs minimaux: id et FQN) et celles absentes du set
+sont périmées. Le rapport se calcule sans aucune lecture par table.
+
+Seules les tables dans le périmètre des filtres include/exclude sont
+candidates: une table hors périmètre n'a simplement pas été découverte. De
+même pour les sous-arbres dont le listing a échoué pendant la découverte
+(``DremioAutoDiscovery.failed_paths``): leurs tables sont gardées.
+
+Garde-fou: si la part de tables périmées dépasse ``max_ratio`` (découverte
+partielle, mauvais filtre, mauvaise instance...), aucune suppression n'a lieu.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Set
+
+from dremio_connector.core.filters import PathFilter
+
+logger = logging.getLogger(__name__)
+
+# Part maximale des tables du service supprimées en un run
+DEFAULT_MAX_DELETE_RATIO = 0.2
+
+# Suppressions par lot (une ligne de log et un contrôle du débit par lot)
+DEFAULT_DELETE_BATCH_SIZE = 50
+
+
+def split_fqn(fqn: str) -> List[str]:
+    """Découpe un FQN OpenMetadata (inverse de build_fqn: les parties entre guillemets gardent leurs ".")"""
+    parts, current, quoted = [], [], False
+    for char in fqn:
+        if char == '"':
+            quoted = not quoted
+        elif char == "." and not quoted:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append("".join(current))
+    return parts
+
+
+def dremio_path(table_fqn: str) -> List[str]:
+    """
+    Path Dremio d'une table depuis son FQN (service.database.schema.table)
+
+    Le schéma joint les dossiers par "." (voir split_dataset_path); un
+    dataset à la racine de sa source a un schéma du même nom que lui.
+    """
+    parts = split_fqn(table_fqn)
+    if len(parts) < 4:
+        return parts[1:]
+    _, database, schema, table = parts[:4]
+    if schema == table:
+        return [database, table]
+    return [database, *schema.split("."), table]
+
+
+def _normalize(path: List[str]) -> List[str]:
+    """Path comparable à dremio_path: les dossiers sont découpés sur "." comme dans les schémas"""
+    return path[:1] + [part for folder in path[1:] for part in folder.split(".")]
+
+
+def find_stale(
+    listed: Dict[str, str],
+    discovered: Set[str],
+    path_filter: Optional[PathFilter] = None,
+    failed_paths: Iterable[List[str]] = (),
+) -> Dict[str, str]:
+    """
+    Tables OpenMetadata absentes de la découverte
+
+    Args:
+        listed: FQN → id des tables du service dans OpenMetadata
+        discovered: FQN des tables découvertes dans Dremio
+        path_filter: périmètre de la découverte (les tables hors périmètre sont gardées)
+        failed_paths: conteneurs dont le listing a échoué (leurs tables sont gardées)
+
+    Returns:
+        Dict[str, str]: FQN → id des tables périmées
+    """
+    path_filter = path_filter or PathFilter()
+    failed = [_normalize(list(path)) for path in failed_paths]
+
+    def unknown(path: List[str]) -> bool:
+        return any(path[:len(prefix)] == prefix for prefix in failed)
+
+    return {
+        fqn: table_id
+        for fqn, table_id in listed.items()
+        if fqn not in discovered
+        and (not path_filter or path_filter.accept(dremio_path(fqn)))
+        and not unknown(dremio_path(fqn))
+    }
+
+
+def exceeds_threshold(stale: int, total: int, max_ratio: Optional[float]) -> bool:
+    """La suppression de ``stale`` tables sur ``total`` dépasse-t-elle le garde-fou?"""
+    if max_ratio is None or not stale:
+        return False
+    return stale > max_ratio * total
+
+
+def batches(items: Iterable, size: int) -> Iterable[List]:
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
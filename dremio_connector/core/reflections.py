@@ -0,0 +1,204 @@
+"""
+Réflexions Dremio utilisables et routage des requêtes de profiling
+
+``sys.reflections`` est lu une seule fois par run (réflexions
+``CAN_ACCELERATE``) et indexé par dataset: colonnes des réflexions RAW,
+dimensions et mesures des réflexions d'agrégation, ``record_count`` des
+réflexions RAW (source ``reflection`` de core.row_count).
+
+Une requête ``SELECT *`` n'est substituée que par une réflexion RAW qui
+couvre toutes les colonnes, et un ``LIMIT`` empêche toute réflexion
+d'agrégation. Chaque requête de colonne est donc routée:
+
+- ``raw``: la colonne est dans une réflexion RAW, la sous-requête ne
+  projette qu'elle (mêmes agrégats, échantillonnage compris)
+- ``aggregation``: la colonne est une mesure avec MIN, MAX et COUNT d'une
+  réflexion d'agrégation, profil complet (sans échantillon) seulement:
+  requête directe sur le dataset limitée aux agrégats couverts (COUNT(*),
+  COUNT, MIN, MAX, AVG si SUM est une mesure, COUNT(DISTINCT) si la colonne
+  est aussi une dimension; pas d'écart-type)
+- ``none``: requête inchangée
+
+Le taux d'accélération est mesuré depuis le statut des jobs (une réflexion
+``CHOSEN`` dans ``acceleration.reflectionRelationships``), par route, dans
+``stats`` et la métrique ``dremio_connector_profile_queries_total``.
+"""
+
+import json
+import logging
+import re
+import threading
+from typing import Dict, List, Optional, Set
+
+from dremio_connector.core import metrics
+from dremio_connector.core.profiler import is_numeric_type
+
+logger = logging.getLogger(__name__)
+
+RAW = "raw"
+AGGREGATION = "aggregation"
+NONE = "none"
+
+ROUTES = (RAW, AGGREGATION, NONE)
+
+REFLECTIONS_QUERY = (
+    "SELECT dataset_id, type, record_count, display_columns, dimensions, measures "
+    "FROM sys.reflections WHERE status = 'CAN_ACCELERATE'"
+)
+
+# Mesures d'une colonne déclarée sans type (défaut Dremio)
+DEFAULT_MEASURES = frozenset({"SUM", "COUNT"})
+
+# Mesures nécessaires à la route aggregation
+ROUTED_MEASURES = frozenset({"MIN", "MAX", "COUNT"})
+
+# "col (SUM, COUNT)", "col:[MIN, MAX]" ou "col", séparés par des virgules
+_MEASURE_RE = re.compile(r'\s*"?([^",()\[\]:]+?)"?\s*:?\s*(?:[(\[]([^)\]]*)[)\]])?\s*(?:,|$)')
+
+
+def parse_columns(value) -> List[str]:
+    """Colonnes d'un champ de sys.reflections (liste, texte JSON ou texte séparé par des virgules)"""
+    if value is None:
+        return []
+    if isinstance(value, str) and value.strip().startswith("["):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            value = value.strip()[1:-1]
+    if isinstance(value, list):
+        return [str(item.get("name") if isinstance(item, dict) else item).strip('" ') for item in value if item]
+    return [part.strip().strip('"') for part in str(value).split(",") if part.strip().strip('"')]
+
+
+def parse_measures(value) -> Dict[str, Set[str]]:
+    """Mesures d'une réflexion d'agrégation: colonne → types (MIN, MAX, SUM, COUNT...)"""
+    if value is None:
+        return {}
+    if isinstance(value, list):
+        measures = {}
+        for item in value:
+            if isinstance(item, dict) and item.get("name"):
+                types = item.get("measureTypeList") or item.get("measureTypes") or DEFAULT_MEASURES
+                measures[str(item["name"])] = {str(t).upper() for t in types}
+            elif item:
+                measures[str(item)] = set(DEFAULT_MEASURES)
+        return measures
+
+    measures = {}
+    for match in _MEASURE_RE.finditer(str(value)):
+        name = match.group(1).strip()
+        if not name:
+            continue
+        types = match.group(2)
+        measures[name] = {t.strip().upper() for t in types.split(",") if t.strip()} if types else set(DEFAULT_MEASURES)
+    return measures
+
+
+class ReflectionIndex:
+    """
+    Réflexions utilisables d'une instance Dremio, par dataset id
+
+    Args:
+        client: DremioAutoDiscovery authentifié
+        routing: route les requêtes de profiling (faux: requêtes inchangées,
+            le taux d'accélération reste mesuré)
+    """
+
+    def __init__(self, client, routing: bool = True):
+        self.client = client
+        self.routing = routing
+        self.stats: Dict[str, Dict[str, int]] = {route: {"queries": 0, "accelerated": 0} for route in ROUTES}
+        self._datasets: Optional[Dict[str, Dict]] = None
+        self._lock = threading.Lock()
+
+    def datasets(self) -> Dict[str, Dict]:
+        """
+        dataset_id → {"record_count", "raw_columns", "dimensions", "measures"}
+        (sys.reflections lu une fois, au premier appel)
+        """
+        with self._lock:
+            if self._datasets is None:
+                self._datasets = {}
+                # toutes les pages: execute_sql_query n'en rend que la première
+                try:
+                    for row in self.client.iter_sql_rows(REFLECTIONS_QUERY, raise_on_error=True):
+                        if row.get("dataset_id"):
+                            self._add(row)
+                except RuntimeError as e:
+                    # index partiel écarté: ni routage ni comptage sur une lecture incomplète
+                    logger.warning(f"⚠️  sys.reflections illisible, profiling sans réflexions: {e}")
+                    self._datasets = {}
+                logger.debug("%d datasets avec une réflexion utilisable", len(self._datasets))
+            return self._datasets
+
+    def _add(self, row: Dict):
+        dataset = self._datasets.setdefault(row["dataset_id"], {
+            "record_count": None, "raw_columns": set(), "dimensions": set(), "measures": {},
+        })
+        if str(row.get("type", "")).upper() == "RAW":
+            count = row.get("record_count")
+            if count is not None and int(count) >= 0:
+                dataset["record_count"] = max(int(count), dataset["record_count"] or 0)
+            dataset["raw_columns"].update(parse_columns(row.get("display_columns")))
+        elif str(row.get("type", "")).upper() == "AGGREGATION":
+            dataset["dimensions"].update(parse_columns(row.get("dimensions")))
+            for name, types in parse_measures(row.get("measures")).items():
+                dataset["measures"].setdefault(name, set()).update(types)
+
+    def record_counts(self) -> Dict[str, int]:
+        """dataset_id → record_count des réflexions RAW"""
+        return {
+            dataset_id: dataset["record_count"]
+            for dataset_id, dataset in self.datasets().items()
+            if dataset["record_count"] is not None
+        }
+
+    def route(
+        self,
+        dataset_id: Optional[str],
+        column_name: str,
+        column_type: str,
+        sample_rows: Optional[int] = None
+    ) -> Optional[Dict]:
+        """
+        Route de la requête d'agrégats d'une colonne (argument ``route`` de
+        build_column_profile_query); None: requête inchangée
+        """
+        if not self.routing or not dataset_id:
+            return None
+        dataset = self.datasets().get(dataset_id)
+        if dataset is None:
+            return None
+        if column_name in dataset["raw_columns"]:
+            return {"type": RAW}
+        measures = dataset["measures"].get(column_name, set())
+        if sample_rows is None and is_numeric_type(column_type) and ROUTED_MEASURES <= measures:
+            return {"type": AGGREGATION, "measures": measures, "dimension": column_name in dataset["dimensions"]}
+        return None
+
+    def observe(self, route: Optional[Dict], result: Optional[Dict]):
+        """Compte une requête de profiling exécutée et son accélération (résultat de execute_sql_query)"""
+        if result is None:
+            return
+        name = route["type"] if route else NONE
+        accelerated = bool(result.get("accelerated"))
+        with self._lock:
+            self.stats[name]["queries"] += 1
+            self.stats[name]["accelerated"] += accelerated
+        metrics.PROFILE_QUERIES.inc(name, "true" if accelerated else "false")
+
+    def hit_rate(self) -> Optional[float]:
+        """Part des requêtes de profiling accélérées (None sans requête)"""
+        queries = sum(stats["queries"] for stats in self.stats.values())
+        if not queries:
+            return None
+        return sum(stats["accelerated"] for stats in self.stats.values()) / queries
+
+    def summary(self) -> str:
+        """Ligne de log du taux d'accélération, par route"""
+        queries = sum(stats["queries"] for stats in self.stats.values())
+        accelerated = sum(stats["accelerated"] for stats in self.stats.values())
+        routes = ", ".join(
+            f"{route} {stats['accelerated']}/{stats['queries']}" for route, stats in self.stats.items() if stats["queries"]
+        )
+        return f"{accelerated}/{queries} requêtes de profiling accélérées ({(self.hit_rate() or 0.0):.0%}; {routes})"
@@ -0,0 +1,156 @@
+"""
+Nombre de lignes des tables sans scan des données
+
+``SELECT COUNT(*)`` coûte un job Dremio par table et par run. Le résolveur
+essaie d'abord les sources de métadonnées, dans l'ordre:
+
+- ``catalog``: statistiques déjà présentes dans l'entité dataset du
+  catalogue (aucune requête)
+- ``iceberg``: ``total-records`` du résumé du dernier snapshot d'une table
+  Iceberg (``TABLE(table_snapshot(...))``, lecture des métadonnées seules)
+- ``reflection``: ``record_count`` d'une réflexion RAW utilisable du dataset
+  (``sys.reflections``, une seule requête pour tout le run, index partagé
+  avec le routage du profiling: core.reflections)
+- ``count``: ``SELECT COUNT(*)``, seulement si aucune autre source ne répond
+
+Le moteur de profiling ``sample`` promet une seule requête par table: il
+utilise ``SAMPLE_SOURCES`` (aucune requête par table), ``iceberg`` et
+``count`` n'y sont essayés que s'ils sont demandés explicitement. Sans
+source disponible, le nombre de lignes d'une grande table reste inconnu.
+
+La source de chaque comptage est renvoyée avec lui et comptée dans
+``stats`` et dans la métrique ``dremio_connector_row_counts_total{source}``.
+Une réflexion peut être en retard sur sa table: ``sources`` permet de s'en
+passer.
+"""
+
+import logging
+import re
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from dremio_connector.core import metrics
+from dremio_connector.core.profiler import build_row_count_query, quote_path
+from dremio_connector.core.reflections import ReflectionIndex
+
+logger = logging.getLogger(__name__)
+
+CATALOG = "catalog"
+ICEBERG = "iceberg"
+REFLECTION = "reflection"
+COUNT = "count"
+
+SOURCES = (CATALOG, ICEBERG, REFLECTION, COUNT)
+
+# Sources par défaut du moteur sample: aucune requête par table
+SAMPLE_SOURCES = (CATALOG, REFLECTION)
+
+# Champs de comptage d'une entité dataset (selon la version et l'édition de
+# Dremio; absents, la source suivante est essayée)
+CATALOG_COUNT_FIELDS = ("recordCount", "approximateRowCount")
+
+_TOTAL_RECORDS_RE = re.compile(r"total-records\W+(\d+)")
+
+
+def build_snapshot_summary_query(dremio_path: str) -> str:
+    """Résumé du dernier snapshot d'une table Iceberg (alias summary)"""
+    table = dremio_path.replace("'", "''")
+    return f"SELECT summary FROM TABLE(table_snapshot('{table}')) ORDER BY committed_at DESC LIMIT 1"
+
+
+def total_records(summary) -> Optional[int]:
+    """
+    ``total-records`` d'un résumé de snapshot Iceberg
+
+    Dremio renvoie la map du résumé en dict, en liste de paires
+    {"key", "value"} ou en texte selon la version.
+    """
+    if isinstance(summary, list):
+        summary = {item.get("key"): item.get("value") for item in summary if isinstance(item, dict)}
+    if isinstance(summary, dict):
+        value = summary.get("total-records")
+        return int(value) if value is not None and str(value).isdigit() else None
+    match = _TOTAL_RECORDS_RE.search(str(summary or ""))
+    return int(match.group(1)) if match else None
+
+
+def is_iceberg(entity: Dict) -> bool:
+    return str((entity.get("format") or {}).get("type", "")).upper() == "ICEBERG"
+
+
+class RowCountResolver:
+    """
+    Nombre de lignes d'un dataset depuis la source la moins chère disponible
+
+    Args:
+        client: DremioAutoDiscovery authentifié
+        sources: sources essayées, dans l'ordre (défaut: toutes, COUNT(*) en dernier)
+        reflections: index des réflexions partagé avec le profiling (défaut: propre au résolveur)
+    """
+
+    def __init__(self, client, sources: Sequence[str] = SOURCES, reflections: Optional[ReflectionIndex] = None):
+        self.client = client
+        self.sources = tuple(sources)
+        self.reflections = reflections or ReflectionIndex(client)
+        self.stats: Dict[str, int] = {source: 0 for source in SOURCES}
+        self._reflection_counts: Optional[Dict[str, int]] = None
+        self._lock = threading.Lock()
+
+    def resolve(self, path: List[str], entity: Optional[Dict] = None) -> Tuple[Optional[int], Optional[str]]:
+        """
+        (nombre de lignes, source) d'un dataset
+
+        Args:
+            path: path Dremio du dataset
+            entity: entité dataset du catalogue (id, format), si elle est connue
+
+        Returns:
+            Tuple: (None, None) si aucune source, COUNT(*) compris, n'a répondu
+        """
+        entity = entity or {}
+        for source in self.sources:
+            try:
+                count = getattr(self, f"_from_{source}")(path, entity)
+            except Exception as e:
+                logger.debug("Comptage %s indisponible pour %s: %s", source, ".".join(path), e)
+                count = None
+            if count is not None:
+                with self._lock:
+                    self.stats[source] += 1
+                metrics.ROW_COUNTS.inc(source)
+                logger.debug("🔢 %s: %d lignes (%s)", ".".join(path), count, source)
+                return count, source
+        return None, None
+
+    def _from_catalog(self, path: List[str], entity: Dict) -> Optional[int]:
+        for field in CATALOG_COUNT_FIELDS:
+            value = entity.get(field)
+            if isinstance(value, int) and value >= 0:
+                return value
+        return None
+
+    def _from_iceberg(self, path: List[str], entity: Dict) -> Optional[int]:
+        if not is_iceberg(entity):
+            return None
+        result = self.client.execute_sql_query(build_snapshot_summary_query(quote_path(path)))
+        if not result or not result.get("rows"):
+            return None
+        return total_records(result["rows"][0].get("summary"))
+
+    def _from_reflection(self, path: List[str], entity: Dict) -> Optional[int]:
+        if not entity.get("id"):
+            return None
+        return self.reflection_counts().get(entity["id"])
+
+    def _from_count(self, path: List[str], entity: Dict) -> Optional[int]:
+        result = self.client.execute_sql_query(build_row_count_query(quote_path(path)))
+        if not result or not result.get("rows"):
+            return None
+        return int(result["rows"][0].get("row_count", 0))
+
+    def reflection_counts(self) -> Dict[str, int]:
+        """dataset_id → record_count des réflexions RAW utilisables (chargé une fois)"""
+        if self._reflection_counts is None:
+            self._reflection_counts = self.reflections.record_counts()
+            logger.debug("%d datasets avec une réflexion RAW comptée", len(self._reflection_counts))
+        return self._reflection_counts
@@ -0,0 +1,204 @@
+"""
+Profiling côté client sur un échantillon par table (moteur ``sample``)
+
+Le moteur SQL (core.profiler) envoie une requête d'agrégats par colonne:
+une table de 200 colonnes coûte 200 jobs au cluster Dremio partagé. Ce
+moteur tire un seul échantillon borné par table
+(``SELECT "a", "b", ... FROM table LIMIT n``, en Arrow via
+``DremioAutoDiscovery.execute_sql_arrow``: colonnaire de bout en bout en
+Arrow Flight) et calcule toutes les métriques localement, en NumPy
+vectorisé, sur le worker d'ingestion:
+
+- toutes les colonnes: total_count, non_null_count, distinct_count,
+  top_values (k valeurs les plus fréquentes et leur nombre)
+- numériques: min_value, max_value, mean_value, stddev_value,
+  first_quartile, median, third_quartile, histogram
+- texte: min_length, max_length, avg_length
+- imbriquées (LIST, STRUCT, MAP): total_count et non_null_count seulement
+
+Les alias sont ceux de build_column_profile_query: le résultat se
+consomme comme celui de profile_dataset (table_profile_payload,
+ProfileState). Les métriques portent sur l'échantillon; si la table a
+moins de lignes que la limite, l'échantillon est la table entière et donne
+aussi le nombre de lignes (source ``sample``, aucune autre requête).
+Sinon le nombre de lignes vient du RowCountResolver, configuré par défaut
+sans ``COUNT(*)`` (core.row_count.SAMPLE_SOURCES): sans statistique de
+catalogue ni réflexion, il reste inconnu plutôt que de coûter un second job.
+"""
+
+import logging
+from typing import Dict, List, Optional
+
+from dremio_connector.core import tracing
+from dremio_connector.core.profiler import is_numeric_type, is_string_type, quote_path
+
+logger = logging.getLogger(__name__)
+
+ENGINES = ("sql", "sample")
+
+# Lignes de l'échantillon si aucune limite n'est donnée (le moteur ne tire jamais une table entière)
+DEFAULT_SAMPLE_ROWS = 10_000
+DEFAULT_TOP_K = 10
+DEFAULT_HISTOGRAM_BINS = 10
+
+# Source du nombre de lignes d'une table plus petite que l'échantillon
+SAMPLE = "sample"
+
+
+def build_sample_query(dremio_path: str, column_names: List[str], sample_rows: int) -> str:
+    """Échantillon borné des colonnes profilées d'une table"""
+    projection = ", ".join('"{}"'.format(name.replace('"', '""')) for name in column_names)
+    return f"SELECT {projection} FROM {dremio_path} LIMIT {sample_rows}"
+
+
+def _top_values(uniques, counts, top_k: int) -> List[List]:
+    import numpy as np
+
+    order = np.argsort(-counts, kind="stable")[:top_k]
+    return [[uniques[i].item() if hasattr(uniques[i], "item") else uniques[i], int(counts[i])] for i in order]
+
+
+def _histogram(values, bins: int) -> Dict:
+    import numpy as np
+
+    frequencies, edges = np.histogram(values, bins=bins)
+    return {
+        "boundaries": [f"{low:.3f} to {high:.3f}" for low, high in zip(edges[:-1], edges[1:])],
+        "frequencies": frequencies.tolist(),
+    }
+
+
+def column_sample_stats(
+    column,
+    column_type: str,
+    top_k: int = DEFAULT_TOP_K,
+    bins: int = DEFAULT_HISTOGRAM_BINS
+) -> Dict:
+    """
+    Métriques d'une colonne d'échantillon (pyarrow Array ou ChunkedArray)
+
+    Les valeurs non nulles passent une fois en tableau NumPy; chaque
+    métrique est une opération vectorisée sur ce tableau.
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    valid = column.drop_null()
+    stats = {"total_count": len(column), "non_null_count": len(valid)}
+    if pa.types.is_nested(column.type):
+        # Valeurs non hachables ni castables en texte: ni distincts ni top values
+        return stats
+    stats.update({"distinct_count": 0, "top_values": []})
+
+    numeric = is_numeric_type(column_type)
+    if numeric:
+        try:
+            values = np.asarray(valid.cast(pa.float64()))
+        except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+            numeric = False
+    if not numeric:
+        values = np.asarray(valid.cast(pa.string()).to_pylist(), dtype=object)
+
+    if len(values) == 0:
+        return stats
+
+    uniques, counts = np.unique(values, return_counts=True)
+    stats["distinct_count"] = int(len(uniques))
+    stats["top_values"] = _top_values(uniques, counts, top_k)
+
+    if numeric:
+        first_quartile, median, third_quartile = np.percentile(values, [25, 50, 75])
+        stats.update({
+            "min_value": float(values.min()),
+            "max_value": float(values.max()),
+            "mean_value": float(values.mean()),
+            # STDDEV de Dremio: écart-type d'échantillon
+            "stddev_value": float(values.std(ddof=1)) if len(values) > 1 else None,
+            "first_quartile": float(first_quartile),
+            "median": float(median),
+            "third_quartile": float(third_quartile),
+            "histogram": _histogram(values, min(bins, len(uniques))),
+        })
+    elif is_string_type(column_type):
+        lengths = np.char.str_len(values.astype(str))
+        stats.update({
+            "min_length": int(lengths.min()),
+            "max_length": int(lengths.max()),
+            "avg_length": float(lengths.mean()),
+        })
+    return stats
+
+
+def sample_table_stats(table, columns: List[Dict]) -> Dict[str, Dict]:
+    """
+    Métriques des colonnes profilées d'un échantillon (pyarrow Table)
+
+    Une colonne dont le calcul échoue est ignorée (warning): elle ne fait
+    pas perdre le profil des autres colonnes de la table.
+    """
+    stats = {}
+    for column in columns:
+        name = column["name"]
+        if name not in table.column_names:
+            continue
+        try:
+            stats[name] = column_sample_stats(table.column(name), column.get("dataType", ""))
+        except Exception as e:
+            logger.warning(f"⚠️  Colonne {name} non profilée: {e}")
+    return stats
+
+
+def profile_dataset_sample(
+    client,
+    path: List[str],
+    columns: List[Dict],
+    sample_rows: Optional[int] = None,
+    previous: Optional[Dict] = None,
+    row_counts=None,
+    entity: Optional[Dict] = None
+) -> Dict:
+    """
+    Profile un dataset depuis un seul échantillon (même contrat que profile_dataset)
+
+    Args:
+        sample_rows: lignes de l'échantillon (None = DEFAULT_SAMPLE_ROWS)
+        previous: dernier profil du dataset (ProfileState.previous); le
+            nombre de lignes est alors résolu d'abord, pour le réutiliser
+            sans tirer d'échantillon
+        row_counts: RowCountResolver, pour les tables d'au moins sample_rows
+            lignes (None = nombre de lignes inconnu, aucune requête de comptage)
+    """
+    sample_rows = sample_rows or DEFAULT_SAMPLE_ROWS
+    dremio_path = quote_path(path)
+    profile = {"path": path, "row_count": None, "row_count_source": None, "columns": {}, "reused": False}
+
+    def resolve_row_count():
+        if row_counts is not None:
+            profile["row_count"], profile["row_count_source"] = row_counts.resolve(path, entity)
+
+    with tracing.span("profile_table", table=".".join(path), engine="sample") as span:
+        if previous is not None:
+            resolve_row_count()
+            if profile["row_count"] is not None and previous.get("row_count") == profile["row_count"]:
+                names = {column["name"] for column in columns}
+                profile["columns"] = {name: stats for name, stats in previous.get("columns", {}).items() if name in names}
+                profile["reused"] = True
+                span.set_attribute("reused", True)
+                return profile
+
+        with tracing.span("profile_sample", rows=sample_rows) as sample_span:
+            table = client.execute_sql_arrow(build_sample_query(dremio_path, [c["name"] for c in columns], sample_rows))
+            if table is not None:
+                sample_span.set_attribute("sampled_rows", table.num_rows)
+
+        if table is not None and profile["row_count"] is None and table.num_rows < sample_rows:
+            profile["row_count"], profile["row_count_source"] = table.num_rows, SAMPLE
+        elif profile["row_count"] is None:
+            resolve_row_count()
+        span.set_attribute("row_count_source", profile["row_count_source"])
+
+        if table is None:
+            logger.warning(f"⚠️  Échantillon indisponible pour {'.'.join(path)}")
+            return profile
+        profile["columns"] = sample_table_stats(table, columns)
+    return profile
@@ -0,0 +1,229 @@
+"""
+Snapshot de découverte partagé entre la synchronisation et le connecteur
+
+Un seul parcours du catalogue Dremio est écrit dans un fichier Arrow IPC
+(une ligne par ressource de DremioAutoDiscovery). Les étapes suivantes du
+même créneau (sync, topologie du connecteur, profiling, lineage) l'ouvrent
+en mémoire mappée au lieu de recrawler le catalogue.
+
+Colonnes:
+- ``id``, ``type``, ``path`` (list<string>), ``dataset_type``
+  (PHYSICAL_DATASET/VIRTUAL_DATASET, vide pour les conteneurs)
+- ``columns`` et ``schema``: JSON des colonnes mappées et de l'entité
+  Dremio brute, décodés seulement pour les ressources lues
+
+Les métadonnées du fichier gardent l'instance Dremio, la date du parcours et
+les filtres include/exclude appliqués: un snapshot filtré ne sert pas un run
+qui demande un autre périmètre, ni un snapshot d'une autre instance (chemin
+partagé par erreur entre deux pipelines).
+
+Usage:
+    snapshot = DiscoverySnapshot.load(path, max_age=3600, dremio_url=client.url)
+    if snapshot is None:
+        resources = client.discover_all_resources()
+        snapshot = DiscoverySnapshot.from_resources(resources, client.url, client.path_filter)
+        snapshot.write(path)
+    snapshot.by_path(["lake", "sales", "orders"])
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from dremio_connector.core.filters import PathFilter
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT_VERSION = "1"
+
+# Fraîcheur par défaut d'un snapshot réutilisé (un créneau d'ingestion)
+DEFAULT_MAX_AGE = 3600.0
+
+
+def default_snapshot_path(dremio_url: str, state_dir: Optional[str] = None) -> Path:
+    """Emplacement du snapshot d'une instance Dremio (défaut: tmp système)"""
+    digest = hashlib.sha1(dremio_url.encode("utf-8")).hexdigest()[:12]
+    directory = Path(state_dir) if state_dir else Path(tempfile.gettempdir()) / "dremio_connector"
+    return directory / f"snapshot_{digest}.arrow"
+
+
+def _build_table(resources: Iterable[Dict], dremio_url: str, path_filter: Optional[PathFilter]):
+    """Table Arrow des ressources découvertes (une ligne par ressource)"""
+    import pyarrow as pa
+
+    ids, types, paths, dataset_types, columns, schemas = [], [], [], [], [], []
+    for resource in resources:
+        schema = resource.get("schema")
+        ids.append(resource.get("id", ""))
+        types.append(resource.get("type", "unknown"))
+        paths.append(list(resource.get("path", [])))
+        dataset_types.append((schema or {}).get("type"))
+        columns.append(json.dumps(resource["columns"], default=str) if "columns" in resource else None)
+        schemas.append(json.dumps(schema, default=str) if schema is not None else None)
+
+    return pa.table(
+        {
+            "id": pa.array(ids, pa.string()),
+            "type": pa.array(types, pa.string()),
+            "path": pa.array(paths, pa.list_(pa.string())),
+            "dataset_type": pa.array(dataset_types, pa.string()),
+            "columns": pa.array(columns, pa.large_string()),
+            "schema": pa.array(schemas, pa.large_string()),
+        }
+    ).replace_schema_metadata({
+        "version": SNAPSHOT_FORMAT_VERSION,
+        "dremio_url": dremio_url,
+        "created_at": repr(time.time()),
+        "path_filter": repr(path_filter or PathFilter()),
+    })
+
+
+class DiscoverySnapshot:
+    """
+    Ressources d'un parcours Dremio, lues depuis un snapshot mappé en mémoire
+
+    Les index par path et par id sont construits à l'ouverture depuis les
+    seules colonnes ``path`` et ``id``; le JSON d'une ressource n'est décodé
+    qu'à sa lecture.
+    """
+
+    def __init__(self, table, path: Optional[Path] = None):
+        metadata = {k.decode(): v.decode() for k, v in (table.schema.metadata or {}).items()}
+        self.table = table
+        self.path = path
+        self.dremio_url = metadata.get("dremio_url", "")
+        self.created_at = float(metadata.get("created_at", 0))
+        self.path_filter = metadata.get("path_filter", repr(PathFilter()))
+        self._paths: List[Tuple[str, ...]] = [tuple(p) for p in table.column("path").to_pylist()]
+        self._by_path: Dict[Tuple[str, ...], int] = {p: i for i, p in enumerate(self._paths)}
+        self._by_id: Dict[str, int] = {
+            item_id: i for i, item_id in enumerate(table.column("id").to_pylist()) if item_id
+        }
+        self._types: List[str] = table.column("type").to_pylist()
+
+    @classmethod
+    def from_resources(
+        cls,
+        resources: Iterable[Dict],
+        dremio_url: str = "",
+        path_filter: Optional[PathFilter] = None,
+    ) -> "DiscoverySnapshot":
+        """Snapshot en mémoire d'un parcours qui vient d'avoir lieu"""
+        return cls(_build_table(resources, dremio_url, path_filter))
+
+    @classmethod
+    def load(
+        cls,
+        path,
+        max_age: Optional[float] = None,
+        path_filter: Optional[PathFilter] = None,
+        dremio_url: Optional[str] = None,
+    ) -> Optional["DiscoverySnapshot"]:
+        """
+        Ouvre le snapshot en mémoire mappée
+
+        Returns None (à recrawler) si le fichier est absent, illisible, plus
+        vieux que ``max_age`` secondes, écrit pour une autre instance que
+        ``dremio_url`` (si donnée) ou avec d'autres filtres que
+        ``path_filter`` (un snapshot complet, sans filtre, sert tous les runs).
+        """
+        import pyarrow as pa
+        import pyarrow.ipc
+
+        path = Path(path)
+        try:
+            table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"⚠️  Snapshot de découverte illisible {path}: {e}")
+            return None
+
+        if (table.schema.metadata or {}).get(b"version", b"").decode() != SNAPSHOT_FORMAT_VERSION:
+            return None
+        snapshot = cls(table, path)
+        if dremio_url is not None and snapshot.dremio_url.rstrip("/") != dremio_url.rstrip("/"):
+            logger.warning(f"⚠️  Snapshot de découverte d'une autre instance Dremio ({snapshot.dremio_url}): {path}")
+            return None
+        if max_age is not None and snapshot.age > max_age:
+            logger.info(f"⌛ Snapshot de découverte périmé ({snapshot.age:.0f}s > {max_age:.0f}s): {path}")
+            return None
+        if not snapshot.covers(path_filter):
+            logger.info(f"🔎 Snapshot de découverte écrit avec d'autres filtres ({snapshot.path_filter}): {path}")
+            return None
+        logger.info(f"♻️  Snapshot de découverte réutilisé: {path} ({len(snapshot)} ressources, {snapshot.age:.0f}s)")
+        return snapshot
+
+    def write(self, path) -> Path:
+        """Écriture atomique en Arrow IPC (fichier temporaire + rename)"""
+        import pyarrow as pa
+        import pyarrow.ipc
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, self.table.schema) as writer:
+                writer.write_table(self.table)
+        os.replace(tmp_path, path)
+        self.path = path
+        logger.info(f"💾 Snapshot de découverte écrit: {path} ({len(self)} ressources)")
+        return path
+
+    @property
+    def age(self) -> float:
+        return max(0.0, time.time() - self.created_at)
+
+    def covers(self, path_filter: Optional[PathFilter]) -> bool:
+        """Le snapshot contient-il tout ce que ``path_filter`` garde?"""
+        return self.path_filter in (repr(PathFilter()), repr(path_filter or PathFilter()))
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def resource(self, index: int) -> Dict:
+        """Ressource au format de DremioAutoDiscovery.discover_all_resources"""
+        row = {name: self.table.column(name)[index].as_py() for name in ("id", "columns", "schema")}
+        path = list(self._paths[index])
+        resource = {"id": row["id"], "path": path, "full_path": ".".join(path), "type": self._types[index]}
+        if row["schema"] is not None:
+            resource["schema"] = json.loads(row["schema"])
+        if row["columns"] is not None:
+            resource["columns"] = json.loads(row["columns"])
+        return resource
+
+    def by_path(self, path: Sequence[str]) -> Optional[Dict]:
+        index = self._by_path.get(tuple(path))
+        return self.resource(index) if index is not None else None
+
+    def by_id(self, item_id: str) -> Optional[Dict]:
+        index = self._by_id.get(item_id)
+        return self.resource(index) if index is not None else None
+
+    def paths(self, resource_type: Optional[str] = None) -> List[Tuple[str, ...]]:
+        """Paths des ressources (d'un type donné), sans décoder le JSON"""
+        if resource_type is None:
+            return list(self._paths)
+        return [p for p, t in zip(self._paths, self._types) if t == resource_type]
+
+    def resources(self, path_filter: Optional[PathFilter] = None) -> List[Dict]:
+        """Toutes les ressources, dans l'ordre du parcours, gardées par ``path_filter``"""
+        path_filter = path_filter or PathFilter()
+        return [self.resource(i) for i, p in enumerate(self._paths) if path_filter.accept(p)]
+
+    def subtree(self, prefix: Sequence[str], path_filter: Optional[PathFilter] = None) -> List[Dict]:
+        """Ressources sous ``prefix`` (un conteneur et ses descendants)"""
+        prefix = tuple(prefix)
+        path_filter = path_filter or PathFilter()
+        return [
+            self.resource(i) for i, p in enumerate(self._paths)
+            if p[:len(prefix)] == prefix and path_filter.accept(p)
+        ]
+
+    def __repr__(self) -> str:
+        return f"DiscoverySnapshot({self.path}, resources={len(self)}, age={self.age:.0f}s)"
@@ -30,12 +30,280 @@ Usage:
 """
 
 import logging
-import requests
-from typing import List, Dict, Optional, Set, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import List, Dict, Iterator, Optional, Set, Tuple
 from datetime import datetime
 
+from dremio_connector.core import metrics, profile_sink, tracing
+from dremio_connector.core.bulk_import import (
+    BULK_MIN_ENTITIES,
+    DEFAULT_CHUNK_SIZE,
+    chunked,
+    failed_fqns,
+    import_aborted,
+    schema_rows,
+    table_rows,
+    to_csv,
+)
+from dremio_connector.core.column_patch import PATCH_CONTENT_TYPE, column_patch
+from dremio_connector.core.entity_index import SKIP, UPDATE, EntityIndex
+from dremio_connector.core.filters import PathFilter
+from dremio_connector.core.flight import FlightTransport, flight_location, is_unavailable
+from dremio_connector.core.lazy import lazy_import
+from dremio_connector.core.progress import DEFAULT_INTERVAL, ProgressLogger
+from dremio_connector.core.reconcile import (
+    DEFAULT_DELETE_BATCH_SIZE,
+    DEFAULT_MAX_DELETE_RATIO,
+    batches,
+    exceeds_threshold,
+    find_stale,
+)
+from dremio_connector.core.lineage import (
+    SqlParseCache,
+    ViewLineageExtractor,
+    collect_view_definitions,
+    default_parse_cache_path,
+)
+from dremio_connector.core.snapshot import DEFAULT_MAX_AGE, DiscoverySnapshot
+from dremio_connector.core.sync_state import SyncState, table_fingerprint
+from dremio_connector.core.usage import UsageIngestion, UsageState
+
 logger = logging.getLogger(__name__)
 
+# Chargé à la première requête HTTP: l'import du module reste en millisecondes
+requests = lazy_import("requests")
+
+# Taille maximale d'une page de résultats de job Dremio (/api/v3/job/{id}/results)
+RESULTS_PAGE_SIZE = 500
+
+
+# Types normalisés des conteneurs explorés récursivement
+CONTAINER_TYPES = ("space", "source", "folder", "home")
+
+# Statuts HTTP rejoués (GET uniquement) quand des retries sont configurés
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+
+
+class RateLimiter:
+    """
+    Limiteur de débit (token bucket) partagé entre threads
+    
+    Args:
+        rate: requêtes par seconde
+        burst: requêtes autorisées d'un coup après une pause (défaut: ``rate``)
+    """
+    
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError(f"rate doit être > 0: {rate}")
+        self.rate = rate
+        self.capacity = burst or max(1, int(rate))
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Bloque jusqu'à ce qu'une requête soit autorisée"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def _body_size(body) -> int:
+    if isinstance(body, (bytes, bytearray)):
+        return len(body)
+    if isinstance(body, str):
+        return len(body.encode("utf-8"))
+    return 0
+
+
+def http_request(
+    method: str,
+    url: str,
+    service: str,
+    endpoint: str,
+    session=None,
+    retries: int = 0,
+    backoff: float = 0.5,
+    limiter: Optional["RateLimiter"] = None,
+    **kwargs
+):
+    """
+    Requête HTTP instrumentée (voir core.metrics)
+    
+    Enregistre la latence par service/endpoint/status, les requêtes en vol,
+    les timeouts et les octets échangés. Les GET sont rejoués jusqu'à
+    ``retries`` fois après un timeout, une erreur de connexion ou une réponse
+    429/5xx (backoff exponentiel); les écritures ne le sont jamais.
+    
+    Args:
+        method: "GET", "POST", "PUT"...
+        service: "dremio" ou "openmetadata" (label des métriques)
+        endpoint: gabarit de l'endpoint, sans identifiants ("/api/v3/job/{id}")
+        session: requests.Session à utiliser (sinon le module requests)
+        limiter: RateLimiter partagé, appliqué à chaque tentative
+    """
+    from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout as RequestsTimeout
+
+    sender = session if session is not None else requests
+    method = method.upper()
+    attempts = retries + 1 if method == "GET" else 1
+    
+    with tracing.span(f"http {method} {endpoint}", service=service) as span:
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            if limiter is not None:
+                limiter.acquire()
+            metrics.HTTP_IN_FLIGHT.inc(service, endpoint)
+            started = time.perf_counter()
+            try:
+                response = getattr(sender, method.lower())(url, **kwargs)
+            except (RequestsTimeout, RequestsConnectionError) as e:
+                timed_out = isinstance(e, RequestsTimeout)
+                if timed_out:
+                    metrics.HTTP_TIMEOUTS.inc(service, endpoint)
+                metrics.observe_http(
+                    service, method, endpoint, "timeout" if timed_out else "error",
+                    time.perf_counter() - started
+                )
+                if last:
+                    raise
+            except Exception:
+                metrics.observe_http(service, method, endpoint, "error", time.perf_counter() - started)
+                raise
+            else:
+                request = getattr(response, "request", None)
+                metrics.observe_http(
+                    service, method, endpoint, str(response.status_code),
+                    time.perf_counter() - started,
+                    request_bytes=_body_size(getattr(request, "body", None)),
+                    response_bytes=_body_size(getattr(response, "content", None)),
+                )
+                span.set_attribute("status_code", response.status_code)
+                if last or response.status_code not in RETRYABLE_STATUS:
+                    span.set_attribute("attempts", attempt + 1)
+                    return response
+            finally:
+                metrics.HTTP_IN_FLIGHT.dec(service, endpoint)
+        
+            metrics.HTTP_RETRIES.inc(service, endpoint)
+            time.sleep(backoff * 2 ** attempt)
+
+
+def split_dataset_path(path: List[str]) -> Tuple[str, str, str]:
+    """
+    Découpe le path Dremio d'un dataset en (database, schema, table)
+    
+    Même convention que organize_hierarchy:
+    - path[0] → database (space/source)
+    - dossiers intermédiaires joints par "." → schema
+    - path de 2 éléments → schema = path[1]
+    - path de 1 élément → schema "default"
+    """
+    db_name = path[0]
+    if len(path) == 1:
+        # Dataset direct dans space/source
+        schema_name = "default"
+    else:
+        schema_name = ".".join(path[1:-1]) if len(path) > 2 else path[1]
+    return db_name, schema_name, path[-1]
+
+
+def organize_hierarchy(resources: List[Dict]) -> Dict:
+    """
+    Organise les ressources en hiérarchie Database → Schema → Table
+    
+    Les dossiers imbriqués sont aplatis en un schéma dont le nom joint les
+    dossiers par "." (voir split_dataset_path). Utilisé par la synchronisation
+    et par la topologie de DremioConnector.
+    """
+    hierarchy = {}
+    
+    for resource in resources:
+        path = resource.get("path", [])
+        res_type = resource.get("type")
+    
+        if not path:
+            continue
+    
+        # Database level: spaces & sources
+        if res_type in ["space", "source"]:
+            db_name = path[0]
+            if db_name not in hierarchy:
+                hierarchy[db_name] = {"schemas": {}}
+    
+        # Schema level: folders (depth 2+)
+        elif res_type == "folder" and len(path) >= 2:
+            db_name = path[0]
+            schema_name = ".".join(path[1:])
+    
+            if db_name not in hierarchy:
+                hierarchy[db_name] = {"schemas": {}}
+    
+            if schema_name not in hierarchy[db_name]["schemas"]:
+                hierarchy[db_name]["schemas"][schema_name] = {"tables": []}
+    
+        # Table level: datasets
+        elif res_type == "dataset":
+            db_name, schema_name, _ = split_dataset_path(path)
+    
+            if db_name not in hierarchy:
+                hierarchy[db_name] = {"schemas": {}}
+    
+            if schema_name not in hierarchy[db_name]["schemas"]:
+                hierarchy[db_name]["schemas"][schema_name] = {"tables": []}
+    
+            hierarchy[db_name]["schemas"][schema_name]["tables"].append(resource)
+    
+    return hierarchy
+
+
+def build_fqn(*parts: str) -> str:
+    """Construit un FQN OpenMetadata (les noms contenant un "." sont entre guillemets)"""
+    return ".".join(f'"{part}"' if "." in part else part for part in parts)
+
+
+def build_columns_lineage(from_table_fqn: str, to_table_fqn: str, columns: List[Dict]) -> List[Dict]:
+    """Convertit les paires de colonnes d'une arête en columnsLineage OpenMetadata (FQN)"""
+    return [
+        {
+            "fromColumns": [f"{from_table_fqn}.{build_fqn(name)}" for name in column["from"]],
+            "toColumn": f"{to_table_fqn}.{build_fqn(column['to'])}",
+        }
+        for column in columns
+    ]
+
+
+def filter_resources(
+    resources: List[Dict],
+    include: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None
+) -> List[Dict]:
+    """
+    Filtre a posteriori des ressources découvertes (voir core.filters)
+    
+    La découverte applique déjà ces motifs en élaguant les conteneurs
+    (``DremioAutoDiscovery(path_filter=...)``); cette fonction sert aux
+    ressources obtenues autrement (fichier JSONL, snapshot...).
+    """
+    path_filter = PathFilter(include, exclude)
+    if not path_filter:
+        return resources
+    
+    kept = path_filter.filter(resources)
+    logger.info(f"🔎 Filtres: {len(kept)}/{len(resources)} ressources retenues")
+    return kept
+
 
 class DremioAutoDiscovery:
     """
@@ -52,19 +320,57 @@ class DremioAutoDiscovery:
     - /api/v3/catalog/by-path/{path} → entityType
     """
     
-    def __init__(self, url: str, username: str, password: str):
+    def __init__(
+        self,
+        url: str,
+        username: str,
+        password: str,
+        query_timeout: int = 30,
+        max_retries: int = 0,
+        progress_interval: Optional[float] = DEFAULT_INTERVAL,
+        max_workers: int = 1,
+        rate_limit: Optional[float] = None,
+        path_filter: Optional[PathFilter] = None,
+        flight_port: Optional[int] = None,
+        flight_tls: bool = False
+    ):
         self.url = url
         self.username = username
         self.password = password
+        self.query_timeout = query_timeout
+        # Retries des GET (catalogue, statut et résultats de jobs) sur timeout/429/5xx
+        self.max_retries = max_retries
+        # Requêtes par seconde vers Dremio (None = illimité)
+        self.limiter = RateLimiter(rate_limit) if rate_limit else None
+        # Schémas des datasets d'un conteneur récupérés en parallèle si > 1
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._schemas: Dict[str, Optional[Dict]] = {}
         self.token = None
         self.headers = {}
         self._visited: Set[str] = set()
+        # Conteneurs dont le listing a échoué au dernier parcours ([] = catalogue racine)
+        self.failed_paths: List[List[str]] = []
+        # Motifs include/exclude: conteneurs exclus jamais ouverts, schémas jamais lus
+        self.path_filter = path_filter or PathFilter()
+        self.pruned = 0
+        # Ligne de progression agrégée (les items eux-mêmes sont loggés en DEBUG)
+        self.progress_interval = progress_interval
+        self._progress = ProgressLogger(logger, "Découverte", interval=progress_interval)
+        # Requêtes SQL en Arrow Flight sur ce port (None = REST), repli REST si injoignable
+        self.flight_port = flight_port
+        self.flight_tls = flight_tls
+        self.flight: Optional[FlightTransport] = None
     
     def authenticate(self) -> bool:
         """Authentifie auprès de Dremio et récupère le token"""
         try:
-            response = requests.post(
+            response = http_request(
+                "POST",
                 f"{self.url}/apiv2/login",
+                "dremio",
+                "/apiv2/login",
+                limiter=self.limiter,
                 json={"userName": self.username, "password": self.password},
                 headers={"Content-Type": "application/json"},
                 timeout=10
@@ -73,6 +379,8 @@ class DremioAutoDiscovery:
                 self.token = response.json()["token"]
                 self.headers = {"Authorization": f"_dremio{self.token}"}
                 logger.info("✅ Authentification Dremio réussie")
+                if self.flight_port:
+                    self._connect_flight()
                 return True
             else:
                 logger.error(f"❌ Échec authentification: {response.status_code}")
@@ -81,6 +389,70 @@ class DremioAutoDiscovery:
             logger.error(f"❌ Erreur authentification: {e}")
             return False
     
+    def _connect_flight(self):
+        """Ouvre le transport Arrow Flight, le client reste en REST s'il échoue"""
+        transport = FlightTransport(
+            flight_location(self.url, self.flight_port, self.flight_tls),
+            self.username, self.password, timeout=self.query_timeout
+        )
+        if transport.connect():
+            self.flight = transport
+            logger.info(f"✅ Requêtes SQL en Arrow Flight ({transport.location})")
+        else:
+            logger.warning("⚠️  Requêtes SQL en REST (Arrow Flight indisponible)")
+    
+    def _flight_call(self, name: str, query: str, *args):
+        """
+        Appel du transport Flight (read_table / read_page / iter_batches)
+        
+        Returns None si le serveur Flight est devenu injoignable: le
+        transport est fermé et les requêtes suivantes passent en REST.
+        Les autres erreurs (SQL invalide...) sont levées.
+        """
+        if self.limiter:
+            self.limiter.acquire()
+        with tracing.span("sql.flight", query=query[:200]) as span:
+            try:
+                return getattr(self.flight, name)(query, *args)
+            except Exception as e:
+                if not is_unavailable(e):
+                    raise
+                logger.warning(f"⚠️  Arrow Flight injoignable, repli REST: {e}")
+                span.set_attribute("fallback", "rest")
+                self._close_flight()
+                return None
+    
+    def _close_flight(self):
+        """Ferme le transport Flight: les requêtes suivantes passent en REST"""
+        if self.flight is not None:
+            self.flight.close()
+            self.flight = None
+    
+    def execute_sql_arrow(self, query: str):
+        """
+        Execute a SQL query and return all results as a pyarrow Table
+        
+        Columnar end to end over Arrow Flight; over REST, the JSON pages
+        are converted (None if the query fails).
+        """
+        import pyarrow as pa
+        
+        if self.flight is not None:
+            try:
+                table = self._flight_call("read_table", query)
+            except Exception as e:
+                logger.error(f"❌ Error executing query: {e}")
+                return None
+            if table is not None:
+                return table
+        
+        try:
+            rows = list(self.iter_sql_rows(query, raise_on_error=True))
+        except RuntimeError as e:
+            logger.error(f"❌ Error executing query: {e}")
+            return None
+        return pa.Table.from_pylist(rows)
+    
     def execute_sql_query(self, query: str) -> Optional[Dict]:
         """
         Execute a SQL query against Dremio and return results
@@ -89,78 +461,41 @@ class DremioAutoDiscovery:
             query: SQL query string to execute
             
         Returns:
-            Dict with query results including rows and schema
+            Dict with query results: "rowCount" (all rows of the job), "rows"
+            (the first results page only, at most RESULTS_PAGE_SIZE rows, over
+            REST and Arrow Flight alike: use iter_sql_rows for all rows) and
+            "accelerated" (a reflection was chosen for the job; always False
+            over Arrow Flight, which does not report it).
         """
         if not self.token:
             logger.error("❌ Not authenticated. Call authenticate() first.")
             return None
         
-        try:
-            # Submit SQL job
-            response = requests.post(
-                f"{self.url}/api/v3/sql",
-                headers={
-                    **self.headers,
-                    "Content-Type": "application/json"
-                },
-                json={"sql": query},
-                timeout=30
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"❌ Query submission failed: {response.status_code} - {response.text}")
-                return None
-            
-            job_data = response.json()
-            job_id = job_data.get("id")
-            
-            if not job_id:
-                logger.error("❌ No job ID returned from query submission")
+        if self.flight is not None:
+            try:
+                # Batches lus jusqu'à la première page, total depuis FlightInfo
+                page = self._flight_call("read_page", query, RESULTS_PAGE_SIZE)
+            except Exception as e:
+                logger.error(f"❌ Error executing query: {e}")
                 return None
-            
-            # Poll for job completion (max 30 seconds)
-            import time
-            max_wait = 30
-            elapsed = 0
-            
-            while elapsed < max_wait:
-                job_response = requests.get(
-                    f"{self.url}/api/v3/job/{job_id}",
-                    headers=self.headers,
-                    timeout=10
-                )
-                
-                if job_response.status_code != 200:
-                    logger.error(f"❌ Job status check failed: {job_response.status_code}")
+            if page is not None:
+                table, row_count = page
+                return {"rowCount": row_count, "rows": table.to_pylist(), "accelerated": False}
+        
+        try:
+            with tracing.span("execute_sql_query", query=query[:200]):
+                job_id = self._submit_sql_job(query)
+                if not job_id:
                     return None
                 
-                job_status = job_response.json()
-                state = job_status.get("jobState")
-                
-                if state == "COMPLETED":
-                    # Get results
-                    results_response = requests.get(
-                        f"{self.url}/api/v3/job/{job_id}/results",
-                        headers=self.headers,
-                        timeout=10
-                    )
-                    
-                    if results_response.status_code == 200:
-                        return results_response.json()
-                    else:
-                        logger.error(f"❌ Failed to get results: {results_response.status_code}")
-                        return None
-                
-                elif state in ["FAILED", "CANCELED"]:
-                    logger.error(f"❌ Query {state}: {job_status.get('errorMessage', 'Unknown error')}")
+                job_status = self._wait_for_job(job_id)
+                if not job_status:
                     return None
                 
-                # Still running, wait
-                time.sleep(1)
-                elapsed += 1
-            
-            logger.warning(f"⚠️  Query timeout after {max_wait}s")
-            return None
+                results = self._get_job_results(job_id, limit=RESULTS_PAGE_SIZE)
+                if results is not None:
+                    results["accelerated"] = metrics.job_accelerated(job_status)
+                return results
             
         except Exception as e:
             logger.error(f"❌ Error executing query: {e}")
@@ -168,24 +503,224 @@ class DremioAutoDiscovery:
             traceback.print_exc()
             return None
     
+    def iter_sql_rows(
+        self,
+        query: str,
+        page_size: int = RESULTS_PAGE_SIZE,
+        raise_on_error: bool = False
+    ) -> Iterator[Dict]:
+        """
+        Execute a SQL query and stream all result rows, page by page
+        
+        Dremio limits a results page to 500 rows: execute_sql_query only
+        returns the first page, this method walks through all of them.
+        
+        Args:
+            query: SQL query string to execute
+            page_size: Rows per results page (max 500)
+            raise_on_error: Raise RuntimeError instead of stopping silently
+                (callers that must not mistake a failure for an empty result).
+                A failure after rows were yielded always raises: a truncated
+                stream is never returned as a complete result.
+            
+        Yields:
+            Dict per result row
+        """
+        yielded = 0
+        
+        def failed(reason: str):
+            if yielded:
+                raise RuntimeError(f"{reason} after {yielded} rows: {query[:200]}")
+            if raise_on_error:
+                raise RuntimeError(f"{reason}: {query[:200]}")
+        
+        if not self.token:
+            logger.error("❌ Not authenticated. Call authenticate() first.")
+            failed("Not authenticated")
+            return
+        
+        if self.flight is not None:
+            try:
+                record_batches = self._flight_call("iter_batches", query)
+                if record_batches is not None:
+                    for record_batch in record_batches:
+                        rows = record_batch.to_pylist()
+                        yield from rows
+                        yielded += len(rows)
+                    return
+            except Exception as e:
+                # Erreur en cours de flux: _flight_call ne la voit pas
+                if is_unavailable(e):
+                    self._close_flight()
+                if yielded or not is_unavailable(e):
+                    logger.error(f"❌ Error executing query: {e}")
+                    failed("Query failed")
+                    return
+                logger.warning(f"⚠️  Arrow Flight injoignable, repli REST: {e}")
+        
+        job_id = self._submit_sql_job(query)
+        if not job_id or not self._wait_for_job(job_id):
+            failed("Query failed")
+            return
+        
+        page_size = min(page_size, RESULTS_PAGE_SIZE)
+        offset = 0
+        while True:
+            page = self._get_job_results(job_id, offset=offset, limit=page_size)
+            if not page:
+                failed("Results fetch failed")
+                return
+            
+            rows = page.get("rows", [])
+            yield from rows
+            yielded += len(rows)
+            
+            offset += len(rows)
+            if not rows or offset >= page.get("rowCount", 0):
+                return
+    
+    def _submit_sql_job(self, query: str) -> Optional[str]:
+        """Submit a SQL job, returns the Dremio job id"""
+        with tracing.span("sql.submit") as span:
+            job_id = self._post_sql_job(query)
+            span.set_attribute("job_id", job_id)
+            return job_id
+    
+    def _post_sql_job(self, query: str) -> Optional[str]:
+        response = http_request(
+            "POST",
+            f"{self.url}/api/v3/sql",
+            "dremio",
+            "/api/v3/sql",
+            limiter=self.limiter,
+            headers={
+                **self.headers,
+                "Content-Type": "application/json"
+            },
+            json={"sql": query},
+            timeout=30
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"❌ Query submission failed: {response.status_code} - {response.text}")
+            return None
+        
+        job_id = response.json().get("id")
+        if not job_id:
+            logger.error("❌ No job ID returned from query submission")
+            return None
+        return job_id
+    
+    def _wait_for_job(self, job_id: str) -> Optional[Dict]:
+        """Poll a job until completion, returns the final job status"""
+        with tracing.span("sql.poll", job_id=job_id) as span:
+            job_status = self._poll_job(job_id)
+            if job_status:
+                span.set_attribute("job_state", job_status.get("jobState"))
+                for key, (start, end) in (
+                    ("queue_ms", ("resourceSchedulingStartedAt", "resourceSchedulingEndedAt")),
+                    ("execution_ms", ("startedAt", "endedAt")),
+                ):
+                    duration = metrics.job_duration(job_status, start, end)
+                    if duration is not None:
+                        span.set_attribute(key, round(duration * 1000, 3))
+            return job_status
+    
+    def _poll_job(self, job_id: str) -> Optional[Dict]:
+        elapsed = 0
+        started = time.perf_counter()
+        
+        while elapsed < self.query_timeout:
+            job_response = http_request(
+                "GET",
+                f"{self.url}/api/v3/job/{job_id}",
+                "dremio",
+                "/api/v3/job/{id}",
+                limiter=self.limiter,
+                retries=self.max_retries,
+                headers=self.headers,
+                timeout=10
+            )
+            
+            if job_response.status_code != 200:
+                logger.error(f"❌ Job status check failed: {job_response.status_code}")
+                return None
+            
+            job_status = job_response.json()
+            state = job_status.get("jobState")
+            
+            if state == "COMPLETED":
+                metrics.observe_sql_job(job_status, time.perf_counter() - started)
+                return job_status
+            
+            elif state in ["FAILED", "CANCELED"]:
+                metrics.observe_sql_job(job_status, time.perf_counter() - started)
+                logger.error(f"❌ Query {state}: {job_status.get('errorMessage', 'Unknown error')}")
+                return None
+            
+            # Still running, wait
+            time.sleep(1)
+            elapsed += 1
+        
+        logger.warning(f"⚠️  Query timeout after {self.query_timeout}s")
+        return None
+    
+    def _get_job_results(self, job_id: str, offset: int = 0, limit: Optional[int] = None) -> Optional[Dict]:
+        """Fetch one page of a completed job results"""
+        with tracing.span("sql.fetch", job_id=job_id, offset=offset) as span:
+            page = self._fetch_job_results(job_id, offset, limit)
+            if page:
+                span.set_attribute("rows", len(page.get("rows", [])))
+            return page
+    
+    def _fetch_job_results(self, job_id: str, offset: int, limit: Optional[int]) -> Optional[Dict]:
+        params = {}
+        if offset or limit:
+            params = {"offset": offset, "limit": limit or RESULTS_PAGE_SIZE}
+        
+        results_response = http_request(
+            "GET",
+            f"{self.url}/api/v3/job/{job_id}/results",
+            "dremio",
+            "/api/v3/job/{id}/results",
+            limiter=self.limiter,
+            retries=self.max_retries,
+            headers=self.headers,
+            params=params or None,
+            timeout=10
+        )
+        
+        if results_response.status_code == 200:
+            return results_response.json()
+        
+        logger.error(f"❌ Failed to get results: {results_response.status_code}")
+        return None
+    
     def get_catalog_item(self, path: str = None) -> Optional[Dict]:
         """Récupère un élément du catalogue par path ou le catalogue racine"""
+        from requests.exceptions import Timeout as RequestsTimeout
+
         try:
             if path:
                 url = f"{self.url}/api/v3/catalog/by-path/{path}"
+                endpoint = "/api/v3/catalog/by-path"
             else:
                 url = f"{self.url}/api/v3/catalog"
+                endpoint = "/api/v3/catalog"
             
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = http_request(
+                "GET", url, "dremio", endpoint,
+                retries=self.max_retries, limiter=self.limiter, headers=self.headers, timeout=10
+            )
             if response.status_code == 200:
                 return response.json()
             elif response.status_code == 404:
-                logger.debug(f"Ressource introuvable: {path}")
+                logger.debug("Ressource introuvable: %s", path)
                 return None
             else:
                 logger.warning(f"Erreur {response.status_code} pour {path or 'catalogue racine'}")
                 return None
-        except requests.Timeout:
+        except RequestsTimeout:
             logger.warning(f"Timeout pour {path or 'catalogue racine'}")
             return None
         except Exception as e:
@@ -196,12 +731,15 @@ class DremioAutoDiscovery:
         """Récupère le schéma détaillé d'un dataset (colonnes, types, etc.)"""
         try:
             url = f"{self.url}/api/v3/catalog/{dataset_id}"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = http_request(
+                "GET", url, "dremio", "/api/v3/catalog/{id}",
+                retries=self.max_retries, limiter=self.limiter, headers=self.headers, timeout=10
+            )
             if response.status_code == 200:
                 return response.json()
             return None
         except Exception as e:
-            logger.debug(f"Erreur récupération schéma {dataset_id}: {e}")
+            logger.debug("Erreur récupération schéma %s: %s", dataset_id, e)
             return None
     
     def discover_all_resources(self) -> List[Dict]:
@@ -222,11 +760,83 @@ class DremioAutoDiscovery:
         logger.info("🔍 Démarrage auto-discovery Dremio...")
         resources = []
         self._visited.clear()
+        self.failed_paths = []
+        self.pruned = 0
+        self._progress = ProgressLogger(logger, "Découverte", interval=self.progress_interval)
         
+        with tracing.span("discover_all_resources") as span, self._workers():
+            return self._discover(resources, span)
+    
+    def discover_snapshot(self, path, max_age: Optional[float] = None) -> Optional[DiscoverySnapshot]:
+        """
+        Snapshot de découverte partagé (voir core.snapshot)
+        
+        Réutilise le snapshot ``path`` s'il a moins de ``max_age`` secondes et
+        couvre les filtres courants; sinon parcourt le catalogue et l'écrit
+        pour les étapes suivantes (le parcours reste utilisable si
+        l'écriture échoue). Un parcours incomplet (``failed_paths``) n'est
+        pas écrit: les runs suivants ne le prendraient pas pour le catalogue
+        entier. None si le parcours n'a rien trouvé.
+        """
+        snapshot = DiscoverySnapshot.load(path, max_age=max_age, path_filter=self.path_filter, dremio_url=self.url)
+        if snapshot is not None:
+            self.failed_paths = []
+            return snapshot
+        
+        resources = self.discover_all_resources()
+        if not resources:
+            return None
+        snapshot = DiscoverySnapshot.from_resources(resources, self.url, self.path_filter)
+        if self.failed_paths:
+            logger.warning(f"⚠️ Découverte incomplète ({len(self.failed_paths)} conteneurs en échec), snapshot non écrit")
+            return snapshot
+        try:
+            snapshot.write(path)
+        except OSError as e:
+            logger.warning(f"⚠️ Impossible d'écrire le snapshot de découverte {path}: {e}")
+        return snapshot
+    
+    def discover_subtree(self, item: Dict) -> List[Dict]:
+        """
+        Découvre un seul conteneur (source, space) et tout son sous-arbre
+        
+        Même parcours que discover_all_resources (filtres, schémas des
+        datasets récupérés en parallèle), limité à ``item``: une entrée du
+        catalogue racine ou ``{"path": [...], "type": "CONTAINER", "containerType": ...}``.
+        """
+        resources = []
+        self._visited.clear()
+        self.failed_paths = []
+        self._progress = ProgressLogger(logger, "Découverte", interval=self.progress_interval)
+        path_str = ".".join(item.get("path", []))
+        
+        with tracing.span("discover_subtree", path=path_str) as span, self._workers():
+            self._explore_item_deep(item, resources)
+            span.set_attribute("resources", len(resources))
+        self._progress.finish()
+        logger.debug("Sous-arbre %s: %d ressources", path_str, len(resources))
+        return resources
+    
+    @contextmanager
+    def _workers(self) -> Iterator[None]:
+        """Pool des schémas de datasets (max_workers > 1), le temps d'un parcours"""
+        if self.max_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
+            yield
+        finally:
+            if self._executor:
+                self._executor.shutdown()
+                self._executor = None
+            self._schemas.clear()
+    
+    def _discover(self, resources: List[Dict], span) -> List[Dict]:
+        """Parcourt le catalogue depuis la racine (voir discover_all_resources)"""
         # Récupérer catalogue racine
         catalog = self.get_catalog_item()
         if not catalog:
             logger.error("❌ Impossible de récupérer le catalogue racine")
+            self.failed_paths.append([])
             return resources
         
         # Explorer récursivement tous les items racine
@@ -236,7 +846,12 @@ class DremioAutoDiscovery:
         for item in items:
             self._explore_item_deep(item, resources)
         
+        span.set_attribute("resources", len(resources))
+        self._progress.finish()
         logger.info(f"✅ Découverte terminée: {len(resources)} ressources")
+        if self.pruned:
+            span.set_attribute("pruned", self.pruned)
+            logger.info(f"✂️  {self.pruned} conteneurs/datasets écartés par les filtres ({self.path_filter})")
         
         # Statistiques par type
         type_counts = {}
@@ -286,6 +901,14 @@ class DremioAutoDiscovery:
         else:
             entity_type = item_type.lower() if item_type else "unknown"
         
+        is_container = entity_type in CONTAINER_TYPES
+        if self.path_filter:
+            # Conteneur exclu: ni listing ni schémas pour tout le sous-arbre
+            if not (self.path_filter.explore(path) if is_container else self.path_filter.accept(path)):
+                self.pruned += 1
+                logger.debug("✂️  Filtré: %s", path_str)
+                return
+        
         resource = {
             "id": item_id,
             "path": path,
@@ -295,25 +918,53 @@ class DremioAutoDiscovery:
         
         # Pour datasets: récupérer schéma et colonnes
         if entity_type == "dataset" and item_id:
-            logger.debug(f"  📄 Schéma pour: {path_str}")
-            schema = self.get_dataset_schema(item_id)
+            logger.debug("  📄 Schéma pour: %s", path_str)
+            if item_id in self._schemas:
+                schema = self._schemas.pop(item_id)
+            else:
+                schema = self.get_dataset_schema(item_id)
             if schema:
                 resource["schema"] = schema
                 resource["columns"] = self._extract_columns(schema)
         
-        resources.append(resource)
-        logger.info(f"✓ [{entity_type.upper():7}] {path_str}")
+        # Conteneur ouvert seulement pour atteindre un motif include plus profond
+        if not is_container or self.path_filter.accept(path):
+            resources.append(resource)
+            logger.debug("✓ [%-7s] %s", entity_type.upper(), path_str)
+            self._progress.advance(item=path_str)
         
         # Explorer conteneurs
-        if entity_type in ["space", "source", "folder", "home"] and path:
-            container_path = "/".join(path)
-            container_data = self.get_catalog_item(container_path)
-            if container_data:
-                children = container_data.get("children", [])
-                if children:
-                    logger.debug(f"    → {len(children)} enfants")
-                    for child in children:
-                        self._explore_item_deep(child, resources)
+        if is_container and path:
+            with tracing.span("explore_container", path=path_str, type=entity_type) as span:
+                container_path = "/".join(path)
+                container_data = self.get_catalog_item(container_path)
+                if container_data:
+                    children = container_data.get("children", [])
+                    span.set_attribute("children", len(children))
+                    if children:
+                        logger.debug("    → %d enfants", len(children))
+                        self._prefetch_schemas(children)
+                        for child in children:
+                            self._explore_item_deep(child, resources)
+                else:
+                    # Sous-arbre inconnu: ses datasets ne doivent pas passer pour supprimés
+                    self.failed_paths.append(list(path))
+                    logger.warning(f"⚠️ Listing impossible de {path_str}, sous-arbre ignoré")
+    
+    def _prefetch_schemas(self, children: List[Dict]):
+        """Récupère en parallèle les schémas des datasets enfants (max_workers > 1)"""
+        if self._executor is None:
+            return
+        ids = [
+            child["id"] for child in children
+            if child.get("type") == "DATASET" and child.get("id")
+            and ".".join(child.get("path", [])) not in self._visited
+            and self.path_filter.accept(child.get("path", []))
+        ]
+        if len(ids) < 2:
+            return
+        for item_id, schema in zip(ids, self._executor.map(self.get_dataset_schema, ids)):
+            self._schemas[item_id] = schema
     
     def _extract_columns(self, schema: Dict) -> List[Dict]:
         """Extrait colonnes avec mapping de types Dremio → OpenMetadata"""
@@ -364,12 +1015,31 @@ class OpenMetadataSyncEngine:
     - Schemas (par folder Dremio)
     - Tables (par dataset Dremio) avec colonnes
     
-    Utilise PUT pour idempotence (safe re-run).
+    Utilise PUT pour idempotence (safe re-run). Avec ``bulk_import``, les
+    schémas d'une database et les tables d'un schéma passent par l'import
+    CSV d'OpenMetadata (voir core.bulk_import), avec repli sur les PUT.
+    Avec un index (``build_index``), une table dont les colonnes ont changé
+    est mise à jour par JSON Patch du delta (voir core.column_patch).
     """
     
-    def __init__(self, url: str, jwt_token: str, service_name: str):
+    def __init__(
+        self,
+        url: str,
+        jwt_token: str,
+        service_name: str,
+        rate_limit: Optional[float] = None,
+        bulk_import: bool = False,
+        bulk_chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
         self.url = url
         self.service_name = service_name
+        # Requêtes par seconde vers OpenMetadata (None = illimité)
+        self.limiter = RateLimiter(rate_limit) if rate_limit else None
+        # Import CSV en masse (dry-run puis import réel, par paquets de bulk_chunk_size entités)
+        self.bulk_import = bulk_import
+        self.bulk_chunk_size = bulk_chunk_size
+        # Entités existantes du service (build_index): décide create/update/skip sans GET
+        self.index: Optional[EntityIndex] = None
         self.headers = {
             "Content-Type": "application/json",
             "Authorization": f"Bearer {jwt_token}"
@@ -378,11 +1048,27 @@ class OpenMetadataSyncEngine:
             "databases": 0,
             "schemas": 0,
             "tables": 0,
+            "lineage": 0,
+            "usage": 0,
+            "usage_skipped": 0,
+            "skipped": 0,
+            "imported": 0,
+            "patched": 0,
+            "fallbacks": 0,
+            "deleted": 0,
+            "profiles": 0,
             "errors": 0
         }
+        # FQN → id des tables créées/màj (pour le lineage, sans GET supplémentaire)
+        self.table_ids: Dict[str, str] = {}
     
     def create_or_update_database(self, name: str, description: str = "") -> Optional[str]:
         """Crée ou met à jour une database"""
+        fqn = build_fqn(self.service_name, name)
+        if self.index is not None and fqn in self.index.databases:
+            logger.debug("Database déjà présente: %s", fqn)
+            return fqn
+        
         payload = {
             "name": name,
             "displayName": name,
@@ -391,12 +1077,17 @@ class OpenMetadataSyncEngine:
         }
         
         try:
-            response = requests.put(
-                f"{self.url}/v1/databases",
-                json=payload,
-                headers=self.headers,
-                timeout=10
-            )
+            with tracing.span("openmetadata.write", entity="database", name=name):
+                response = http_request(
+                    "PUT",
+                    f"{self.url}/v1/databases",
+                    "openmetadata",
+                    "/v1/databases",
+                    limiter=self.limiter,
+                    json=payload,
+                    headers=self.headers,
+                    timeout=10
+                )
             
             if response.status_code in [200, 201]:
                 fqn = response.json().get("fullyQualifiedName")
@@ -422,16 +1113,21 @@ class OpenMetadataSyncEngine:
         }
         
         try:
-            response = requests.put(
-                f"{self.url}/v1/databaseSchemas",
-                json=payload,
-                headers=self.headers,
-                timeout=10
-            )
+            with tracing.span("openmetadata.write", entity="schema", name=name):
+                response = http_request(
+                    "PUT",
+                    f"{self.url}/v1/databaseSchemas",
+                    "openmetadata",
+                    "/v1/databaseSchemas",
+                    limiter=self.limiter,
+                    json=payload,
+                    headers=self.headers,
+                    timeout=10
+                )
             
             if response.status_code in [200, 201]:
                 fqn = response.json().get("fullyQualifiedName")
-                logger.info(f"✅ Schema: {fqn}")
+                logger.debug("✅ Schema: %s", fqn)
                 self.stats["schemas"] += 1
                 return fqn
             else:
@@ -455,16 +1151,24 @@ class OpenMetadataSyncEngine:
         }
         
         try:
-            response = requests.put(
-                f"{self.url}/v1/tables",
-                json=payload,
-                headers=self.headers,
-                timeout=10
-            )
+            with tracing.span("openmetadata.write", entity="table", name=name):
+                response = http_request(
+                    "PUT",
+                    f"{self.url}/v1/tables",
+                    "openmetadata",
+                    "/v1/tables",
+                    limiter=self.limiter,
+                    json=payload,
+                    headers=self.headers,
+                    timeout=10
+                )
             
             if response.status_code in [200, 201]:
-                fqn = response.json().get("fullyQualifiedName")
-                logger.info(f"✅ Table: {fqn} ({len(columns)} colonnes)")
+                data = response.json()
+                fqn = data.get("fullyQualifiedName")
+                if fqn and data.get("id"):
+                    self.table_ids[fqn] = data["id"]
+                logger.debug("✅ Table: %s (%d colonnes)", fqn, len(columns))
                 self.stats["tables"] += 1
                 return fqn
             else:
@@ -475,6 +1179,493 @@ class OpenMetadataSyncEngine:
             logger.error(f"❌ Erreur table {name}: {e}")
             self.stats["errors"] += 1
             return None
+    
+    def patch_table(self, table_fqn: str, columns: List[Dict]) -> bool:
+        """
+        Met à jour les colonnes d'une table indexée par JSON Patch du delta
+        
+        Returns:
+            bool: False si la table doit être réécrite par PUT (colonnes
+            renommées ou déplacées, conflit, erreur)
+        """
+        operations = column_patch(self.index.columns.get(table_fqn, []), columns)
+        if operations is None:
+            return False
+        
+        table_id = self.index.table_id(table_fqn)
+        if not operations:
+            # Différence sans effet sur les champs patchés (casse d'un type...)
+            self.table_ids[table_fqn] = table_id
+            self.stats["skipped"] += 1
+            return True
+        
+        try:
+            with tracing.span("openmetadata.write", entity="table", name=table_fqn, operations=len(operations)):
+                response = http_request(
+                    "PATCH",
+                    f"{self.url}/v1/tables/{table_id}",
+                    "openmetadata",
+                    "/v1/tables/{id}",
+                    limiter=self.limiter,
+                    json=operations,
+                    headers={**self.headers, "Content-Type": PATCH_CONTENT_TYPE},
+                    timeout=10
+                )
+        except Exception as e:
+            logger.warning(f"⚠️ Erreur patch table {table_fqn}, repli PUT: {e}")
+            self.stats["fallbacks"] += 1
+            return False
+        
+        if response.status_code != 200:
+            logger.debug("Patch refusé %s (%d), repli PUT", table_fqn, response.status_code)
+            self.stats["fallbacks"] += 1
+            return False
+        
+        self.table_ids[table_fqn] = response.json().get("id") or table_id
+        logger.debug("✅ Table patchée: %s (%d opérations)", table_fqn, len(operations))
+        self.stats["tables"] += 1
+        self.stats["patched"] += 1
+        return True
+    
+    def write_schemas(self, database_fqn: str, schemas: List[str]) -> Dict[str, str]:
+        """
+        Crée ou met à jour les schémas d'une database
+        
+        Returns:
+            Dict[str, str]: nom → FQN des schémas écrits ou déjà présents
+        """
+        written: Dict[str, str] = {}
+        if self.index is not None:
+            # Schémas déjà présents dans OpenMetadata: aucune écriture
+            for name in schemas:
+                fqn = f"{database_fqn}.{build_fqn(name)}"
+                if fqn in self.index.schemas:
+                    written[name] = fqn
+            schemas = [name for name in schemas if name not in written]
+        
+        if not self._use_bulk(schemas):
+            for name in schemas:
+                fqn = self.create_or_update_schema(database_fqn=database_fqn, name=name, description=f"Schema {name}")
+                if fqn:
+                    written[name] = fqn
+            return written
+        
+        records = {name: schema_rows(database_fqn, name, f"Schema {name}") for name in schemas}
+        imported = self.import_entities("databases", database_fqn, records)
+        self.stats["schemas"] += len(imported)
+        written.update({name: records[name][0]["fullyQualifiedName"] for name in imported})
+        for name in schemas:
+            if name not in written:
+                self.stats["fallbacks"] += 1
+                fqn = self.create_or_update_schema(database_fqn=database_fqn, name=name, description=f"Schema {name}")
+                if fqn:
+                    written[name] = fqn
+        return written
+    
+    def write_tables(self, schema_fqn: str, tables: List[Dict]) -> Dict[str, str]:
+        """
+        Crée ou met à jour les tables d'un schéma
+        
+        Args:
+            tables: [{"name": str, "columns": List[Dict], "description": str}]
+        
+        Returns:
+            Dict[str, str]: nom → FQN des tables écrites ou inchangées (ids dans table_ids)
+        """
+        written: Dict[str, str] = {}
+        if self.index is not None:
+            # Tables identiques dans OpenMetadata (même empreinte de colonnes): aucune écriture;
+            # colonnes modifiées: PATCH du delta, PUT complet si le patch est impossible ou refusé
+            pending = []
+            for table in tables:
+                fqn = f"{schema_fqn}.{build_fqn(table['name'])}"
+                decision = self.index.decide(fqn, table["columns"])
+                if decision == SKIP:
+                    written[table["name"]] = fqn
+                    self.table_ids[fqn] = self.index.table_id(fqn)
+                    self.stats["skipped"] += 1
+                elif decision == UPDATE and self.patch_table(fqn, table["columns"]):
+                    written[table["name"]] = fqn
+                else:
+                    pending.append(table)
+            tables = pending
+        
+        if not self._use_bulk(tables):
+            for table in tables:
+                fqn = self.create_or_update_table(schema_fqn, table["name"], table["columns"], table.get("description", ""))
+                if fqn:
+                    written[table["name"]] = fqn
+            return written
+        
+        records = {
+            t["name"]: table_rows(schema_fqn, t["name"], t["columns"], t.get("description", ""))
+            for t in tables
+        }
+        imported = self.import_entities("databaseSchemas", schema_fqn, records)
+        written.update({name: records[name][0]["fullyQualifiedName"] for name in imported})
+        if imported:
+            self.stats["tables"] += len(imported)
+            self.stats["imported"] += len(imported)
+            self._fetch_table_ids(schema_fqn)
+        for table in tables:
+            if table["name"] not in written:
+                self.stats["fallbacks"] += 1
+                fqn = self.create_or_update_table(schema_fqn, table["name"], table["columns"], table.get("description", ""))
+                if fqn:
+                    written[table["name"]] = fqn
+        return written
+    
+    def build_index(self, max_workers: int = 4) -> EntityIndex:
+        """Prefetch des databases, schémas et tables existants du service (voir core.entity_index)"""
+        with tracing.span("openmetadata.index", service=self.service_name) as span:
+            self.index = EntityIndex.build(self, max_workers=max_workers)
+            span.set_attribute("entities", len(self.index))
+        return self.index
+    
+    def _use_bulk(self, entities: List) -> bool:
+        return self.bulk_import and len(entities) >= BULK_MIN_ENTITIES
+    
+    def import_entities(self, collection: str, parent_fqn: str, records: Dict[str, List[Dict]]) -> Set[str]:
+        """
+        Importe des entités enfants de ``parent_fqn`` par CSV, paquet par paquet
+        
+        Chaque paquet est validé en dry-run; les entités dont une ligne est
+        refusée sont retirées avant l'import réel. Un paquet abandonné
+        (en-têtes, erreur HTTP) n'importe rien.
+        
+        Args:
+            collection: "databases" ou "databaseSchemas" (type du parent)
+            records: nom de l'entité → lignes CSV (schema_rows, table_rows)
+        
+        Returns:
+            Set[str]: noms des entités importées (les autres sont à réécrire par PUT)
+        """
+        imported: Set[str] = set()
+        for names in chunked(list(records), self.bulk_chunk_size):
+            owners = {row["fullyQualifiedName"]: name for name in names for row in records[name]}
+            
+            result = self._put_import(collection, parent_fqn, [records[n] for n in names], dry_run=True)
+            if import_aborted(result):
+                continue
+            rejected = {owners.get(fqn) for fqn in failed_fqns(result)}
+            names = [n for n in names if n not in rejected]
+            if not names:
+                continue
+            
+            result = self._put_import(collection, parent_fqn, [records[n] for n in names], dry_run=False)
+            if import_aborted(result):
+                continue
+            rejected = {owners.get(fqn) for fqn in failed_fqns(result)}
+            imported.update(n for n in names if n not in rejected)
+        return imported
+    
+    def _put_import(self, collection: str, parent_fqn: str, records: List[List[Dict]], dry_run: bool) -> Optional[Dict]:
+        """Un PUT d'import CSV, CsvImportResult ou None si la requête échoue"""
+        from urllib.parse import quote
+        
+        rows = [row for record in records for row in record]
+        endpoint = f"/v1/{collection}/name/{{fqn}}/import"
+        try:
+            with tracing.span("openmetadata.import", entity=collection, name=parent_fqn, rows=len(rows), dry_run=dry_run):
+                response = http_request(
+                    "PUT",
+                    f"{self.url}/v1/{collection}/name/{quote(parent_fqn, safe='')}/import",
+                    "openmetadata",
+                    endpoint,
+                    limiter=self.limiter,
+                    params={"dryRun": str(dry_run).lower(), "recursive": "true"},
+                    data=to_csv(rows).encode("utf-8"),
+                    headers={**self.headers, "Content-Type": "text/plain"},
+                    timeout=60
+                )
+            if response.status_code not in [200, 201]:
+                logger.warning(f"⚠️ Échec import CSV {parent_fqn} (dryRun={dry_run}): {response.status_code}")
+                return None
+            result = response.json()
+        except Exception as e:
+            logger.warning(f"⚠️ Erreur import CSV {parent_fqn} (dryRun={dry_run}): {e}")
+            return None
+        
+        if import_aborted(result):
+            logger.warning(f"⚠️ Import CSV {parent_fqn} abandonné: {result.get('abortReason')}")
+        else:
+            logger.debug(
+                "📥 Import CSV %s (dryRun=%s): %s lignes, %s refusées",
+                parent_fqn, dry_run, result.get("numberOfRowsProcessed"), result.get("numberOfRowsFailed")
+            )
+        return result
+    
+    def _fetch_table_ids(self, schema_fqn: str):
+        """Ids des tables d'un schéma (l'import CSV ne les renvoie pas)"""
+        for table in self.list_entities("tables", {"databaseSchema": schema_fqn}) or []:
+            if table.get("fullyQualifiedName") and table.get("id"):
+                self.table_ids[table["fullyQualifiedName"]] = table["id"]
+    
+    def list_entities(self, collection: str, params: Dict, page_size: int = 1000) -> Optional[List[Dict]]:
+        """
+        Liste complète ``GET /v1/{collection}``, page par page (curseur ``after``)
+        
+        Sans ``fields`` dans ``params``, seuls les champs de base (id, nom,
+        FQN, version) sont renvoyés.
+        
+        Returns:
+            None si une page est en échec (liste incomplète)
+        """
+        entities: List[Dict] = []
+        after = None
+        while True:
+            page_params = {**params, "limit": page_size}
+            if after:
+                page_params["after"] = after
+            try:
+                response = http_request(
+                    "GET",
+                    f"{self.url}/v1/{collection}",
+                    "openmetadata",
+                    f"/v1/{collection}",
+                    limiter=self.limiter,
+                    params=page_params,
+                    headers=self.headers,
+                    timeout=30
+                )
+                if response.status_code != 200:
+                    logger.warning(f"⚠️ Échec lecture {collection} {params}: {response.status_code}")
+                    return None
+                page = response.json()
+            except Exception as e:
+                logger.warning(f"⚠️ Erreur lecture {collection} {params}: {e}")
+                return None
+            entities.extend(page.get("data", []))
+            after = (page.get("paging") or {}).get("after")
+            if not after:
+                return entities
+    
+    def list_service_tables(self) -> Optional[Dict[str, str]]:
+        """FQN → id des tables non supprimées du service, None si le listing a échoué"""
+        tables = self.list_entities("tables", {"service": self.service_name, "include": "non-deleted"})
+        if tables is None:
+            return None
+        return {t["fullyQualifiedName"]: t["id"] for t in tables if t.get("fullyQualifiedName") and t.get("id")}
+    
+    def soft_delete_tables(
+        self,
+        tables: Dict[str, str],
+        batch_size: int = DEFAULT_DELETE_BATCH_SIZE,
+        rate_limit: Optional[float] = None
+    ) -> int:
+        """
+        Soft-delete (``hardDelete=false``) des tables FQN → id, par lots
+        
+        Args:
+            rate_limit: suppressions par seconde (défaut: limite du moteur)
+        
+        Returns:
+            int: nombre de tables supprimées
+        """
+        limiter = RateLimiter(rate_limit) if rate_limit else self.limiter
+        deleted = 0
+        
+        with requests.Session() as session:
+            session.headers.update(self.headers)
+            for batch in batches(tables.items(), batch_size):
+                for fqn, table_id in batch:
+                    try:
+                        with tracing.span("openmetadata.delete", entity="table", name=fqn):
+                            response = http_request(
+                                "DELETE",
+                                f"{self.url}/v1/tables/{table_id}",
+                                "openmetadata",
+                                "/v1/tables/{id}",
+                                session=session,
+                                limiter=limiter,
+                                params={"hardDelete": "false", "recursive": "false"},
+                                timeout=10
+                            )
+                        if response.status_code in [200, 204]:
+                            deleted += 1
+                            self.table_ids.pop(fqn, None)
+                            logger.debug("🗑️  Table supprimée (soft): %s", fqn)
+                        else:
+                            logger.warning(f"⚠️ Échec suppression {fqn}: {response.status_code}")
+                            self.stats["errors"] += 1
+                    except Exception as e:
+                        logger.error(f"❌ Erreur suppression {fqn}: {e}")
+                        self.stats["errors"] += 1
+                logger.info(f"🗑️  Suppressions: {deleted}/{len(tables)}")
+        
+        self.stats["deleted"] += deleted
+        return deleted
+    
+    def put_table_profile(self, table_id: str, payload: Dict) -> str:
+        """
+        Écrit le profil d'une table et de ses colonnes (CreateTableProfile)
+        
+        Appelé en parallèle par core.profile_sink.ProfileSink. Retourne
+        WRITTEN, REJECTED pour un refus 4xx (table supprimée, payload
+        invalide: le profil est abandonné) ou FAILED pour un 5xx/429 (le
+        profil part dans le spool). Les erreurs de connexion sont levées.
+        """
+        with tracing.span("openmetadata.profile", table_id=table_id):
+            response = http_request(
+                "PUT",
+                f"{self.url}/v1/tables/{table_id}/tableProfile",
+                "openmetadata",
+                "/v1/tables/{id}/tableProfile",
+                limiter=self.limiter,
+                json=payload,
+                headers=self.headers,
+                timeout=30
+            )
+        if response.status_code not in [200, 201]:
+            logger.debug("Échec profil %s: %d", table_id, response.status_code)
+            if 400 <= response.status_code < 500 and response.status_code not in (408, 429):
+                return profile_sink.REJECTED
+            return profile_sink.FAILED
+        self.stats["profiles"] += 1
+        return profile_sink.WRITTEN
+    
+    def add_lineage(
+        self,
+        from_table_id: str,
+        to_table_id: str,
+        sql_query: Optional[str] = None,
+        columns_lineage: Optional[List[Dict]] = None
+    ) -> bool:
+        """
+        Ajoute une arête de lineage table → table (vue)
+        
+        Args:
+            columns_lineage: [{"fromColumns": [fqn colonne amont], "toColumn": fqn colonne}]
+        """
+        edge = {
+            "fromEntity": {"id": from_table_id, "type": "table"},
+            "toEntity": {"id": to_table_id, "type": "table"},
+        }
+        if sql_query or columns_lineage:
+            edge["lineageDetails"] = {"sqlQuery": sql_query, "source": "ViewLineage"}
+            if columns_lineage:
+                edge["lineageDetails"]["columnsLineage"] = columns_lineage
+        
+        try:
+            with tracing.span("openmetadata.write", entity="lineage", from_id=from_table_id, to_id=to_table_id):
+                response = http_request(
+                    "PUT",
+                    f"{self.url}/v1/lineage",
+                    "openmetadata",
+                    "/v1/lineage",
+                    limiter=self.limiter,
+                    json={"edge": edge},
+                    headers=self.headers,
+                    timeout=10
+                )
+            
+            if response.status_code in [200, 201]:
+                self.stats["lineage"] += 1
+                return True
+            else:
+                logger.warning(f"⚠️ Échec lineage {from_table_id} → {to_table_id}: {response.status_code}")
+                self.stats["errors"] += 1
+                return False
+        except Exception as e:
+            logger.error(f"❌ Erreur lineage {from_table_id} → {to_table_id}: {e}")
+            self.stats["errors"] += 1
+            return False
+
+    
+    def publish_usage(self, summaries: List[Dict]) -> List[Dict]:
+        """
+        Pousse les résumés d'usage (UsageIngestion.collect) vers OpenMetadata
+        
+        OpenMetadata n'a pas d'endpoint d'usage multi-tables: les résumés sont
+        déjà agrégés par table et par jour, ce qui donne un appel par table/jour
+        (au lieu d'un par requête), sur une session HTTP keep-alive. Les
+        percentiles ne sont recalculés qu'une fois par jour publié.
+        
+        L'usage est envoyé en PUT, qui s'ajoute au compteur du jour (POST le
+        remplace): un run incrémental ne publie que les jobs terminés depuis le
+        high-water mark, la journée en cours est donc complétée run après run.
+        Comme le PUT n'est pas idempotent, les résumés en échec sont retournés
+        pour que UsageIngestion.commit ne republie que ceux-là.
+        
+        Les résumés des tables absentes de table_ids (non synchronisées) sont
+        écartés et comptés dans stats["usage_skipped"].
+        
+        Returns:
+            List[Dict]: résumés non publiés (vide si tout est publié)
+        """
+        failed = []
+        skipped = 0
+        dates = set()
+        
+        with requests.Session() as session:
+            session.headers.update(self.headers)
+            
+            for summary in summaries:
+                table_fqn = build_fqn(self.service_name, *split_dataset_path(summary["path"]))
+                table_id = self.table_ids.get(table_fqn)
+                if not table_id:
+                    logger.debug("Usage ignoré, table non synchronisée: %s", table_fqn)
+                    skipped += 1
+                    continue
+                
+                try:
+                    with tracing.span("openmetadata.write", entity="usage", name=table_fqn):
+                        response = http_request(
+                            "PUT",
+                            f"{self.url}/v1/usage/table/{table_id}",
+                            "openmetadata",
+                            "/v1/usage/table/{id}",
+                            limiter=self.limiter,
+                            session=session,
+                            json={"date": summary["date"], "count": summary["count"]},
+                            timeout=10
+                        )
+                    if response.status_code not in [200, 201]:
+                        logger.warning(f"⚠️ Échec usage {table_fqn}: {response.status_code}")
+                        self.stats["errors"] += 1
+                        failed.append(summary)
+                        continue
+                    
+                    if summary.get("joins"):
+                        joins = {
+                            "startDate": summary["date"],
+                            "dayCount": 1,
+                            "columnJoins": [],
+                            "directTableJoins": [
+                                {
+                                    "fullyQualifiedName": build_fqn(self.service_name, *split_dataset_path(path)),
+                                    "joinCount": count
+                                }
+                                for path, count in summary["joins"]
+                            ]
+                        }
+                        response = http_request(
+                            "PUT", f"{self.url}/v1/tables/{table_id}/joins", "openmetadata",
+                            "/v1/tables/{id}/joins", session=session, limiter=self.limiter, json=joins, timeout=10
+                        )
+                        if response.status_code not in [200, 201]:
+                            logger.warning(f"⚠️ Échec jointures {table_fqn}: {response.status_code}")
+                    
+                    self.stats["usage"] += 1
+                    dates.add(summary["date"])
+                except Exception as e:
+                    logger.error(f"❌ Erreur usage {table_fqn}: {e}")
+                    self.stats["errors"] += 1
+                    failed.append(summary)
+            
+            for date in sorted(dates):
+                try:
+                    http_request(
+                        "POST", f"{self.url}/v1/usage/compute.percentile/table/{date}", "openmetadata",
+                        "/v1/usage/compute.percentile/table/{date}", session=session, limiter=self.limiter, timeout=30
+                    )
+                except Exception as e:
+                    logger.warning(f"⚠️ Calcul des percentiles d'usage {date} impossible: {e}")
+        
+        if skipped:
+            self.stats["usage_skipped"] += skipped
+            logger.warning(f"⚠️ Usage: {skipped} résumés ignorés, tables non synchronisées dans OpenMetadata")
+        return failed
 
 
 class DremioOpenMetadataSync:
@@ -499,16 +1690,85 @@ class DremioOpenMetadataSync:
         dremio_password: str,
         openmetadata_url: str,
         jwt_token: str,
-        service_name: str
+        service_name: str,
+        state_dir: Optional[str] = None,
+        max_retries: int = 0,
+        metrics_file: Optional[str] = None,
+        trace_file: Optional[str] = None,
+        progress_interval: Optional[float] = DEFAULT_INTERVAL,
+        max_workers: int = 1,
+        rate_limit: Optional[float] = None,
+        om_rate_limit: Optional[float] = None,
+        include: Optional[List[str]] = None,
+        exclude: Optional[List[str]] = None,
+        snapshot_path: Optional[str] = None,
+        snapshot_max_age: Optional[float] = DEFAULT_MAX_AGE,
+        bulk_import: bool = False,
+        max_delete_ratio: Optional[float] = DEFAULT_MAX_DELETE_RATIO,
+        delete_rate_limit: Optional[float] = None,
+        prefetch_index: bool = False,
+        flight_port: Optional[int] = None,
+        flight_tls: bool = False
     ):
-        self.dremio = DremioAutoDiscovery(dremio_url, dremio_user, dremio_password)
-        self.om = OpenMetadataSyncEngine(openmetadata_url, jwt_token, service_name)
+        self.dremio = DremioAutoDiscovery(
+            dremio_url, dremio_user, dremio_password,
+            max_retries=max_retries, progress_interval=progress_interval,
+            max_workers=max_workers, rate_limit=rate_limit,
+            path_filter=PathFilter(include, exclude),
+            flight_port=flight_port, flight_tls=flight_tls
+        )
+        self.om = OpenMetadataSyncEngine(
+            openmetadata_url, jwt_token, service_name, rate_limit=om_rate_limit, bulk_import=bulk_import
+        )
         self.service_name = service_name
+        self.state_dir = state_dir
+        # Dump des métriques Prometheus en fin de sync (textfile collector / pushgateway)
+        self.metrics_file = metrics_file
+        # Spans de la sync en JSON lines (tracing.FileSpanExporter)
+        self.trace_file = trace_file
+        # Secondes entre deux lignes de progression agrégées (0 = désactivé)
+        self.progress_interval = progress_interval
+        # Motifs include/exclude (voir core.filters), appliqués pendant la découverte
+        self.include = include or []
+        self.exclude = exclude or []
+        # Snapshot de découverte partagé avec le connecteur (voir core.snapshot):
+        # réutilisé s'il a moins de snapshot_max_age secondes, sinon réécrit
+        self.snapshot_path = snapshot_path
+        self.snapshot_max_age = snapshot_max_age
+        # Réconciliation: garde-fou (part max des tables supprimées, None = aucun)
+        # et suppressions par seconde (None = limite OpenMetadata du moteur)
+        self.max_delete_ratio = max_delete_ratio
+        self.delete_rate_limit = delete_rate_limit
+        # Listing préalable des entités du service (voir core.entity_index):
+        # les databases, schémas et tables identiques ne sont pas réécrits
+        self.prefetch_index = prefetch_index
     
-    def sync(self) -> Dict:
+    def sync(
+        self,
+        lineage: bool = False,
+        usage: bool = False,
+        incremental: bool = False,
+        dry_run: bool = False,
+        reconcile: bool = False
+    ) -> Dict:
         """
         Synchronisation complète Dremio → OpenMetadata
         
+        Args:
+            lineage: Calculer et pousser le lineage des vues (VIRTUAL_DATASET)
+            usage: Scanner l'historique des jobs (sys.jobs_recent) depuis le
+                dernier run et pousser l'usage des tables
+            incremental: Ne réécrire que les tables dont les colonnes ont
+                changé depuis le dernier run (état dans ``state_dir``)
+            dry_run: Découvrir et planifier sans aucune écriture OpenMetadata
+                (ni lineage, ni usage, ni état)
+            reconcile: Soft-delete des tables OpenMetadata du service dont le
+                dataset Dremio a disparu (voir core.reconcile); en dry-run,
+                seul le rapport des tables périmées est calculé
+        
+        Avec ``trace_file``, les spans de la sync (découverte, jobs SQL,
+        écritures OpenMetadata) sont écrits dans ce fichier.
+        
         Returns:
             Dict: Statistiques de synchronisation
                 {
@@ -520,6 +1780,20 @@ class DremioOpenMetadataSync:
                     "duration_seconds": float
                 }
         """
+        if not self.trace_file:
+            return self._sync(lineage, usage, incremental, dry_run, reconcile)
+        
+        exporter = tracing.FileSpanExporter(self.trace_file)
+        previous = tracing.get_tracer()
+        tracing.configure_tracing(exporter)
+        try:
+            with tracing.span("sync", service=self.service_name):
+                return self._sync(lineage, usage, incremental, dry_run, reconcile)
+        finally:
+            tracing.set_tracer(previous)
+            exporter.shutdown()
+    
+    def _sync(self, lineage: bool, usage: bool, incremental: bool, dry_run: bool, reconcile: bool) -> Dict:
         start_time = datetime.now()
         logger.info("="*80)
         logger.info("🚀 SYNCHRONISATION DREMIO → OPENMETADATA")
@@ -531,18 +1805,49 @@ class DremioOpenMetadataSync:
             return {"error": "authentication_failed"}
         
         # 2. Découverte
-        resources = self.dremio.discover_all_resources()
+        with metrics.stage("discovery"):
+            resources = self._discover()
         if not resources:
             logger.warning("⚠️ Aucune ressource découverte")
             return {"resources_discovered": 0}
         
         # 3. Organisation hiérarchique
-        hierarchy = self._organize_hierarchy(resources)
+        with metrics.stage("hierarchy"):
+            hierarchy = self._organize_hierarchy(resources)
+        
+        state = SyncState(self.dremio.url, self.service_name, self.state_dir).load() if incremental else None
+        if self.prefetch_index:
+            with metrics.stage("openmetadata_index"):
+                self.om.build_index(self.dremio.max_workers)
+        if dry_run:
+            plan = self._plan(resources, hierarchy, state)
+            if reconcile:
+                plan.update(self._reconcile(hierarchy, dry_run=True))
+            return plan
         
         # 4. Synchronisation vers OpenMetadata
-        self._sync_to_openmetadata(hierarchy)
+        with metrics.stage("openmetadata_sync"):
+            self._sync_to_openmetadata(hierarchy, state)
+        if state is not None:
+            state.save()
+        
+        # 5. Réconciliation des tables supprimées côté Dremio (optionnel)
+        reconciliation = {}
+        if reconcile:
+            with metrics.stage("reconciliation"):
+                reconciliation = self._reconcile(hierarchy)
+        
+        # 6. Lineage des vues (optionnel)
+        if lineage:
+            with metrics.stage("lineage"):
+                self._sync_lineage(resources)
+        
+        # 7. Usage depuis l'historique des jobs (optionnel)
+        if usage:
+            with metrics.stage("usage"):
+                self._sync_usage(resources)
         
-        # 5. Statistiques finales
+        # 8. Statistiques finales
         duration = (datetime.now() - start_time).total_seconds()
         
         logger.info("="*80)
@@ -552,69 +1857,150 @@ class DremioOpenMetadataSync:
         logger.info(f"Databases créées/màj:       {self.om.stats['databases']}")
         logger.info(f"Schemas créés/màj:          {self.om.stats['schemas']}")
         logger.info(f"Tables créées/màj:          {self.om.stats['tables']}")
+        if incremental or self.prefetch_index:
+            logger.info(f"Tables inchangées:          {self.om.stats['skipped']}")
+        if self.om.bulk_import:
+            logger.info(f"Tables importées (CSV):     {self.om.stats['imported']}")
+            logger.info(f"Replis PUT:                 {self.om.stats['fallbacks']}")
+        if self.prefetch_index:
+            logger.info(f"Tables patchées:            {self.om.stats['patched']}")
+        if reconcile:
+            logger.info(f"Tables supprimées:          {self.om.stats['deleted']}")
+        if lineage:
+            logger.info(f"Arêtes de lineage:          {self.om.stats['lineage']}")
+        if usage:
+            logger.info(f"Résumés d'usage:            {self.om.stats['usage']}")
+            logger.info(f"Résumés d'usage ignorés:    {self.om.stats['usage_skipped']}")
         logger.info(f"Erreurs:                    {self.om.stats['errors']}")
         logger.info(f"Durée:                      {duration:.2f}s")
         logger.info("="*80)
         
+        if self.metrics_file:
+            try:
+                metrics.write_textfile(self.metrics_file)
+            except OSError as e:
+                logger.warning(f"⚠️ Impossible d'écrire les métriques {self.metrics_file}: {e}")
+        
         return {
             "resources_discovered": len(resources),
             "databases_created": self.om.stats["databases"],
             "schemas_created": self.om.stats["schemas"],
             "tables_created": self.om.stats["tables"],
+            "tables_skipped": self.om.stats["skipped"],
+            "tables_imported": self.om.stats["imported"],
+            "tables_patched": self.om.stats["patched"],
+            "lineage_edges": self.om.stats["lineage"],
+            "usage_summaries": self.om.stats["usage"],
+            "usage_skipped": self.om.stats["usage_skipped"],
             "errors": self.om.stats["errors"],
-            "duration_seconds": duration
+            "duration_seconds": duration,
+            **reconciliation
         }
     
-    def _organize_hierarchy(self, resources: List[Dict]) -> Dict:
-        """Organise les ressources en hiérarchie Database → Schema → Table"""
-        hierarchy = {}
+    def _discover(self) -> List[Dict]:
+        """Ressources du snapshot partagé s'il est frais, sinon d'un nouveau parcours"""
+        if not self.snapshot_path:
+            return self.dremio.discover_all_resources()
+        snapshot = self.dremio.discover_snapshot(self.snapshot_path, max_age=self.snapshot_max_age)
+        return snapshot.resources(self.dremio.path_filter) if snapshot is not None else []
+    
+    def _plan(self, resources: List[Dict], hierarchy: Dict, state: Optional[SyncState]) -> Dict:
+        """Écritures qu'effectuerait la synchronisation (dry-run)"""
+        plan = {
+            "dry_run": True,
+            "resources_discovered": len(resources),
+            "databases": 0,
+            "schemas": 0,
+            "tables": 0,
+            "tables_unchanged": 0
+        }
+        for db_name, db_data in hierarchy.items():
+            plan["databases"] += 1
+            for schema_name, schema_data in db_data.get("schemas", {}).items():
+                plan["schemas"] += 1
+                for table in schema_data.get("tables", []):
+                    table_fqn = build_fqn(self.service_name, db_name, schema_name, table["path"][-1])
+                    if state is not None and state.unchanged(table_fqn, table_fingerprint(table.get("columns", []))):
+                        plan["tables_unchanged"] += 1
+                    elif self.om.index is not None and self.om.index.decide(table_fqn, table.get("columns", [])) == SKIP:
+                        plan["tables_unchanged"] += 1
+                    else:
+                        plan["tables"] += 1
+        logger.info(
+            f"📝 Dry-run: {plan['databases']} databases, {plan['schemas']} schemas, "
+            f"{plan['tables']} tables à écrire ({plan['tables_unchanged']} inchangées)"
+        )
+        return plan
+    
+    def _reconcile(self, hierarchy: Dict, dry_run: bool = False) -> Dict:
+        """
+        Mark-and-sweep des tables OpenMetadata dont le dataset a disparu
         
-        for resource in resources:
-            path = resource.get("path", [])
-            res_type = resource.get("type")
-            
-            if not path:
-                continue
-            
-            # Database level: spaces & sources
-            if res_type in ["space", "source"]:
-                db_name = path[0]
-                if db_name not in hierarchy:
-                    hierarchy[db_name] = {"schemas": {}}
-            
-            # Schema level: folders (depth 2+)
-            elif res_type == "folder" and len(path) >= 2:
-                db_name = path[0]
-                schema_name = ".".join(path[1:])
-                
-                if db_name not in hierarchy:
-                    hierarchy[db_name] = {"schemas": {}}
-                
-                if schema_name not in hierarchy[db_name]["schemas"]:
-                    hierarchy[db_name]["schemas"][schema_name] = {"tables": []}
-            
-            # Table level: datasets
-            elif res_type == "dataset":
-                if len(path) == 1:
-                    # Dataset direct dans space/source
-                    db_name = path[0]
-                    schema_name = "default"
-                else:
-                    db_name = path[0]
-                    schema_name = ".".join(path[1:-1]) if len(path) > 2 else path[1]
-                
-                if db_name not in hierarchy:
-                    hierarchy[db_name] = {"schemas": {}}
-                
-                if schema_name not in hierarchy[db_name]["schemas"]:
-                    hierarchy[db_name]["schemas"][schema_name] = {"tables": []}
-                
-                hierarchy[db_name]["schemas"][schema_name]["tables"].append(resource)
+        Les FQN découverts (écrits ou inchangés) sont comparés aux tables du
+        service listées par pages: aucune lecture par table. Au-delà du
+        garde-fou ``max_delete_ratio``, rien n'est supprimé. Les tables des
+        conteneurs dont le listing a échoué pendant la découverte sont
+        gardées; sans catalogue racine, rien n'est balayé.
+        """
+        discovered = {
+            build_fqn(self.service_name, db_name, schema_name, table["path"][-1])
+            for db_name, db_data in hierarchy.items()
+            for schema_name, schema_data in db_data.get("schemas", {}).items()
+            for table in schema_data.get("tables", [])
+        }
+        failed_paths = self.dremio.failed_paths
+        if [] in failed_paths:
+            logger.warning("⚠️ Réconciliation annulée: catalogue racine Dremio illisible")
+            return {"tables_stale": 0, "tables_deleted": 0, "reconcile_aborted": True}
+        if failed_paths:
+            logger.warning(
+                f"⚠️ Réconciliation: {len(failed_paths)} conteneurs non listés exclus du balayage "
+                f"({', '.join('.'.join(p) for p in failed_paths[:5])})"
+            )
+        listed = self.om.list_service_tables()
+        if listed is None:
+            logger.warning("⚠️ Réconciliation annulée: listing des tables OpenMetadata incomplet")
+            return {"tables_stale": 0, "tables_deleted": 0, "reconcile_aborted": True}
         
-        return hierarchy
+        stale = find_stale(listed, discovered, self.dremio.path_filter, failed_paths)
+        report = {
+            "tables_stale": len(stale),
+            "tables_deleted": 0,
+            "reconcile_aborted": False,
+            "stale_tables": sorted(stale),
+        }
+        logger.info(f"🧹 Réconciliation: {len(stale)} tables périmées sur {len(listed)} dans OpenMetadata")
+        
+        if exceeds_threshold(len(stale), len(listed), self.max_delete_ratio):
+            logger.error(
+                f"❌ Réconciliation annulée: {len(stale)}/{len(listed)} tables à supprimer "
+                f"dépasse le garde-fou ({self.max_delete_ratio:.0%})"
+            )
+            report["reconcile_aborted"] = True
+            return report
+        if dry_run or not stale:
+            return report
+        
+        report["tables_deleted"] = self.om.soft_delete_tables(stale, rate_limit=self.delete_rate_limit)
+        return report
+    
+    def _organize_hierarchy(self, resources: List[Dict]) -> Dict:
+        """Organise les ressources en hiérarchie Database → Schema → Table"""
+        return organize_hierarchy(resources)
     
-    def _sync_to_openmetadata(self, hierarchy: Dict):
-        """Synchronise la hiérarchie vers OpenMetadata"""
+    def _sync_to_openmetadata(self, hierarchy: Dict, state: Optional[SyncState] = None):
+        """
+        Synchronise la hiérarchie vers OpenMetadata
+        
+        Avec un état incrémental, les tables dont l'empreinte des colonnes n'a
+        pas changé ne sont pas réécrites (leur id reste connu).
+        """
+        progress = ProgressLogger(
+            logger,
+            "Tables",
+            total=sum(len(s["tables"]) for db in hierarchy.values() for s in db["schemas"].values()),
+            interval=self.progress_interval,
+        )
         for db_name, db_data in hierarchy.items():
             # Créer database
             db_fqn = self.om.create_or_update_database(
@@ -625,28 +2011,105 @@ class DremioOpenMetadataSync:
             if not db_fqn:
                 continue
             
-            # Créer schemas
-            for schema_name, schema_data in db_data.get("schemas", {}).items():
-                schema_fqn = self.om.create_or_update_schema(
-                    database_fqn=db_fqn,
-                    name=schema_name,
-                    description=f"Schema {schema_name}"
-                )
-                
+            # Créer schemas (un import CSV par database avec bulk_import)
+            schemas = db_data.get("schemas", {})
+            schema_fqns = self.om.write_schemas(db_fqn, list(schemas))
+            
+            for schema_name, schema_data in schemas.items():
+                schema_fqn = schema_fqns.get(schema_name)
                 if not schema_fqn:
                     continue
                 
-                # Créer tables
+                # Tables à écrire (les inchangées sont sautées en incrémental)
+                pending = []
                 for table in schema_data.get("tables", []):
                     table_name = table["path"][-1]
                     columns = table.get("columns", [])
+                    state_key = fingerprint = None
+                    
+                    if state is not None:
+                        state_key = build_fqn(self.service_name, db_name, schema_name, table_name)
+                        fingerprint = table_fingerprint(columns)
+                        table_id = state.unchanged(state_key, fingerprint)
+                        if table_id:
+                            self.om.table_ids[state_key] = table_id
+                            self.om.stats["skipped"] += 1
+                            progress.advance()
+                            continue
                     
-                    self.om.create_or_update_table(
-                        schema_fqn=schema_fqn,
-                        name=table_name,
-                        columns=columns,
-                        description=f"Table {table_name} from Dremio"
+                    pending.append((table, state_key, fingerprint))
+                
+                # Créer tables (un import CSV par paquet avec bulk_import)
+                table_fqns = self.om.write_tables(schema_fqn, [
+                    {
+                        "name": table["path"][-1],
+                        "columns": table.get("columns", []),
+                        "description": f"Table {table['path'][-1]} from Dremio"
+                    }
+                    for table, _, _ in pending
+                ])
+                for table, state_key, fingerprint in pending:
+                    table_fqn = table_fqns.get(table["path"][-1])
+                    if state is not None and table_fqn and self.om.table_ids.get(table_fqn):
+                        state.record(state_key, fingerprint, self.om.table_ids[table_fqn])
+                    progress.advance(item=table.get("full_path", table["path"][-1]))
+        progress.finish()
+
+
+    def _sync_lineage(self, resources: List[Dict]):
+        """
+        Pousse le lineage des vues, calculé depuis le SQL déjà récupéré au crawl
+        
+        Le cache de parsing est persisté dans ``state_dir``: seules les vues
+        dont le SQL a changé depuis le run précédent sont re-parsées.
+        """
+        views = collect_view_definitions(resources)
+        if not views:
+            return
+        
+        logger.info(f"🔗 Lineage: {len(views)} vues à analyser")
+        datasets = [r for r in resources if r.get("type") == "dataset" and r.get("path")]
+        extractor = ViewLineageExtractor(
+            known_datasets=[r["path"] for r in datasets],
+            known_columns={
+                tuple(r["path"]): [c["name"] for c in r["columns"]]
+                for r in datasets if r.get("columns")
+            },
+            parse_cache=SqlParseCache(default_parse_cache_path(self.dremio.url, self.state_dir)),
+            column_level=True,
+        )
+        
+        for batch in extractor.extract(views):
+            for edge in batch:
+                from_fqn = build_fqn(self.service_name, *split_dataset_path(edge["from"]))
+                to_fqn = build_fqn(self.service_name, *split_dataset_path(edge["to"]))
+                from_id = self.om.table_ids.get(from_fqn)
+                to_id = self.om.table_ids.get(to_fqn)
+                if from_id and to_id:
+                    self.om.add_lineage(
+                        from_id,
+                        to_id,
+                        sql_query=edge["sql"],
+                        columns_lineage=build_columns_lineage(from_fqn, to_fqn, edge.get("columns", []))
                     )
+        
+        logger.info(f"🔗 Lineage: {extractor.stats}")
+    
+    def _sync_usage(self, resources: List[Dict]):
+        """Pousse l'usage des tables; seuls les résumés en échec sont recomptés au run suivant"""
+        usage = UsageIngestion(
+            self.dremio,
+            known_datasets=[r["path"] for r in resources if r.get("type") == "dataset" and r.get("path")],
+            state=UsageState(self.dremio.url, self.state_dir),
+        )
+        
+        try:
+            summaries = usage.collect()
+        except Exception as e:
+            logger.error(f"❌ Scan de l'historique des jobs impossible: {e}")
+            return
+        
+        usage.commit(self.om.publish_usage(summaries))
 
 
 # Fonction utilitaire pour usage direct
@@ -0,0 +1,88 @@
+"""
+État de la synchronisation incrémentale (empreinte des tables déjà poussées)
+
+Pour chaque table synchronisée, l'état garde l'empreinte de ses colonnes et
+l'id OpenMetadata renvoyé par le PUT. En mode incrémental, une table dont
+l'empreinte n'a pas changé depuis le dernier run n'est pas réécrite; son id
+reste connu pour le lineage et l'usage.
+
+Un fichier JSON par couple (instance Dremio, service OpenMetadata).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATE_FORMAT_VERSION = 1
+
+
+def table_fingerprint(columns: List[Dict]) -> str:
+    """Empreinte stable des colonnes d'une table (nom, type, position, description)"""
+    payload = json.dumps(
+        [
+            [c.get("name"), c.get("dataType"), c.get("ordinalPosition"), c.get("description")]
+            for c in columns
+        ],
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class SyncState:
+    """
+    Empreintes et ids des tables synchronisées, persistés en JSON
+
+    Args:
+        dremio_url: instance Dremio (clé du fichier)
+        service_name: service OpenMetadata (clé du fichier)
+        state_dir: répertoire de l'état (défaut: tmp système)
+    """
+
+    def __init__(self, dremio_url: str, service_name: str, state_dir: Optional[str] = None):
+        digest = hashlib.sha1(f"{dremio_url}|{service_name}".encode("utf-8")).hexdigest()[:12]
+        directory = Path(state_dir) if state_dir else Path(tempfile.gettempdir()) / "dremio_connector"
+        self.path = directory / f"sync_state_{digest}.json"
+        self.tables: Dict[str, Tuple[str, str]] = {}
+
+    def load(self) -> "SyncState":
+        """Charge l'état du dernier run (vide au premier run ou si illisible)"""
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return self
+        except Exception as e:
+            logger.warning(f"⚠️  État de synchronisation illisible {self.path}: {e}")
+            return self
+
+        if state.get("version") == STATE_FORMAT_VERSION:
+            self.tables = {fqn: tuple(entry) for fqn, entry in state.get("tables", {}).items()}
+        return self
+
+    def unchanged(self, table_fqn: str, fingerprint: str) -> Optional[str]:
+        """Id OpenMetadata de la table si son empreinte n'a pas changé, sinon None"""
+        entry = self.tables.get(table_fqn)
+        if entry and entry[0] == fingerprint:
+            return entry[1]
+        return None
+
+    def record(self, table_fqn: str, fingerprint: str, table_id: str):
+        self.tables[table_fqn] = (fingerprint, table_id)
+
+    def save(self):
+        """Écriture atomique (fichier temporaire + rename)"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": STATE_FORMAT_VERSION, "tables": self.tables}, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"⚠️  Impossible d'écrire l'état de synchronisation {self.path}: {e}")
@@ -0,0 +1,267 @@
+"""
+Traces des étapes de découverte, de profiling et de synchronisation
+
+API calquée sur OpenTelemetry (``span(name, **attributes)`` comme
+``start_as_current_span``, ``set_attribute``, ``record_exception``) avec:
+- un tracer no-op par défaut (coût quasi nul sur les chemins chauds)
+- ``InMemorySpanExporter``: spans gardés en mémoire (tests, benchmarks)
+- ``FileSpanExporter``: un span JSON par ligne, format proche d'OTLP/JSON
+  (traceId, spanId, parentSpanId, startTimeUnixNano...), exploitable hors ligne
+- ``configure_tracing("otel")``: délègue au SDK ``opentelemetry`` s'il est
+  installé (exporters OTLP, Jaeger... configurés par l'application)
+
+Spans émis:
+    discover_all_resources
+    explore_container              (un par expansion de conteneur)
+    execute_sql_query              → sql.submit, sql.poll, sql.fetch
+    profile_table                  → profile_column
+    openmetadata.write             (un par écriture)
+    http {METHOD} {endpoint}       (temps réseau de chaque requête)
+
+Usage:
+    from dremio_connector.core import tracing
+
+    exporter = tracing.FileSpanExporter("/tmp/dremio_trace.jsonl")
+    tracing.configure_tracing(exporter)
+    sync.sync()
+    exporter.shutdown()
+"""
+
+import json
+import logging
+import random
+import threading
+import time
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("dremio_connector_current_span", default=None)
+
+
+class Span:
+    """Span terminé ou en cours, sérialisable en dict OTLP-like"""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_span_id", "attributes",
+        "events", "status", "status_message", "start_time_ns", "end_time_ns",
+        "_tracer", "_token",
+    )
+
+    def __init__(self, tracer: "Tracer", name: str, parent: Optional["Span"], attributes: Dict):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_span_id = parent.span_id if parent else None
+        self.attributes = dict(attributes)
+        self.events: List[Dict] = []
+        self.status = "UNSET"
+        self.status_message = None
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns: Optional[int] = None
+        self._tracer = tracer
+        self._token = None
+
+    def set_attribute(self, key: str, value):
+        self.attributes[key] = value
+
+    def add_event(self, name: str, attributes: Optional[Dict] = None):
+        self.events.append({"name": name, "timeUnixNano": time.time_ns(), "attributes": attributes or {}})
+
+    def record_exception(self, exception: BaseException):
+        self.add_event("exception", {
+            "exception.type": type(exception).__name__,
+            "exception.message": str(exception),
+        })
+
+    def set_status(self, status: str, message: Optional[str] = None):
+        self.status = status
+        self.status_message = message
+
+    @property
+    def duration_ms(self) -> Optional[float]:
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1e6
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc is not None:
+            self.record_exception(exc)
+            self.set_status("ERROR", str(exc))
+        elif self.status == "UNSET":
+            self.status = "OK"
+        self.end_time_ns = time.time_ns()
+        _current_span.reset(self._token)
+        self._tracer.exporter.export(self)
+        return False
+
+    def to_dict(self) -> Dict:
+        status = {"code": self.status}
+        if self.status_message:
+            status["message"] = self.status_message
+        return {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentSpanId": self.parent_span_id,
+            "name": self.name,
+            "startTimeUnixNano": self.start_time_ns,
+            "endTimeUnixNano": self.end_time_ns,
+            "attributes": self.attributes,
+            "events": self.events,
+            "status": status,
+        }
+
+
+class _NoopSpan:
+    """Span partagé du tracer désactivé: aucune allocation ni horodatage"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value):
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Dict] = None):
+        pass
+
+    def record_exception(self, exception: BaseException):
+        pass
+
+    def set_status(self, status: str, message: Optional[str] = None):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class InMemorySpanExporter:
+    """Garde les spans terminés en mémoire (ordre de fin)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.spans: List[Span] = []
+
+    def export(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def find(self, name: str) -> List[Span]:
+        with self._lock:
+            return [s for s in self.spans if s.name == name]
+
+    def clear(self):
+        with self._lock:
+            self.spans.clear()
+
+    def shutdown(self):
+        pass
+
+
+class FileSpanExporter:
+    """Écrit chaque span terminé en une ligne JSON (fichier en ajout)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+
+    def export(self, span: Span):
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def shutdown(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+        logger.info(f"🧭 Traces écrites: {self.path}")
+
+
+class Tracer:
+    """Tracer actif: spans imbriqués via contextvars, envoyés à l'exporter à la fin"""
+
+    enabled = True
+
+    def __init__(self, exporter):
+        self.exporter = exporter
+
+    def span(self, name: str, /, **attributes) -> Span:
+        return Span(self, name, _current_span.get(), attributes)
+
+
+class NoopTracer:
+    enabled = False
+    exporter = None
+
+    def span(self, name: str, /, **attributes) -> _NoopSpan:
+        return NOOP_SPAN
+
+
+class OpenTelemetryTracer:
+    """Délègue au SDK opentelemetry (TracerProvider configuré par l'application)"""
+
+    enabled = True
+    exporter = None
+
+    def __init__(self):
+        from opentelemetry import trace
+        self._tracer = trace.get_tracer("dremio_connector")
+
+    def span(self, name: str, /, **attributes):
+        return self._tracer.start_as_current_span(name, attributes=attributes)
+
+
+_tracer: Union[Tracer, NoopTracer, OpenTelemetryTracer] = NoopTracer()
+
+
+def configure_tracing(exporter=None):
+    """
+    Active le tracing
+
+    Args:
+        exporter: None (no-op), un exporter (``export(span)``, ``shutdown()``),
+            ou "otel" pour utiliser le SDK opentelemetry installé
+    """
+    global _tracer
+    if exporter is None:
+        _tracer = NoopTracer()
+    elif exporter == "otel":
+        try:
+            _tracer = OpenTelemetryTracer()
+        except ImportError:
+            logger.warning("⚠️  opentelemetry non installé, tracing désactivé")
+            _tracer = NoopTracer()
+    else:
+        _tracer = Tracer(exporter)
+    return _tracer
+
+
+def get_tracer():
+    return _tracer
+
+
+def set_tracer(tracer):
+    """Réinstalle un tracer (par exemple celui renvoyé par get_tracer)"""
+    global _tracer
+    _tracer = tracer
+
+
+def span(name: str, /, **attributes):
+    """Context manager d'un span enfant du span courant"""
+    return _tracer.span(name, **attributes)
+
+
+def load_spans(path: str) -> List[Dict]:
+    """Relit un fichier écrit par FileSpanExporter"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
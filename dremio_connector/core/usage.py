@@ -0,0 +1,345 @@
+"""
+Usage des datasets Dremio extrait de l'historique des jobs (sys.jobs_recent)
+
+Pipeline:
+1. Scan de ``sys.jobs_recent`` par fenêtres de temps (une requête SQL par
+   fenêtre, résultats paginés par ``iter_sql_rows``), uniquement sur les jobs
+   terminés depuis le dernier run (high-water mark)
+2. Agrégation en streaming, job par job: nombre de requêtes et jointures
+   par dataset et par jour. Seuls les compteurs sont gardés en
+   mémoire, jamais les jobs eux-mêmes.
+3. Les résumés (un par dataset et par jour) sont poussés en masse vers
+   OpenMetadata par ``OpenMetadataSyncEngine.publish_usage``
+4. Le high-water mark n'est avancé qu'après la publication. Si une partie
+   des résumés échoue, il reste en place et les couples (dataset, jour)
+   publiés sont mémorisés avec la fin du scan: le run suivant rescanne la
+   même plage mais n'y recompte que les couples non publiés (l'usage est
+   additif côté OpenMetadata, un résumé republié serait compté deux fois)
+
+Le fenêtrage porte sur ``final_state_ts``: un job n'apparaît dans
+``sys.jobs_recent`` qu'une fois terminé, un job long soumis avant le dernier
+run n'est donc pas perdu. Le jour d'usage reste celui de ``submitted_ts``.
+
+Dremio enregistre ses timestamps en UTC: toutes les dates manipulées ici sont
+des datetime naïfs en UTC (un ``now`` avec fuseau est converti).
+
+Usage:
+    from dremio_connector.core.usage import UsageIngestion
+
+    usage = UsageIngestion(client, known_datasets=[r["path"] for r in datasets])
+    summaries = usage.collect()
+    failed = om.publish_usage(summaries)
+    usage.commit(failed)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from dremio_connector.core.lineage import _path_key, parse_view_sql
+
+logger = logging.getLogger(__name__)
+
+JOBS_TABLE = "sys.jobs_recent"
+
+# Requêtes utilisateur (les jobs internes: réflexions, métadonnées... sont exclus)
+USAGE_QUERY_TYPES = ("UI_RUN", "ODBC", "JDBC", "REST", "FLIGHT")
+
+STATE_FORMAT_VERSION = 1
+
+_TS_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def _utc(value: datetime) -> datetime:
+    """datetime naïf en UTC (les datetime avec fuseau sont convertis)"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _parse_ts(value) -> Optional[datetime]:
+    """Parse un timestamp renvoyé par Dremio ("2024-01-15 10:23:45.123" ou ISO)"""
+    if isinstance(value, datetime):
+        return _utc(value)
+    if not value:
+        return None
+    try:
+        return _utc(datetime.fromisoformat(str(value).replace("T", " ").rstrip("Z")))
+    except ValueError:
+        return None
+
+
+def _format_ts(value: datetime) -> str:
+    """Littéral TIMESTAMP Dremio (précision milliseconde)"""
+    return value.strftime(_TS_FORMAT)[:-3]
+
+
+def build_jobs_query(
+    start: datetime,
+    end: datetime,
+    jobs_table: str = JOBS_TABLE,
+    query_types: Iterable[str] = USAGE_QUERY_TYPES,
+) -> str:
+    """Requête d'une fenêtre ]start, end] de l'historique des jobs terminés"""
+    types = ", ".join(f"'{t}'" for t in query_types)
+    return (
+        f"SELECT job_id, submitted_ts, final_state_ts, query FROM {jobs_table} "
+        f"WHERE status = 'COMPLETED' AND query_type IN ({types}) "
+        f"AND final_state_ts > TIMESTAMP '{_format_ts(start)}' "
+        f"AND final_state_ts <= TIMESTAMP '{_format_ts(end)}'"
+    )
+
+
+class UsageState:
+    """
+    High-water mark de l'ingestion d'usage, persisté en JSON
+
+    Un fichier par instance Dremio (clé: hash de l'URL). Après une publication
+    partielle, l'état garde aussi les couples (dataset, jour) déjà publiés et
+    la borne jusqu'à laquelle leurs jobs ont été comptés.
+    """
+
+    def __init__(self, dremio_url: str, state_dir: Optional[str] = None):
+        digest = hashlib.sha1(dremio_url.encode("utf-8")).hexdigest()[:12]
+        directory = Path(state_dir) if state_dir else Path(tempfile.gettempdir()) / "dremio_connector"
+        self.path = directory / f"usage_state_{digest}.json"
+
+    def _read(self) -> Dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"⚠️  État d'usage illisible {self.path}: {e}")
+            return {}
+
+        if state.get("version") != STATE_FORMAT_VERSION:
+            return {}
+        return state
+
+    def load(self) -> Optional[datetime]:
+        """Retourne le high-water mark, None au premier run"""
+        return _parse_ts(self._read().get("high_water_mark"))
+
+    def load_published(self) -> Dict[Tuple[Tuple[str, ...], str], datetime]:
+        """(dataset, jour) → borne des jobs déjà publiés au-delà du high-water mark"""
+        published = {}
+        for entry in self._read().get("published", []):
+            until = _parse_ts(entry.get("until"))
+            if until is not None:
+                published[(_path_key(entry["path"]), entry["date"])] = until
+        return published
+
+    def save(
+        self,
+        high_water_mark: datetime,
+        published: Optional[Dict[Tuple[Tuple[str, ...], str], datetime]] = None,
+    ):
+        """Écriture atomique (fichier temporaire + rename)"""
+        state = {"version": STATE_FORMAT_VERSION, "high_water_mark": high_water_mark.isoformat()}
+        if published:
+            state["published"] = [
+                {"path": list(key), "date": day, "until": until.isoformat()}
+                for (key, day), until in sorted(published.items())
+            ]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+        except Exception as e:
+            logger.warning(f"⚠️  Impossible d'écrire l'état d'usage {self.path}: {e}")
+
+
+class UsageAggregator:
+    """
+    Agrège l'usage des datasets job par job
+
+    Args:
+        known_datasets: paths des datasets connus. Les références SQL sont
+            résolues dessus (insensible à la casse); les tables système et les
+            références inconnues sont ignorées.
+        parse_cache_size: nombre de SQL distincts gardés en cache de parsing
+            (les dashboards rejouent les mêmes requêtes)
+        published: (dataset, jour) → borne des jobs déjà publiés
+            (UsageState.load_published); ces jobs ne sont pas recomptés
+    """
+
+    def __init__(
+        self,
+        known_datasets: Iterable[List[str]],
+        parse_cache_size: int = 10000,
+        published: Optional[Dict[Tuple[Tuple[str, ...], str], datetime]] = None,
+    ):
+        self.known: Dict[Tuple[str, ...], List[str]] = {
+            _path_key(path): list(path) for path in known_datasets
+        }
+        self._parse = lru_cache(maxsize=parse_cache_size)(parse_view_sql)
+        # (dataset, jour) → compteurs
+        self.counts: Counter = Counter()
+        self.joins: Dict[Tuple[Tuple[str, ...], str], Counter] = {}
+        self.published = published or {}
+        self.stats = {"jobs": 0, "skipped": 0, "unresolved": 0, "published": 0}
+
+    def add(self, job: Dict):
+        """Ajoute un job (ligne de sys.jobs_recent) aux agrégats"""
+        self.stats["jobs"] += 1
+        submitted = _parse_ts(job.get("submitted_ts"))
+        sql = job.get("query")
+        if submitted is None or not sql:
+            self.stats["skipped"] += 1
+            return
+
+        try:
+            references = self._parse(sql)["tables"]
+        except Exception as e:
+            logger.debug(f"SQL de job non parsable {job.get('job_id')}: {e}")
+            self.stats["skipped"] += 1
+            return
+
+        datasets = []
+        for reference in references:
+            key = _path_key(reference)
+            if key not in self.known:
+                self.stats["unresolved"] += 1
+            elif key not in datasets:
+                datasets.append(key)
+
+        day = submitted.date().isoformat()
+        finished = _parse_ts(job.get("final_state_ts"))
+        for key in datasets:
+            bucket = (key, day)
+            until = self.published.get(bucket)
+            if until is not None and finished is not None and finished <= until:
+                self.stats["published"] += 1
+                continue
+            self.counts[bucket] += 1
+            if len(datasets) > 1:
+                partners = self.joins.setdefault(bucket, Counter())
+                partners.update(other for other in datasets if other != key)
+
+    def summaries(self) -> List[Dict]:
+        """
+        Returns:
+            List[Dict]: un résumé par dataset et par jour
+                {"path": List[str], "date": "YYYY-MM-DD", "count": int,
+                 "joins": List[(List[str], int)]}
+        """
+        summaries = []
+        for (key, day), count in sorted(self.counts.items()):
+            bucket = (key, day)
+            summaries.append({
+                "path": self.known[key],
+                "date": day,
+                "count": count,
+                "joins": [
+                    (self.known[other], joined)
+                    for other, joined in self.joins.get(bucket, Counter()).most_common()
+                ],
+            })
+        return summaries
+
+
+class UsageIngestion:
+    """
+    Scan incrémental de l'historique des jobs Dremio
+
+    Args:
+        client: DremioAutoDiscovery authentifié
+        known_datasets: paths des datasets à suivre
+        state: high-water mark (par défaut dans le tmp système)
+        window: taille d'une fenêtre de scan (une requête SQL par fenêtre)
+        lookback: profondeur du premier run, sans high-water mark
+        lag: marge avant "maintenant", le temps que Dremio enregistre les jobs
+        jobs_table: ``sys.jobs_recent`` (Dremio 23+) ou une vue équivalente
+    """
+
+    def __init__(
+        self,
+        client,
+        known_datasets: Iterable[List[str]],
+        state: Optional[UsageState] = None,
+        window: timedelta = timedelta(hours=1),
+        lookback: timedelta = timedelta(days=1),
+        lag: timedelta = timedelta(minutes=1),
+        jobs_table: str = JOBS_TABLE,
+    ):
+        self.client = client
+        self.state = state if state is not None else UsageState(client.url)
+        self.aggregator = UsageAggregator(known_datasets, published=self.state.load_published())
+        self.window = window
+        self.lookback = lookback
+        self.lag = lag
+        self.jobs_table = jobs_table
+        self._scan_start: Optional[datetime] = None
+        self._scanned_until: Optional[datetime] = None
+        self.stats = {"windows": 0}
+
+    def windows(self, start: datetime, end: datetime) -> Iterator[Tuple[datetime, datetime]]:
+        """Découpe ]start, end] en fenêtres consécutives"""
+        while start < end:
+            window_end = min(start + self.window, end)
+            yield start, window_end
+            start = window_end
+
+    def iter_jobs(self, start: datetime, end: datetime) -> Iterator[Dict]:
+        """Jobs terminés dans ]start, end], fenêtre par fenêtre"""
+        for window_start, window_end in self.windows(start, end):
+            self.stats["windows"] += 1
+            query = build_jobs_query(window_start, window_end, self.jobs_table)
+            yield from self.client.iter_sql_rows(query, raise_on_error=True)
+            self._scanned_until = window_end
+
+    def collect(self, now: Optional[datetime] = None) -> List[Dict]:
+        """Scanne les jobs depuis le high-water mark et retourne les résumés d'usage"""
+        end = _utc(now or datetime.now(timezone.utc)) - self.lag
+        start = self.state.load() or end - self.lookback
+        self._scan_start = start
+        logger.info(f"📈 Usage: scan de {self.jobs_table} du {_format_ts(start)} au {_format_ts(end)}")
+
+        for job in self.iter_jobs(start, end):
+            self.aggregator.add(job)
+
+        summaries = self.aggregator.summaries()
+        logger.info(
+            f"📈 Usage: {self.aggregator.stats['jobs']} jobs, {len(summaries)} résumés "
+            f"({self.stats['windows']} fenêtres)"
+        )
+        return summaries
+
+    def commit(self, failed: Iterable[Dict] = ()):
+        """
+        Avance le high-water mark jusqu'à la dernière fenêtre scannée
+
+        Args:
+            failed: résumés dont la publication a échoué (publish_usage). Le
+                high-water mark reste alors au début du scan, et les autres
+                couples (dataset, jour) sont mémorisés comme publiés jusqu'à
+                la dernière fenêtre scannée.
+        """
+        if self._scanned_until is None:
+            return
+
+        failed_buckets = {(_path_key(s["path"]), s["date"]) for s in failed}
+        if not failed_buckets:
+            self.state.save(self._scanned_until)
+            return
+
+        published = dict(self.aggregator.published)
+        for bucket in self.aggregator.counts:
+            if bucket not in failed_buckets:
+                published[bucket] = self._scanned_until
+        self.state.save(self._scan_start, published)
+        logger.warning(
+            f"⚠️ Usage: {len(failed_buckets)} résumés non publiés, high-water mark conservé "
+            f"({len(published)} couples table/jour déjà publiés ne seront pas recomptés)"
+        )
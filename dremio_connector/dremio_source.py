@@ -6,45 +6,63 @@ databases, schemas, and tables from Dremio.
 Supports Metadata ingestion, Profiling, Auto-Classification, and DBT in the same agent (4-in-1).
 """
 
-from typing import Iterable, Optional, List, Tuple, Dict, Any
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Optional, List, Tuple, Dict, Any
 import logging
-import json
-from pathlib import Path
 from datetime import datetime, timezone
+from functools import lru_cache
 
-from metadata.ingestion.api.common import Entity
-from metadata.ingestion.api.steps import Source
-from metadata.ingestion.source.database.database_service import DatabaseServiceSource
-from metadata.generated.schema.entity.services.connections.metadata.openMetadataConnection import (
-    OpenMetadataConnection,
-)
+# Seuls la classe de base du framework et Either sont nécessaires à l'import;
+# les modules metadata.generated.schema sont importés au premier usage, dans
+# les méthodes qui construisent les entités (voir _dremio_type_mapping).
 from metadata.ingestion.api.models import Either
-from metadata.generated.schema.api.data.createDatabase import CreateDatabaseRequest
-from metadata.generated.schema.api.data.createDatabaseSchema import CreateDatabaseSchemaRequest
-from metadata.generated.schema.api.data.createTable import CreateTableRequest
-from metadata.generated.schema.entity.data.table import Column, DataType, TableType, Table, TableProfile, ColumnProfile
-from metadata.generated.schema.entity.data.database import Database
-from metadata.generated.schema.entity.data.databaseSchema import DatabaseSchema
-from metadata.generated.schema.entity.services.databaseService import (
-    DatabaseService,
-)
-from metadata.generated.schema.api.classification.createTag import CreateTagRequest
-from metadata.generated.schema.api.classification.createClassification import CreateClassificationRequest
-from metadata.generated.schema.entity.classification.tag import Tag
-from metadata.generated.schema.type.tagLabel import TagLabel, TagSource, LabelType
-from metadata.generated.schema.type.basic import FullyQualifiedEntityName
-from metadata.generated.schema.metadataIngestion.workflow import (
-    Source as WorkflowSource,
-)
-from metadata.ingestion.ometa.ometa_api import OpenMetadata
+from metadata.ingestion.source.database.database_service import DatabaseServiceSource
 from metadata.utils.logger import ingestion_logger
-from metadata.utils import fqn
+
+if TYPE_CHECKING:
+    from metadata.generated.schema.api.classification.createTag import CreateTagRequest
+    from metadata.generated.schema.api.data.createDatabase import CreateDatabaseRequest
+    from metadata.generated.schema.api.data.createDatabaseSchema import CreateDatabaseSchemaRequest
+    from metadata.generated.schema.api.data.createTable import CreateTableRequest
+    from metadata.generated.schema.api.lineage.addLineage import AddLineageRequest
+    from metadata.generated.schema.entity.data.table import ColumnProfile, DataType, Table, TableProfile, TableType
+    from metadata.generated.schema.metadataIngestion.workflow import Source as WorkflowSource
+    from metadata.generated.schema.type.tagLabel import TagLabel
+    from metadata.ingestion.ometa.ometa_api import OpenMetadata
 
 # Import votre logique de découverte Dremio
-from dremio_connector.core.sync_engine import DremioAutoDiscovery
+from dremio_connector.core.sync_engine import (
+    DremioAutoDiscovery,
+    build_columns_lineage,
+    build_fqn,
+    organize_hierarchy,
+    split_dataset_path,
+)
+from dremio_connector.core.lineage import (
+    SqlParseCache,
+    ViewLineageExtractor,
+    default_parse_cache_path,
+    fetch_known_datasets,
+    fetch_view_definitions,
+)
+from dremio_connector.core.dbt_cache import DbtIndex, load_dbt_index
+from dremio_connector.core.filters import PathFilter, split_patterns
+from dremio_connector.core.snapshot import DEFAULT_MAX_AGE, DiscoverySnapshot, default_snapshot_path
+from dremio_connector.core.profile_state import DEFAULT_PROFILE_MAX_AGE, ProfileState, dataset_tag
+from dremio_connector.core.reflections import ReflectionIndex
+from dremio_connector.core.row_count import SAMPLE_SOURCES as SAMPLE_ROW_COUNT_SOURCES, SOURCES as ROW_COUNT_SOURCES, RowCountResolver
+from dremio_connector.core.sample_profiler import DEFAULT_SAMPLE_ROWS, profile_dataset_sample
+from dremio_connector.core import metrics, tracing
+from dremio_connector.core.progress import DEFAULT_INTERVAL, ProgressLogger
+from dremio_connector.core.classification import classify_column_name
+from dremio_connector.core.profiler import is_numeric_type, is_string_type, profile_dataset
 
 logger = ingestion_logger()
 
+# Classification of the DBT model tags applied to tables (DBT.<tag>)
+DBT_CLASSIFICATION = "DBT"
+
 
 class DremioConnector(DatabaseServiceSource):
     """
@@ -58,12 +76,16 @@ class DremioConnector(DatabaseServiceSource):
         self.service_connection = config.serviceConnection.root.config
         self.dremio_client = None
         self.database_source_state = set()
+        # Column names per Dremio dataset path, recorded by yield_table for column lineage
+        self.dataset_columns: Dict[Tuple[str, ...], List[str]] = {}
         super().__init__()
 
     @classmethod
     def create(
         cls, config_dict: dict, metadata: OpenMetadata, pipeline_name: Optional[str] = None
     ) -> "DremioConnector":
+        from metadata.generated.schema.metadataIngestion.workflow import Source as WorkflowSource
+
         config: WorkflowSource = WorkflowSource.parse_obj(config_dict)
         return cls(config, metadata)
 
@@ -77,11 +99,41 @@ class DremioConnector(DatabaseServiceSource):
         
         # Configuration options with defaults
         self.profile_sample_rows = None  # Number of rows for profiling (None = all rows)
+        self.incremental_profiling = False  # Reuse column statistics of unchanged datasets
+        self.profile_max_age = DEFAULT_PROFILE_MAX_AGE  # Seconds before an unchanged dataset is profiled again
+        self.state_dir = None  # Incremental profiling state directory (None = system tmp)
+        self._profile_state: Optional[ProfileState] = None
+        self._profile_reused = 0
+        self.row_count_sources = ROW_COUNT_SOURCES  # Zero-scan row count sources, COUNT(*) last (see core.row_count)
+        self._row_counts: Optional[RowCountResolver] = None
+        self.reflection_routing = True  # Shape column profiling queries so reflections can accelerate them
+        self.profile_engine = "sql"  # sql: one aggregate query per column; sample: one sample per table, local NumPy metrics
+        self._reflections: Optional[ReflectionIndex] = None
         self.classification_enabled = True  # Enable auto-classification (default: True)
         self.dbt_enabled = False
         self.dbt_catalog_path = None
         self.dbt_manifest_path = None
         self.dbt_run_results_path = None
+        self.dbt_cache_path = None
+        self.lineage_parser_processes = None  # None = one process per CPU
+        self.http_retries = 0
+        self.flight_port = None  # Arrow Flight port for SQL queries (None = REST only)
+        self.flight_tls = False
+        self.metrics_port = None  # Prometheus /metrics endpoint (None = disabled)
+        self.metrics_textfile = None  # Prometheus textfile written on close()
+        self.tracing_file = None  # JSON lines span file (None = tracing disabled)
+        self.progress_interval = DEFAULT_INTERVAL  # Seconds between aggregated progress lines (0 = off)
+        self.path_filter = PathFilter()  # includePaths/excludePaths (see core.filters)
+        # Topology prefetch: root catalog entries, then schema → datasets of the current source
+        self._database_items: Dict[str, Dict] = {}
+        self._schema_tables: Dict[str, Dict] = {}
+        self._current_tables: Dict[str, Dict] = {}
+        # Shared discovery snapshot (see core.snapshot): one crawl per window for all pipelines
+        self.snapshot_path = None
+        self.snapshot_max_age = DEFAULT_MAX_AGE
+        self._snapshot: Optional[DiscoverySnapshot] = None
+        self._snapshot_checked = False
+        self._snapshot_tables: Optional[Dict[Tuple[str, str, str], List[str]]] = None
         
         try:
             # Extract from serviceConnection.__dict__['root'].config.connectionOptions.root
@@ -95,39 +147,10 @@ class DremioConnector(DatabaseServiceSource):
                         conn_opts = root.config.connectionOptions
                         # ConnectionOptions has a 'root' attribute containing the dict
                         if hasattr(conn_opts, 'root') and isinstance(conn_opts.root, dict):
-                            opts = conn_opts.root
-                            dremio_url = opts.get('url')
-                            username = opts.get('username')
-                            password = opts.get('password')
-                            
-                            # Extract optional configuration
-                            self.profile_sample_rows = opts.get('profileSampleRows')
-                            self.classification_enabled = opts.get('classificationEnabled', True)
-                            self.dbt_enabled = opts.get('dbtEnabled', False)
-                            self.dbt_catalog_path = opts.get('dbtCatalogPath')
-                            self.dbt_manifest_path = opts.get('dbtManifestPath')
-                            self.dbt_run_results_path = opts.get('dbtRunResultsPath')
-                            
-                            logger.info(f"📋 Found connectionOptions: url={dremio_url}, username={username}")
-                            logger.info(f"📊 Profiling sample rows: {self.profile_sample_rows or 'all rows'}")
-                            logger.info(f"🏷️  Classification enabled: {self.classification_enabled}")
-                            logger.info(f"🔧 DBT enabled: {self.dbt_enabled}")
-                            
+                            dremio_url, username, password = self._read_connection_options(conn_opts.root, "")
                         # Or ConnectionOptions might be a direct dict
                         elif isinstance(conn_opts, dict):
-                            dremio_url = conn_opts.get('url')
-                            username = conn_opts.get('username')
-                            password = conn_opts.get('password')
-                            self.profile_sample_rows = conn_opts.get('profileSampleRows')
-                            self.classification_enabled = conn_opts.get('classificationEnabled', True)
-                            self.dbt_enabled = conn_opts.get('dbtEnabled', False)
-                            self.dbt_catalog_path = conn_opts.get('dbtCatalogPath')
-                            self.dbt_manifest_path = conn_opts.get('dbtManifestPath')
-                            self.dbt_run_results_path = conn_opts.get('dbtRunResultsPath')
-                            logger.info(f"📋 Found connectionOptions (dict): url={dremio_url}, username={username}")
-                            logger.info(f"📊 Profiling sample rows: {self.profile_sample_rows or 'all rows'}")
-                            logger.info(f"🏷️  Classification enabled: {self.classification_enabled}")
-                            logger.info(f"🔧 DBT enabled: {self.dbt_enabled}")
+                            dremio_url, username, password = self._read_connection_options(conn_opts, " (dict)")
                 
                 # Pattern 2: Fallback via __root__ (older structure)
                 if not dremio_url and hasattr(service_conn, '__root__'):
@@ -135,34 +158,9 @@ class DremioConnector(DatabaseServiceSource):
                     if hasattr(root, 'config') and hasattr(root.config, 'connectionOptions'):
                         conn_opts = root.config.connectionOptions
                         if hasattr(conn_opts, 'root') and isinstance(conn_opts.root, dict):
-                            opts = conn_opts.root
-                            dremio_url = opts.get('url')
-                            username = opts.get('username')
-                            password = opts.get('password')
-                            self.profile_sample_rows = opts.get('profileSampleRows')
-                            self.classification_enabled = opts.get('classificationEnabled', True)
-                            self.dbt_enabled = opts.get('dbtEnabled', False)
-                            self.dbt_catalog_path = opts.get('dbtCatalogPath')
-                            self.dbt_manifest_path = opts.get('dbtManifestPath')
-                            self.dbt_run_results_path = opts.get('dbtRunResultsPath')
-                            logger.info(f"📋 Found connectionOptions (__root__): url={dremio_url}, username={username}")
-                            logger.info(f"📊 Profiling sample rows: {self.profile_sample_rows or 'all rows'}")
-                            logger.info(f"🏷️  Classification enabled: {self.classification_enabled}")
-                            logger.info(f"🔧 DBT enabled: {self.dbt_enabled}")
+                            dremio_url, username, password = self._read_connection_options(conn_opts.root, " (__root__)")
                         elif isinstance(conn_opts, dict):
-                            dremio_url = conn_opts.get('url')
-                            username = conn_opts.get('username')
-                            password = conn_opts.get('password')
-                            self.profile_sample_rows = conn_opts.get('profileSampleRows')
-                            self.classification_enabled = conn_opts.get('classificationEnabled', True)
-                            self.dbt_enabled = conn_opts.get('dbtEnabled', False)
-                            self.dbt_catalog_path = conn_opts.get('dbtCatalogPath')
-                            self.dbt_manifest_path = conn_opts.get('dbtManifestPath')
-                            self.dbt_run_results_path = conn_opts.get('dbtRunResultsPath')
-                            logger.info(f"📋 Found connectionOptions (__root__ dict): url={dremio_url}, username={username}")
-                            logger.info(f"📊 Profiling sample rows: {self.profile_sample_rows or 'all rows'}")
-                            logger.info(f"🏷️  Classification enabled: {self.classification_enabled}")
-                            logger.info(f"🔧 DBT enabled: {self.dbt_enabled}")
+                            dremio_url, username, password = self._read_connection_options(conn_opts, " (__root__ dict)")
         except Exception as config_error:
             logger.error(f"❌ Error reading connectionOptions: {config_error}")
             import traceback
@@ -182,13 +180,140 @@ class DremioConnector(DatabaseServiceSource):
         self.dremio_client = DremioAutoDiscovery(
             url=dremio_url,
             username=username,
-            password=password
+            password=password,
+            max_retries=self.http_retries,
+            progress_interval=self.progress_interval,
+            path_filter=self.path_filter,
+            flight_port=self.flight_port,
+            flight_tls=self.flight_tls
         )
+        # Per-item logs are DEBUG: these emit one aggregated line per interval
+        self._table_progress = ProgressLogger(logger, "Tables", interval=self.progress_interval)
+        self._profile_progress = ProgressLogger(logger, "Profiling", interval=self.progress_interval)
+        self._reflections = ReflectionIndex(self.dremio_client, routing=self.reflection_routing)
+        self._row_counts = RowCountResolver(self.dremio_client, self.row_count_sources, reflections=self._reflections)
+        if self.incremental_profiling:
+            self._profile_state = ProfileState(dremio_url, self.state_dir).load()
+        if self.metrics_port:
+            metrics.start_metrics_server(int(self.metrics_port))
+        if self.tracing_file:
+            tracing.configure_tracing(tracing.FileSpanExporter(self.tracing_file))
         if not self.dremio_client or not self.dremio_client.authenticate():
             logger.error("❌ Dremio authentication failed, raising exception")
             raise Exception("Dremio authentication failed in prepare()")
 
+    def _read_connection_options(self, opts: Dict[str, Any], origin: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Read connectionOptions into connector settings, returns (url, username, password)"""
+        dremio_url = opts.get('url')
+        username = opts.get('username')
+        password = opts.get('password')
+        
+        # Extract optional configuration
+        self.profile_sample_rows = opts.get('profileSampleRows')
+        self.incremental_profiling = bool(opts.get('incrementalProfiling', False))
+        self.profile_max_age = float(opts.get('profileMaxAge', DEFAULT_PROFILE_MAX_AGE))
+        self.state_dir = opts.get('stateDir')
+        self.reflection_routing = bool(opts.get('reflectionRouting', True))
+        self.profile_engine = opts.get('profileEngine', 'sql')
+        if self.profile_engine == 'sample' and not self.profile_sample_rows:
+            # The sample engine always pulls a bounded sample
+            self.profile_sample_rows = DEFAULT_SAMPLE_ROWS
+        if opts.get('rowCountSources'):
+            self.row_count_sources = tuple(split_patterns(opts.get('rowCountSources')))
+        elif self.profile_engine == 'sample':
+            # One query per table: no COUNT(*) unless rowCountSources asks for it
+            self.row_count_sources = SAMPLE_ROW_COUNT_SOURCES
+        self.classification_enabled = opts.get('classificationEnabled', True)
+        self.dbt_enabled = opts.get('dbtEnabled', False)
+        self.dbt_catalog_path = opts.get('dbtCatalogPath')
+        self.dbt_manifest_path = opts.get('dbtManifestPath')
+        self.dbt_run_results_path = opts.get('dbtRunResultsPath')
+        self.dbt_cache_path = opts.get('dbtCachePath')
+        self.lineage_parser_processes = opts.get('lineageParserProcesses')
+        self.http_retries = int(opts.get('httpRetries', 0))
+        self.flight_port = int(opts['flightPort']) if opts.get('flightPort') else None
+        self.flight_tls = bool(opts.get('flightTls', False))
+        self.metrics_port = opts.get('metricsPort')
+        self.metrics_textfile = opts.get('metricsTextfile')
+        self.tracing_file = opts.get('tracingFile')
+        self.progress_interval = opts.get('progressLogInterval', DEFAULT_INTERVAL)
+        self.path_filter = PathFilter(
+            include=split_patterns(opts.get('includePaths')),
+            exclude=split_patterns(opts.get('excludePaths')),
+        )
+        self.snapshot_path = opts.get('snapshotPath')
+        if self.snapshot_path == 'auto' and dremio_url:
+            self.snapshot_path = str(default_snapshot_path(dremio_url))
+        self.snapshot_max_age = float(opts.get('snapshotMaxAge', DEFAULT_MAX_AGE))
+        
+        logger.info(f"📋 Found connectionOptions{origin}: url={dremio_url}, username={username}")
+        logger.info(f"📊 Profiling sample rows: {self.profile_sample_rows or 'all rows'}")
+        if self.incremental_profiling:
+            logger.info(f"♻️  Incremental profiling (max age {self.profile_max_age:.0f}s)")
+        logger.info(f"🏷️  Classification enabled: {self.classification_enabled}")
+        logger.info(f"🔧 DBT enabled: {self.dbt_enabled}")
+        if self.path_filter:
+            logger.info(f"🔎 Path filters: {self.path_filter}")
+        if self.snapshot_path:
+            logger.info(f"💾 Discovery snapshot: {self.snapshot_path} (max age {self.snapshot_max_age:.0f}s)")
+        return dremio_url, username, password
+
+    def _get_snapshot(self) -> Optional[DiscoverySnapshot]:
+        """
+        Shared discovery snapshot (snapshotPath), reused while fresher than
+        snapshotMaxAge or written by one full crawl; None when disabled
+        """
+        if self.snapshot_path and not self._snapshot_checked:
+            self._snapshot_checked = True
+            self._snapshot = self.dremio_client.discover_snapshot(self.snapshot_path, max_age=self.snapshot_max_age)
+        return self._snapshot
+
+    def _filtered_out(self, entity: str, name: str, path: List[str], container: bool = True) -> bool:
+        """
+        Apply the sourceConfig filter pattern of ``entity`` to ``name`` and the
+        includePaths/excludePaths rules to ``path``; record filtered entities
+        in the workflow status. An excluded container is never listed.
+        """
+        from metadata.utils.filters import filter_by_database, filter_by_schema, filter_by_table
+
+        pattern_filter, pattern_attr = {
+            "Database": (filter_by_database, "databaseFilterPattern"),
+            "Schema": (filter_by_schema, "schemaFilterPattern"),
+            "Table": (filter_by_table, "tableFilterPattern"),
+        }[entity]
+        kept_by_path = self.path_filter.explore(path) if container else self.path_filter.accept(path)
+        if kept_by_path and not pattern_filter(getattr(self.source_config, pattern_attr, None), name):
+            return False
+        self.status.filter(".".join(path), f"{entity} Filtered Out")
+        logger.debug("✂️  %s filtered out: %s", entity, ".".join(path))
+        return True
+
+    def _dremio_path(self, database: str, schema: str, table: str) -> List[str]:
+        """
+        Dremio path of an OpenMetadata table (inverse of split_dataset_path):
+        the schema name is the "."-joined folders, and a dataset stored at
+        the root of its source has a schema named after itself
+        """
+        resource = self._current_tables.get(table)
+        if resource and split_dataset_path(resource["path"]) == (database, schema, table):
+            return list(resource["path"])
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            # Exact path even for folder names containing "." (profiler runs without topology)
+            if self._snapshot_tables is None:
+                self._snapshot_tables = {
+                    split_dataset_path(list(path)): list(path) for path in snapshot.paths("dataset")
+                }
+            path = self._snapshot_tables.get((database, schema, table))
+            if path:
+                return list(path)
+        if schema == table:
+            return [database, table]
+        return [database, *schema.split("."), table]
+
     def yield_create_request_database_service(self, config: WorkflowSource):
+        from metadata.generated.schema.entity.services.databaseService import DatabaseService
+
         yield Either(
             right=self.metadata.get_create_service_from_source(
                 entity=DatabaseService, config=config
@@ -206,16 +331,23 @@ class DremioConnector(DatabaseServiceSource):
             return
         
         try:
-            catalog = self.dremio_client.get_catalog_item()
-            if not catalog or 'data' not in catalog:
-                logger.warning("⚠️  No catalog data found")
-                return
-            
-            sources = catalog.get('data', [])
+            snapshot = self._get_snapshot()
+            if snapshot is not None:
+                # Sources of the snapshot, in crawl order
+                sources = [{'path': [name]} for name in dict.fromkeys(path[0] for path in snapshot.paths())]
+            else:
+                catalog = self.dremio_client.get_catalog_item()
+                if not catalog or 'data' not in catalog:
+                    logger.warning("⚠️  No catalog data found")
+                    return
+                sources = catalog.get('data', [])
             logger.info(f"📦 Found {len(sources)} Dremio sources")
             
             for source in sources:
                 source_name = source.get('path', ['unknown'])[0]
+                if self._filtered_out("Database", source_name, [source_name]):
+                    continue
+                self._database_items[source_name] = source
                 logger.info(f"📂 Database name: {source_name}")
                 yield source_name
                 
@@ -226,6 +358,8 @@ class DremioConnector(DatabaseServiceSource):
 
     def yield_database(self, database_name: str) -> Iterable[Either[CreateDatabaseRequest]]:
         """Create a database for one Dremio source"""
+        from metadata.generated.schema.api.data.createDatabase import CreateDatabaseRequest
+
         try:
             logger.info(f"📂 Creating database: {database_name}")
             
@@ -245,7 +379,15 @@ class DremioConnector(DatabaseServiceSource):
             traceback.print_exc()
 
     def get_database_schema_names(self) -> Iterable[str]:
-        """Return list of schema names from Dremio source"""
+        """
+        Return the schemas of the current Dremio source
+        
+        The whole source is walked once (one listing per folder, dataset
+        schemas fetched alongside) and flattened like the sync engine:
+        nested folders are joined with "." into one schema name. Tables and
+        columns are then served from this prefetch. With snapshotPath, the
+        source is read from the shared discovery snapshot instead.
+        """
         if not self.dremio_client:
             logger.error("❌ Dremio client not initialized")
             return
@@ -254,24 +396,24 @@ class DremioConnector(DatabaseServiceSource):
             current_source = self.context.get().database
             logger.info(f"🔍 Getting schemas for source: {current_source}")
             
-            # Get source details - use string path separated by /
-            source_details = self.dremio_client.get_catalog_item(current_source)
-            
-            if not source_details or 'children' not in source_details:
-                logger.warning(f"⚠️  No children found for source {current_source}")
-                return
-            
-            # List all folders/schemas in this source
-            children = source_details.get('children', [])
-            logger.info(f"� Found {len(children)} items in source {current_source}")
-            
-            for child in children:
-                child_path = child.get('path', [])
-                if len(child_path) >= 2:
-                    schema_name = child_path[1]  # Second element is the schema
-                    child_type = child.get('type', 'UNKNOWN')
-                    logger.info(f"🗂️  Schema: {schema_name} (type: {child_type})")
-                    yield schema_name
+            snapshot = self._get_snapshot()
+            if snapshot is not None:
+                resources = snapshot.subtree([current_source], self.path_filter)
+            else:
+                item = self._database_items.get(current_source) or {
+                    "path": [current_source], "type": "CONTAINER", "containerType": "SOURCE"
+                }
+                resources = self.dremio_client.discover_subtree(item)
+            self._schema_tables = organize_hierarchy(resources).get(current_source, {}).get("schemas", {})
+            logger.info(f"📁 Found {len(self._schema_tables)} schemas in source {current_source}")
+            
+            for schema_name, schema_data in self._schema_tables.items():
+                tables = schema_data.get("tables", [])
+                schema_path = tables[0]["path"][:-1] if tables else [current_source, *schema_name.split(".")]
+                if self._filtered_out("Schema", schema_name, schema_path):
+                    continue
+                logger.debug("🗂️  Schema: %s (%d tables)", schema_name, len(tables))
+                yield schema_name
                     
         except Exception as e:
             logger.error(f"❌ Error getting schema names: {e}")
@@ -280,6 +422,10 @@ class DremioConnector(DatabaseServiceSource):
 
     def yield_database_schema(self, schema_name: str) -> Iterable[Either[CreateDatabaseSchemaRequest]]:
         """Create a schema for the current database"""
+        from metadata.generated.schema.api.data.createDatabaseSchema import CreateDatabaseSchemaRequest
+        from metadata.generated.schema.entity.data.database import Database
+        from metadata.utils import fqn
+
         try:
             database_fqn = fqn.build(
                 self.metadata,
@@ -306,7 +452,9 @@ class DremioConnector(DatabaseServiceSource):
             traceback.print_exc()
 
     def get_tables_name_and_type(self) -> Optional[Iterable[Tuple[str, TableType]]]:
-        """Return list of tables from Dremio schema"""
+        """Return the tables of the current schema, from the source prefetch"""
+        from metadata.generated.schema.entity.data.table import TableType
+
         if not self.dremio_client:
             logger.error("❌ Dremio client not initialized")
             return
@@ -316,35 +464,24 @@ class DremioConnector(DatabaseServiceSource):
             current_schema = self.context.get().database_schema
             logger.info(f"🔍 Getting tables for {current_source}.{current_schema}")
             
-            # Get schema details - use path separated by /
-            schema_path_str = f"{current_source}/{current_schema}"
-            schema_details = self.dremio_client.get_catalog_item(schema_path_str)
-            
-            if not schema_details or 'children' not in schema_details:
+            tables = self._schema_tables.get(current_schema, {}).get("tables", [])
+            if not tables:
                 logger.warning(f"⚠️  No tables found in {current_source}.{current_schema}")
                 return
             
-            # List all tables in this schema
-            children = schema_details.get('children', [])
-            logger.info(f"� Found {len(children)} items in schema {current_schema}")
-            
-            for child in children:
-                child_path = child.get('path', [])
-                child_type = child.get('type', 'UNKNOWN')
+            self._current_tables = {}
+            for resource in tables:
+                table_name = resource["path"][-1]
+                if self._filtered_out("Table", table_name, resource["path"], container=False):
+                    continue
+                self._current_tables[table_name] = resource
                 
-                if len(child_path) >= 3:
-                    table_name = child_path[2]  # Third element is the table
-                    
-                    # Map Dremio types to OpenMetadata TableType
-                    if child_type in ['PHYSICAL_DATASET', 'TABLE']:
-                        om_type = TableType.Regular
-                    elif child_type == 'VIRTUAL_DATASET':
-                        om_type = TableType.View
-                    else:
-                        om_type = TableType.Regular
-                    
-                    logger.info(f"📋 Table: {table_name} (Dremio type: {child_type} -> OM type: {om_type})")
-                    yield (table_name, om_type)
+                # Map Dremio types to OpenMetadata TableType
+                child_type = (resource.get("schema") or {}).get("type", "UNKNOWN")
+                om_type = TableType.View if child_type == 'VIRTUAL_DATASET' else TableType.Regular
+                
+                logger.debug("📋 Table: %s (Dremio type: %s -> OM type: %s)", table_name, child_type, om_type)
+                yield (table_name, om_type)
                     
         except Exception as e:
             logger.error(f"❌ Error getting table names: {e}")
@@ -353,6 +490,11 @@ class DremioConnector(DatabaseServiceSource):
 
     def yield_table(self, table_name_and_type: Tuple[str, TableType]) -> Iterable[Either[CreateTableRequest]]:
         """Create a table with real columns from Dremio"""
+        from metadata.generated.schema.api.data.createTable import CreateTableRequest
+        from metadata.generated.schema.entity.data.databaseSchema import DatabaseSchema
+        from metadata.generated.schema.entity.data.table import Column, DataType
+        from metadata.utils import fqn
+
         table_name, table_type = table_name_and_type
         
         try:
@@ -367,11 +509,25 @@ class DremioConnector(DatabaseServiceSource):
             current_source = self.context.get().database
             current_schema = self.context.get().database_schema
             
-            logger.info(f"📋 Creating table: {table_name} in {current_source}.{current_schema}")
+            logger.debug("📋 Creating table: %s in %s.%s", table_name, current_source, current_schema)
             
-            # Get table details from Dremio - use path separated by /
-            table_path_str = f"{current_source}/{current_schema}/{table_name}"
-            table_details = self.dremio_client.get_catalog_item(table_path_str)
+            # Table details from the source prefetch (one catalog call as a fallback)
+            resource = self._current_tables.get(table_name)
+            if resource:
+                table_path = resource["path"]
+                table_details = resource.get("schema")
+            else:
+                table_path = self._dremio_path(current_source, current_schema, table_name)
+                snapshot_resource = self._snapshot.by_path(table_path) if self._snapshot is not None else None
+                if snapshot_resource and snapshot_resource.get("schema"):
+                    table_details = snapshot_resource["schema"]
+                else:
+                    table_details = self.dremio_client.get_catalog_item("/".join(table_path))
+            dotted_path = ".".join(table_path)
+            
+            # 🔧 DBT ENRICHMENT: indexed lookup, applied while building the request
+            dbt_model = self._get_dbt_model(table_name)
+            dbt_columns = dbt_model.get('columns', {}) if dbt_model else {}
             
             columns = []
             if table_details and 'fields' in table_details:
@@ -388,7 +544,7 @@ class DremioConnector(DatabaseServiceSource):
                         "name": field_name,
                         "displayName": field_name,
                         "dataType": om_type,
-                        "description": f"Column from Dremio (type: {field_type})"
+                        "description": dbt_columns.get(field_name.lower()) or f"Column from Dremio (type: {field_type})"
                     }
                     
                     # Ajouter dataLength pour les types qui l'exigent
@@ -400,13 +556,13 @@ class DremioConnector(DatabaseServiceSource):
                         'name': field_name,
                         'dataType': str(om_type)
                     }
-                    tags = self.get_column_tag_labels(f"{current_source}.{current_schema}.{table_name}", column_dict)
+                    tags = self.get_column_tag_labels(dotted_path, column_dict)
                     if tags:
                         column_args["tags"] = tags
-                        logger.info(f"  🏷️ {field_name}: Adding {len(tags)} tags to column definition")
+                        logger.debug("  🏷️ %s: Adding %d tags to column definition", field_name, len(tags))
                     
                     columns.append(Column(**column_args))
-                    logger.info(f"  ├─ Column: {field_name} ({field_type} -> {om_type})")
+                    logger.debug("  ├─ Column: %s (%s -> %s)", field_name, field_type, om_type)
             else:
                 # Fallback: dummy column if no schema available
                 logger.warning(f"⚠️  No fields found for table {table_name}, using dummy column")
@@ -418,24 +574,33 @@ class DremioConnector(DatabaseServiceSource):
                     description="No schema information available"
                 ))
             
-            table_request = CreateTableRequest(
-                name=table_name,
-                displayName=table_name,
-                description=f"Table {table_name} from Dremio source {current_source}",
-                tableType=table_type,
-                columns=columns,
-                databaseSchema=schema_fqn,
-            )
+            table_args = {
+                "name": table_name,
+                "displayName": table_name,
+                "description": f"Table {table_name} from Dremio source {current_source}",
+                "tableType": table_type,
+                "columns": columns,
+                "databaseSchema": schema_fqn,
+            }
+            
+            if dbt_model:
+                logger.debug("🔧 Enriching %s.%s.%s with DBT model: %s", current_source, current_schema, table_name, dbt_model['unique_id'])
+                if dbt_model.get('description'):
+                    table_args["description"] = dbt_model['description']
+                dbt_tags = self._dbt_tag_labels(dbt_model)
+                if dbt_tags:
+                    table_args["tags"] = dbt_tags
+            
+            table_request = CreateTableRequest(**table_args)
             
-            # 🔧 DBT ENRICHMENT: Add DBT metadata if enabled
-            if self.dbt_enabled:
-                table_fqn = f"{self.context.get().database_service}.{current_source}.{current_schema}.{table_name}"
-                logger.info(f"🔧 Attempting DBT enrichment for: {table_fqn}")
-                # Note: We enrich after table is created by OpenMetadata
-                # For now, we log the intention - actual enrichment happens in post-processing
+            if table_details and 'fields' in table_details:
+                self.dataset_columns[tuple(table_path)] = [
+                    field.get('name', 'unknown') for field in table_details.get('fields', [])
+                ]
             
             yield Either(right=table_request)
             self.register_record(table_request=table_request)
+            self._table_progress.advance(item=dotted_path)
             
         except Exception as e:
             logger.error(f"❌ Error yielding table {table_name}: {e}")
@@ -444,28 +609,9 @@ class DremioConnector(DatabaseServiceSource):
     
     def _map_dremio_type_to_om(self, dremio_type: str) -> DataType:
         """Map Dremio data types to OpenMetadata DataType"""
-        type_mapping = {
-            'INTEGER': DataType.INT,
-            'BIGINT': DataType.BIGINT,
-            'FLOAT': DataType.FLOAT,
-            'DOUBLE': DataType.DOUBLE,
-            'DECIMAL': DataType.DECIMAL,
-            'VARCHAR': DataType.VARCHAR,
-            'CHAR': DataType.CHAR,
-            'TEXT': DataType.TEXT,
-            'BOOLEAN': DataType.BOOLEAN,
-            'DATE': DataType.DATE,
-            'TIME': DataType.TIME,
-            'TIMESTAMP': DataType.TIMESTAMP,
-            'BINARY': DataType.BINARY,
-            'ARRAY': DataType.ARRAY,
-            'MAP': DataType.MAP,
-            'STRUCT': DataType.STRUCT,
-            'JSON': DataType.JSON,
-        }
-        
-        dremio_type_upper = dremio_type.upper()
-        return type_mapping.get(dremio_type_upper, DataType.VARCHAR)
+        from metadata.generated.schema.entity.data.table import DataType
+
+        return _dremio_type_mapping().get(dremio_type.upper(), DataType.VARCHAR)
 
     # ============================================================================
     # REQUIRED ABSTRACT METHODS (stubs for optional functionality)
@@ -479,9 +625,87 @@ class DremioConnector(DatabaseServiceSource):
         """Not implemented"""
         yield from []
 
-    def yield_view_lineage(self) -> Iterable[Either]:
-        """Not implemented"""
-        yield from []
+    def yield_view_lineage(self) -> Iterable[Either[AddLineageRequest]]:
+        """
+        Emit table → view lineage for every Dremio virtual dataset
+        
+        View definitions and dataset names are read in bulk from INFORMATION_SCHEMA
+        (two paginated SQL jobs, no per-view API call), SQL is parsed with a
+        hash-keyed cache in a process pool, and table ids come from a single
+        listing of the service tables in OpenMetadata. The parse cache is
+        kept in stateDir: only views whose SQL changed are parsed again.
+        """
+        from metadata.generated.schema.api.lineage.addLineage import AddLineageRequest
+        from metadata.generated.schema.type.entityLineage import (
+            ColumnLineage,
+            EntitiesEdge,
+            LineageDetails,
+            Source as LineageSource,
+        )
+        from metadata.generated.schema.type.entityReference import EntityReference
+
+        if not self.dremio_client:
+            logger.error("❌ Dremio client not initialized")
+            return
+        
+        try:
+            views = fetch_view_definitions(self.dremio_client)
+            if not views:
+                logger.info("🔗 No Dremio views found, skipping view lineage")
+                return
+            
+            service_name = self.context.get().database_service
+            table_ids = self._get_service_table_ids(service_name)
+            extractor = ViewLineageExtractor(
+                known_datasets=fetch_known_datasets(self.dremio_client),
+                max_workers=self.lineage_parser_processes,
+                known_columns=self.dataset_columns,
+                parse_cache=SqlParseCache(default_parse_cache_path(self.dremio_client.url, self.state_dir)),
+                column_level=True,
+            )
+            
+            for batch in extractor.extract(views):
+                for edge in batch:
+                    from_fqn = build_fqn(service_name, *split_dataset_path(edge['from']))
+                    to_fqn = build_fqn(service_name, *split_dataset_path(edge['to']))
+                    from_id = table_ids.get(from_fqn)
+                    to_id = table_ids.get(to_fqn)
+                    if not from_id or not to_id:
+                        continue
+                    
+                    columns_lineage = [
+                        ColumnLineage(fromColumns=column['fromColumns'], toColumn=column['toColumn'])
+                        for column in build_columns_lineage(from_fqn, to_fqn, edge.get('columns', []))
+                    ]
+                    
+                    yield Either(right=AddLineageRequest(
+                        edge=EntitiesEdge(
+                            fromEntity=EntityReference(id=from_id, type="table"),
+                            toEntity=EntityReference(id=to_id, type="table"),
+                            lineageDetails=LineageDetails(
+                                sqlQuery=edge['sql'],
+                                source=LineageSource.ViewLineage,
+                                columnsLineage=columns_lineage or None,
+                            ),
+                        )
+                    ))
+            
+            logger.info(f"🔗 View lineage: {extractor.stats}")
+            
+        except Exception as e:
+            logger.error(f"❌ Error computing view lineage: {e}")
+            import traceback
+            traceback.print_exc()
+    
+    def _get_service_table_ids(self, service_name: str) -> Dict[str, Any]:
+        """Map table FQN → id for the whole service, from one paginated listing"""
+        from metadata.generated.schema.entity.data.table import Table
+
+        table_ids = {}
+        for table in self.metadata.list_all_entities(entity=Table, fields=[], params={"service": service_name}):
+            table_fqn = getattr(table.fullyQualifiedName, 'root', table.fullyQualifiedName)
+            table_ids[str(table_fqn)] = getattr(table.id, 'root', table.id)
+        return table_ids
 
     def yield_tag(self, schema_name: str) -> Iterable[Either]:
         """Not implemented"""
@@ -520,40 +744,78 @@ class DremioConnector(DatabaseServiceSource):
         Returns:
             Tuple of (TableProfile, List of ColumnProfiles)
         """
-        logger.info(f"🔬 Profiling table: {table.fullyQualifiedName}")
+        logger.debug("🔬 Profiling table: %s", table.fullyQualifiedName)
         
+        with metrics.stage("profile_table"):
+            result = self._profile_table(table, profile_sample)
+        self._profile_progress.advance(item=str(table.fullyQualifiedName))
+        return result
+
+    def _profile_table(
+        self,
+        table: Table,
+        profile_sample: Optional[float],
+    ) -> Tuple[Optional[TableProfile], List[ColumnProfile]]:
+        from metadata.generated.schema.entity.data.table import TableProfile
+        from metadata.utils import fqn
+
         try:
             # Extract source/schema/table from FQN
-            # Format: service.database.schema.table
-            fqn_parts = table.fullyQualifiedName.split('.')
+            # Format: service.database.schema.table (nested folder schemas are quoted)
+            fqn_parts = fqn.split(str(getattr(table.fullyQualifiedName, 'root', table.fullyQualifiedName)))
             if len(fqn_parts) < 4:
                 logger.warning(f"⚠️  Invalid FQN format: {table.fullyQualifiedName}")
                 return None, []
             
             database = fqn_parts[1]  # Dremio source
-            schema = fqn_parts[2]     # Dremio folder/schema
+            schema = fqn_parts[2]     # Dremio folders joined with "."
             table_name = fqn_parts[3]
             
-            logger.info(f"  📊 Analyzing: {database}.{schema}.{table_name}")
+            logger.debug("  📊 Analyzing: %s.%s.%s", database, schema, table_name)
             
-            # Build Dremio path (with quotes for safety)
-            dremio_path = f'"{database}"."{schema}"."{table_name}"'
+            path = self._dremio_path(database, schema, table_name)
+            columns = [
+                {"name": str(getattr(column.name, 'root', column.name)), "dataType": str(column.dataType)}
+                for column in table.columns or []
+            ]
             
-            # 1. Get row count
-            row_count = self._get_row_count(dremio_path)
+            # 1. Last profile of the dataset, reused by the engine when its row count is unchanged
+            entity = self.dremio_client.get_catalog_item("/".join(path)) or {}
+            tag = dataset_tag(entity)
+            previous = None
+            if self._profile_state is not None:
+                previous = self._profile_state.previous(path, tag, self.profile_sample_rows, self.profile_max_age)
+            
+            # 2. Row count and column statistics, same engines as the profile CLI (see core.profiler)
+            if self.profile_engine == "sample":
+                profile = profile_dataset_sample(
+                    self.dremio_client, path, columns, self.profile_sample_rows, previous,
+                    row_counts=self._row_counts, entity=entity,
+                )
+            else:
+                profile = profile_dataset(
+                    self.dremio_client, path, columns, self.profile_sample_rows, previous,
+                    row_counts=self._row_counts, entity=entity, reflections=self._reflections,
+                )
+            row_count = profile["row_count"]
+            if row_count is None and self.profile_engine == "sample":
+                # Expected without catalog or reflection counts: no COUNT(*) with the sample engine
+                logger.debug("  🔢 Row count unknown for %s, left unset", ".".join(path))
+            elif row_count is None:
+                logger.warning(f"⚠️  Could not get row count for {'.'.join(path)}")
+            else:
+                logger.debug("  🔢 Row count %d from %s", row_count, profile["row_count_source"])
             
-            # 2. Get column statistics
-            column_profiles = []
-            if table.columns:
-                for column in table.columns:
-                    col_profile = self._profile_column(
-                        dremio_path=dremio_path,
-                        column_name=column.name,
-                        column_type=str(column.dataType),
-                        total_rows=row_count
-                    )
-                    if col_profile:
-                        column_profiles.append(col_profile)
+            if profile["reused"]:
+                self._profile_reused += 1
+                logger.debug("  ♻️  Unchanged since last profile, column statistics reused: %s", ".".join(path))
+            elif self._profile_state is not None:
+                self._profile_state.record(path, tag, self.profile_sample_rows, profile["row_count"], profile["columns"])
+            
+            column_profiles = [
+                self._column_profile(column["name"], column["dataType"], profile["columns"][column["name"]])
+                for column in columns if profile["columns"].get(column["name"])
+            ]
             
             # 3. Create TableProfile
             table_profile = TableProfile(
@@ -563,7 +825,7 @@ class DremioConnector(DatabaseServiceSource):
                 profileSample=profile_sample or 100.0,
             )
             
-            logger.info(f"  ✅ Profile complete: {row_count} rows, {len(column_profiles)} columns profiled")
+            logger.debug("  ✅ Profile complete: %s rows, %d columns profiled", row_count, len(column_profiles))
             
             return table_profile, column_profiles
             
@@ -573,131 +835,63 @@ class DremioConnector(DatabaseServiceSource):
             traceback.print_exc()
             return None, []
 
-    def _get_row_count(self, dremio_path: str) -> int:
-        """Get total row count for a table"""
-        try:
-            query = f"SELECT COUNT(*) as row_count FROM {dremio_path}"
-            result = self.dremio_client.execute_sql_query(query)
-            
-            if result and 'rows' in result and len(result['rows']) > 0:
-                return int(result['rows'][0].get('row_count', 0))
-            return 0
-        except Exception as e:
-            logger.warning(f"⚠️  Could not get row count for {dremio_path}: {e}")
-            return 0
-
-    def _profile_column(
-        self, 
-        dremio_path: str, 
-        column_name: str, 
-        column_type: str,
-        total_rows: int
-    ) -> Optional[ColumnProfile]:
+    def _column_profile(self, column_name: str, column_type: str, stats: Dict) -> ColumnProfile:
         """
-        Profile a single column with optional row sampling
-        Returns statistics like null count, distinct count, min, max, etc.
+        ColumnProfile from the aggregates of one column
+        Statistics like null count, distinct count, min, max, etc.
         """
-        try:
-            logger.info(f"    📈 Profiling column: {column_name} ({column_type})")
-            
-            # Escape column name with double quotes
-            col_escaped = f'"{column_name}"'
-            
-            # Build sample clause if configured
-            sample_clause = ""
-            if self.profile_sample_rows:
-                sample_clause = f" LIMIT {self.profile_sample_rows}"
-                logger.info(f"    📊 Using sample: {self.profile_sample_rows} rows")
-            
-            # Base metrics for all types
-            query = f"""
-                SELECT 
-                    COUNT(*) as total_count,
-                    COUNT({col_escaped}) as non_null_count,
-                    COUNT(DISTINCT {col_escaped}) as distinct_count
-                FROM (SELECT * FROM {dremio_path}{sample_clause})
-            """
-            
-            # Add type-specific metrics
-            if 'INT' in column_type.upper() or column_type.upper() in ('BIGINT', 'DOUBLE', 'FLOAT', 'DECIMAL'):
-                query = f"""
-                    SELECT 
-                        COUNT(*) as total_count,
-                        COUNT({col_escaped}) as non_null_count,
-                        COUNT(DISTINCT {col_escaped}) as distinct_count,
-                        MIN({col_escaped}) as min_value,
-                        MAX({col_escaped}) as max_value,
-                        AVG(CAST({col_escaped} AS DOUBLE)) as mean_value,
-                        STDDEV(CAST({col_escaped} AS DOUBLE)) as stddev_value
-                    FROM (SELECT * FROM {dremio_path}{sample_clause})
-                """
-            elif 'VARCHAR' in column_type.upper() or 'CHAR' in column_type.upper():
-                query = f"""
-                    SELECT 
-                        COUNT(*) as total_count,
-                        COUNT({col_escaped}) as non_null_count,
-                        COUNT(DISTINCT {col_escaped}) as distinct_count,
-                        MIN(LENGTH({col_escaped})) as min_length,
-                        MAX(LENGTH({col_escaped})) as max_length,
-                        AVG(LENGTH({col_escaped})) as avg_length
-                    FROM (SELECT * FROM {dremio_path}{sample_clause})
-                """
-            
-            result = self.dremio_client.execute_sql_query(query)
-            
-            if not result or 'rows' not in result or len(result['rows']) == 0:
-                logger.warning(f"    ⚠️  No statistics returned for column {column_name}")
-                return None
-            
-            stats = result['rows'][0]
-            
-            # Calculate metrics
-            total_count = int(stats.get('total_count', 0))
-            non_null_count = int(stats.get('non_null_count', 0))
-            null_count = total_count - non_null_count
-            null_proportion = (null_count / total_count) if total_count > 0 else 0.0
-            distinct_count = int(stats.get('distinct_count', 0))
-            unique_proportion = (distinct_count / total_count) if total_count > 0 else 0.0
-            
-            # Create ColumnProfile
-            profile = ColumnProfile(
-                name=column_name,
-                timestamp=int(datetime.now(timezone.utc).timestamp() * 1000),
-                valuesCount=total_count,
-                nullCount=null_count,
-                nullProportion=null_proportion,
-                distinctCount=distinct_count,
-                uniqueCount=distinct_count,
-                uniqueProportion=unique_proportion,
-            )
-            
-            # Add numeric-specific metrics
-            if 'INT' in column_type.upper() or column_type.upper() in ('BIGINT', 'DOUBLE', 'FLOAT', 'DECIMAL'):
-                if 'min_value' in stats and stats['min_value'] is not None:
-                    profile.min = float(stats['min_value'])
-                if 'max_value' in stats and stats['max_value'] is not None:
-                    profile.max = float(stats['max_value'])
-                if 'mean_value' in stats and stats['mean_value'] is not None:
-                    profile.mean = float(stats['mean_value'])
-                if 'stddev_value' in stats and stats['stddev_value'] is not None:
-                    profile.stddev = float(stats['stddev_value'])
-            
-            # Add string-specific metrics
-            elif 'VARCHAR' in column_type.upper() or 'CHAR' in column_type.upper():
-                if 'min_length' in stats and stats['min_length'] is not None:
-                    profile.minLength = float(stats['min_length'])
-                if 'max_length' in stats and stats['max_length'] is not None:
-                    profile.maxLength = float(stats['max_length'])
-                if 'avg_length' in stats and stats['avg_length'] is not None:
-                    profile.meanLength = float(stats['avg_length'])
-            
-            logger.info(f"    ✅ Column {column_name}: {non_null_count}/{total_count} values, {distinct_count} distinct, {null_count} nulls")
-            
-            return profile
-            
-        except Exception as e:
-            logger.warning(f"    ⚠️  Could not profile column {column_name}: {e}")
-            return None
+        from metadata.generated.schema.entity.data.table import ColumnProfile, Histogram
+
+        # Calculate metrics
+        total_count = int(stats.get('total_count', 0))
+        non_null_count = int(stats.get('non_null_count', 0))
+        null_count = total_count - non_null_count
+        null_proportion = (null_count / total_count) if total_count > 0 else 0.0
+        # Not computed by queries routed to an aggregation reflection (unless the column is a dimension)
+        distinct_count = int(stats['distinct_count']) if stats.get('distinct_count') is not None else None
+        unique_proportion = (distinct_count / total_count) if distinct_count is not None and total_count > 0 else None
+        
+        # Create ColumnProfile
+        profile = ColumnProfile(
+            name=column_name,
+            timestamp=int(datetime.now(timezone.utc).timestamp() * 1000),
+            valuesCount=total_count,
+            nullCount=null_count,
+            nullProportion=null_proportion,
+            distinctCount=distinct_count,
+            uniqueCount=distinct_count,
+            uniqueProportion=unique_proportion,
+        )
+        
+        # Add numeric-specific metrics
+        if is_numeric_type(column_type):
+            if 'min_value' in stats and stats['min_value'] is not None:
+                profile.min = float(stats['min_value'])
+            if 'max_value' in stats and stats['max_value'] is not None:
+                profile.max = float(stats['max_value'])
+            if 'mean_value' in stats and stats['mean_value'] is not None:
+                profile.mean = float(stats['mean_value'])
+            if 'stddev_value' in stats and stats['stddev_value'] is not None:
+                profile.stddev = float(stats['stddev_value'])
+            # Sample engine only
+            for key, field in (('first_quartile', 'firstQuartile'), ('median', 'median'), ('third_quartile', 'thirdQuartile')):
+                if stats.get(key) is not None:
+                    setattr(profile, field, float(stats[key]))
+            if stats.get('histogram'):
+                profile.histogram = Histogram(**stats['histogram'])
+        
+        # Add string-specific metrics
+        elif is_string_type(column_type):
+            if 'min_length' in stats and stats['min_length'] is not None:
+                profile.minLength = float(stats['min_length'])
+            if 'max_length' in stats and stats['max_length'] is not None:
+                profile.maxLength = float(stats['max_length'])
+            if 'avg_length' in stats and stats['avg_length'] is not None:
+                profile.meanLength = float(stats['avg_length'])
+        
+        logger.debug("    ✅ Column %s: %d/%d values, %s distinct, %d nulls", column_name, non_null_count, total_count, distinct_count, null_count)
+        
+        return profile
 
     def yield_tag(self, *args, **kwargs) -> Iterable[Either[CreateTagRequest]]:
         """
@@ -706,6 +900,8 @@ class DremioConnector(DatabaseServiceSource):
         
         Creates PII (Personally Identifiable Information) tags for sensitive data.
         """
+        from metadata.generated.schema.api.classification.createTag import CreateTagRequest
+
         logger.info("🏷️  Creating classification tags for auto-tagging")
         
         try:
@@ -764,6 +960,8 @@ class DremioConnector(DatabaseServiceSource):
                     logger.info(f"  ✅ Created tag: {tag_info['classification']}.{tag_info['name']}")
                 except Exception as tag_error:
                     logger.warning(f"  ⚠️  Could not create tag {tag_info['name']}: {tag_error}")
+
+            yield from self._yield_dbt_tags()
                     
         except Exception as e:
             logger.error(f"❌ Error creating classification tags: {e}")
@@ -787,8 +985,9 @@ class DremioConnector(DatabaseServiceSource):
         # Check if classification is enabled
         if not self.classification_enabled:
             return None
+        
+        from metadata.generated.schema.type.tagLabel import LabelType, TagLabel, TagSource
             
-        logger.info(f"🔍 get_column_tag_labels() CALLED for {table_name}.{column.get('name', 'unknown')}")
         try:
             # Extract column name from ColumnName object or string
             col_name_obj = column.get('name', '')
@@ -799,94 +998,20 @@ class DremioConnector(DatabaseServiceSource):
             
             column_type = str(column.get('dataType', '')).upper()
             
-            logger.info(f"  📝 Analyzing column: {column_name} (type: {column_type})")
+            logger.debug("  📝 Analyzing column %s.%s (type: %s)", table_name, column_name, column_type)
             
             tags = []
-            
-            # Email detection
-            if any(pattern in column_name for pattern in ['email', 'mail', 'e_mail', 'courriel']):
-                tags.append(TagLabel(
-                    tagFQN="PII.Email",
-                    source=TagSource.Classification,
-                    labelType=LabelType.Automated,
-                    state="Suggested"
-                ))
-                logger.debug(f"  🏷️  {table_name}.{column['name']}: Detected EMAIL")
-            
-            # Phone detection
-            if any(pattern in column_name for pattern in ['phone', 'tel', 'telephone', 'mobile', 'cell']):
-                tags.append(TagLabel(
-                    tagFQN="PII.Phone",
-                    source=TagSource.Classification,
-                    labelType=LabelType.Automated,
-                    state="Suggested"
-                ))
-                logger.debug(f"  🏷️  {table_name}.{column['name']}: Detected PHONE")
-            
-            # Name detection
-            if any(pattern in column_name for pattern in ['name', 'nom', 'prenom', 'firstname', 'lastname', 'fullname']):
-                tags.append(TagLabel(
-                    tagFQN="PII.Name",
-                    source=TagSource.Classification,
-                    labelType=LabelType.Automated,
-                    state="Suggested"
-                ))
-                logger.debug(f"  🏷️  {table_name}.{column['name']}: Detected NAME")
-            
-            # Address detection
-            if any(pattern in column_name for pattern in ['address', 'adresse', 'street', 'city', 'ville', 'zip', 'postal', 'country', 'pays']):
-                tags.append(TagLabel(
-                    tagFQN="PII.Address",
-                    source=TagSource.Classification,
-                    labelType=LabelType.Automated,
-                    state="Suggested"
-                ))
-                logger.debug(f"  🏷️  {table_name}.{column['name']}: Detected ADDRESS")
-            
-            # ID detection
-            if any(pattern in column_name for pattern in ['ssn', 'social_security', 'passport', 'license', 'licence']):
+            for tag_fqn in classify_column_name(column_name):
                 tags.append(TagLabel(
-                    tagFQN="PII.ID",
+                    tagFQN=tag_fqn,
                     source=TagSource.Classification,
                     labelType=LabelType.Automated,
                     state="Suggested"
                 ))
-                logger.debug(f"  🏷️  {table_name}.{column['name']}: Detected ID")
-            
-            # Credential detection
-            if any(pattern in column_name for pattern in ['password', 'passwd', 'pwd', 'token', 'secret', 'key', 'credential']):
-                tags.append(TagLabel(
-                    tagFQN="Sensitive.Credential",
-                    source=TagSource.Classification,
-                    labelType=LabelType.Automated,
-                    state="Suggested"
-                ))
-                logger.debug(f"  🏷️  {table_name}.{column['name']}: Detected CREDENTIAL")
-            
-            # Credit card detection
-            if any(pattern in column_name for pattern in ['credit_card', 'creditcard', 'cc_number', 'card_number', 'carte_credit']):
-                tags.append(TagLabel(
-                    tagFQN="Financial.CreditCard",
-                    source=TagSource.Classification,
-                    labelType=LabelType.Automated,
-                    state="Suggested"
-                ))
-                logger.debug(f"  🏷️  {table_name}.{column['name']}: Detected CREDIT CARD")
-            
-            # Bank account detection
-            if any(pattern in column_name for pattern in ['account', 'iban', 'swift', 'routing', 'bank_account', 'compte_bancaire']):
-                tags.append(TagLabel(
-                    tagFQN="Financial.BankAccount",
-                    source=TagSource.Classification,
-                    labelType=LabelType.Automated,
-                    state="Suggested"
-                ))
-                logger.debug(f"  🏷️  {table_name}.{column['name']}: Detected BANK ACCOUNT")
+                logger.debug("  🏷️  %s.%s: Detected %s", table_name, column_name, tag_fqn)
             
             if tags:
-                logger.info(f"  ✅ {table_name}.{column['name']}: Applied {len(tags)} classification tags: {[t.tagFQN for t in tags]}")
-            else:
-                logger.info(f"  ⚠️  {table_name}.{column['name']}: No tags detected")
+                logger.debug("  ✅ %s.%s: Applied %d classification tags", table_name, column_name, len(tags))
             
             return tags if tags else None
             
@@ -898,143 +1023,127 @@ class DremioConnector(DatabaseServiceSource):
     # DBT INTEGRATION - Optional 4th capability
     # ============================================================================
     
-    def _load_dbt_catalog(self) -> Optional[Dict]:
-        """Load DBT catalog.json file"""
-        if not self.dbt_catalog_path:
-            return None
-            
-        try:
-            catalog_file = Path(self.dbt_catalog_path)
-            if not catalog_file.exists():
-                logger.warning(f"⚠️  DBT catalog not found: {self.dbt_catalog_path}")
-                return None
-                
-            logger.info(f"📖 Loading DBT catalog from: {self.dbt_catalog_path}")
-            with open(catalog_file, 'r', encoding='utf-8') as f:
-                catalog = json.load(f)
-            logger.info(f"✅ DBT catalog loaded: {len(catalog.get('nodes', {}))} nodes")
-            return catalog
-        except Exception as e:
-            logger.error(f"❌ Error loading DBT catalog: {e}")
-            return None
-    
-    def _load_dbt_manifest(self) -> Optional[Dict]:
-        """Load DBT manifest.json file"""
-        if not self.dbt_manifest_path:
-            return None
-            
-        try:
-            manifest_file = Path(self.dbt_manifest_path)
-            if not manifest_file.exists():
-                logger.warning(f"⚠️  DBT manifest not found: {self.dbt_manifest_path}")
-                return None
-                
-            logger.info(f"📖 Loading DBT manifest from: {self.dbt_manifest_path}")
-            with open(manifest_file, 'r', encoding='utf-8') as f:
-                manifest = json.load(f)
-            logger.info(f"✅ DBT manifest loaded: {len(manifest.get('nodes', {}))} nodes")
-            return manifest
-        except Exception as e:
-            logger.error(f"❌ Error loading DBT manifest: {e}")
-            return None
+    def _get_dbt_index(self) -> DbtIndex:
+        """Load the indexed DBT artifacts once, through the on-disk JSON cache"""
+        if getattr(self, '_dbt_index', None) is None:
+            self._dbt_index = load_dbt_index(
+                catalog_path=self.dbt_catalog_path,
+                manifest_path=self.dbt_manifest_path,
+                run_results_path=self.dbt_run_results_path,
+                cache_path=getattr(self, 'dbt_cache_path', None),
+            )
+        return self._dbt_index
     
-    def _load_dbt_run_results(self) -> Optional[Dict]:
-        """Load DBT run_results.json file"""
-        if not self.dbt_run_results_path:
+    def _get_dbt_model(self, table_name: str) -> Optional[Dict]:
+        """Return the DBT model matching a Dremio table name, if DBT is enabled"""
+        if not self.dbt_enabled:
             return None
-            
+        
         try:
-            results_file = Path(self.dbt_run_results_path)
-            if not results_file.exists():
-                logger.warning(f"⚠️  DBT run results not found: {self.dbt_run_results_path}")
-                return None
-                
-            logger.info(f"📖 Loading DBT run results from: {self.dbt_run_results_path}")
-            with open(results_file, 'r', encoding='utf-8') as f:
-                results = json.load(f)
-            logger.info(f"✅ DBT run results loaded: {len(results.get('results', []))} results")
-            return results
+            return self._get_dbt_index().lookup(table_name)
         except Exception as e:
-            logger.error(f"❌ Error loading DBT run results: {e}")
+            logger.warning(f"⚠️  Could not look up DBT model for {table_name}: {e}")
             return None
     
-    def _enrich_with_dbt(self, table_fqn: str, table_entity: Table) -> Table:
+    def _yield_dbt_tags(self) -> Iterable[Either]:
         """
-        Enrich table metadata with DBT information
-        
-        Args:
-            table_fqn: Fully qualified name of the table
-            table_entity: Table entity to enrich
-            
-        Returns:
-            Enriched table entity
+        Create the DBT classification and one tag per distinct DBT model tag.
+
+        yield_table labels tables with DBT.<tag>: the tags must exist before
+        the tables reference them. Yielded once per run, before the first table.
         """
-        if not self.dbt_enabled:
-            return table_entity
-            
+        if not self.dbt_enabled or getattr(self, '_dbt_tags_created', False):
+            return
+        self._dbt_tags_created = True
+
+        from metadata.generated.schema.api.classification.createClassification import CreateClassificationRequest
+        from metadata.generated.schema.api.classification.createTag import CreateTagRequest
+
         try:
-            # Load DBT files on first call
-            if not hasattr(self, '_dbt_catalog'):
-                self._dbt_catalog = self._load_dbt_catalog()
-                self._dbt_manifest = self._load_dbt_manifest()
-                self._dbt_run_results = self._load_dbt_run_results()
-            
-            # Match table with DBT model
-            # DBT uses format: model.project_name.model_name
-            # We need to match against our Dremio table FQN
-            
-            if self._dbt_manifest:
-                for node_id, node_data in self._dbt_manifest.get('nodes', {}).items():
-                    if node_data.get('resource_type') == 'model':
-                        # Try to match by name
-                        model_name = node_data.get('name', '').lower()
-                        table_name = table_fqn.split('.')[-1].lower()
-                        
-                        if model_name == table_name:
-                            logger.info(f"🔧 Enriching {table_fqn} with DBT model: {node_id}")
-                            
-                            # Add description from DBT
-                            if node_data.get('description') and not table_entity.description:
-                                table_entity.description = node_data['description']
-                                logger.info(f"  ✅ Added DBT description")
-                            
-                            # Add tags from DBT
-                            dbt_tags = node_data.get('tags', [])
-                            if dbt_tags:
-                                # Convert to TagLabel objects
-                                if not table_entity.tags:
-                                    table_entity.tags = []
-                                for tag_name in dbt_tags:
-                                    table_entity.tags.append(TagLabel(
-                                        tagFQN=f"DBT.{tag_name}",
-                                        source=TagSource.Classification,
-                                        labelType=LabelType.Automated,
-                                        state="Confirmed"
-                                    ))
-                                logger.info(f"  ✅ Added {len(dbt_tags)} DBT tags")
-                            
-                            # Add column descriptions from DBT
-                            dbt_columns = node_data.get('columns', {})
-                            if dbt_columns and table_entity.columns:
-                                for col in table_entity.columns:
-                                    col_name = str(col.name.__root__ if hasattr(col.name, '__root__') else col.name).lower()
-                                    if col_name in dbt_columns:
-                                        dbt_col = dbt_columns[col_name]
-                                        if dbt_col.get('description') and not col.description:
-                                            col.description = dbt_col['description']
-                                            logger.info(f"  ✅ Added description for column: {col_name}")
-                            
-                            break
-            
-            return table_entity
-            
+            tag_names = self._get_dbt_index().tags()
         except Exception as e:
-            logger.warning(f"⚠️  Could not enrich table with DBT: {e}")
-            return table_entity
+            logger.warning(f"⚠️  Could not read DBT tags: {e}")
+            return
+        if not tag_names:
+            return
+
+        yield Either(right=CreateClassificationRequest(
+            name=DBT_CLASSIFICATION,
+            description="Tags of the DBT models matching Dremio tables"
+        ))
+        for tag_name in tag_names:
+            yield Either(right=CreateTagRequest(
+                name=tag_name,
+                description=f"DBT model tag '{tag_name}'",
+                classification=DBT_CLASSIFICATION
+            ))
+        logger.info(f"  ✅ Created {len(tag_names)} DBT tags")
 
+    def _dbt_tag_labels(self, model: Dict) -> List[TagLabel]:
+        """Convert DBT model tags to TagLabel objects"""
+        from metadata.generated.schema.type.tagLabel import LabelType, TagLabel, TagSource
+
+        return [
+            TagLabel(
+                tagFQN=f"{DBT_CLASSIFICATION}.{tag_name}",
+                source=TagSource.Classification,
+                labelType=LabelType.Automated,
+                state="Confirmed"
+            )
+            for tag_name in model.get('tags', [])
+        ]
+    
     def close(self):
         """Clean up resources"""
         logger.info("👋 Closing Dremio connector")
+        for progress in (getattr(self, "_table_progress", None), getattr(self, "_profile_progress", None)):
+            if progress:
+                progress.finish()
+        if getattr(self, "_row_counts", None) is not None and any(self._row_counts.stats.values()):
+            logger.info(f"🔢 Row counts by source: {self._row_counts.stats}")
+        if getattr(self, "_reflections", None) is not None and self._reflections.hit_rate() is not None:
+            logger.info(
+                f"⚡ Profiling queries accelerated by reflections: {self._reflections.hit_rate():.0%} "
+                f"(by route: {self._reflections.stats})"
+            )
+        if getattr(self, "_profile_state", None) is not None:
+            logger.info(f"♻️  Profiles reused for unchanged datasets: {self._profile_reused}")
+            self._profile_state.save()
+        if getattr(self, "metrics_textfile", None):
+            try:
+                metrics.write_textfile(self.metrics_textfile)
+            except OSError as e:
+                logger.warning(f"⚠️  Could not write metrics to {self.metrics_textfile}: {e}")
+        if getattr(self, "tracing_file", None):
+            exporter = tracing.get_tracer().exporter
+            if exporter:
+                exporter.shutdown()
+            tracing.configure_tracing(None)
         if self.dremio_client:
             self.dremio_client = None
 
+
+@lru_cache(maxsize=None)
+def _dremio_type_mapping() -> Dict[str, DataType]:
+    """Dremio type → OpenMetadata DataType, built on first call"""
+    from metadata.generated.schema.entity.data.table import DataType
+
+    return {
+        'INTEGER': DataType.INT,
+        'BIGINT': DataType.BIGINT,
+        'FLOAT': DataType.FLOAT,
+        'DOUBLE': DataType.DOUBLE,
+        'DECIMAL': DataType.DECIMAL,
+        'VARCHAR': DataType.VARCHAR,
+        'CHAR': DataType.CHAR,
+        'TEXT': DataType.TEXT,
+        'BOOLEAN': DataType.BOOLEAN,
+        'DATE': DataType.DATE,
+        'TIME': DataType.TIME,
+        'TIMESTAMP': DataType.TIMESTAMP,
+        'BINARY': DataType.BINARY,
+        'ARRAY': DataType.ARRAY,
+        'MAP': DataType.MAP,
+        'STRUCT': DataType.STRUCT,
+        'JSON': DataType.JSON,
+    }
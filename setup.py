@@ -49,6 +49,7 @@ setup(
         "pyarrow>=14.0.0",
         "typing-extensions>=4.7.0",
         "pandas>=2.2.0",
+        "numpy>=1.24.0",
         "prettytable>=3.14.0",
         "python-dateutil>=2.8.2",
     ],
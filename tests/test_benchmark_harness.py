@@ -0,0 +1,94 @@
+"""
+Tests unitaires pour le harnais de benchmark (catalogue synthétique et serveurs simulés)
+"""
+import pytest
+
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.harness import percentiles, run_discovery_benchmark, run_sync_benchmark
+from dremio_connector.benchmark.servers import MockDremioServer
+from dremio_connector.core.sync_engine import DremioAutoDiscovery
+
+
+class TestSyntheticCatalog:
+    """Tests pour le générateur de catalogue"""
+
+    def test_paths_round_trip_without_materializing(self):
+        catalog = SyntheticCatalog(datasets=1_000_000, sources=10, depth=2, fan_out=10)
+
+        entity = catalog.by_path(catalog.dataset_path(987_654))
+
+        assert entity["id"] == "ds-987654"
+        assert catalog.by_id("ds-987654")["path"] == entity["path"]
+        assert catalog.by_path(["source_0", "folder_99"]) is None
+
+    def test_datasets_are_spread_over_leaf_folders(self):
+        catalog = SyntheticCatalog(datasets=95, sources=2, depth=1, fan_out=5)
+
+        leaves = [catalog.children(["source_%d" % s, "folder_%d" % f]) for s in range(2) for f in range(5)]
+
+        assert sum(len(children) for children in leaves) == 95
+        assert all(child["type"] == "DATASET" for children in leaves for child in children)
+
+    def test_views_reference_an_existing_dataset(self):
+        catalog = SyntheticCatalog(datasets=200, view_ratio=0.5)
+        views = [i for i in catalog.iter_datasets() if catalog.is_view(i)]
+
+        entity = catalog.dataset(views[0])
+
+        assert views
+        assert entity["type"] == "VIRTUAL_DATASET"
+        assert ".".join(f'"{p}"' for p in catalog.dataset_path(views[0] - 1)) in entity["sql"]
+
+
+class TestMockServers:
+    """Tests pour les serveurs simulés, via le vrai client HTTP"""
+
+    def test_sql_jobs_are_paginated(self):
+        catalog = SyntheticCatalog(datasets=1200)
+        with MockDremioServer(catalog) as dremio:
+            client = DremioAutoDiscovery(dremio.url, "admin", "admin")
+            assert client.authenticate()
+
+            rows = list(client.iter_sql_rows('SELECT * FROM INFORMATION_SCHEMA."TABLES"'))
+            count = client.execute_sql_query('SELECT COUNT(*) as row_count FROM "source_0"."folder_0"."table_0"')
+
+        assert len(rows) == 1200
+        assert count["rows"] == [{"row_count": dremio.rows_per_table}]
+        assert dremio.stats.durations["GET /api/v3/job/{id}/results"]
+
+    def test_discovery_reports_all_datasets(self):
+        report = run_discovery_benchmark(SyntheticCatalog(datasets=150, sources=2, depth=2, fan_out=3))
+
+        assert report["resources"] == 150 + 2 + 6 + 18
+        assert report["dremio_endpoints"]["GET /api/v3/catalog/{id}"]["requests"] == 150
+
+    def test_sync_writes_every_table(self):
+        report = run_sync_benchmark(SyntheticCatalog(datasets=120, sources=2, fan_out=3), lineage=True)
+
+        assert report["result"]["tables_created"] == 120
+        assert report["result"]["errors"] == 0
+        assert report["openmetadata_endpoints"]["PUT /v1/tables"]["requests"] == 120
+        assert report["result"]["lineage_edges"] > 0
+
+    def test_injected_errors_are_reported(self):
+        report = run_discovery_benchmark(SyntheticCatalog(datasets=200), error_rate=0.2)
+
+        errors = sum(e["errors"] for e in report["dremio_endpoints"].values())
+        assert errors > 0
+
+
+def test_percentiles_use_nearest_rank():
+    samples = [i / 1000 for i in range(1, 101)]
+
+    assert percentiles(samples, points=(50, 99)) == {"p50_ms": 50.0, "p99_ms": 99.0, "max_ms": 100.0}
+
+
+def test_compare_flags_regressions_over_threshold():
+    from benchmarks.compare import compare
+
+    baseline = {"benchmarks": {"a": {"median": 1.0}, "b": {"median": 1.0}, "gone": {"median": 1.0}}}
+    current = {"benchmarks": {"a": {"median": 1.05}, "b": {"median": 1.5}, "new": {"median": 1.0}}}
+
+    statuses = {row["name"]: row["status"] for row in compare(current, baseline, threshold=0.10)}
+
+    assert statuses == {"a": "ok", "b": "regression", "gone": "missing", "new": "new"}
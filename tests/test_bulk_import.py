@@ -0,0 +1,118 @@
+"""
+Tests unitaires pour l'import CSV en masse des schémas et des tables
+"""
+import csv
+import io
+import math
+from unittest.mock import patch
+
+import pytest
+
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer, MockOpenMetadataServer
+from dremio_connector.core.bulk_import import IMPORT_HEADERS, failed_fqns, table_rows, to_csv
+from dremio_connector.core.sync_engine import DremioOpenMetadataSync, OpenMetadataSyncEngine
+
+IMPORT_ENDPOINT = "PUT /v1/databaseSchemas/name/{fqn}/import"
+
+
+@pytest.fixture
+def catalog():
+    return SyntheticCatalog(datasets=60, sources=2, fan_out=2, view_ratio=0)
+
+
+def _sync(dremio, om, **options) -> DremioOpenMetadataSync:
+    return DremioOpenMetadataSync(
+        dremio_url=dremio.url,
+        dremio_user="admin",
+        dremio_password="admin",
+        openmetadata_url=om.url,
+        jwt_token="token",
+        service_name="dremio",
+        progress_interval=0,
+        bulk_import=True,
+        **options,
+    )
+
+
+class TestCsvFormat:
+    """Tests pour la construction et la relecture des CSV d'import"""
+
+    def test_table_rows_carry_columns(self):
+        columns = [{"name": "a.b", "dataType": "INT", "dataLength": 1}, {"name": "label", "dataType": "VARCHAR"}]
+
+        rows = list(csv.DictReader(io.StringIO(to_csv(table_rows("svc.lake.raw", "my.orders", columns)))))
+
+        assert list(rows[0]) == IMPORT_HEADERS
+        assert [r["entityType*"] for r in rows] == ["table", "column", "column"]
+        assert rows[0]["fullyQualifiedName"] == 'svc.lake.raw."my.orders"'
+        assert rows[1]["fullyQualifiedName"] == 'svc.lake.raw."my.orders"."a.b"'
+        assert (rows[2]["column.dataType"], rows[2]["column.dataTypeDisplay"]) == ("VARCHAR", "varchar")
+
+    def test_failed_rows_are_read_from_results(self):
+        results = "status,details,name*,fullyQualifiedName\nsuccess,ok,a,s.a\nfailure,bad,b,s.b\n"
+
+        assert failed_fqns({"status": "partialSuccess", "numberOfRowsFailed": 1, "importResultsCsv": results}) == {"s.b"}
+        assert failed_fqns({"status": "success", "numberOfRowsFailed": 0}) == set()
+
+
+class TestBulkSync:
+    """Tests de la synchronisation par import CSV contre les serveurs simulés"""
+
+    def test_tables_are_imported_per_schema(self, catalog):
+        with MockDremioServer(catalog) as dremio, MockOpenMetadataServer() as om:
+            sync = _sync(dremio, om)
+            result = sync.sync()
+
+        assert (result["tables_created"], result["tables_imported"], result["errors"]) == (60, 60, 0)
+        assert "PUT /v1/tables" not in om.stats.durations
+        # dry-run + import réel pour chacun des 4 schémas
+        assert len(om.stats.durations[IMPORT_ENDPOINT]) == 8
+        assert len(sync.om.table_ids) == 60
+
+    def test_rejected_rows_fall_back_to_put(self, catalog):
+        rejected = catalog.dataset_path(3)[-1]
+        with MockDremioServer(catalog) as dremio, MockOpenMetadataServer(reject_names={rejected}) as om:
+            sync = _sync(dremio, om)
+            result = sync.sync()
+
+        assert (result["tables_created"], result["tables_imported"]) == (60, 59)
+        assert len(om.stats.durations["PUT /v1/tables"]) == 1
+        assert sync.om.stats["fallbacks"] == 1
+        assert len(sync.om.table_ids) == 60
+
+    def test_aborted_dry_run_writes_with_put(self, catalog):
+        with MockDremioServer(catalog) as dremio, MockOpenMetadataServer() as om:
+            sync = _sync(dremio, om)
+            with patch("dremio_connector.core.sync_engine.to_csv", return_value="name\nx\n"):
+                result = sync.sync()
+
+        assert (result["tables_created"], result["tables_imported"]) == (60, 0)
+        assert len(om.stats.durations["PUT /v1/tables"]) == 60
+        # aucun import réel après un dry-run abandonné
+        assert len(om.stats.durations[IMPORT_ENDPOINT]) == 4
+
+    def test_large_schemas_are_chunked(self, catalog):
+        with MockDremioServer(catalog) as dremio, MockOpenMetadataServer() as om:
+            sync = _sync(dremio, om)
+            sync.om.bulk_chunk_size = 4
+            sync.sync()
+
+        schema_sizes = {}
+        for i in catalog.iter_datasets():
+            key = tuple(catalog.dataset_path(i)[:-1])
+            schema_sizes[key] = schema_sizes.get(key, 0) + 1
+        expected = sum(2 * math.ceil(n / 4) for n in schema_sizes.values())
+        assert len(om.stats.durations[IMPORT_ENDPOINT]) == expected
+        assert len(sync.om.table_ids) == 60
+
+    def test_schemas_are_imported_per_database(self):
+        names = [f"folder_{i}" for i in range(11)] + ["nested.folder"]
+        with MockOpenMetadataServer() as om:
+            engine = OpenMetadataSyncEngine(om.url, "token", "dremio", bulk_import=True)
+            written = engine.write_schemas("dremio.lake", names)
+
+        assert written["nested.folder"] == 'dremio.lake."nested.folder"'
+        assert len(written) == 12 and engine.stats["schemas"] == 12
+        assert len(om.stats.durations["PUT /v1/databases/name/{fqn}/import"]) == 2
+        assert "PUT /v1/databaseSchemas" not in om.stats.durations
@@ -0,0 +1,50 @@
+"""
+Tests unitaires pour les règles de classification et les requêtes de profiling
+"""
+import pytest
+
+from dremio_connector.core.classification import classify_column_name
+from dremio_connector.core.profiler import build_column_profile_query, build_row_count_query
+
+
+class TestClassification:
+    """Tests pour classify_column_name"""
+
+    @pytest.mark.parametrize("column_name,expected", [
+        ("customer_email", ["PII.Email"]),
+        ("Phone_Number", ["PII.Phone"]),
+        ("billing_street_address", ["PII.Address"]),
+        ("api_key", ["Sensitive.Credential"]),
+        ("iban", ["Financial.BankAccount"]),
+        ("amount", []),
+    ])
+    def test_rules(self, column_name, expected):
+        assert classify_column_name(column_name) == expected
+
+    def test_multiple_categories_keep_rule_order(self):
+        assert classify_column_name("account_name") == ["PII.Name", "Financial.BankAccount"]
+
+
+class TestProfileQueries:
+    """Tests pour la génération des requêtes de profiling"""
+
+    def test_row_count(self):
+        assert build_row_count_query('"s"."t"') == 'SELECT COUNT(*) as row_count FROM "s"."t"'
+
+    def test_numeric_column_with_sample(self):
+        query = build_column_profile_query('"s"."t"', "amount", "DataType.BIGINT", 1000)
+
+        assert 'STDDEV(CAST("amount" AS DOUBLE)) as stddev_value' in query
+        assert query.endswith('FROM (SELECT * FROM "s"."t" LIMIT 1000)')
+
+    def test_string_column(self):
+        query = build_column_profile_query('"s"."t"', "email", "DataType.VARCHAR")
+
+        assert 'AVG(LENGTH("email")) as avg_length' in query
+        assert "LIMIT" not in query
+
+    def test_other_types_only_get_base_metrics(self):
+        query = build_column_profile_query('"s"."t"', "created_at", "DataType.TIMESTAMP")
+
+        assert 'COUNT(DISTINCT "created_at") as distinct_count' in query
+        assert "MIN(" not in query
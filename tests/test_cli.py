@@ -0,0 +1,132 @@
+"""
+Tests unitaires pour la CLI dremio-connector (discover, sync, profile, bench)
+"""
+import json
+import time
+
+import pytest
+
+from dremio_connector import cli
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer, MockOpenMetadataServer
+from dremio_connector.core.sync_engine import RateLimiter, filter_resources
+from dremio_connector.core.sync_state import SyncState, table_fingerprint
+
+
+@pytest.fixture
+def servers():
+    catalog = SyntheticCatalog(datasets=40, sources=2, fan_out=2, view_ratio=0)
+    with MockDremioServer(catalog, rows_per_table=100) as dremio, MockOpenMetadataServer() as om:
+        yield dremio, om
+
+
+def _connection(dremio, om=None):
+    args = ["--dremio-url", dremio.url, "--dremio-user", "admin", "--dremio-password", "admin"]
+    if om:
+        args += ["--openmetadata-url", om.url, "--jwt-token", "token"]
+    return args
+
+
+class TestParser:
+    """Tests pour les options communes aux sous-commandes"""
+
+    def test_common_tuning_flags(self):
+        args = cli.build_parser().parse_args([
+            "sync", "--mode", "incremental", "--concurrency", "8", "--rate-limit", "50",
+            "--include", "lake.*", "--exclude", "*tmp*", "--exclude", "scratch*", "--state-dir", "/var/state",
+        ])
+
+        assert args.func is cli.cmd_sync
+        assert (args.concurrency, args.rate_limit, args.state_dir) == (8, 50.0, "/var/state")
+        assert args.include == ["lake.*"]
+        assert args.exclude == ["*tmp*", "scratch*"]
+
+    def test_bench_reuses_harness_options(self):
+        args = cli.build_parser().parse_args(["bench", "--datasets", "10", "--mode", "dry-run", "--concurrency", "4"])
+
+        assert (args.datasets, args.mode, args.concurrency, args.scenario) == (10, "dry-run", 4, "sync")
+
+    def test_unknown_mode_is_rejected(self):
+        with pytest.raises(SystemExit):
+            cli.build_parser().parse_args(["sync", "--mode", "partial"])
+
+
+class TestCommands:
+    """Tests des sous-commandes contre les serveurs simulés"""
+
+    def test_discover_writes_jsonl(self, servers, tmp_path):
+        dremio, _ = servers
+        output = tmp_path / "catalog.jsonl"
+
+        code = cli.main(["discover", *_connection(dremio), "-o", str(output), "--include", "source_0.*"])
+
+        lines = [json.loads(line) for line in output.read_text().splitlines()]
+        assert code == 0
+        assert lines and all(r["full_path"].startswith("source_0.") for r in lines)
+        assert all("schema" not in r for r in lines)
+
+    def test_sync_dry_run_then_incremental(self, servers, tmp_path, capsys):
+        dremio, om = servers
+        common = [*_connection(dremio, om), "--state-dir", str(tmp_path), "--progress-interval", "0"]
+
+        assert cli.main(["sync", *common, "--mode", "dry-run"]) == 0
+        plan = json.loads(capsys.readouterr().out)
+        assert plan["dry_run"] and plan["tables"] == 40
+        assert "PUT /v1/tables" not in om.stats.durations
+
+        assert cli.main(["sync", *common, "--mode", "incremental"]) == 0
+        first = json.loads(capsys.readouterr().out)
+        assert cli.main(["sync", *common, "--mode", "incremental"]) == 0
+        second = json.loads(capsys.readouterr().out)
+
+        assert first["tables_created"] == 40
+        assert (second["tables_created"], second["tables_skipped"]) == (0, 40)
+
+    def test_profile_runs_in_parallel(self, servers, tmp_path):
+        dremio, _ = servers
+        output = tmp_path / "profiles.jsonl"
+
+        code = cli.main(["profile", *_connection(dremio), "-o", str(output), "--concurrency", "4",
+                         "--include", "source_1.*"])
+
+        profiles = [json.loads(line) for line in output.read_text().splitlines()]
+        assert code == 0
+        assert len(profiles) == 20
+        assert all(p["path"][0] == "source_1" and p["row_count"] == 100 for p in profiles)
+
+    def test_bench_prints_report(self, capsys):
+        code = cli.main(["bench", "--datasets", "30", "--scenario", "discovery", "--concurrency", "2"])
+
+        assert code == 0
+        assert "datasets" in capsys.readouterr().out
+
+
+class TestBuildingBlocks:
+    """Tests pour les briques utilisées par la CLI"""
+
+    def test_filter_resources(self):
+        resources = [{"full_path": p} for p in ("lake.sales.orders", "lake.tmp.x", "other.t")]
+
+        kept = filter_resources(resources, include=["lake.*"], exclude=["*.tmp.*"])
+
+        assert [r["full_path"] for r in kept] == ["lake.sales.orders"]
+
+    def test_sync_state_round_trip(self, tmp_path):
+        columns = [{"name": "id", "dataType": "BIGINT", "ordinalPosition": 1}]
+        state = SyncState("http://d", "dremio", str(tmp_path))
+        state.record("dremio.src.raw.t", table_fingerprint(columns), "uuid-1")
+        state.save()
+
+        loaded = SyncState("http://d", "dremio", str(tmp_path)).load()
+
+        assert loaded.unchanged("dremio.src.raw.t", table_fingerprint(columns)) == "uuid-1"
+        assert loaded.unchanged("dremio.src.raw.t", table_fingerprint(columns + columns)) is None
+
+    def test_rate_limiter_spaces_requests(self):
+        limiter = RateLimiter(50, burst=1)
+
+        started = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+
+        assert time.monotonic() - started >= 0.035
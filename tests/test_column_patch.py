@@ -0,0 +1,103 @@
+"""
+Tests unitaires pour la mise à jour des colonnes par JSON Patch (core.column_patch)
+"""
+import copy
+
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer, MockOpenMetadataServer
+from dremio_connector.core.column_patch import column_patch, compact_columns
+from dremio_connector.core.reconcile import split_fqn
+from dremio_connector.core.sync_engine import DremioOpenMetadataSync, OpenMetadataSyncEngine
+
+OLD = [
+    {"name": "id", "dataType": "INT", "dataLength": 1},
+    {"name": "label", "dataType": "VARCHAR", "dataLength": 1, "description": "libellé"},
+]
+
+
+def _sync(dremio, om, **options) -> DremioOpenMetadataSync:
+    return DremioOpenMetadataSync(
+        dremio_url=dremio.url,
+        dremio_user="admin",
+        dremio_password="admin",
+        openmetadata_url=om.url,
+        jwt_token="token",
+        service_name="dremio",
+        progress_interval=0,
+        **options,
+    )
+
+
+class TestColumnPatch:
+    """Tests pour le calcul du delta RFC 6902"""
+
+    def test_changed_type_is_replaced_after_a_test(self):
+        new = [{"name": "id", "dataType": "BIGINT", "dataLength": 1, "ordinalPosition": 1}, OLD[1]]
+
+        assert column_patch(OLD, new) == [
+            {"op": "test", "path": "/columns/0/name", "value": "id"},
+            {"op": "replace", "path": "/columns/0/dataType", "value": "BIGINT"},
+        ]
+
+    def test_columns_added_and_removed_at_the_end(self):
+        added = {"name": "amount", "dataType": "DECIMAL"}
+
+        assert column_patch(OLD, OLD + [added]) == [{"op": "add", "path": "/columns/-", "value": added}]
+        assert column_patch(OLD, OLD[:1]) == [
+            {"op": "test", "path": "/columns/1/name", "value": "label"},
+            {"op": "remove", "path": "/columns/1"},
+        ]
+
+    def test_absent_description_is_kept(self):
+        new = [OLD[0], {"name": "label", "dataType": "VARCHAR", "dataLength": 1}]
+
+        assert column_patch(OLD, new) == []
+
+    def test_renamed_or_moved_columns_need_a_put(self):
+        assert column_patch(OLD, [OLD[1], OLD[0]]) is None
+        assert column_patch(OLD, [{"name": "ident", "dataType": "INT"}, OLD[1]]) is None
+
+    def test_compact_columns_keeps_patched_fields(self):
+        listed = [{"name": "id", "dataType": "INT", "dataTypeDisplay": "int", "fullyQualifiedName": "s.d.x.t.id",
+                   "description": None}]
+
+        assert compact_columns(listed) == [{"name": "id", "dataType": "INT"}]
+
+
+class TestPatchedSync:
+    """Tests des mises à jour par PATCH contre les serveurs simulés"""
+
+    def test_changed_column_is_patched(self):
+        catalog = SyntheticCatalog(datasets=20, sources=2, fan_out=2, view_ratio=0)
+        with MockDremioServer(catalog) as dremio, MockOpenMetadataServer() as om:
+            _sync(dremio, om).sync()
+            puts = len(om.stats.durations["PUT /v1/tables"])
+            fqn = next(fqn for fqn, record in om.records.items() if record["kind"] == "table")
+            expected = copy.deepcopy(om.records[fqn]["columns"])
+            om.records[fqn]["columns"][0]["dataType"] = "UNKNOWN"
+
+            result = _sync(dremio, om, prefetch_index=True).sync()
+
+            assert len(om.stats.durations["PUT /v1/tables"]) == puts
+            assert len(om.stats.durations["PATCH /v1/tables/{id}"]) == 1
+        assert (result["tables_created"], result["tables_patched"], result["tables_skipped"]) == (1, 1, 19)
+        assert om.records[fqn]["columns"] == expected
+
+    def test_conflict_falls_back_to_put(self):
+        catalog = SyntheticCatalog(datasets=4, sources=1, fan_out=2, view_ratio=0)
+        with MockDremioServer(catalog) as dremio, MockOpenMetadataServer() as om:
+            _sync(dremio, om).sync()
+            fqn = next(fqn for fqn, record in om.records.items() if record["kind"] == "table")
+            expected = copy.deepcopy(om.records[fqn]["columns"])
+            om.records[fqn]["columns"][0]["dataType"] = "UNKNOWN"
+
+            engine = OpenMetadataSyncEngine(om.url, "token", "dremio")
+            engine.build_index()
+            # Modification concurrente entre le listing et le patch
+            om.records[fqn]["columns"][0]["name"] = "renamed"
+            written = engine.write_tables(om.records[fqn]["parent"], [{"name": split_fqn(fqn)[-1], "columns": expected}])
+
+            assert len(om.stats.durations["PATCH /v1/tables/{id}"]) == 1
+        assert written == {split_fqn(fqn)[-1]: fqn}
+        assert (engine.stats["tables"], engine.stats["patched"], engine.stats["fallbacks"]) == (1, 0, 1)
+        assert om.records[fqn]["columns"] == expected
@@ -0,0 +1,158 @@
+"""
+Tests unitaires pour le cache disque des artefacts dbt
+"""
+import json
+import os
+import pickle
+
+import pytest
+
+from dremio_connector.core.dbt_cache import DbtArtifactCache, DbtIndex
+
+
+class _Payload:
+    """Objet dont le dépickling crée un fichier témoin"""
+
+    def __init__(self, marker):
+        self.marker = marker
+
+    def __reduce__(self):
+        return (open, (self.marker, "w"))
+
+
+@pytest.fixture
+def dbt_artifacts(tmp_path, sample_dbt_manifest):
+    """Écrit manifest, catalog et run_results dans un répertoire temporaire"""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(json.dumps(sample_dbt_manifest))
+
+    catalog_path = tmp_path / "catalog.json"
+    catalog_path.write_text(json.dumps({
+        "nodes": {
+            "model.test_analytics.stg_customers": {
+                "columns": {
+                    "customer_id": {"name": "customer_id", "comment": "from catalog"},
+                    "email": {"name": "email", "comment": "Customer email"}
+                }
+            }
+        }
+    }))
+
+    run_results_path = tmp_path / "run_results.json"
+    run_results_path.write_text(json.dumps({
+        "results": [{"unique_id": "model.test_analytics.stg_customers", "status": "success"}]
+    }))
+
+    return {
+        "catalog_path": str(catalog_path),
+        "manifest_path": str(manifest_path),
+        "run_results_path": str(run_results_path),
+        "cache_path": str(tmp_path / "cache" / "dbt_index.json"),
+    }
+
+
+class TestDbtIndex:
+    """Tests pour la construction de l'index"""
+
+    def test_lookup_is_case_insensitive(self, sample_dbt_manifest):
+        index = DbtIndex.from_artifacts(manifest=sample_dbt_manifest)
+
+        model = index.lookup("STG_Customers")
+
+        assert model["unique_id"] == "model.test_analytics.stg_customers"
+        assert model["description"] == "Staging customer data"
+        assert index.lookup("unknown") is None
+
+    def test_catalog_comments_complete_manifest_docs(self, sample_dbt_manifest):
+        catalog = {"nodes": {"model.test_analytics.stg_customers": {"columns": {
+            "customer_id": {"comment": "ignored"},
+            "email": {"comment": "Customer email"}
+        }}}}
+
+        model = DbtIndex.from_artifacts(catalog=catalog, manifest=sample_dbt_manifest).lookup("stg_customers")
+
+        assert model["columns"] == {"customer_id": "Customer ID", "email": "Customer email"}
+
+    def test_run_status_is_attached(self, sample_dbt_manifest):
+        run_results = {"results": [{"unique_id": "model.test_analytics.stg_customers", "status": "error"}]}
+
+        model = DbtIndex.from_artifacts(manifest=sample_dbt_manifest, run_results=run_results).lookup("stg_customers")
+
+        assert model["run_status"] == "error"
+
+    def test_tags_are_distinct_and_sorted(self):
+        index = DbtIndex({"a": {"tags": ["pii", "daily"]}, "b": {"tags": ["daily"]}, "c": {}})
+
+        assert index.tags() == ["daily", "pii"]
+
+
+class TestDbtArtifactCache:
+    """Tests pour l'invalidation du cache"""
+
+    def test_second_load_is_a_hit(self, dbt_artifacts):
+        first = DbtArtifactCache(**dbt_artifacts)
+        first.load()
+        second = DbtArtifactCache(**dbt_artifacts)
+
+        index = second.load()
+
+        assert first.stats == {"hits": 0, "misses": 1}
+        assert second.stats == {"hits": 1, "misses": 0}
+        assert index.lookup("stg_customers")["run_status"] == "success"
+
+    def test_touched_file_with_same_content_is_a_hit(self, dbt_artifacts):
+        DbtArtifactCache(**dbt_artifacts).load()
+        stat = os.stat(dbt_artifacts["manifest_path"])
+        os.utime(dbt_artifacts["manifest_path"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        cache = DbtArtifactCache(**dbt_artifacts)
+        cache.load()
+
+        assert cache.stats["hits"] == 1
+
+    def test_changed_content_is_a_miss(self, dbt_artifacts, sample_dbt_manifest):
+        DbtArtifactCache(**dbt_artifacts).load()
+        sample_dbt_manifest["nodes"]["model.test_analytics.stg_customers"]["description"] = "Updated"
+        with open(dbt_artifacts["manifest_path"], "w") as f:
+            json.dump(sample_dbt_manifest, f)
+        stat = os.stat(dbt_artifacts["manifest_path"])
+        os.utime(dbt_artifacts["manifest_path"], ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        cache = DbtArtifactCache(**dbt_artifacts)
+        index = cache.load()
+
+        assert cache.stats["misses"] == 1
+        assert index.lookup("stg_customers")["description"] == "Updated"
+
+    def test_removed_artifact_is_a_miss(self, dbt_artifacts):
+        DbtArtifactCache(**dbt_artifacts).load()
+        os.unlink(dbt_artifacts["run_results_path"])
+
+        cache = DbtArtifactCache(**dbt_artifacts)
+        index = cache.load()
+
+        assert cache.stats["misses"] == 1
+        assert "run_status" not in index.lookup("stg_customers")
+
+    def test_corrupted_cache_is_rebuilt(self, dbt_artifacts):
+        os.makedirs(os.path.dirname(dbt_artifacts["cache_path"]))
+        with open(dbt_artifacts["cache_path"], "wb") as f:
+            f.write(b"not json")
+
+        cache = DbtArtifactCache(**dbt_artifacts)
+        index = cache.load()
+
+        assert cache.stats["misses"] == 1
+        assert len(index) == 1
+
+    def test_pickled_cache_is_never_executed(self, dbt_artifacts, tmp_path):
+        marker = tmp_path / "executed"
+        os.makedirs(os.path.dirname(dbt_artifacts["cache_path"]))
+        with open(dbt_artifacts["cache_path"], "wb") as f:
+            pickle.dump(_Payload(str(marker)), f)
+
+        cache = DbtArtifactCache(**dbt_artifacts)
+        index = cache.load()
+
+        assert not marker.exists()
+        assert cache.stats["misses"] == 1 and len(index) == 1
@@ -0,0 +1,192 @@
+"""
+Tests du connecteur OpenMetadata (dremio_source) contre le serveur Dremio simulé
+
+Le connecteur est préparé depuis ses connectionOptions (prepare), puis la
+topologie est déroulée à la main: schémas, tables, requêtes de création.
+Nécessite le package OpenMetadata ``metadata``.
+"""
+import json
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("metadata")
+
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer
+from dremio_connector.core.dbt_cache import DbtIndex
+from dremio_connector.dremio_source import DBT_CLASSIFICATION, DremioConnector
+
+
+def _value(field):
+    """Valeur d'un type OpenMetadata enveloppé (RootModel) ou brute"""
+    return getattr(field, "root", field)
+
+
+def _fake_fqn(metadata, entity_type, **parts):
+    return ".".join(str(parts[key]) for key in ("service_name", "database_name", "schema_name", "table_name") if parts.get(key))
+
+
+@pytest.fixture
+def catalog():
+    return SyntheticCatalog(datasets=4, sources=1, fan_out=2, view_ratio=0)
+
+
+@pytest.fixture(autouse=True)
+def fqn_without_server(monkeypatch):
+    """fqn.build interroge OpenMetadata pour certains types: FQN construit localement"""
+    monkeypatch.setattr("metadata.utils.fqn.build", _fake_fqn)
+
+
+def make_connector(dremio_url: str, **options) -> DremioConnector:
+    """Connecteur préparé depuis ses connectionOptions, sans workflow OpenMetadata"""
+    options = {"url": dremio_url, "username": "admin", "password": "admin", "progressLogInterval": 0, **options}
+    connection = SimpleNamespace(connectionOptions=SimpleNamespace(root=options))
+    connector = DremioConnector.__new__(DremioConnector)
+    connector.config = SimpleNamespace(serviceConnection=SimpleNamespace(root=SimpleNamespace(config=connection)))
+    connector.metadata = None
+    connector.source_config = SimpleNamespace()
+    connector.dremio_client = None
+    connector.database_source_state = set()
+    connector.dataset_columns = {}
+    connector.context = SimpleNamespace(state=SimpleNamespace(database_service="dremio", database=None, database_schema=None))
+    connector.context.get = lambda: connector.context.state
+    connector.prepare()
+    return connector
+
+
+def ingest_tables(connector: DremioConnector, source: str):
+    """CreateTableRequest de toutes les tables d'une source, dans l'ordre de la topologie"""
+    state = connector.context.get()
+    state.database = source
+    requests = []
+    for schema_name in list(connector.get_database_schema_names()):
+        state.database_schema = schema_name
+        for table_name_and_type in list(connector.get_tables_name_and_type()):
+            requests.extend(either.right for either in connector.yield_table(table_name_and_type))
+    return requests
+
+
+def om_table(connector: DremioConnector, catalog: SyntheticCatalog, index: int):
+    """Entité Table OpenMetadata d'un dataset du catalogue simulé (entrée du profiler)"""
+    from metadata.generated.schema.entity.data.table import Column, Table
+
+    dataset = catalog.dataset(index)
+    return Table(
+        id=str(uuid.uuid4()),
+        name=dataset["path"][-1],
+        fullyQualifiedName=".".join(["dremio", *dataset["path"]]),
+        columns=[
+            Column(name=field["name"], dataType=connector._map_dremio_type_to_om(field["type"]["name"]))
+            for field in dataset["fields"]
+        ],
+    )
+
+
+def sql_queries(dremio) -> int:
+    return len(dremio.stats.durations.get("POST /api/v3/sql", []))
+
+
+class TestTopology:
+    """Schémas et tables depuis le préchargement de la source ou le snapshot partagé"""
+
+    def test_prefetch_and_snapshot_give_same_tables(self, catalog, tmp_path):
+        with MockDremioServer(catalog) as dremio:
+            crawled = ingest_tables(make_connector(dremio.url), "source_0")
+            options = {"snapshotPath": str(tmp_path / "snapshot.arrow")}
+            ingest_tables(make_connector(dremio.url, **options), "source_0")
+            listings = len(dremio.stats.durations["GET /api/v3/catalog/by-path"])
+            from_snapshot = ingest_tables(make_connector(dremio.url, **options), "source_0")
+            # snapshot frais: aucun listing de conteneur
+            assert len(dremio.stats.durations["GET /api/v3/catalog/by-path"]) == listings
+
+        expected = sorted(catalog.dataset(i)["path"][-1] for i in catalog.iter_datasets())
+        assert sorted(_value(r.name) for r in crawled) == expected
+        assert [(_value(r.name), len(r.columns)) for r in from_snapshot] == [(_value(r.name), len(r.columns)) for r in crawled]
+
+
+class TestProfiling:
+    """get_profile_metrics délègue aux moteurs de core.profiler et core.sample_profiler"""
+
+    def test_sql_engine_and_incremental_reuse(self, catalog, tmp_path):
+        options = {"incrementalProfiling": True, "stateDir": str(tmp_path)}
+        with MockDremioServer(catalog, rows_per_table=30) as dremio:
+            first = make_connector(dremio.url, **options)
+            table = om_table(first, catalog, 0)
+            table_profile, columns = first.get_profile_metrics(table)
+            first.close()
+            queries = sql_queries(dremio)
+
+            second = make_connector(dremio.url, **options)
+            reused_profile, reused_columns = second.get_profile_metrics(table)
+
+        assert table_profile.rowCount == 30
+        assert len(columns) == len(table.columns) and columns[0].valuesCount == 30
+        # dataset inchangé: nombre de lignes seulement, aucune requête par colonne
+        assert sql_queries(dremio) - queries < len(table.columns)
+        assert second._profile_reused == 1
+        assert reused_profile.rowCount == 30
+        assert [c.distinctCount for c in reused_columns] == [c.distinctCount for c in columns]
+
+    def test_sample_engine_one_query_per_table(self, catalog):
+        with MockDremioServer(catalog, rows_per_table=20) as dremio:
+            connector = make_connector(dremio.url, profileEngine="sample")
+            table = om_table(connector, catalog, 0)
+            table_profile, columns = connector.get_profile_metrics(table)
+
+        # une requête: l'échantillon (table plus petite que la limite) donne aussi le nombre de lignes
+        assert sql_queries(dremio) == 1
+        assert table_profile.rowCount == 20
+        assert {_value(c.name) for c in columns} == {_value(c.name) for c in table.columns}
+
+
+class TestDbtEnrichment:
+    """Descriptions et tags dbt appliqués depuis l'index en cache"""
+
+    @pytest.fixture
+    def dbt_options(self, tmp_path, catalog):
+        columns = [field["name"] for field in catalog.dataset(0)["fields"]]
+        manifest = {"nodes": {"model.analytics.table_0": {
+            "resource_type": "model",
+            "name": "table_0",
+            "description": "Table documentée par dbt",
+            "tags": ["finance", "daily"],
+            "columns": {columns[0].upper(): {"description": "Colonne documentée par dbt"}},
+        }}}
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps(manifest))
+        return {
+            "dbtEnabled": True,
+            "dbtManifestPath": str(manifest_path),
+            "dbtCachePath": str(tmp_path / "dbt_index.cache"),
+        }
+
+    def test_descriptions_and_tags_from_cached_index(self, catalog, dbt_options, monkeypatch):
+        with MockDremioServer(catalog) as dremio:
+            make_connector(dremio.url, **dbt_options)._get_dbt_index()
+
+            # second run: l'index vient du cache, les artefacts ne sont pas re-parsés
+            def no_parse(*args, **kwargs):
+                raise AssertionError("dbt artifacts parsed despite a valid cache")
+
+            monkeypatch.setattr(DbtIndex, "from_artifacts", classmethod(no_parse))
+            connector = make_connector(dremio.url, **dbt_options)
+            tag_requests = [either.right for either in connector.yield_tag("folder_0")]
+            table_requests = {_value(request.name): request for request in ingest_tables(connector, "source_0")}
+            # yield_tag est rappelé pour chaque schéma: les tags dbt ne sont créés qu'une fois
+            again = [either.right for either in connector.yield_tag("folder_1")]
+            assert not [r for r in again if _value(getattr(r, "classification", None)) == DBT_CLASSIFICATION]
+
+        classifications = [_value(r.name) for r in tag_requests if not hasattr(r, "classification")]
+        created = {f"{_value(r.classification)}.{_value(r.name)}" for r in tag_requests if hasattr(r, "classification")}
+        assert classifications == [DBT_CLASSIFICATION]
+        assert {"DBT.daily", "DBT.finance"} <= created
+
+        table = table_requests["table_0"]
+        labels = [_value(label.tagFQN) for label in table.tags]
+        assert labels == ["DBT.finance", "DBT.daily"] and set(labels) <= created
+        assert _value(table.description) == "Table documentée par dbt"
+        assert _value(table.columns[0].description) == "Colonne documentée par dbt"
+        assert _value(table.columns[1].description).startswith("Column from Dremio")
+        assert not table_requests["table_1"].tags
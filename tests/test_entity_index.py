@@ -0,0 +1,93 @@
+"""
+Tests unitaires pour l'index des entités OpenMetadata existantes (core.entity_index)
+"""
+import pytest
+
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer, MockOpenMetadataServer
+from dremio_connector.core.entity_index import CREATE, SKIP, UPDATE, EntityIndex, column_checksum
+from dremio_connector.core.sync_engine import DremioOpenMetadataSync, OpenMetadataSyncEngine
+
+
+@pytest.fixture
+def catalog():
+    return SyntheticCatalog(datasets=40, sources=2, fan_out=2, view_ratio=0)
+
+
+def _sync(dremio, om, **options) -> DremioOpenMetadataSync:
+    return DremioOpenMetadataSync(
+        dremio_url=dremio.url,
+        dremio_user="admin",
+        dremio_password="admin",
+        openmetadata_url=om.url,
+        jwt_token="token",
+        service_name="dremio",
+        progress_interval=0,
+        max_workers=4,
+        **options,
+    )
+
+
+class TestEntityIndex:
+    """Tests pour l'empreinte des colonnes et la décision create/update/skip"""
+
+    def test_checksum_ignores_other_fields(self):
+        columns = [{"name": "id", "dataType": "int", "ordinalPosition": 1}]
+
+        assert column_checksum(columns) == column_checksum([{"name": "id", "dataType": "INT", "description": None}])
+        assert column_checksum(columns) != column_checksum([{"name": "id", "dataType": "BIGINT"}])
+
+    def test_decide(self):
+        index = EntityIndex()
+        index.add_tables([{"id": "t1", "fullyQualifiedName": "s.d.x.t", "version": 0.2,
+                           "columns": [{"name": "id", "dataType": "INT"}]}])
+
+        assert index.decide("s.d.x.t", [{"name": "id", "dataType": "INT"}]) == SKIP
+        assert index.decide("s.d.x.t", [{"name": "id", "dataType": "VARCHAR"}]) == UPDATE
+        assert index.decide("s.d.x.other", []) == CREATE
+        assert index.table_id("s.d.x.t") == "t1"
+
+    def test_failed_listing_marks_index_incomplete(self):
+        with MockOpenMetadataServer() as om:
+            engine = OpenMetadataSyncEngine(om.url, "token", "dremio")
+            engine.list_entities = lambda collection, params: None
+            index = engine.build_index()
+
+        assert not index.complete and len(index) == 0
+
+
+class TestPrefetchedSync:
+    """Tests de la synchronisation guidée par l'index contre les serveurs simulés"""
+
+    def test_second_run_writes_nothing(self, catalog):
+        with MockDremioServer(catalog) as dremio, MockOpenMetadataServer() as om:
+            assert _sync(dremio, om, prefetch_index=True).sync()["tables_created"] == 40
+            puts = {endpoint: len(om.stats.durations[endpoint]) for endpoint in om.stats.durations if endpoint.startswith("PUT")}
+
+            sync = _sync(dremio, om, prefetch_index=True)
+            result = sync.sync()
+
+            for endpoint, count in puts.items():
+                assert len(om.stats.durations[endpoint]) == count
+            # une liste de schémas et une de tables par database
+            assert len(om.stats.durations["GET /v1/tables"]) == 2
+        assert (result["tables_created"], result["tables_skipped"], result["errors"]) == (0, 40, 0)
+        assert len(sync.om.table_ids) == 40
+
+    def test_changed_columns_are_rewritten(self, catalog):
+        with MockDremioServer(catalog) as dremio, MockOpenMetadataServer() as om:
+            _sync(dremio, om).sync()
+            changed = next(fqn for fqn, record in om.records.items() if record["kind"] == "table")
+            om.records[changed]["columns"] = [{"name": "dropped", "dataType": "INT"}]
+
+            result = _sync(dremio, om, prefetch_index=True).sync()
+
+        assert (result["tables_created"], result["tables_skipped"]) == (1, 39)
+        assert om.records[changed]["version"] == pytest.approx(0.2)
+
+    def test_dry_run_counts_unchanged_tables(self, catalog):
+        with MockDremioServer(catalog) as dremio, MockOpenMetadataServer() as om:
+            _sync(dremio, om).sync()
+            plan = _sync(dremio, om, prefetch_index=True).sync(dry_run=True)
+
+        assert (plan["tables"], plan["tables_unchanged"]) == (0, 40)
@@ -0,0 +1,84 @@
+"""
+Tests unitaires pour les filtres include/exclude et l'élagage de la découverte
+"""
+import pytest
+
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer
+from dremio_connector.core.filters import PathFilter, split_patterns
+from dremio_connector.core.sync_engine import DremioAutoDiscovery
+
+
+class TestPathFilter:
+    """Tests pour l'évaluation des motifs sur les préfixes du path"""
+
+    def test_exclude_covers_the_subtree(self):
+        path_filter = PathFilter(exclude=["scratch*"])
+
+        assert not path_filter.explore(["scratch_alice"])
+        assert not path_filter.accept(["Scratch_Bob", "tmp", "t"])
+        assert path_filter.accept(["lake", "scratch_in_name"])
+
+    def test_include_explores_only_matching_branches(self):
+        path_filter = PathFilter(include=["lake.sales.*"])
+
+        assert path_filter.explore(["lake"])
+        assert path_filter.explore(["lake", "sales"])
+        assert not path_filter.explore(["lake", "hr"])
+        assert not path_filter.explore(["other"])
+        assert not path_filter.accept(["lake", "sales"])
+        assert path_filter.accept(["lake", "sales", "orders"])
+
+    def test_star_may_span_several_segments(self):
+        path_filter = PathFilter(include=["lake.*.orders"])
+
+        assert path_filter.explore(["lake", "a", "b"])
+        assert path_filter.accept(["lake", "a", "b", "orders"])
+        assert not path_filter.explore(["other", "a"])
+
+    def test_regex_rules(self):
+        path_filter = PathFilter(include=["re:(prod|dwh)\\..*"], exclude=["re:.*\\.tmp_[0-9]+"])
+
+        assert path_filter.explore(["anything"])
+        assert path_filter.accept(["dwh", "sales", "orders"])
+        assert not path_filter.accept(["dwh", "sales", "tmp_42"])
+        assert not path_filter.accept(["dev", "sales", "orders"])
+
+    def test_empty_filter_keeps_everything(self):
+        assert not PathFilter()
+        assert PathFilter().explore(["x"]) and PathFilter().accept(["x", "y"])
+        assert split_patterns(" scratch*, re:^dev_.* ,") == ["scratch*", "re:^dev_.*"]
+
+
+class TestDiscoveryPruning:
+    """Tests de l'élagage pendant la découverte, contre le serveur simulé"""
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_excluded_sources_are_never_listed(self, max_workers):
+        catalog = SyntheticCatalog(datasets=60, sources=3, fan_out=2)
+        with MockDremioServer(catalog) as dremio:
+            client = DremioAutoDiscovery(
+                dremio.url, "admin", "admin", max_workers=max_workers,
+                path_filter=PathFilter(exclude=["source_1", "source_2"])
+            )
+            assert client.authenticate()
+            resources = client.discover_all_resources()
+
+        datasets = [r for r in resources if r["type"] == "dataset"]
+        assert datasets and all(r["path"][0] == "source_0" for r in resources)
+        assert len(dremio.stats.durations["GET /api/v3/catalog/{id}"]) == len(datasets)
+        assert client.pruned == 2
+
+    def test_include_prunes_sibling_folders(self):
+        catalog = SyntheticCatalog(datasets=40, sources=2, fan_out=4)
+        with MockDremioServer(catalog) as dremio:
+            client = DremioAutoDiscovery(
+                dremio.url, "admin", "admin", path_filter=PathFilter(include=["source_0.folder_1"])
+            )
+            assert client.authenticate()
+            resources = client.discover_all_resources()
+
+        assert resources
+        assert all(r["full_path"].startswith("source_0.folder_1") for r in resources)
+        listed = dremio.stats.durations["GET /api/v3/catalog/by-path"]
+        assert len(listed) == 2  # source_0 puis source_0/folder_1
@@ -0,0 +1,119 @@
+"""
+Tests unitaires pour le transport Arrow Flight des requêtes SQL (core.flight)
+"""
+import json
+
+import pytest
+
+flight = pytest.importorskip("pyarrow.flight")
+
+from dremio_connector import cli
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.flight_server import MockFlightServer
+from dremio_connector.benchmark.servers import MockDremioServer
+from dremio_connector.core.flight import flight_location
+from dremio_connector.core.sync_engine import DremioAutoDiscovery
+
+SQL_ENDPOINT = "POST /api/v3/sql"
+TABLES_QUERY = 'SELECT * FROM INFORMATION_SCHEMA."TABLES"'
+COUNT_QUERY = 'SELECT COUNT(*) as row_count FROM "source_0"."folder_0"."table_0"'
+
+
+@pytest.fixture
+def catalog():
+    return SyntheticCatalog(datasets=1200, sources=2, fan_out=2, view_ratio=0)
+
+
+class TestFlightTransport:
+    """Tests des requêtes SQL en Flight et du repli REST"""
+
+    def test_location(self):
+        assert flight_location("http://dremio:9047") == "grpc+tcp://dremio:32010"
+        assert flight_location("https://dremio.example.com", 443, tls=True) == "grpc+tls://dremio.example.com:443"
+
+    def test_queries_go_through_flight(self, catalog):
+        with MockDremioServer(catalog, rows_per_table=30) as dremio, MockFlightServer(dremio) as flight:
+            client = DremioAutoDiscovery(dremio.url, "admin", "admin", flight_port=flight.port)
+            assert client.authenticate() and client.flight is not None
+
+            count = client.execute_sql_query(COUNT_QUERY)
+            rows = list(client.iter_sql_rows(TABLES_QUERY))
+            table = client.execute_sql_arrow(TABLES_QUERY)
+            first_page = client.execute_sql_query(TABLES_QUERY)
+
+        assert count["rows"] == [{"row_count": 30}]
+        # pas de pagination à 500 lignes
+        assert len(rows) == table.num_rows == 1200
+        assert table.column_names == ["TABLE_SCHEMA", "TABLE_NAME"]
+        # execute_sql_query: première page seulement, comme en REST
+        assert (first_page["rowCount"], len(first_page["rows"])) == (1200, 500)
+        assert len(flight.queries) == 4
+        assert SQL_ENDPOINT not in dremio.stats.durations
+
+    def test_rest_fallback(self, catalog):
+        with MockDremioServer(catalog, rows_per_table=30) as dremio:
+            with MockFlightServer(dremio) as flight:
+                client = DremioAutoDiscovery(dremio.url, "admin", "admin", flight_port=flight.port)
+                assert client.authenticate()
+            # serveur Flight arrêté en cours de run: requête rejouée en REST
+            assert client.execute_sql_query(COUNT_QUERY)["rows"] == [{"row_count": 30}]
+            assert client.flight is None
+
+            unreachable = DremioAutoDiscovery(dremio.url, "admin", "admin", flight_port=flight.port)
+            assert unreachable.authenticate() and unreachable.flight is None
+            assert len(list(unreachable.iter_sql_rows(TABLES_QUERY))) == 1200
+            first_page = unreachable.execute_sql_query(TABLES_QUERY)
+            assert (first_page["rowCount"], len(first_page["rows"])) == (1200, 500)
+
+    def test_cli_profile_over_flight(self, tmp_path):
+        catalog = SyntheticCatalog(datasets=4, sources=1, fan_out=2, view_ratio=0)
+        output = tmp_path / "profiles.jsonl"
+        with MockDremioServer(catalog, rows_per_table=30) as dremio, MockFlightServer(dremio) as flight:
+            assert cli.main([
+                "profile", "--dremio-url", dremio.url, "--dremio-user", "admin", "--dremio-password", "admin",
+                "--flight-port", str(flight.port), "--progress-interval", "0", "-o", str(output),
+            ]) == 0
+
+        profiles = [json.loads(line) for line in output.read_text().splitlines()]
+        assert [p["row_count"] for p in profiles] == [30] * 4
+        assert SQL_ENDPOINT not in dremio.stats.durations
+
+    def test_first_page_streams_and_counts_without_total_records(self, catalog, monkeypatch):
+        with MockDremioServer(catalog, rows_per_table=30) as dremio, MockFlightServer(dremio) as flight_server:
+            get_flight_info = flight_server.get_flight_info
+
+            def without_total(context, descriptor):
+                info = get_flight_info(context, descriptor)
+                return flight.FlightInfo(info.schema, descriptor, info.endpoints, -1, -1)
+
+            client = DremioAutoDiscovery(dremio.url, "admin", "admin", flight_port=flight_server.port)
+            assert client.authenticate()
+            with_total = client.execute_sql_query(TABLES_QUERY)
+            monkeypatch.setattr(flight_server, "get_flight_info", without_total)
+            counted = client.execute_sql_query(TABLES_QUERY)
+
+        assert (with_total["rowCount"], len(with_total["rows"])) == (1200, 500)
+        # sans total_records, les batches restants sont comptés
+        assert (counted["rowCount"], counted["rows"]) == (1200, with_total["rows"])
+
+    def test_interrupted_stream_is_never_a_complete_result(self, catalog, monkeypatch):
+        with MockDremioServer(catalog, rows_per_table=30) as dremio, MockFlightServer(dremio) as flight_server:
+
+            def broken_stream(context, ticket):
+                table = flight_server._results.pop(ticket.ticket)
+
+                def batches():
+                    yield table.slice(0, 100).to_batches()[0]
+                    raise flight.FlightInternalError("stream reset")
+
+                return flight.GeneratorStream(table.schema, batches())
+
+            monkeypatch.setattr(flight_server, "do_get", broken_stream)
+            client = DremioAutoDiscovery(dremio.url, "admin", "admin", flight_port=flight_server.port)
+            assert client.authenticate()
+            rows = []
+            with pytest.raises(RuntimeError, match="after 100 rows"):
+                for row in client.iter_sql_rows(TABLES_QUERY):
+                    rows.append(row)
+
+        assert len(rows) == 100
@@ -0,0 +1,45 @@
+"""
+Tests unitaires pour l'aplatissement des dossiers imbriqués en schémas
+"""
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer
+from dremio_connector.core.sync_engine import DremioAutoDiscovery, organize_hierarchy, split_dataset_path
+
+
+class TestOrganizeHierarchy:
+    """Tests pour la convention Database → Schema → Table"""
+
+    def test_nested_folders_are_joined(self):
+        resources = [
+            {"path": ["lake"], "type": "source"},
+            {"path": ["lake", "raw"], "type": "folder"},
+            {"path": ["lake", "raw", "2024", "orders"], "type": "dataset"},
+            {"path": ["lake", "customers"], "type": "dataset"},
+        ]
+
+        schemas = organize_hierarchy(resources)["lake"]["schemas"]
+
+        assert list(schemas) == ["raw", "raw.2024", "customers"]
+        assert [t["path"][-1] for t in schemas["raw.2024"]["tables"]] == ["orders"]
+        assert split_dataset_path(["lake", "raw", "2024", "orders"]) == ("lake", "raw.2024", "orders")
+
+
+class TestDiscoverSubtree:
+    """Tests pour le parcours d'une seule source (prefetch de la topologie)"""
+
+    def test_deep_source_is_walked_once(self):
+        catalog = SyntheticCatalog(datasets=90, sources=2, depth=3, fan_out=3)
+        with MockDremioServer(catalog) as dremio:
+            client = DremioAutoDiscovery(dremio.url, "admin", "admin", max_workers=4)
+            assert client.authenticate()
+            resources = client.discover_subtree({"path": ["source_1"], "type": "CONTAINER", "containerType": "SOURCE"})
+
+        expected = [i for i in catalog.iter_datasets() if catalog.dataset_path(i)[0] == "source_1"]
+        schemas = organize_hierarchy(resources)["source_1"]["schemas"]
+        tables = [t for schema in schemas.values() for t in schema["tables"]]
+        assert len(tables) == len(expected)
+        assert all(len(t["path"]) == 5 and t["columns"] for t in tables)
+        assert "folder_0.folder_1.folder_2" in schemas
+        # une requête par conteneur (1 source + 3 + 9 + 27 dossiers), une par dataset
+        assert len(dremio.stats.durations["GET /api/v3/catalog/by-path"]) == 40
+        assert len(dremio.stats.durations["GET /api/v3/catalog/{id}"]) == len(expected)
@@ -0,0 +1,81 @@
+"""
+Tests du budget d'import: dremio_connector et core.sync_engine doivent
+s'importer en quelques millisecondes (-X importtime), sans charger requests,
+openmetadata-ingestion ni multiprocessing.
+"""
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Budgets en microsecondes (temps cumulé rapporté par -X importtime), avec de
+# la marge pour les machines de CI: ~1 ms et ~30 ms mesurés en local
+BUDGETS_US = {
+    "dremio_connector": 20_000,
+    "dremio_connector.core.sync_engine": 75_000,
+}
+
+HEAVY_MODULES = ("requests", "urllib3", "metadata", "multiprocessing", "http.server")
+
+
+def _python(code: str, pycache: Path, *flags: str) -> subprocess.CompletedProcess:
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    env["PYTHONPATH"] = str(ROOT)
+    return subprocess.run(
+        [sys.executable, "-X", f"pycache_prefix={pycache}", *flags, "-c", code],
+        capture_output=True, text=True, env=env, cwd=ROOT, check=True,
+    )
+
+
+def _cumulative_us(stderr: str, module: str) -> int:
+    for line in stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} absent de la sortie -X importtime")
+
+
+@pytest.fixture(scope="module")
+def pycache(tmp_path_factory):
+    """Bytecode compilé une fois: on mesure l'import, pas la compilation"""
+    path = tmp_path_factory.mktemp("pycache")
+    _python("import dremio_connector.core.sync_engine", path)
+    return path
+
+
+class TestImportTime:
+    """Tests pour le coût d'import du connecteur"""
+
+    @pytest.mark.parametrize("module", sorted(BUDGETS_US))
+    def test_import_within_budget(self, module, pycache):
+        samples = [
+            _cumulative_us(_python(f"import {module}", pycache, "-X", "importtime").stderr, module)
+            for _ in range(3)
+        ]
+
+        assert statistics.median(samples) < BUDGETS_US[module], samples
+
+    def test_heavy_modules_are_loaded_on_first_use(self, pycache):
+        code = (
+            "import sys, importlib.util, dremio_connector, dremio_connector.core.sync_engine\n"
+            f"for name in {HEAVY_MODULES!r}:\n"
+            "    module = sys.modules.get(name)\n"
+            "    if module is not None and not isinstance(module, importlib.util._LazyModule):\n"
+            "        print(name)\n"
+        )
+
+        assert _python(code, pycache).stdout.split() == []
+
+    def test_package_exports_resolve_lazily(self, pycache):
+        code = (
+            "import sys, dremio_connector\n"
+            "assert 'dremio_connector.core.sync_engine' not in sys.modules\n"
+            "print(dremio_connector.DremioAutoDiscovery.__module__)\n"
+        )
+
+        assert _python(code, pycache).stdout.strip() == "dremio_connector.core.sync_engine"
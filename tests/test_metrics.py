@@ -0,0 +1,131 @@
+"""
+Tests unitaires pour les métriques Prometheus du connecteur
+"""
+import urllib.request
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from dremio_connector.core import metrics
+from dremio_connector.core.metrics import MetricsRegistry
+from dremio_connector.core.sync_engine import DremioAutoDiscovery, http_request
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    metrics.REGISTRY.reset()
+    yield
+    metrics.REGISTRY.reset()
+
+
+def response(status=200, payload=None, content=b"{}"):
+    resp = Mock(status_code=status, content=content)
+    resp.request = Mock(body=b'{"sql": "SELECT 1"}')
+    resp.json.return_value = payload or {}
+    return resp
+
+
+class TestRegistry:
+    """Tests pour le rendu au format texte Prometheus"""
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", ("endpoint",), buckets=(0.1, 1.0))
+        histogram.observe("/a", value=0.05)
+        histogram.observe("/a", value=0.5)
+        histogram.observe("/a", value=5)
+
+        text = registry.render()
+
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{endpoint="/a",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{endpoint="/a",le="1"} 2' in text
+        assert 'latency_seconds_bucket{endpoint="/a",le="+Inf"} 3' in text
+        assert 'latency_seconds_count{endpoint="/a"} 3' in text
+        assert 'latency_seconds_sum{endpoint="/a"} 5.55' in text
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors", ("reason",)).inc('say "hi"\n')
+
+        assert 'errors_total{reason="say \\"hi\\"\\n"} 1' in registry.render()
+
+    def test_wrong_label_count_is_rejected(self):
+        counter = MetricsRegistry().counter("c_total", "C", ("a", "b"))
+        with pytest.raises(ValueError):
+            counter.inc("only_one")
+
+    def test_textfile_and_http_endpoint(self, tmp_path):
+        metrics.STAGE_DURATION.observe("discovery", value=1.5)
+        path = tmp_path / "node_exporter" / "dremio.prom"
+
+        metrics.write_textfile(str(path))
+        server = metrics.start_metrics_server(0, addr="127.0.0.1")
+        try:
+            port = server.server_address[1]
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as resp:
+                body = resp.read().decode("utf-8")
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert 'dremio_connector_stage_duration_seconds_count{stage="discovery"} 1' in path.read_text()
+        assert body == metrics.render()
+
+
+class TestHttpInstrumentation:
+    """Tests pour l'instrumentation des appels HTTP"""
+
+    @patch('dremio_connector.core.sync_engine.requests')
+    def test_latency_status_and_bytes_per_endpoint(self, mock_requests):
+        mock_requests.post.return_value = response(content=b'{"id": "job-1"}')
+
+        http_request("POST", "http://d/api/v3/sql", "dremio", "/api/v3/sql", json={"sql": "SELECT 1"})
+
+        assert metrics.HTTP_REQUEST_DURATION.count("dremio", "POST", "/api/v3/sql", "200") == 1
+        assert metrics.HTTP_REQUEST_BYTES.value("dremio", "/api/v3/sql") == 19
+        assert metrics.HTTP_RESPONSE_BYTES.value("dremio", "/api/v3/sql") == 15
+        assert metrics.HTTP_IN_FLIGHT.value("dremio", "/api/v3/sql") == 0
+
+    @patch('dremio_connector.core.sync_engine.time.sleep')
+    @patch('dremio_connector.core.sync_engine.requests')
+    def test_get_is_retried_after_timeout_and_5xx(self, mock_requests, mock_sleep):
+        mock_requests.get.side_effect = [requests.Timeout(), response(503), response(200)]
+
+        resp = http_request("GET", "http://d/api/v3/catalog", "dremio", "/api/v3/catalog", retries=2)
+
+        assert resp.status_code == 200
+        assert metrics.HTTP_TIMEOUTS.value("dremio", "/api/v3/catalog") == 1
+        assert metrics.HTTP_RETRIES.value("dremio", "/api/v3/catalog") == 2
+        assert metrics.HTTP_REQUEST_DURATION.count("dremio", "GET", "/api/v3/catalog", "timeout") == 1
+        assert metrics.HTTP_REQUEST_DURATION.count("dremio", "GET", "/api/v3/catalog", "503") == 1
+        assert mock_sleep.call_count == 2
+
+    @patch('dremio_connector.core.sync_engine.requests')
+    def test_writes_are_never_retried(self, mock_requests):
+        mock_requests.put.return_value = response(503)
+
+        resp = http_request("PUT", "http://om/v1/tables", "openmetadata", "/v1/tables", retries=3)
+
+        assert resp.status_code == 503
+        assert mock_requests.put.call_count == 1
+        assert metrics.HTTP_RETRIES.value("openmetadata", "/v1/tables") == 0
+
+    @patch('dremio_connector.core.sync_engine.requests')
+    def test_sql_job_queue_and_execution_times(self, mock_requests):
+        mock_requests.get.return_value = response(payload={
+            "jobState": "COMPLETED",
+            "resourceSchedulingStartedAt": "2024-01-15T10:00:00.000Z",
+            "resourceSchedulingEndedAt": "2024-01-15T10:00:02.000Z",
+            "startedAt": "2024-01-15T10:00:00.000Z",
+            "endedAt": "2024-01-15T10:00:05.500Z",
+        })
+        client = DremioAutoDiscovery("http://d", "u", "p")
+
+        assert client._wait_for_job("job-1")
+
+        assert metrics.SQL_JOB_QUEUE.count() == 1
+        assert metrics.SQL_JOB_WALL.count("COMPLETED") == 1
+        assert 'dremio_connector_sql_job_queue_seconds_sum 2' in metrics.render()
+        assert 'dremio_connector_sql_job_execution_seconds_sum 5.5' in metrics.render()
@@ -0,0 +1,151 @@
+"""
+Tests unitaires pour l'écriture tamponnée des profils (core.profile_sink)
+"""
+import json
+import threading
+from unittest.mock import Mock, patch
+
+from dremio_connector import cli
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer, MockOpenMetadataServer
+from dremio_connector.core.profile_sink import FAILED, REJECTED, WRITTEN, ProfileSink
+from dremio_connector.core.profiler import table_profile_payload
+from dremio_connector.core.sync_engine import DremioOpenMetadataSync, OpenMetadataSyncEngine
+
+
+class _Writer:
+    """Writer enregistrant les appels, en échec tant que ``available`` est faux"""
+
+    def __init__(self, available: bool = True):
+        self.available = available
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, table_id, payload):
+        with self.lock:
+            self.calls.append(table_id)
+        return self.available
+
+
+class TestProfileSink:
+    """Tests pour les lots, le spool et le replay"""
+
+    def test_profiles_are_written_in_batches(self, tmp_path):
+        writer = _Writer()
+        with ProfileSink(writer, tmp_path / "spool.jsonl", batch_size=8, max_queue=4, max_workers=4) as sink:
+            for i in range(50):
+                sink.put(f"t{i}", {"tableProfile": {"rowCount": i}})
+
+        assert sorted(writer.calls) == sorted(f"t{i}" for i in range(50))
+        assert sink.stats == {"written": 50, "failed": 0, "rejected": 0, "spooled": 0, "replayed": 0}
+        assert not (tmp_path / "spool.jsonl").exists()
+
+    def test_unavailable_server_spills_then_replays(self, tmp_path):
+        spool = tmp_path / "spool.jsonl"
+        down = _Writer(available=False)
+        with ProfileSink(down, spool, batch_size=5) as sink:
+            for i in range(12):
+                sink.put(f"t{i}", {"tableProfile": {"rowCount": i}})
+
+        # premier lot tenté puis le reste directement dans le spool
+        assert len(down.calls) == 5
+        assert sink.stats["spooled"] == 12
+        assert len(spool.read_text().splitlines()) == 12
+
+        with open(spool, "a", encoding="utf-8") as f:
+            f.write('{"table_id": "tronq')
+        up = _Writer()
+        with ProfileSink(up, spool, batch_size=5) as sink:
+            sink.put("new", {})
+
+        assert sorted(up.calls) == sorted([f"t{i}" for i in range(12)] + ["new"])
+        assert (sink.stats["replayed"], sink.stats["written"], sink.stats["spooled"]) == (12, 13, 0)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_rejected_replay_does_not_block_new_profiles(self, tmp_path):
+        spool = tmp_path / "spool.jsonl"
+        spool.write_text("".join(
+            json.dumps({"table_id": f"deleted{i}", "profile": {}}) + "\n" for i in range(3)
+        ))
+        calls = []
+
+        def writer(table_id, payload):
+            calls.append(table_id)
+            return REJECTED if table_id.startswith("deleted") else WRITTEN
+
+        with ProfileSink(writer, spool, batch_size=8) as sink:
+            for i in range(5):
+                sink.put(f"t{i}", {})
+
+        # profils de la table supprimée abandonnés, pas remis dans le spool
+        assert sorted(calls) == sorted([f"deleted{i}" for i in range(3)] + [f"t{i}" for i in range(5)])
+        assert (sink.stats["written"], sink.stats["rejected"], sink.stats["spooled"]) == (5, 3, 0)
+        assert not sink.unavailable
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failed_replay_does_not_mark_server_unavailable(self, tmp_path):
+        spool = tmp_path / "spool.jsonl"
+        spool.write_text(json.dumps({"table_id": "flaky", "profile": {}}) + "\n")
+
+        def writer(table_id, payload):
+            return FAILED if table_id == "flaky" else WRITTEN
+
+        with ProfileSink(writer, spool, batch_size=8) as sink:
+            for i in range(5):
+                sink.put(f"t{i}", {})
+
+        assert (sink.stats["written"], sink.stats["failed"], sink.stats["spooled"]) == (5, 1, 1)
+        assert not sink.unavailable
+        assert [json.loads(line)["table_id"] for line in spool.read_text().splitlines()] == ["flaky"]
+
+    @patch("dremio_connector.core.sync_engine.requests")
+    def test_put_table_profile_separates_rejections_from_failures(self, mock_requests):
+        engine = OpenMetadataSyncEngine("http://om/api", "jwt", "dremio")
+        results = {}
+        for status in (201, 404, 400, 429, 503):
+            mock_requests.put.return_value = Mock(status_code=status, content=b"")
+            results[status] = engine.put_table_profile("id", {})
+
+        assert results == {201: WRITTEN, 404: REJECTED, 400: REJECTED, 429: FAILED, 503: FAILED}
+
+    def test_payload_from_profile_dataset(self):
+        profile = {
+            "path": ["lake", "orders"],
+            "row_count": 10,
+            "columns": {
+                "id": {"total_count": 10, "non_null_count": 8, "distinct_count": 5, "min_value": 1, "max_value": 9},
+                "label": {"total_count": 10, "non_null_count": 10, "distinct_count": 2, "avg_length": 4.5},
+            },
+        }
+
+        payload = table_profile_payload(profile, 1000, column_count=3)
+
+        assert payload["tableProfile"] == {"timestamp": 1000, "rowCount": 10, "columnCount": 3, "profileSample": 100.0}
+        id_profile, label_profile = payload["columnProfile"]
+        assert (id_profile["nullCount"], id_profile["nullProportion"], id_profile["max"]) == (2, 0.2, 9.0)
+        assert label_profile["meanLength"] == 4.5 and "min" not in label_profile
+
+
+class TestProfilePush:
+    """Tests de ``dremio-connector profile --push`` contre les serveurs simulés"""
+
+    def test_cli_pushes_profiles(self, tmp_path):
+        catalog = SyntheticCatalog(datasets=12, sources=2, fan_out=2, view_ratio=0)
+        with MockDremioServer(catalog, rows_per_table=10) as dremio, MockOpenMetadataServer() as om:
+            DremioOpenMetadataSync(
+                dremio.url, "admin", "admin", om.url, "token", "dremio", progress_interval=0
+            ).sync()
+            code = cli.main([
+                "profile", "--dremio-url", dremio.url, "--dremio-user", "admin", "--dremio-password", "admin",
+                "--openmetadata-url", om.url, "--jwt-token", "token", "--push", "--concurrency", "4",
+                "--state-dir", str(tmp_path), "--progress-interval", "0", "-o", str(tmp_path / "p.jsonl"),
+            ])
+
+        assert code == 0
+        assert len(om.profiles) == 12
+        profile = next(iter(om.profiles.values()))
+        assert profile["tableProfile"]["rowCount"] == 10
+        assert len(profile["columnProfile"]) == profile["tableProfile"]["columnCount"]
+        assert len((tmp_path / "p.jsonl").read_text().splitlines()) == 12
+        assert not list(tmp_path.glob("profile_spool_*"))
+        assert json.loads((tmp_path / "p.jsonl").read_text().splitlines()[0])["row_count"] == 10
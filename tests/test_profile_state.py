@@ -0,0 +1,85 @@
+"""
+Tests unitaires pour le profiling incrémental (core.profile_state)
+"""
+import json
+
+import pytest
+
+from dremio_connector import cli
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer
+from dremio_connector.core.profile_state import ProfileState
+
+SQL_ENDPOINT = "POST /api/v3/sql"
+
+
+@pytest.fixture
+def catalog():
+    return SyntheticCatalog(datasets=10, sources=2, fan_out=2, view_ratio=0, columns=(3, 3))
+
+
+def _profile(dremio, tmp_path, *options) -> list:
+    output = tmp_path / "profiles.jsonl"
+    assert cli.main([
+        "profile", "--dremio-url", dremio.url, "--dremio-user", "admin", "--dremio-password", "admin",
+        "--state-dir", str(tmp_path), "--progress-interval", "0", "-o", str(output), "--incremental", *options,
+    ]) == 0
+    return [json.loads(line) for line in output.read_text().splitlines()]
+
+
+def _queries(dremio) -> int:
+    return len(dremio.stats.durations[SQL_ENDPOINT])
+
+
+class TestProfileState:
+    """Tests pour les conditions de réutilisation d'un profil"""
+
+    def test_previous_requires_same_tag_and_sampling(self, tmp_path):
+        state = ProfileState("http://dremio:9047", str(tmp_path))
+        state.record(["lake", "orders"], "t1", None, 10, {"id": {"total_count": 10}})
+        state.record(["lake", "untagged"], None, None, 10, {})
+        state.save()
+
+        loaded = ProfileState("http://dremio:9047", str(tmp_path)).load()
+
+        assert loaded.previous(["lake", "orders"], "t1")["columns"] == {"id": {"total_count": 10}}
+        assert loaded.previous(["lake", "orders"], "t2") is None
+        assert loaded.previous(["lake", "orders"], "t1", sample_rows=100) is None
+        assert loaded.previous(["lake", "orders"], "t1", max_age=-1) is None
+        assert loaded.previous(["lake", "untagged"], None) is None
+
+
+class TestIncrementalProfiling:
+    """Tests de ``dremio-connector profile --incremental`` contre le serveur simulé"""
+
+    def test_unchanged_tables_only_cost_a_row_count(self, catalog, tmp_path):
+        with MockDremioServer(catalog, rows_per_table=10) as dremio:
+            first = _profile(dremio, tmp_path)
+            queries = _queries(dremio)
+            second = _profile(dremio, tmp_path)
+
+            # un COUNT(*) par table et la lecture de sys.reflections, aucune requête par colonne
+            assert _queries(dremio) - queries == 11
+        assert not any(p["reused"] for p in first) and all(p["reused"] for p in second)
+        assert [p["columns"] for p in second] == [p["columns"] for p in first]
+
+    def test_changed_row_count_or_tag_is_profiled_again(self, catalog, tmp_path):
+        with MockDremioServer(catalog, rows_per_table=10) as dremio:
+            _profile(dremio, tmp_path)
+            dremio.rows_per_table = 20
+            grown = _profile(dremio, tmp_path)
+
+            dataset = catalog.dataset
+            catalog.dataset = lambda index: {**dataset(index), "tag": "new"} if index == 0 else dataset(index)
+            retagged = _profile(dremio, tmp_path)
+
+        assert not any(p["reused"] for p in grown)
+        assert grown[0]["columns"]["id"]["total_count"] == 20
+        assert [p["reused"] for p in retagged].count(False) == 1
+
+    def test_stale_profiles_are_recomputed(self, catalog, tmp_path):
+        with MockDremioServer(catalog, rows_per_table=10) as dremio:
+            _profile(dremio, tmp_path)
+            again = _profile(dremio, tmp_path, "--profile-max-age", "0")
+
+        assert not any(p["reused"] for p in again)
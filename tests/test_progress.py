@@ -0,0 +1,88 @@
+"""
+Tests unitaires pour les logs de progression agrégés
+"""
+import logging
+from unittest.mock import Mock, patch
+
+from dremio_connector.core.progress import ProgressLogger, format_eta
+from dremio_connector.core.sync_engine import DremioAutoDiscovery
+
+logger = logging.getLogger("tests.progress")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestProgressLogger:
+    """Tests pour la ligne de progression périodique"""
+
+    def test_rate_limited_with_rate_and_eta(self, caplog):
+        clock = FakeClock()
+        progress = ProgressLogger(logger, "Tables", total=100, interval=10, clock=clock)
+
+        with caplog.at_level(logging.INFO, logger="tests.progress"):
+            for i in range(50):
+                clock.now = i * 0.1
+                progress.advance(item=f"t{i}")
+            clock.now = 10.0
+            progress.advance(item="t50")
+
+        assert len(caplog.records) == 1
+        assert caplog.records[0].getMessage() == "📊 Tables: 51/100 (5.1/s, ETA 9s) — ex: t50"
+
+    def test_final_line_and_disabled_mode(self, caplog):
+        clock = FakeClock()
+        progress = ProgressLogger(logger, "Découverte", interval=5, clock=clock)
+        disabled = ProgressLogger(logger, "Off", interval=0, clock=clock)
+
+        with caplog.at_level(logging.INFO, logger="tests.progress"):
+            for _ in range(30):
+                progress.advance()
+                disabled.advance()
+            clock.now = 3.0
+            progress.finish()
+            disabled.finish()
+
+        assert [r.getMessage() for r in caplog.records] == ["📊 Découverte: 30 items (10.0/s, en 3s)"]
+
+    def test_nothing_formatted_when_level_disabled(self):
+        quiet = Mock(isEnabledFor=Mock(return_value=False))
+        clock = FakeClock()
+        progress = ProgressLogger(quiet, "Tables", interval=1, clock=clock)
+
+        clock.now = 5.0
+        progress.advance()
+
+        quiet.log.assert_not_called()
+
+    def test_format_eta(self):
+        assert format_eta(45) == "45s"
+        assert format_eta(192) == "3m12s"
+        assert format_eta(7500) == "2h05m"
+
+
+class TestDiscoveryLogging:
+    """Tests pour les logs de découverte: DEBUG par item, INFO agrégé"""
+
+    @patch('dremio_connector.core.sync_engine.requests')
+    def test_per_item_logs_are_debug(self, mock_requests, caplog):
+        root = Mock(status_code=200, content=b"")
+        root.json.return_value = {"data": [
+            {"id": f"ds-{i}", "path": ["src", f"t{i}"], "type": "DATASET"} for i in range(20)
+        ]}
+        schema = Mock(status_code=200, content=b"")
+        schema.json.return_value = {"fields": [{"name": "id", "type": {"name": "BIGINT"}}]}
+        mock_requests.get.side_effect = [root] + [schema] * 20
+        client = DremioAutoDiscovery("http://d", "u", "p", progress_interval=0)
+
+        with caplog.at_level(logging.INFO, logger="dremio_connector"):
+            resources = client.discover_all_resources()
+
+        assert len(resources) == 20
+        assert not [r for r in caplog.records if r.getMessage().startswith("✓")]
+        assert len(caplog.records) <= 4
@@ -0,0 +1,129 @@
+"""
+Tests unitaires pour la réconciliation mark-and-sweep des tables supprimées
+"""
+import pytest
+
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer, MockOpenMetadataServer
+from dremio_connector.core.filters import PathFilter
+from dremio_connector.core.reconcile import dremio_path, exceeds_threshold, find_stale, split_fqn
+from dremio_connector.core.sync_engine import DremioOpenMetadataSync, OpenMetadataSyncEngine
+
+
+@pytest.fixture
+def servers():
+    catalog = SyntheticCatalog(datasets=40, sources=2, fan_out=2, view_ratio=0)
+    with MockDremioServer(catalog) as dremio, MockOpenMetadataServer() as om:
+        yield dremio, om
+
+
+def _sync(dremio, om, **options) -> DremioOpenMetadataSync:
+    return DremioOpenMetadataSync(
+        dremio_url=dremio.url,
+        dremio_user="admin",
+        dremio_password="admin",
+        openmetadata_url=om.url,
+        jwt_token="token",
+        service_name="dremio",
+        progress_interval=0,
+        **options,
+    )
+
+
+def _stale_tables(om, names, schema="dremio.source_0.folder_0"):
+    """Tables présentes dans OpenMetadata mais plus dans Dremio"""
+    engine = OpenMetadataSyncEngine(om.url, "token", "dremio")
+    for name in names:
+        engine.create_or_update_table(schema, name, [])
+    return {f"{schema}.{name}" for name in names}
+
+
+class TestStaleReport:
+    """Tests pour le diff des FQN (sans lecture par table)"""
+
+    def test_fqn_back_to_dremio_path(self):
+        assert split_fqn('svc.lake."raw.2024".orders') == ["svc", "lake", "raw.2024", "orders"]
+        assert dremio_path('svc.lake."raw.2024".orders') == ["lake", "raw", "2024", "orders"]
+        assert dremio_path("svc.lake.orders.orders") == ["lake", "orders"]
+
+    def test_out_of_scope_tables_are_kept(self):
+        listed = {"svc.lake.raw.a": "1", "svc.lake.raw.b": "2", "svc.scratch.tmp.c": "3"}
+
+        stale = find_stale(listed, {"svc.lake.raw.a"}, PathFilter(exclude=["scratch"]))
+
+        assert stale == {"svc.lake.raw.b": "2"}
+        assert find_stale(listed, {"svc.lake.raw.a"}, failed_paths=[["lake", "raw"]]) == {"svc.scratch.tmp.c": "3"}
+        assert not exceeds_threshold(1, 3, 0.5) and exceeds_threshold(2, 3, 0.5)
+        assert not exceeds_threshold(3, 3, None)
+
+
+class TestReconcileSync:
+    """Tests de l'étape de réconciliation contre les serveurs simulés"""
+
+    def test_stale_tables_are_soft_deleted(self, servers):
+        dremio, om = servers
+        stale = _stale_tables(om, ["gone_1", "gone_2", "gone_3"])
+
+        result = _sync(dremio, om).sync(reconcile=True)
+
+        assert (result["tables_stale"], result["tables_deleted"]) == (3, 3)
+        assert set(result["stale_tables"]) == stale
+        assert om.deleted == stale
+        assert len(om.stats.durations["DELETE /v1/tables/{id}"]) == 3
+        # une seule page de listing pour tout le service
+        assert len(om.stats.durations["GET /v1/tables"]) == 1
+
+    def test_dry_run_reports_without_deleting(self, servers):
+        dremio, om = servers
+        _stale_tables(om, ["gone_1"])
+
+        plan = _sync(dremio, om).sync(dry_run=True, reconcile=True)
+
+        assert plan["dry_run"] and plan["tables_stale"] == 1
+        assert "DELETE /v1/tables/{id}" not in om.stats.durations
+
+    def test_safety_threshold_aborts_mass_deletion(self, servers):
+        dremio, om = servers
+        _stale_tables(om, [f"gone_{i}" for i in range(30)])
+
+        result = _sync(dremio, om, max_delete_ratio=0.2).sync(reconcile=True)
+
+        assert result["reconcile_aborted"] and result["tables_stale"] == 30
+        assert result["tables_deleted"] == 0 and not om.deleted
+
+    def test_excluded_subtrees_are_not_swept(self, servers):
+        dremio, om = servers
+        _sync(dremio, om).sync()
+
+        result = _sync(dremio, om, exclude=["source_1"]).sync(reconcile=True)
+
+        assert (result["tables_stale"], result["tables_deleted"]) == (0, 0)
+
+    def test_subtree_that_fails_to_list_is_not_swept(self, servers, monkeypatch):
+        dremio, om = servers
+        _sync(dremio, om).sync()
+        stale = _stale_tables(om, ["gone_1"])
+        route = dremio.route
+
+        def failing_folder(method, path, query, body):
+            if path == "/api/v3/catalog/by-path/source_0/folder_1":
+                return "/api/v3/catalog/by-path", 503, {"errorMessage": "unavailable"}
+            return route(method, path, query, body)
+
+        monkeypatch.setattr(dremio, "route", failing_folder)
+        sync = _sync(dremio, om, max_delete_ratio=0.5)
+        result = sync.sync(reconcile=True)
+
+        # les 10 tables de source_0.folder_1 n'ont pas été listées: elles ne sont pas périmées
+        assert sync.dremio.failed_paths == [["source_0", "folder_1"]]
+        assert set(result["stale_tables"]) == stale
+        assert om.deleted == stale
+
+    def test_unreadable_root_catalog_aborts_the_sweep(self, servers):
+        dremio, om = servers
+        sync = _sync(dremio, om)
+        sync.dremio.failed_paths = [[]]
+
+        result = sync._reconcile({})
+
+        assert result["reconcile_aborted"] and result["tables_deleted"] == 0
@@ -0,0 +1,150 @@
+"""
+Tests unitaires pour le routage des requêtes de profiling vers les réflexions (core.reflections)
+"""
+import logging
+import os
+from unittest.mock import Mock
+
+from dremio_connector import cli
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer
+from dremio_connector.core.profiler import build_column_profile_query, profile_dataset
+from dremio_connector.core.reflections import ReflectionIndex, parse_columns, parse_measures
+from dremio_connector.core.row_count import RowCountResolver
+from dremio_connector.core.sync_engine import DremioAutoDiscovery
+
+SQL_ENDPOINT = "POST /api/v3/sql"
+
+COLUMNS = [
+    {"name": "id", "dataType": "BIGINT"},
+    {"name": "amount", "dataType": "DOUBLE"},
+    {"name": "email", "dataType": "VARCHAR"},
+]
+
+
+def _client(dremio) -> DremioAutoDiscovery:
+    client = DremioAutoDiscovery(dremio.url, "admin", "admin")
+    assert client.authenticate()
+    return client
+
+
+class TestReflectionColumns:
+    """Tests pour la lecture des colonnes et mesures de sys.reflections"""
+
+    def test_parse_formats(self):
+        assert parse_columns("id, \"amount\"") == ["id", "amount"]
+        assert parse_columns('["id", "email"]') == ["id", "email"]
+        assert parse_columns(None) == []
+        assert parse_measures("amount (MIN, MAX, COUNT), price (SUM)") == {
+            "amount": {"MIN", "MAX", "COUNT"}, "price": {"SUM"},
+        }
+        assert parse_measures("amount:[min, max]")["amount"] == {"MIN", "MAX"}
+        assert parse_measures("amount, price") == {"amount": {"SUM", "COUNT"}, "price": {"SUM", "COUNT"}}
+
+    def test_query_shapes(self):
+        raw = build_column_profile_query('"s"."t"', "amount", "DOUBLE", 100, {"type": "raw"})
+        aggregation = build_column_profile_query(
+            '"s"."t"', "amount", "DOUBLE", route={"type": "aggregation", "measures": {"MIN", "MAX", "COUNT"}}
+        )
+
+        assert raw.endswith('FROM (SELECT "amount" FROM "s"."t" LIMIT 100)')
+        assert aggregation.endswith('FROM "s"."t"') and "SELECT *" not in aggregation
+        assert "distinct_count" not in aggregation and "stddev_value" not in aggregation
+        assert "mean_value" not in aggregation
+
+
+class TestReflectionRouting:
+    """Tests du routage et du taux d'accélération contre le serveur simulé"""
+
+    def test_routes_and_hit_rate(self):
+        catalog = SyntheticCatalog(datasets=3, sources=1, fan_out=1, view_ratio=0)
+        with MockDremioServer(catalog, rows_per_table=10) as dremio:
+            dremio.reflections["ds-2"] = 7
+            dremio.reflection_rows = [
+                {"dataset_id": "ds-0", "type": "RAW", "record_count": 10, "display_columns": "id, email"},
+                {"dataset_id": "ds-1", "type": "AGGREGATION", "dimensions": "id",
+                 "measures": "amount (MIN, MAX, COUNT, SUM), id (MIN, MAX, COUNT)"},
+            ]
+            client = _client(dremio)
+            index = ReflectionIndex(client)
+            row_counts = RowCountResolver(client, reflections=index)
+
+            profiles = [
+                profile_dataset(client, catalog.dataset(i)["path"], COLUMNS, row_counts=row_counts,
+                                entity=catalog.dataset(i), reflections=index)
+                for i in range(3)
+            ]
+            queries = len(dremio.stats.durations[SQL_ENDPOINT])
+
+        # sys.reflections lu une fois pour le routage et les nombres de lignes, un COUNT(*), 9 colonnes
+        assert queries == 1 + 1 + 9
+        assert [p["row_count_source"] for p in profiles] == ["reflection", "count", "reflection"]
+        assert index.stats == {
+            "raw": {"queries": 2, "accelerated": 2},
+            "aggregation": {"queries": 2, "accelerated": 2},
+            "none": {"queries": 5, "accelerated": 0},
+        }
+        assert index.hit_rate() == 4 / 9
+        aggregated = profiles[1]["columns"]
+        assert "mean_value" in aggregated["amount"] and "distinct_count" not in aggregated["amount"]
+        assert "distinct_count" in aggregated["id"]
+
+    def test_sampling_and_disabled_routing(self):
+        catalog = SyntheticCatalog(datasets=1, sources=1, fan_out=1, view_ratio=0)
+        with MockDremioServer(catalog, rows_per_table=10) as dremio:
+            dremio.reflection_rows = [
+                {"dataset_id": "ds-0", "type": "AGGREGATION", "measures": "amount (MIN, MAX, COUNT)"},
+            ]
+            index = ReflectionIndex(_client(dremio))
+
+            assert index.route("ds-0", "amount", "DOUBLE") == {
+                "type": "aggregation", "measures": {"MIN", "MAX", "COUNT"}, "dimension": False,
+            }
+            # un LIMIT empêche la réflexion d'agrégation
+            assert index.route("ds-0", "amount", "DOUBLE", sample_rows=100) is None
+            assert index.route("ds-0", "email", "VARCHAR") is None
+            assert ReflectionIndex(None, routing=False).route("ds-0", "amount", "DOUBLE") is None
+
+    def test_all_reflection_pages_are_read(self):
+        catalog = SyntheticCatalog(datasets=1, sources=1, fan_out=1, view_ratio=0)
+        with MockDremioServer(catalog, rows_per_table=10) as dremio:
+            dremio.reflections = {f"ds-{i}": i for i in range(1200)}
+            counts = ReflectionIndex(_client(dremio)).record_counts()
+
+        # plus d'une page de résultats (500 lignes)
+        assert len(counts) == 1200 and counts["ds-1199"] == 1199
+        assert len(dremio.stats.durations[SQL_ENDPOINT]) == 1
+
+    def test_interrupted_read_leaves_no_partial_index(self):
+        def rows(query, **kwargs):
+            yield {"dataset_id": "ds-0", "type": "RAW", "record_count": 10}
+            raise RuntimeError("Results fetch failed after 1 rows")
+
+        client = Mock()
+        client.iter_sql_rows.side_effect = rows
+        index = ReflectionIndex(client)
+
+        # index tronqué écarté: aucune réflexion plutôt qu'une partie
+        assert index.record_counts() == {}
+        assert client.iter_sql_rows.call_args.kwargs == {"raise_on_error": True}
+
+    def test_cli_reports_hit_rate(self, caplog):
+        catalog = SyntheticCatalog(datasets=4, sources=1, fan_out=2, view_ratio=0, columns=(3, 3))
+        fields = ",".join(field["name"] for field in catalog.dataset(0)["fields"])
+
+        def hit_rates(*options):
+            caplog.clear()
+            with caplog.at_level(logging.INFO, logger="dremio_connector.cli"):
+                assert cli.main([
+                    "profile", "--dremio-url", dremio.url, "--dremio-user", "admin", "--dremio-password", "admin",
+                    "--progress-interval", "0", "-o", os.devnull, *options,
+                ]) == 0
+            return [r.getMessage() for r in caplog.records if r.getMessage().startswith("⚡")]
+
+        with MockDremioServer(catalog, rows_per_table=10) as dremio:
+            dremio.reflection_rows = [{"dataset_id": "ds-0", "type": "RAW", "display_columns": fields}]
+            routed = hit_rates()
+            unrouted = hit_rates("--no-reflection-routing")
+
+        assert routed == ["⚡ 3/12 requêtes de profiling accélérées (25%; raw 3/3, none 0/9)"]
+        assert unrouted == ["⚡ 0/12 requêtes de profiling accélérées (0%; none 0/12)"]
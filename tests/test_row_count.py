@@ -0,0 +1,80 @@
+"""
+Tests unitaires pour les nombres de lignes sans scan (core.row_count)
+"""
+import json
+
+import pytest
+
+from dremio_connector import cli
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer
+from dremio_connector.core.row_count import COUNT, RowCountResolver, total_records
+from dremio_connector.core.sync_engine import DremioAutoDiscovery
+
+SQL_ENDPOINT = "POST /api/v3/sql"
+
+
+@pytest.fixture
+def catalog():
+    return SyntheticCatalog(datasets=6, sources=1, fan_out=2, view_ratio=0)
+
+
+def _client(dremio) -> DremioAutoDiscovery:
+    client = DremioAutoDiscovery(dremio.url, "admin", "admin")
+    assert client.authenticate()
+    return client
+
+
+class TestSnapshotSummary:
+    """Tests pour la lecture de total-records selon le format renvoyé par Dremio"""
+
+    def test_total_records_formats(self):
+        assert total_records({"total-records": "42", "added-records": "2"}) == 42
+        assert total_records([{"key": "total-records", "value": "7"}]) == 7
+        assert total_records("{added-records=2, total-records=9}") == 9
+        assert total_records({"added-records": "2"}) is None
+
+
+class TestRowCountResolver:
+    """Tests de l'ordre des sources contre le serveur simulé"""
+
+    def test_sources_in_order(self, catalog):
+        with MockDremioServer(catalog, rows_per_table=30) as dremio:
+            resolver = RowCountResolver(_client(dremio))
+            entity = catalog.dataset(0)
+            path = entity["path"]
+
+            assert resolver.resolve(path, {**entity, "recordCount": 12}) == (12, "catalog")
+            assert SQL_ENDPOINT not in dremio.stats.durations
+            assert resolver.resolve(path, {**entity, "format": {"type": "ICEBERG"}}) == (30, "iceberg")
+
+            dremio.reflections[entity["id"]] = 25
+            assert resolver.resolve(path, entity) == (25, "reflection")
+            assert resolver.resolve(catalog.dataset(1)["path"], catalog.dataset(1)) == (30, "count")
+            # sys.reflections lu une seule fois
+            queries = len(dremio.stats.durations[SQL_ENDPOINT])
+            resolver.resolve(path, entity)
+            assert len(dremio.stats.durations[SQL_ENDPOINT]) == queries
+
+        assert resolver.stats == {"catalog": 1, "iceberg": 1, "reflection": 2, "count": 1}
+
+    def test_count_only(self, catalog):
+        with MockDremioServer(catalog, rows_per_table=30) as dremio:
+            resolver = RowCountResolver(_client(dremio), sources=[COUNT])
+            entity = {**catalog.dataset(0), "recordCount": 12}
+
+            assert resolver.resolve(entity["path"], entity) == (30, "count")
+
+    def test_cli_reports_the_source(self, catalog, tmp_path):
+        output = tmp_path / "profiles.jsonl"
+        with MockDremioServer(catalog, rows_per_table=30) as dremio:
+            dremio.reflections[catalog.dataset(0)["id"]] = 25
+            assert cli.main([
+                "profile", "--dremio-url", dremio.url, "--dremio-user", "admin", "--dremio-password", "admin",
+                "--progress-interval", "0", "-o", str(output),
+            ]) == 0
+
+        profiles = {tuple(p["path"]): p for p in map(json.loads, output.read_text().splitlines())}
+        assert profiles[tuple(catalog.dataset_path(0))]["row_count"] == 25
+        assert profiles[tuple(catalog.dataset_path(0))]["row_count_source"] == "reflection"
+        assert [p["row_count_source"] for p in profiles.values()].count("count") == 5
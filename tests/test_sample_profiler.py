@@ -0,0 +1,155 @@
+"""
+Tests unitaires pour le profiling côté client sur échantillon (core.sample_profiler)
+"""
+import json
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from dremio_connector import cli
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer
+from dremio_connector.core.profiler import table_profile_payload
+from dremio_connector.core.row_count import COUNT, RowCountResolver
+from dremio_connector.core import sample_profiler
+from dremio_connector.core.sample_profiler import (
+    build_sample_query,
+    column_sample_stats,
+    profile_dataset_sample,
+    sample_table_stats,
+)
+from dremio_connector.core.sync_engine import DremioAutoDiscovery
+
+SQL_ENDPOINT = "POST /api/v3/sql"
+
+
+@pytest.fixture
+def catalog():
+    return SyntheticCatalog(datasets=4, sources=1, fan_out=2, view_ratio=0, columns=(4, 6))
+
+
+def _columns(catalog, index):
+    return [{"name": f["name"], "dataType": f["type"]["name"]} for f in catalog.dataset(index)["fields"]]
+
+
+class TestColumnSampleStats:
+    """Tests des métriques vectorisées d'une colonne"""
+
+    def test_numeric_column(self):
+        values = [3, 1, None, 4, 1, 5, 9, 2, 6, None]
+        stats = column_sample_stats(pa.chunked_array([values[:5], values[5:]]), "DataType.BIGINT", bins=4)
+        present = np.array([v for v in values if v is not None], dtype=float)
+
+        assert (stats["total_count"], stats["non_null_count"], stats["distinct_count"]) == (10, 8, 7)
+        assert (stats["min_value"], stats["max_value"]) == (1.0, 9.0)
+        assert stats["mean_value"] == pytest.approx(present.mean())
+        assert stats["stddev_value"] == pytest.approx(present.std(ddof=1))
+        assert stats["median"] == pytest.approx(np.median(present))
+        assert stats["top_values"][0] == [1.0, 2]
+        assert sum(stats["histogram"]["frequencies"]) == 8 and len(stats["histogram"]["boundaries"]) == 4
+
+    def test_string_and_empty_columns(self):
+        stats = column_sample_stats(pa.array(["ab", None, "abcd", "ab"]), "VARCHAR")
+
+        assert (stats["min_length"], stats["max_length"], stats["avg_length"]) == (2, 4, pytest.approx(8 / 3))
+        assert stats["top_values"] == [["ab", 2], ["abcd", 1]]
+        assert "min_value" not in stats
+        empty = column_sample_stats(pa.array([None, None], pa.float64()), "DOUBLE")
+        assert (empty["non_null_count"], empty["distinct_count"], empty["top_values"]) == (0, 0, [])
+
+    def test_nested_columns_only_get_counts(self):
+        lists = column_sample_stats(pa.array([[1, 2], None, [3]]), "LIST")
+        structs = column_sample_stats(pa.array([{"a": 1}, {"a": 2}]), "STRUCT")
+        maps = column_sample_stats(pa.array([[("k", 1)]], pa.map_(pa.string(), pa.int64())), "MAP")
+
+        assert lists == {"total_count": 3, "non_null_count": 2}
+        assert structs == {"total_count": 2, "non_null_count": 2}
+        assert maps == {"total_count": 1, "non_null_count": 1}
+
+    def test_failing_column_keeps_the_table_profile(self, monkeypatch):
+        table = pa.table({"id": [1, 2, 2], "tags": [["a"], ["b"], None], "broken": ["x", "y", "z"]})
+        columns = [{"name": "id", "dataType": "BIGINT"}, {"name": "tags", "dataType": "LIST"},
+                   {"name": "broken", "dataType": "VARCHAR"}]
+        compute = sample_profiler.column_sample_stats
+
+        def failing(column, column_type, **kwargs):
+            if column_type == "VARCHAR":
+                raise pa.ArrowNotImplementedError("unsupported")
+            return compute(column, column_type, **kwargs)
+
+        monkeypatch.setattr(sample_profiler, "column_sample_stats", failing)
+        stats = sample_table_stats(table, columns)
+
+        assert set(stats) == {"id", "tags"}
+        assert stats["id"]["distinct_count"] == 2 and stats["tags"]["non_null_count"] == 2
+
+    def test_sample_query(self):
+        assert build_sample_query('"s"."t"', ["id", 'a"b'], 100) == 'SELECT "id", "a""b" FROM "s"."t" LIMIT 100'
+
+
+class TestSampleProfiling:
+    """Tests du moteur sample contre le serveur simulé"""
+
+    def test_one_query_per_table(self, catalog):
+        with MockDremioServer(catalog, rows_per_table=20) as dremio:
+            client = DremioAutoDiscovery(dremio.url, "admin", "admin")
+            assert client.authenticate()
+            row_counts = RowCountResolver(client, sources=[COUNT])
+            small = [
+                profile_dataset_sample(client, catalog.dataset(i)["path"], _columns(catalog, i), 100,
+                                       row_counts=row_counts, entity=catalog.dataset(i))
+                for i in range(4)
+            ]
+            queries = len(dremio.stats.durations[SQL_ENDPOINT])
+            large = profile_dataset_sample(client, catalog.dataset(0)["path"], _columns(catalog, 0), 5,
+                                           row_counts=row_counts, entity=catalog.dataset(0))
+
+        # table plus petite que l'échantillon: il donne aussi le nombre de lignes
+        assert queries == 4
+        assert [(p["row_count"], p["row_count_source"]) for p in small] == [(20, "sample")] * 4
+        assert (large["row_count"], large["row_count_source"]) == (20, "count")
+        stats = small[0]["columns"][_columns(catalog, 0)[0]["name"]]
+        assert (stats["total_count"], stats["non_null_count"], stats["distinct_count"]) == (20, 18, 7)
+        assert large["columns"][_columns(catalog, 0)[0]["name"]]["total_count"] == 5
+
+    def test_cli_sample_engine_and_payload(self, catalog, tmp_path):
+        output = tmp_path / "profiles.jsonl"
+        with MockDremioServer(catalog, rows_per_table=20) as dremio:
+            assert cli.main([
+                "profile", "--dremio-url", dremio.url, "--dremio-user", "admin", "--dremio-password", "admin",
+                "--engine", "sample", "--progress-interval", "0", "-o", str(output),
+            ]) == 0
+            queries = len(dremio.stats.durations[SQL_ENDPOINT])
+
+        profiles = [json.loads(line) for line in output.read_text().splitlines()]
+        # exactement une requête par table: l'échantillon donne aussi le nombre de lignes
+        assert queries == len(profiles)
+        assert all(len(p["columns"]) == len(_columns(catalog, i)) for i, p in enumerate(profiles))
+        numeric = next(
+            (name, stats) for p in profiles for name, stats in p["columns"].items() if "median" in stats
+        )
+        column_profile = table_profile_payload({"columns": dict([numeric])}, 0)["columnProfile"][0]
+        assert column_profile["median"] == 3.0
+        assert sum(column_profile["histogram"]["frequencies"]) == 18
+
+    def test_cli_large_tables_without_count(self, catalog, tmp_path):
+        output = tmp_path / "profiles.jsonl"
+
+        def run(*options):
+            assert cli.main([
+                "profile", "--dremio-url", dremio.url, "--dremio-user", "admin", "--dremio-password", "admin",
+                "--engine", "sample", "--sample-rows", "5", "--progress-interval", "0", "-o", str(output), *options,
+            ]) == 0
+            return [json.loads(line) for line in output.read_text().splitlines()]
+
+        with MockDremioServer(catalog, rows_per_table=20) as dremio:
+            profiles = run()
+            queries = len(dremio.stats.durations[SQL_ENDPOINT])
+            counted = run("--row-count-sources", "count")
+
+        # tables plus grandes que l'échantillon: pas de COUNT(*) par défaut, sys.reflections lu une fois
+        assert queries == len(profiles) + 1
+        assert {(p["row_count"], p["row_count_source"]) for p in profiles} == {(None, None)}
+        assert "rowCount" not in table_profile_payload(profiles[0], 0)["tableProfile"]
+        assert {(p["row_count"], p["row_count_source"]) for p in counted} == {(20, "count")}
@@ -0,0 +1,117 @@
+"""
+Tests unitaires pour le snapshot de découverte partagé (core.snapshot)
+"""
+import time
+
+from dremio_connector import cli
+from dremio_connector.benchmark.catalog import SyntheticCatalog
+from dremio_connector.benchmark.servers import MockDremioServer
+from dremio_connector.core.filters import PathFilter
+from dremio_connector.core.snapshot import DiscoverySnapshot
+from dremio_connector.core.sync_engine import DremioAutoDiscovery, organize_hierarchy
+
+RESOURCES = [
+    {"id": "s1", "path": ["lake"], "full_path": "lake", "type": "source"},
+    {"id": "f1", "path": ["lake", "my.folder"], "full_path": "lake.my.folder", "type": "folder"},
+    {
+        "id": "d1",
+        "path": ["lake", "my.folder", "orders"],
+        "full_path": "lake.my.folder.orders",
+        "type": "dataset",
+        "schema": {"type": "VIRTUAL_DATASET", "sql": "SELECT 1", "fields": [{"name": "id", "type": {"name": "INTEGER"}}]},
+        "columns": [{"name": "id", "dataType": "INT", "ordinalPosition": 1}],
+    },
+    {"id": "s2", "path": ["scratch"], "full_path": "scratch", "type": "source"},
+]
+
+
+class TestDiscoverySnapshot:
+    """Tests pour l'écriture, la relecture mappée et les index"""
+
+    def test_round_trip_and_indexes(self, tmp_path):
+        path = tmp_path / "snapshot.arrow"
+        DiscoverySnapshot.from_resources(RESOURCES, "http://dremio:9047").write(path)
+
+        snapshot = DiscoverySnapshot.load(path)
+
+        assert len(snapshot) == 4 and snapshot.dremio_url == "http://dremio:9047"
+        assert snapshot.resources() == RESOURCES
+        assert snapshot.by_id("d1") == RESOURCES[2]
+        assert snapshot.by_path(["lake", "my.folder", "orders"])["schema"]["sql"] == "SELECT 1"
+        assert snapshot.by_path(["missing"]) is None
+        assert snapshot.paths("dataset") == [("lake", "my.folder", "orders")]
+        assert [r["id"] for r in snapshot.subtree(["lake"])] == ["s1", "f1", "d1"]
+        assert [r["id"] for r in snapshot.resources(PathFilter(exclude=["lake.*"]))] == ["s1", "s2"]
+
+    def test_stale_or_other_scope_is_not_reused(self, tmp_path):
+        path = tmp_path / "snapshot.arrow"
+        DiscoverySnapshot.from_resources(RESOURCES, path_filter=PathFilter(exclude=["tmp*"])).write(path)
+
+        assert DiscoverySnapshot.load(path, max_age=60, path_filter=PathFilter(exclude=["tmp*"])) is not None
+        assert DiscoverySnapshot.load(path, path_filter=PathFilter()) is None
+        time.sleep(0.05)
+        assert DiscoverySnapshot.load(path, max_age=0.01, path_filter=PathFilter(exclude=["tmp*"])) is None
+        assert DiscoverySnapshot.load(tmp_path / "absent.arrow") is None
+
+    def test_other_dremio_instance_is_not_reused(self, tmp_path):
+        path = tmp_path / "snapshot.arrow"
+        DiscoverySnapshot.from_resources(RESOURCES, "http://dremio-a:9047").write(path)
+
+        assert DiscoverySnapshot.load(path, dremio_url="http://dremio-a:9047/") is not None
+        assert DiscoverySnapshot.load(path, dremio_url="http://dremio-b:9047") is None
+
+    def test_unreadable_file_is_ignored(self, tmp_path):
+        path = tmp_path / "snapshot.arrow"
+        path.write_bytes(b"not arrow")
+
+        assert DiscoverySnapshot.load(path) is None
+
+
+class TestSharedCrawl:
+    """Tests du parcours unique réutilisé par les étapes suivantes"""
+
+    def test_second_stage_does_not_crawl(self, tmp_path):
+        catalog = SyntheticCatalog(datasets=30, sources=2, depth=2, fan_out=2)
+        path = tmp_path / "snapshot.arrow"
+        with MockDremioServer(catalog) as dremio:
+            first = DremioAutoDiscovery(dremio.url, "admin", "admin", max_workers=4)
+            assert first.authenticate()
+            crawled = first.discover_snapshot(path, max_age=3600)
+            listed = len(dremio.stats.durations["GET /api/v3/catalog/by-path"])
+
+            second = DremioAutoDiscovery(dremio.url, "admin", "admin", path_filter=PathFilter(include=["source_1"]))
+            reused = second.discover_snapshot(path, max_age=3600)
+
+            assert len(dremio.stats.durations["GET /api/v3/catalog/by-path"]) == listed
+        assert crawled is not None and reused is not None
+        resources = reused.resources(second.path_filter)
+        tables = [t for s in organize_hierarchy(resources)["source_1"]["schemas"].values() for t in s["tables"]]
+        expected = [i for i in catalog.iter_datasets() if catalog.dataset_path(i)[0] == "source_1"]
+        assert len(tables) == len(expected)
+        assert all(t["columns"] and t["schema"]["fields"] for t in tables)
+
+    def test_cli_discover_then_profile_share_the_snapshot(self, tmp_path):
+        catalog = SyntheticCatalog(datasets=20, sources=2, fan_out=2, view_ratio=0)
+        connection = ["--dremio-user", "admin", "--dremio-password", "admin", "--progress-interval", "0",
+                      "--state-dir", str(tmp_path), "--snapshot"]
+        with MockDremioServer(catalog, rows_per_table=10) as dremio:
+            assert cli.main(["discover", "--dremio-url", dremio.url, *connection, "-o", str(tmp_path / "a.jsonl")]) == 0
+            listed = len(dremio.stats.durations["GET /api/v3/catalog/by-path"])
+            assert cli.main(["profile", "--dremio-url", dremio.url, *connection, "-o", str(tmp_path / "p.jsonl")]) == 0
+
+            assert len(dremio.stats.durations["GET /api/v3/catalog/by-path"]) == listed
+        assert len((tmp_path / "p.jsonl").read_text().splitlines()) == 20
+        assert list(tmp_path.glob("snapshot_*.arrow"))
+
+    def test_snapshot_of_another_instance_is_recrawled(self, tmp_path):
+        catalog = SyntheticCatalog(datasets=10, sources=1, fan_out=2, view_ratio=0)
+        path = tmp_path / "snapshot.arrow"
+        DiscoverySnapshot.from_resources(RESOURCES, "http://other-dremio:9047").write(path)
+        with MockDremioServer(catalog) as dremio:
+            client = DremioAutoDiscovery(dremio.url, "admin", "admin")
+            assert client.authenticate()
+            snapshot = client.discover_snapshot(path, max_age=3600)
+
+        assert snapshot.dremio_url == dremio.url
+        assert len(snapshot.paths("dataset")) == 10
+        assert DiscoverySnapshot.load(path, dremio_url=dremio.url) is not None
@@ -0,0 +1,133 @@
+"""
+Tests unitaires pour les traces de découverte, des jobs SQL et des écritures
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from dremio_connector.core import tracing
+from dremio_connector.core.sync_engine import DremioAutoDiscovery, OpenMetadataSyncEngine
+
+
+@pytest.fixture
+def exporter():
+    exporter = tracing.InMemorySpanExporter()
+    tracing.configure_tracing(exporter)
+    yield exporter
+    tracing.configure_tracing(None)
+
+
+def response(status=200, payload=None):
+    resp = Mock(status_code=status, content=b"{}")
+    resp.json.return_value = payload or {}
+    return resp
+
+
+class TestTracer:
+    """Tests pour le tracer et les exporters"""
+
+    def test_noop_by_default(self):
+        assert tracing.span("anything", a=1) is tracing.NOOP_SPAN
+
+    def test_nested_spans_share_trace_and_link_parent(self, exporter):
+        with tracing.span("parent") as parent:
+            with tracing.span("child", column="email") as child:
+                child.set_attribute("rows", 3)
+
+        assert [s.name for s in exporter.spans] == ["child", "parent"]
+        assert child.trace_id == parent.trace_id
+        assert child.parent_span_id == parent.span_id
+        assert parent.parent_span_id is None
+        assert child.attributes == {"column": "email", "rows": 3}
+        assert child.status == "OK"
+
+    def test_exception_marks_span_as_error(self, exporter):
+        with pytest.raises(ValueError):
+            with tracing.span("failing"):
+                raise ValueError("boom")
+
+        span = exporter.find("failing")[0]
+        assert span.status == "ERROR"
+        assert span.events[0]["attributes"]["exception.message"] == "boom"
+
+    def test_file_exporter_writes_json_lines(self, tmp_path):
+        path = tmp_path / "trace.jsonl"
+        exporter = tracing.FileSpanExporter(str(path))
+        tracing.configure_tracing(exporter)
+        try:
+            with tracing.span("parent"):
+                with tracing.span("child"):
+                    pass
+        finally:
+            tracing.configure_tracing(None)
+            exporter.shutdown()
+
+        child, parent = tracing.load_spans(str(path))
+        assert child["parentSpanId"] == parent["spanId"]
+        assert parent["endTimeUnixNano"] >= parent["startTimeUnixNano"]
+        assert parent["status"] == {"code": "OK"}
+
+
+class TestInstrumentation:
+    """Tests pour les spans émis par la découverte, les jobs SQL et les écritures"""
+
+    @patch('dremio_connector.core.sync_engine.requests')
+    def test_sql_job_phases(self, mock_requests, exporter):
+        mock_requests.post.return_value = response(payload={"id": "job-1"})
+        mock_requests.get.side_effect = [
+            response(payload={
+                "jobState": "COMPLETED",
+                "resourceSchedulingStartedAt": "2024-01-15T10:00:00.000Z",
+                "resourceSchedulingEndedAt": "2024-01-15T10:00:01.250Z",
+            }),
+            response(payload={"rowCount": 1, "rows": [{"n": 1}]}),
+        ]
+        client = DremioAutoDiscovery("http://d", "u", "p")
+        client.token = "t"
+
+        assert client.execute_sql_query("SELECT 1")["rows"] == [{"n": 1}]
+
+        query = exporter.find("execute_sql_query")[0]
+        phases = {s.name: s for s in exporter.spans if s.parent_span_id == query.span_id}
+        assert set(phases) == {"sql.submit", "sql.poll", "sql.fetch"}
+        assert phases["sql.poll"].attributes["queue_ms"] == 1250.0
+        assert phases["sql.fetch"].attributes["rows"] == 1
+        http = [s for s in exporter.spans if s.parent_span_id == phases["sql.poll"].span_id]
+        assert http[0].name == "http GET /api/v3/job/{id}"
+
+    @patch('dremio_connector.core.sync_engine.requests')
+    def test_discovery_spans_per_container(self, mock_requests, exporter):
+        catalog = {
+            None: {"data": [{"id": "s", "path": ["src"], "type": "CONTAINER", "containerType": "SOURCE"}]},
+            "src": {"children": [{"id": "f", "path": ["src", "raw"], "type": "CONTAINER", "containerType": "FOLDER"}]},
+            "src/raw": {"children": []},
+        }
+
+        def get(url, **kwargs):
+            path = url.split("/by-path/")[1] if "/by-path/" in url else None
+            return response(payload=catalog[path])
+
+        mock_requests.get.side_effect = get
+        client = DremioAutoDiscovery("http://d", "u", "p")
+
+        client.discover_all_resources()
+
+        root = exporter.find("discover_all_resources")[0]
+        source, folder = sorted(exporter.find("explore_container"), key=lambda s: s.attributes["path"])
+        assert root.attributes["resources"] == 2
+        assert source.parent_span_id == root.span_id
+        assert folder.parent_span_id == source.span_id
+        assert source.attributes["children"] == 1
+
+    @patch('dremio_connector.core.sync_engine.requests')
+    def test_one_span_per_openmetadata_write(self, mock_requests, exporter):
+        mock_requests.put.return_value = response(payload={"fullyQualifiedName": "svc.db", "id": "1"})
+        engine = OpenMetadataSyncEngine("http://om/api", "jwt", "svc")
+
+        engine.create_or_update_database("db")
+        engine.create_or_update_table("svc.db.s", "t", [])
+
+        writes = exporter.find("openmetadata.write")
+        assert [(s.attributes["entity"], s.attributes["name"]) for s in writes] == [
+            ("database", "db"), ("table", "t")
+        ]
@@ -0,0 +1,188 @@
+"""
+Tests unitaires pour l'ingestion d'usage depuis l'historique des jobs Dremio
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from dremio_connector.core.sync_engine import OpenMetadataSyncEngine
+from dremio_connector.core.usage import UsageAggregator, UsageIngestion, UsageState, build_jobs_query
+
+KNOWN = [["src", "raw", "orders"], ["src", "raw", "customers"], ["Analytics", "v"]]
+
+
+def job(query, ts="2024-01-15 10:00:00.000"):
+    return {"job_id": "j", "submitted_ts": ts, "final_state_ts": ts, "query": query}
+
+
+class TestUsageAggregator:
+    """Tests pour l'agrégation en streaming"""
+
+    def test_counts_and_joins_per_dataset_and_day(self):
+        aggregator = UsageAggregator(KNOWN)
+        aggregator.add(job("SELECT * FROM src.raw.orders"))
+        aggregator.add(job("SELECT * FROM SRC.RAW.ORDERS o JOIN src.raw.customers c ON o.c = c.id"))
+        aggregator.add(job("SELECT * FROM src.raw.orders", ts="2024-01-16 08:00:00.000"))
+
+        summaries = {(tuple(s["path"]), s["date"]): s for s in aggregator.summaries()}
+
+        orders = summaries[(("src", "raw", "orders"), "2024-01-15")]
+        assert orders["count"] == 2
+        assert orders["joins"] == [(["src", "raw", "customers"], 1)]
+        assert summaries[(("src", "raw", "orders"), "2024-01-16")]["count"] == 1
+        assert summaries[(("src", "raw", "customers"), "2024-01-15")]["joins"] == [(["src", "raw", "orders"], 1)]
+
+    def test_system_tables_and_broken_rows_are_ignored(self):
+        aggregator = UsageAggregator(KNOWN)
+        aggregator.add(job("SELECT * FROM sys.jobs_recent"))
+        aggregator.add(job(None))
+        aggregator.add(job("SELECT * FROM Analytics.v", ts=None))
+
+        assert aggregator.summaries() == []
+        assert aggregator.stats == {"jobs": 3, "skipped": 2, "unresolved": 1, "published": 0}
+
+
+class TestUsageIngestion:
+    """Tests pour le fenêtrage et le high-water mark"""
+
+    def test_windows_cover_range_without_overlap(self):
+        ingestion = UsageIngestion(Mock(url="http://d"), KNOWN, state=Mock(), window=timedelta(hours=1))
+        start = datetime(2024, 1, 15, 0, 0)
+
+        windows = list(ingestion.windows(start, start + timedelta(hours=2, minutes=30)))
+
+        assert [(s.hour, s.minute, e.hour, e.minute) for s, e in windows] == [
+            (0, 0, 1, 0), (1, 0, 2, 0), (2, 0, 2, 30)
+        ]
+
+    def test_query_is_bounded_by_final_state_ts(self):
+        query = build_jobs_query(datetime(2024, 1, 15, 0, 0), datetime(2024, 1, 15, 1, 0, 0, 123456))
+
+        assert "FROM sys.jobs_recent" in query
+        assert "final_state_ts > TIMESTAMP '2024-01-15 00:00:00.000'" in query
+        assert "final_state_ts <= TIMESTAMP '2024-01-15 01:00:00.123'" in query
+
+    def test_high_water_mark_limits_next_scan(self, tmp_path):
+        client = Mock(url="http://d")
+        client.iter_sql_rows.side_effect = lambda query, **kwargs: iter([job("SELECT * FROM Analytics.v")])
+        now = datetime(2024, 1, 15, 12, 0)
+        state = UsageState("http://d", str(tmp_path))
+
+        first = UsageIngestion(client, KNOWN, state=state, lag=timedelta(0))
+        assert first.collect(now=now)[0]["count"] == 24
+        first.commit()
+
+        second = UsageIngestion(client, KNOWN, state=state, lag=timedelta(0))
+        second.collect(now=now + timedelta(minutes=30))
+
+        assert state.load() == now
+        assert second.stats["windows"] == 1
+        assert "TIMESTAMP '2024-01-15 12:00:00.000'" in client.iter_sql_rows.call_args.args[0]
+
+    def test_now_with_timezone_is_converted_to_utc(self, tmp_path):
+        client = Mock(url="http://d")
+        client.iter_sql_rows.side_effect = lambda query, **kwargs: iter([])
+        state = UsageState("http://d", str(tmp_path))
+        ingestion = UsageIngestion(client, KNOWN, state=state, lag=timedelta(0))
+
+        # 14h à Paris (UTC+2) = 12h UTC, l'heure des final_state_ts de Dremio
+        ingestion.collect(now=datetime(2024, 7, 15, 14, 0, tzinfo=timezone(timedelta(hours=2))))
+        ingestion.commit()
+
+        assert "final_state_ts <= TIMESTAMP '2024-07-15 12:00:00.000'" in client.iter_sql_rows.call_args.args[0]
+        assert state.load() == datetime(2024, 7, 15, 12, 0)
+
+    def test_default_now_is_utc(self, tmp_path):
+        client = Mock(url="http://d")
+        client.iter_sql_rows.side_effect = lambda query, **kwargs: iter([])
+        ingestion = UsageIngestion(client, KNOWN, state=UsageState("http://d", str(tmp_path)), lag=timedelta(0))
+
+        before = datetime.now(timezone.utc).replace(tzinfo=None)
+        ingestion.collect()
+        ingestion.commit()
+
+        assert before <= ingestion.state.load() <= datetime.now(timezone.utc).replace(tzinfo=None)
+
+    def test_failed_window_does_not_advance_mark(self, tmp_path):
+        client = Mock(url="http://d")
+        client.iter_sql_rows.side_effect = RuntimeError("Query failed")
+        state = UsageState("http://d", str(tmp_path))
+        ingestion = UsageIngestion(client, KNOWN, state=state)
+
+        with pytest.raises(RuntimeError):
+            ingestion.collect()
+        ingestion.commit()
+
+        assert state.load() is None
+
+
+class TestPublishUsage:
+    """Tests pour la publication vers OpenMetadata"""
+
+    @patch("dremio_connector.core.sync_engine.requests.Session")
+    def test_one_put_per_table_day_and_one_percentile_per_day(self, mock_session_cls):
+        session = mock_session_cls.return_value.__enter__.return_value
+        session.post.return_value = Mock(status_code=200)
+        session.put.return_value = Mock(status_code=200)
+        om = OpenMetadataSyncEngine("http://om/api", "jwt", "dremio")
+        om.table_ids = {"dremio.src.raw.orders": "id-o", "dremio.src.raw.customers": "id-c"}
+        summaries = [
+            {"path": ["src", "raw", "orders"], "date": "2024-01-15", "count": 3,
+             "joins": [(["src", "raw", "customers"], 2)]},
+            {"path": ["src", "raw", "customers"], "date": "2024-01-15", "count": 2, "joins": []},
+            {"path": ["src", "raw", "unknown"], "date": "2024-01-15", "count": 1, "joins": []},
+        ]
+
+        assert om.publish_usage(summaries) == []
+
+        # PUT ajoute au compteur du jour: les runs incrémentaux ne se remplacent pas
+        usage = [c for c in session.put.call_args_list if "/v1/usage/table/" in c.args[0]]
+        assert [(c.args[0], c.kwargs["json"]) for c in usage] == [
+            ("http://om/api/v1/usage/table/id-o", {"date": "2024-01-15", "count": 3}),
+            ("http://om/api/v1/usage/table/id-c", {"date": "2024-01-15", "count": 2}),
+        ]
+        assert [c.args[0] for c in session.post.call_args_list] == [
+            "http://om/api/v1/usage/compute.percentile/table/2024-01-15",
+        ]
+        joins = next(c for c in session.put.call_args_list if c.args[0].endswith("/joins")).kwargs["json"]
+        assert joins["directTableJoins"] == [{"fullyQualifiedName": "dremio.src.raw.customers", "joinCount": 2}]
+        assert om.stats["usage"] == 2
+        assert om.stats["usage_skipped"] == 1
+
+    @patch("dremio_connector.core.sync_engine.requests.Session")
+    def test_partial_failure_is_not_counted_twice(self, mock_session_cls, tmp_path):
+        session = mock_session_cls.return_value.__enter__.return_value
+        session.post.return_value = Mock(status_code=200)
+        om = OpenMetadataSyncEngine("http://om/api", "jwt", "dremio")
+        om.table_ids = {"dremio.src.raw.orders": "id-o", "dremio.src.raw.customers": "id-c"}
+        jobs = [
+            job("SELECT * FROM src.raw.orders", ts="2024-01-15 09:30:00.000"),
+            job("SELECT * FROM src.raw.customers", ts="2024-01-15 09:30:00.000"),
+        ]
+
+        def window_rows(query, **kwargs):
+            start, end = re.findall(r"TIMESTAMP '([^']+)'", query)
+            return iter([j for j in jobs if start < j["final_state_ts"] <= end])
+
+        client = Mock(url="http://d")
+        client.iter_sql_rows.side_effect = window_rows
+        state = UsageState("http://d", str(tmp_path))
+
+        def run(now, customers_status):
+            session.put.reset_mock()
+            session.put.side_effect = lambda url, **kwargs: Mock(status_code=customers_status if "id-c" in url else 200)
+            usage = UsageIngestion(client, KNOWN, state=state, lag=timedelta(0))
+            usage.commit(om.publish_usage(usage.collect(now=now)))
+            return {c.args[0].rsplit("/", 1)[-1]: c.kwargs["json"]["count"] for c in session.put.call_args_list}
+
+        # premier run: l'usage de customers échoue, celui de orders est publié
+        assert run(datetime(2024, 1, 15, 12, 0), 503) == {"id-o": 1, "id-c": 1}
+        assert state.load() == datetime(2024, 1, 14, 12, 0)
+
+        # second run: même plage rescannée, orders n'est pas republié
+        jobs.append(job("SELECT * FROM src.raw.orders", ts="2024-01-15 12:30:00.000"))
+        assert run(datetime(2024, 1, 15, 13, 0), 200) == {"id-o": 1, "id-c": 1}
+        assert state.load() == datetime(2024, 1, 15, 13, 0)
+        assert state.load_published() == {}
@@ -0,0 +1,258 @@
+"""
+Tests unitaires pour le lineage des vues Dremio
+"""
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from dremio_connector.core.lineage import (
+    SqlParseCache,
+    ViewLineageExtractor,
+    collect_view_definitions,
+    parse_view_sql,
+    sql_hash,
+)
+from dremio_connector.core.sync_engine import DremioAutoDiscovery, DremioOpenMetadataSync
+
+
+class TestParseViewSql:
+    """Tests pour l'extraction des références de tables"""
+
+    def test_quoted_and_unquoted_references(self):
+        parsed = parse_view_sql('SELECT * FROM "Sales"."orders" o JOIN crm.customers c ON o.id = c.id')
+
+        assert parsed["tables"] == [["Sales", "orders"], ["crm", "customers"]]
+        assert parsed["aliases"] == {"o": ["Sales", "orders"], "c": ["crm", "customers"]}
+
+    def test_ctes_are_not_tables(self):
+        sql = "WITH x AS (SELECT * FROM s.t1), y AS (SELECT * FROM x) SELECT * FROM y"
+
+        assert parse_view_sql(sql)["tables"] == [["s", "t1"]]
+
+    def test_subqueries_and_comma_joins(self):
+        sql = "SELECT * FROM (SELECT * FROM a.b) sub, c.d WHERE x IN (SELECT y FROM e.f)"
+
+        assert sorted(parse_view_sql(sql)["tables"]) == [["a", "b"], ["c", "d"], ["e", "f"]]
+
+    def test_from_inside_functions_is_ignored(self):
+        sql = "SELECT EXTRACT(YEAR FROM created_at), TRIM(BOTH ' ' FROM name) FROM s.t -- FROM x.y"
+
+        assert parse_view_sql(sql)["tables"] == [["s", "t"]]
+
+    def test_table_functions_are_ignored(self):
+        assert parse_view_sql("SELECT * FROM TABLE(table_snapshot('s.t'))")["tables"] == []
+
+
+class TestViewLineageExtractor:
+    """Tests pour la résolution et l'émission des arêtes"""
+
+    def test_resolution_prefers_sql_context(self):
+        extractor = ViewLineageExtractor(
+            known_datasets=[["Sales", "raw", "orders"], ["raw", "orders"]], max_workers=1
+        )
+
+        assert extractor.resolve(["raw", "orders"], ["Sales"]) == ["Sales", "raw", "orders"]
+        assert extractor.resolve(["RAW", "Orders"], []) == ["raw", "orders"]
+        assert extractor.resolve(["missing"], ["Sales"]) is None
+
+    def test_edges_are_batched_and_deduplicated(self):
+        views = [
+            {"path": ["Analytics", f"v{i}"], "sql": "SELECT * FROM src.t JOIN src.t t2 ON 1=1", "context": []}
+            for i in range(5)
+        ]
+        extractor = ViewLineageExtractor(known_datasets=[["src", "t"]], max_workers=1, batch_size=2)
+
+        batches = list(extractor.extract(views))
+
+        assert [len(b) for b in batches] == [2, 2, 1]
+        assert batches[0][0] == {"from": ["src", "t"], "to": ["Analytics", "v0"], "sql": views[0]["sql"]}
+        assert extractor.stats["parsed"] == 1
+        assert extractor.stats["cache_hits"] == 4
+
+    def test_parse_cache_is_persisted(self, tmp_path):
+        cache_path = str(tmp_path / "parse_cache.json")
+        view = {"path": ["s", "v"], "sql": "SELECT a, b + 1 AS c FROM s.t", "context": []}
+        list(ViewLineageExtractor(max_workers=1, parse_cache=SqlParseCache(cache_path)).extract([view]))
+
+        cache = SqlParseCache(cache_path)
+
+        assert cache.get(sql_hash(view["sql"])) == parse_view_sql(view["sql"])
+        with open(cache_path) as f:
+            assert json.load(f)
+
+    def test_process_pool_gives_same_result(self):
+        views = [
+            {"path": ["s", f"v{i}"], "sql": f"SELECT * FROM s.t{i % 3}", "context": []}
+            for i in range(20)
+        ]
+        sequential = ViewLineageExtractor(max_workers=1)
+        parallel = ViewLineageExtractor(max_workers=2, parallel_threshold=1)
+
+        assert list(sequential.extract(views)) == list(parallel.extract(views))
+
+
+class TestViewDefinitions:
+    """Tests pour la collecte des définitions de vues"""
+
+    def test_collect_from_discovered_resources(self):
+        resources = [
+            {"type": "dataset", "path": ["s", "v"], "schema": {
+                "type": "VIRTUAL_DATASET", "sql": "SELECT 1", "sqlContext": ["s"]}},
+            {"type": "dataset", "path": ["s", "t"], "schema": {"type": "PHYSICAL_DATASET"}},
+            {"type": "folder", "path": ["s"]},
+        ]
+
+        assert collect_view_definitions(resources) == [{"path": ["s", "v"], "sql": "SELECT 1", "context": ["s"]}]
+
+    @patch("dremio_connector.core.sync_engine.requests")
+    def test_iter_sql_rows_walks_all_pages(self, mock_requests):
+        client = DremioAutoDiscovery("http://dremio:9047", "admin", "admin")
+        client.token = "t"
+
+        def get(url, params=None, **kwargs):
+            response = Mock(status_code=200)
+            if url.endswith("/results"):
+                offset = params["offset"]
+                rows = [{"n": i} for i in range(offset, min(offset + 500, 1200))]
+                response.json.return_value = {"rowCount": 1200, "rows": rows}
+            else:
+                response.json.return_value = {"jobState": "COMPLETED"}
+            return response
+
+        mock_requests.post.return_value = Mock(status_code=200, json=Mock(return_value={"id": "job-1"}))
+        mock_requests.get.side_effect = get
+
+        rows = list(client.iter_sql_rows("SELECT 1"))
+
+        assert [r["n"] for r in rows] == list(range(1200))
+
+
+class TestSyncLineage:
+    """Tests pour l'étape lineage de DremioOpenMetadataSync"""
+
+    def test_lineage_uses_ids_of_synced_tables(self):
+        sync = DremioOpenMetadataSync("http://d", "u", "p", "http://om/api", "jwt", "dremio")
+        sync.om = Mock()
+        sync.om.table_ids = {"dremio.src.raw.orders": "id-orders", "dremio.Analytics.sales.v": "id-view"}
+        resources = [
+            {"type": "dataset", "path": ["src", "raw", "orders"]},
+            {"type": "dataset", "path": ["Analytics", "sales", "v"], "schema": {
+                "type": "VIRTUAL_DATASET", "sql": "SELECT * FROM raw.orders", "sqlContext": ["src"]}},
+        ]
+
+        sync._sync_lineage(resources)
+
+        sync.om.add_lineage.assert_called_once_with(
+            "id-orders", "id-view", sql_query="SELECT * FROM raw.orders", columns_lineage=[]
+        )
+
+    def test_column_lineage_uses_crawled_columns(self):
+        sync = DremioOpenMetadataSync("http://d", "u", "p", "http://om/api", "jwt", "dremio")
+        sync.om = Mock()
+        sync.om.table_ids = {"dremio.src.raw.orders": "id-orders", "dremio.Analytics.sales.v": "id-view"}
+        resources = [
+            {"type": "dataset", "path": ["src", "raw", "orders"], "columns": [{"name": "id"}, {"name": "amount"}]},
+            {"type": "dataset", "path": ["Analytics", "sales", "v"], "schema": {
+                "type": "VIRTUAL_DATASET", "sql": "SELECT amount AS total FROM src.raw.orders"}},
+        ]
+
+        sync._sync_lineage(resources)
+
+        assert sync.om.add_lineage.call_args.kwargs["columns_lineage"] == [{
+            "fromColumns": ["dremio.src.raw.orders.amount"],
+            "toColumn": "dremio.Analytics.sales.v.total",
+        }]
+
+    def test_parse_cache_is_kept_in_state_dir(self, tmp_path):
+        resources = [
+            {"type": "dataset", "path": ["src", "raw", "orders"], "columns": [{"name": "id"}]},
+            {"type": "dataset", "path": ["Analytics", "v"], "schema": {
+                "type": "VIRTUAL_DATASET", "sql": "SELECT id FROM src.raw.orders"}},
+        ]
+
+        def run():
+            sync = DremioOpenMetadataSync("http://d", "u", "p", "http://om/api", "jwt", "dremio", state_dir=str(tmp_path))
+            sync.om = Mock()
+            sync.om.table_ids = {"dremio.src.raw.orders": "id-orders", "dremio.Analytics.v": "id-view"}
+            sync._sync_lineage(resources)
+            return sync.om.add_lineage.call_args
+
+        first = run()
+        # second run: le SQL des vues vient du cache persisté, rien n'est re-parsé
+        with patch("dremio_connector.core.lineage.parse_view_sql", side_effect=AssertionError("parsed again")):
+            second = run()
+
+        assert first == second
+        assert list(tmp_path.glob("view_parse_cache_*.json"))
+
+
+class TestColumnLineage:
+    """Tests pour le lineage colonne et la mémoïsation des schémas amont"""
+
+    @staticmethod
+    def _column_edges(views, known_columns):
+        known = [list(path) for path in known_columns] + [view["path"] for view in views]
+        extractor = ViewLineageExtractor(
+            known_datasets=known, known_columns=known_columns, column_level=True, max_workers=1
+        )
+        edges = {}
+        for batch in extractor.extract(views):
+            for edge in batch:
+                edges[(tuple(edge["from"]), tuple(edge["to"]))] = edge["columns"]
+        return edges, extractor
+
+    def test_aliases_expressions_and_joins(self):
+        views = [{"path": ["s", "v"], "context": [], "sql": (
+            "SELECT o.id, UPPER(c.name) AS customer, o.amount * 2 doubled "
+            "FROM raw.orders o JOIN raw.customers c ON o.customer_id = c.id"
+        )}]
+        known_columns = {("raw", "orders"): ["id", "customer_id", "amount"], ("raw", "customers"): ["id", "name"]}
+
+        edges, _ = self._column_edges(views, known_columns)
+
+        assert edges[(("raw", "orders"), ("s", "v"))] == [
+            {"from": ["id"], "to": "id"}, {"from": ["amount"], "to": "doubled"}
+        ]
+        assert edges[(("raw", "customers"), ("s", "v"))] == [{"from": ["name"], "to": "customer"}]
+
+    def test_unqualified_columns_resolved_with_upstream_schemas(self):
+        views = [{"path": ["s", "v"], "context": [], "sql": (
+            "SELECT amount, name FROM raw.orders o JOIN raw.customers c ON o.customer_id = c.id"
+        )}]
+        known_columns = {("raw", "orders"): ["customer_id", "amount"], ("raw", "customers"): ["id", "name"]}
+
+        edges, _ = self._column_edges(views, known_columns)
+
+        assert edges[(("raw", "orders"), ("s", "v"))] == [{"from": ["amount"], "to": "amount"}]
+        assert edges[(("raw", "customers"), ("s", "v"))] == [{"from": ["name"], "to": "name"}]
+
+    def test_ctes_subqueries_and_unions(self):
+        views = [{"path": ["s", "v"], "context": [], "sql": (
+            "WITH recent AS (SELECT id, amount FROM raw.orders) "
+            "SELECT x.id, x.amount FROM (SELECT * FROM recent) x "
+            "UNION ALL SELECT id, amount FROM raw.archive"
+        )}]
+        known_columns = {("raw", "orders"): ["id", "amount"], ("raw", "archive"): ["id", "amount"]}
+
+        edges, _ = self._column_edges(views, known_columns)
+
+        expected = [{"from": ["id"], "to": "id"}, {"from": ["amount"], "to": "amount"}]
+        assert edges[(("raw", "orders"), ("s", "v"))] == expected
+        assert edges[(("raw", "archive"), ("s", "v"))] == expected
+
+    def test_deep_view_chain_is_resolved_once_per_dataset(self):
+        depth = 10
+        views = [{"path": ["s", "v0"], "context": [], "sql": "SELECT id, name FROM raw.t"}]
+        for level in range(1, depth):
+            # Chaque vue référence deux fois la précédente: sans mémoïsation, 2^depth résolutions
+            views.append({"path": ["s", f"v{level}"], "context": ["s"], "sql": (
+                f"SELECT a.*, b.name AS other{level} FROM v{level - 1} a JOIN v{level - 1} b ON a.id = b.id"
+            )})
+
+        edges, extractor = self._column_edges(views, {("raw", "t"): ["id", "name"]})
+
+        assert extractor.resolver.stats["views_resolved"] == depth
+        last = edges[(("s", f"v{depth - 2}"), ("s", f"v{depth - 1}"))]
+        assert {"from": ["name"], "to": f"other{depth - 1}"} in last
+        assert {"from": [f"other{depth - 2}"], "to": f"other{depth - 2}"} in last